@@ -18,13 +18,34 @@ Usage:
 import os
 import json
 import glob
+import hashlib
 import re
+import sys
 from datetime import datetime
 from typing import Optional
 
+# utils/ lives at the project root, next to commands/
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from utils.frontmatter import split_frontmatter, strip_frontmatter  # noqa: E402
+from utils.search_index import (  # noqa: E402
+    SEARCH_VERSION,
+    SearchIndex,
+    build_search_index,
+)
+
 # Get the commands directory (same directory as this script)
 COMMANDS_DIR = os.path.dirname(os.path.abspath(__file__))
 CACHE_FILE = os.path.join(COMMANDS_DIR, "_cache.json")
+# The search index lives in a compact sidecar next to CACHE_FILE, read only
+# when searching.
+SEARCH_FILE_NAME = "_search.json"
+PROJECT_ROOT = os.path.dirname(COMMANDS_DIR)
+
+# Bump when the per-file index layout inside _cache.json changes.
+INDEX_VERSION = 1
 
 # Skills live as a sibling tree to commands/ (../skills/<name>/SKILL.md)
 SKILLS_DIR = os.path.join(os.path.dirname(COMMANDS_DIR), "skills")
@@ -34,7 +55,8 @@ def parse_yaml_frontmatter(content: str) -> dict:
     """
     Extract YAML frontmatter from markdown file.
 
-    Frontmatter is delimited by --- at start and end.
+    Frontmatter is delimited by --- at start and end. Thin wrapper over the
+    shared scanner/parser in utils/frontmatter.py.
 
     Supports:
     - Simple key: value pairs
@@ -47,109 +69,7 @@ def parse_yaml_frontmatter(content: str) -> dict:
     Returns:
         Dictionary of frontmatter fields (empty dict if no frontmatter)
     """
-    # Match frontmatter: starts with ---, content, ends with ---
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
-        return {}
-
-    frontmatter_text = match.group(1)
-    metadata = {}
-
-    # Parse YAML manually
-    current_key = None
-    current_array = []
-    current_obj = {}
-    in_array = False
-    in_nested_obj = False
-    array_item_indent = None  # Track indent level of array items
-
-    for line in frontmatter_text.split('\n'):
-        line = line.rstrip()
-
-        # Skip empty lines
-        if not line:
-            continue
-
-        # Determine indentation level
-        indent = len(line) - len(line.lstrip())
-        stripped = line.lstrip()
-
-        # Top-level key-value pair (indent=0)
-        if indent == 0 and ':' in stripped and not stripped.startswith('-'):
-            # Save previous array if exists
-            if in_array and current_key:
-                # Save last nested object if exists
-                if in_nested_obj and current_obj:
-                    current_array.append(current_obj)
-                    current_obj = {}
-
-                metadata[current_key] = current_array
-                current_array = []
-                in_array = False
-                in_nested_obj = False
-                array_item_indent = None
-
-            # Parse new key-value
-            key, value = stripped.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-
-            if value:
-                # Simple value
-                metadata[key] = value
-                current_key = key
-            else:
-                # Array follows
-                current_key = key
-                in_array = True
-                current_array = []
-
-        # Array item (starts with - at some indent level)
-        elif in_array and stripped.startswith('-'):
-            # Save previous nested object if exists
-            if in_nested_obj and current_obj:
-                current_array.append(current_obj)
-                current_obj = {}
-                in_nested_obj = False
-
-            # Track array item indent level
-            if array_item_indent is None:
-                array_item_indent = indent
-
-            # Parse array item
-            item_content = stripped[1:].strip()  # Remove '-' and whitespace
-
-            if ':' in item_content:
-                # Array item with inline key:value (e.g., "- name: mode")
-                # Start a new nested object
-                in_nested_obj = True
-                key, value = item_content.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                current_obj = {key: value}
-            else:
-                # Simple array item
-                current_array.append(item_content)
-
-        # Nested object field (more indented than array item)
-        elif in_array and in_nested_obj and indent > array_item_indent and ':' in stripped:
-            # Parse key-value for nested object
-            key, value = stripped.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            current_obj[key] = value
-
-    # Save final array if exists
-    if in_array and current_key:
-        # Save last nested object if exists
-        if in_nested_obj and current_obj:
-            current_array.append(current_obj)
-
-        metadata[current_key] = current_array
-
-    return metadata
+    return split_frontmatter(content).fields
 
 
 def extract_first_heading(content: str) -> Optional[str]:
@@ -163,7 +83,7 @@ def extract_first_heading(content: str) -> Optional[str]:
         First heading text (without #) or None
     """
     # Skip frontmatter
-    content_without_frontmatter = re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, flags=re.DOTALL)
+    content_without_frontmatter = strip_frontmatter(content)
 
     # Find first heading (# or ##)
     match = re.search(r'^#{1,2}\s+(.+)$', content_without_frontmatter, re.MULTILINE)
@@ -187,7 +107,7 @@ def extract_first_paragraph(content: str) -> Optional[str]:
         First paragraph text or None
     """
     # Skip frontmatter
-    content_without_frontmatter = re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, flags=re.DOTALL)
+    content_without_frontmatter = strip_frontmatter(content)
 
     # Skip headings and find first paragraph
     lines = content_without_frontmatter.split('\n')
@@ -299,6 +219,110 @@ def infer_command_name(filepath: str, category: str) -> str:
     return f"{category}:{filename}"
 
 
+def _command_record(filepath: str, rel_path: str, content: str) -> Optional[dict]:
+    """
+    Build one command's metadata record from its file content.
+
+    Args:
+        filepath: Absolute path of the command file
+        rel_path: Path relative to commands/
+        content: File content
+
+    Returns:
+        Command metadata dictionary, or None for internal files
+    """
+    # Parse frontmatter
+    metadata = parse_yaml_frontmatter(content)
+
+    # Infer category from path
+    category = infer_category(rel_path)
+
+    # Skip if internal category
+    if category == 'internal':
+        return None
+
+    # Get or infer command name
+    name = metadata.get('name')
+    if not name:
+        name = infer_command_name(rel_path, category)
+
+    # Get or infer description
+    description = metadata.get('description')
+    if not description:
+        # Try to extract from first heading
+        description = extract_first_heading(content)
+        if not description:
+            # Try first paragraph
+            description = extract_first_paragraph(content)
+        if not description:
+            description = "No description available"
+
+    # Build command metadata
+    command = {
+        'name': name,
+        'category': category,
+        'description': description,
+        'file': rel_path
+    }
+
+    # Add optional fields if present
+    if 'subcategory' in metadata:
+        command['subcategory'] = metadata['subcategory']
+
+    if 'modes' in metadata:
+        # Parse modes if it's a string
+        modes = metadata['modes']
+        if isinstance(modes, str):
+            modes = [m.strip() for m in modes.split(',')]
+        command['modes'] = modes
+
+    if 'arguments' in metadata:
+        command['arguments'] = metadata['arguments']
+
+        # Infer mode support from arguments
+        # If there's a 'mode' argument, extract supported modes from description
+        for arg in metadata['arguments']:
+            if isinstance(arg, dict) and arg.get('name') == 'mode':
+                desc = arg.get('description', '')
+                # Extract modes from description like "(default|debug|optimize|release)"
+                mode_match = re.search(r'\(([^)]+)\)', desc)
+                if mode_match:
+                    modes_str = mode_match.group(1)
+                    modes = [m.strip() for m in modes_str.split('|')]
+                    command['modes'] = modes
+                break
+
+    if 'tutorial' in metadata:
+        tutorial_val = metadata['tutorial']
+        command['tutorial'] = tutorial_val == 'true' if isinstance(tutorial_val, str) else bool(tutorial_val)
+
+    if 'tutorial_level' in metadata:
+        command['tutorial_level'] = metadata['tutorial_level']
+
+    if 'tutorial_file' in metadata:
+        command['tutorial_file'] = metadata['tutorial_file']
+
+    if 'related_commands' in metadata:
+        related = metadata['related_commands']
+        if isinstance(related, str):
+            related = [r.strip() for r in related.split(',')]
+        command['related_commands'] = related
+
+    if 'tags' in metadata:
+        tags = metadata['tags']
+        if isinstance(tags, str):
+            tags = [t.strip() for t in tags.split(',')]
+        command['tags'] = tags
+
+    if 'project_types' in metadata:
+        project_types = metadata['project_types']
+        if isinstance(project_types, str):
+            project_types = [p.strip() for p in project_types.split(',')]
+        command['project_types'] = project_types
+
+    return command
+
+
 def discover_commands() -> list[dict]:
     """
     Auto-detect all commands from filesystem.
@@ -327,103 +351,74 @@ def discover_commands() -> list[dict]:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            # Parse frontmatter
-            metadata = parse_yaml_frontmatter(content)
-
-            # Infer category from path
-            category = infer_category(rel_path)
-
-            # Skip if internal category
-            if category == 'internal':
-                continue
-
-            # Get or infer command name
-            name = metadata.get('name')
-            if not name:
-                name = infer_command_name(rel_path, category)
-
-            # Get or infer description
-            description = metadata.get('description')
-            if not description:
-                # Try to extract from first heading
-                description = extract_first_heading(content)
-                if not description:
-                    # Try first paragraph
-                    description = extract_first_paragraph(content)
-                if not description:
-                    description = "No description available"
-
-            # Build command metadata
-            command = {
-                'name': name,
-                'category': category,
-                'description': description,
-                'file': rel_path
-            }
-
-            # Add optional fields if present
-            if 'subcategory' in metadata:
-                command['subcategory'] = metadata['subcategory']
-
-            if 'modes' in metadata:
-                # Parse modes if it's a string
-                modes = metadata['modes']
-                if isinstance(modes, str):
-                    modes = [m.strip() for m in modes.split(',')]
-                command['modes'] = modes
-
-            if 'arguments' in metadata:
-                command['arguments'] = metadata['arguments']
-
-                # Infer mode support from arguments
-                # If there's a 'mode' argument, extract supported modes from description
-                for arg in metadata['arguments']:
-                    if isinstance(arg, dict) and arg.get('name') == 'mode':
-                        desc = arg.get('description', '')
-                        # Extract modes from description like "(default|debug|optimize|release)"
-                        mode_match = re.search(r'\(([^)]+)\)', desc)
-                        if mode_match:
-                            modes_str = mode_match.group(1)
-                            modes = [m.strip() for m in modes_str.split('|')]
-                            command['modes'] = modes
-                        break
+            command = _command_record(filepath, rel_path, content)
+            if command is not None:
+                commands.append(command)
 
-            if 'tutorial' in metadata:
-                tutorial_val = metadata['tutorial']
-                command['tutorial'] = tutorial_val == 'true' if isinstance(tutorial_val, str) else bool(tutorial_val)
-
-            if 'tutorial_level' in metadata:
-                command['tutorial_level'] = metadata['tutorial_level']
+        except Exception as e:
+            # Log error but continue processing
+            print(f"Warning: Failed to parse {filepath}: {e}")
+            continue
 
-            if 'tutorial_file' in metadata:
-                command['tutorial_file'] = metadata['tutorial_file']
+    return commands
 
-            if 'related_commands' in metadata:
-                related = metadata['related_commands']
-                if isinstance(related, str):
-                    related = [r.strip() for r in related.split(',')]
-                command['related_commands'] = related
 
-            if 'tags' in metadata:
-                tags = metadata['tags']
-                if isinstance(tags, str):
-                    tags = [t.strip() for t in tags.split(',')]
-                command['tags'] = tags
+def _skill_record(filepath: str, content: str) -> Optional[dict]:
+    """
+    Build one skill's metadata record from its SKILL.md content.
 
-            if 'project_types' in metadata:
-                project_types = metadata['project_types']
-                if isinstance(project_types, str):
-                    project_types = [p.strip() for p in project_types.split(',')]
-                command['project_types'] = project_types
+    Args:
+        filepath: Absolute path of the SKILL.md file
+        content: File content
 
-            commands.append(command)
+    Returns:
+        Skill metadata dictionary, or None if the path is not a skill
+    """
+    rel_from_skills = os.path.relpath(filepath, SKILLS_DIR).replace('\\', '/')
+    # Path relative to project root, for stable references
+    project_root = os.path.dirname(COMMANDS_DIR)
+    rel_from_root = os.path.relpath(filepath, project_root).replace('\\', '/')
+
+    parts = rel_from_skills.split('/')
+    # parts[-1] == 'SKILL.md'; parts[-2] is the skill slug dir
+    if len(parts) < 2:
+        return None
+
+    slug = parts[-2]
+    # Category: top-level dir under skills/. For flat skills
+    # (skills/<slug>/SKILL.md, len(parts)==2), category mirrors slug.
+    category = parts[0] if len(parts) > 2 else slug
+
+    metadata = parse_yaml_frontmatter(content)
+
+    name = metadata.get('name') or slug
+
+    description = metadata.get('description')
+    if not description:
+        description = extract_first_heading(content)
+    if not description:
+        description = extract_first_paragraph(content)
+    if not description:
+        description = "No description available"
+
+    skill = {
+        'name': name,
+        'slug': slug,
+        'category': category,
+        'description': description,
+        'path': rel_from_root,
+        'file': rel_from_root,
+    }
 
-        except Exception as e:
-            # Log error but continue processing
-            print(f"Warning: Failed to parse {filepath}: {e}")
-            continue
+    # Mirror optional command-record fields when present.
+    for opt in ('tags', 'related_commands', 'project_types'):
+        if opt in metadata:
+            val = metadata[opt]
+            if isinstance(val, str):
+                val = [v.strip() for v in val.split(',')]
+            skill[opt] = val
 
-    return commands
+    return skill
 
 
 def discover_skills() -> list[dict]:
@@ -453,55 +448,13 @@ def discover_skills() -> list[dict]:
     skill_files = glob.glob(pattern, recursive=True)
 
     for filepath in skill_files:
-        rel_from_skills = os.path.relpath(filepath, SKILLS_DIR).replace('\\', '/')
-        # Path relative to project root, for stable references
-        project_root = os.path.dirname(COMMANDS_DIR)
-        rel_from_root = os.path.relpath(filepath, project_root).replace('\\', '/')
-
-        parts = rel_from_skills.split('/')
-        # parts[-1] == 'SKILL.md'; parts[-2] is the skill slug dir
-        if len(parts) < 2:
-            continue
-
-        slug = parts[-2]
-        # Category: top-level dir under skills/. For flat skills
-        # (skills/<slug>/SKILL.md, len(parts)==2), category mirrors slug.
-        category = parts[0] if len(parts) > 2 else slug
-
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            metadata = parse_yaml_frontmatter(content)
-
-            name = metadata.get('name') or slug
-
-            description = metadata.get('description')
-            if not description:
-                description = extract_first_heading(content)
-            if not description:
-                description = extract_first_paragraph(content)
-            if not description:
-                description = "No description available"
-
-            skill = {
-                'name': name,
-                'slug': slug,
-                'category': category,
-                'description': description,
-                'path': rel_from_root,
-                'file': rel_from_root,
-            }
-
-            # Mirror optional command-record fields when present.
-            for opt in ('tags', 'related_commands', 'project_types'):
-                if opt in metadata:
-                    val = metadata[opt]
-                    if isinstance(val, str):
-                        val = [v.strip() for v in val.split(',')]
-                    skill[opt] = val
-
-            skills.append(skill)
+            skill = _skill_record(filepath, content)
+            if skill is not None:
+                skills.append(skill)
 
         except Exception as e:
             print(f"Warning: Failed to parse {filepath}: {e}")
@@ -510,7 +463,114 @@ def discover_skills() -> list[dict]:
     return skills
 
 
-def cache_commands(commands: list[dict], skills: list[dict] | None = None) -> None:
+def _file_digest(data: bytes) -> str:
+    """Content hash used to tell a touched file from an edited one."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _scan_tree() -> tuple[dict, dict]:
+    """
+    List every indexable file and directory under commands/ and skills/.
+
+    Mirrors the discovery globs (`commands/**/*.md`, `skills/**/SKILL.md`):
+    hidden and `__pycache__` directories are pruned, `_`-prefixed command
+    files are skipped.
+
+    Returns:
+        (dirs, files): {rel_dir: mtime_ns} and {rel_file: kind} where kind is
+        "command" or "skill"; paths are relative to the project root.
+    """
+    dirs = {}
+    files = {}
+    for root_dir, kind in ((COMMANDS_DIR, 'command'), (SKILLS_DIR, 'skill')):
+        if not os.path.isdir(root_dir):
+            continue
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            dirnames[:] = sorted(
+                d for d in dirnames if not d.startswith('.') and d != '__pycache__'
+            )
+            rel_dir = os.path.relpath(dirpath, PROJECT_ROOT).replace('\\', '/')
+            dirs[rel_dir] = os.stat(dirpath).st_mtime_ns
+            for name in sorted(filenames):
+                if kind == 'command':
+                    if not name.endswith('.md') or name.startswith(('_', '.')):
+                        continue
+                elif name != 'SKILL.md':
+                    continue
+                files[f"{rel_dir}/{name}"] = kind
+    return dirs, files
+
+
+def _dirs_unchanged(dirs: dict) -> bool:
+    """True if every indexed directory still has its recorded mtime.
+
+    Adding, removing or renaming an entry bumps its directory's mtime, so an
+    unchanged set means the indexed file list is still complete.
+    """
+    if not dirs:
+        return False
+    try:
+        return all(
+            os.stat(os.path.join(PROJECT_ROOT, rel)).st_mtime_ns == mtime_ns
+            for rel, mtime_ns in dirs.items()
+        )
+    except OSError:
+        return False
+
+
+def _record_path(record: dict) -> str:
+    """Project-relative path of the file a command/skill record came from."""
+    if 'path' in record:
+        return record['path']
+    return f"commands/{record['file']}".replace('\\', '/')
+
+
+def _index_entry(rel: str, kind: str, st: os.stat_result, data: bytes) -> tuple:
+    """Parse one file: (record or None if not listed, index entry)."""
+    filepath = os.path.join(PROJECT_ROOT, rel)
+    record = None
+    try:
+        content = data.decode('utf-8')
+        if kind == 'command':
+            record = _command_record(filepath, os.path.relpath(filepath, COMMANDS_DIR), content)
+        else:
+            record = _skill_record(filepath, content)
+    except Exception as e:
+        print(f"Warning: Failed to parse {filepath}: {e}")
+    return record, {
+        'kind': kind,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'hash': _file_digest(data),
+    }
+
+
+def _build_index(commands: list[dict], skills: list[dict]) -> dict:
+    """Index the current tree for already-built records (no re-parse)."""
+    dirs, listing = _scan_tree()
+    files = {}
+    for rel, kind in listing.items():
+        filepath = os.path.join(PROJECT_ROOT, rel)
+        try:
+            st = os.stat(filepath)
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except OSError:
+            continue
+        files[rel] = {
+            'kind': kind,
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'hash': _file_digest(data),
+        }
+    return {'version': INDEX_VERSION, 'dirs': dirs, 'files': files}
+
+
+def cache_commands(
+    commands: list[dict],
+    skills: list[dict] | None = None,
+    index: dict | None = None,
+) -> dict:
     """
     Save commands (and optionally skills) to cache file for performance.
 
@@ -519,9 +579,16 @@ def cache_commands(commands: list[dict], skills: list[dict] | None = None) -> No
         skills: Optional list of skill metadata dictionaries. If None, skills
                 are auto-discovered via `discover_skills()` so callers that
                 pre-date the skills extension keep working.
+        index: Optional per-file index (see `_refresh_cache`). If None, one is
+               built from the given records and the files' current stat/hash.
+
+    Returns:
+        The cache dictionary that was written
     """
     if skills is None:
         skills = discover_skills()
+    if index is None:
+        index = _build_index(commands, skills)
     # Build category counts
     categories = {}
     for cmd in commands:
@@ -569,94 +636,161 @@ def cache_commands(commands: list[dict], skills: list[dict] | None = None) -> No
         'skills_count': len(skills),
         'skills_categories': skill_categories,
         'skills': skills,
+        'index': index,
     }
 
-    # Write to cache file
+    # Write to cache file. Rewritten in place (not replaced) so the commands/
+    # directory mtime — which the index watches — stays put.
+    created = not os.path.exists(CACHE_FILE) or not os.path.exists(_search_file())
+    _write_search_index(cache['generated'], build_search_index(commands, skills))
     with open(CACHE_FILE, 'w', encoding='utf-8') as f:
         json.dump(cache, f, indent=2)
+    cache_dir = os.path.relpath(os.path.dirname(CACHE_FILE), PROJECT_ROOT).replace('\\', '/')
+    if created and cache_dir in index['dirs']:
+        # Creating the cache files bumped their directory's mtime; re-stamp it
+        # so the next load doesn't mistake our own write for a new command.
+        index['dirs'][cache_dir] = os.stat(os.path.dirname(CACHE_FILE)).st_mtime_ns
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    return cache
 
 
-def load_cached_commands() -> list[dict]:
+def _search_file() -> str:
+    """Path of the search index sidecar (next to `_cache.json`)."""
+    return os.path.join(os.path.dirname(CACHE_FILE), SEARCH_FILE_NAME)
+
+
+def _write_search_index(generated: str, search: dict) -> None:
+    """Write the search index for the cache stamped `generated`, compactly."""
+    with open(_search_file(), 'w', encoding='utf-8') as f:
+        json.dump({'generated': generated, 'search': search}, f, separators=(',', ':'))
+
+
+def _read_search_index(generated: str) -> dict | None:
+    """Load the sidecar index, or None if absent, corrupt, or not built for
+    the cache stamped `generated`."""
+    try:
+        with open(_search_file(), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    search = data.get('search') if isinstance(data, dict) else None
+    if (
+        data.get('generated') != generated
+        or not isinstance(search, dict)
+        or search.get('version') != SEARCH_VERSION
+    ):
+        return None
+    return search
+
+
+def _read_cache() -> dict | None:
+    """Load `_cache.json`, or None if absent/corrupt."""
+    if not os.path.exists(CACHE_FILE):
+        return None
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Warning: Failed to load cache: {e}")
+        return None
+
+
+def _refresh_cache() -> dict:
     """
-    Load commands from cache if fresh, else regenerate.
+    Bring `_cache.json` up to date, re-parsing only files that changed.
 
-    Cache is stale if:
-    - _cache.json doesn't exist
-    - Any .md file is newer than cache file
+    The cache carries a per-file index (mtime_ns, size, content hash; the
+    parsed records stay in `commands`/`skills`, keyed back by file path) plus
+    the mtime of every indexed directory:
+
+    - All directory mtimes unchanged: no file was added or removed, so the
+      recursive listing is skipped and only the indexed files are stat'ed.
+    - A file whose (mtime_ns, size) matches is reused as-is; one whose stat
+      changed but whose hash did not is just re-stamped; only a file whose
+      content changed is re-parsed.
+
+    The cache is rewritten only when something changed.
 
     Returns:
-        List of command metadata dictionaries
+        The current cache dictionary
     """
-    # Check if cache exists
-    if not os.path.exists(CACHE_FILE):
-        # Generate new cache
-        commands = discover_commands()
-        cache_commands(commands)
-        return commands
-
-    # Get cache modification time
-    cache_mtime = os.path.getmtime(CACHE_FILE)
+    cache = _read_cache() or {}
+    index = cache.get('index')
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        index = {'version': INDEX_VERSION, 'dirs': {}, 'files': {}}
 
-    # Find all .md files (commands + skills)
-    pattern = os.path.join(COMMANDS_DIR, '**', '*.md')
-    md_files = glob.glob(pattern, recursive=True)
-    skill_pattern = os.path.join(SKILLS_DIR, '**', 'SKILL.md')
-    md_files.extend(glob.glob(skill_pattern, recursive=True))
+    records = {
+        _record_path(r): r for r in cache.get('commands', []) + cache.get('skills', [])
+    }
+    changed = False
+    dirs = index['dirs']
+    if _dirs_unchanged(dirs):
+        listing = {rel: entry['kind'] for rel, entry in index['files'].items()}
+    else:
+        dirs, listing = _scan_tree()
+        changed = True
 
-    # Check if any .md file is newer than cache
-    for filepath in md_files:
-        # Skip internal files
-        if os.path.basename(filepath).startswith('_'):
+    files = {}
+    commands = []
+    skills = []
+    for rel, kind in listing.items():
+        entry = index['files'].get(rel)
+        record = records.get(rel)
+        filepath = os.path.join(PROJECT_ROOT, rel)
+        try:
+            st = os.stat(filepath)
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                data = None
+            else:
+                with open(filepath, 'rb') as f:
+                    data = f.read()
+        except OSError:
+            changed = True
             continue
+        if data is None:
+            files[rel] = entry
+        elif entry and entry['hash'] == _file_digest(data):
+            files[rel] = dict(entry, mtime_ns=st.st_mtime_ns, size=st.st_size)
+            changed = True
+        else:
+            record, files[rel] = _index_entry(rel, kind, st, data)
+            changed = True
+        if record is not None:
+            (commands if kind == 'command' else skills).append(record)
 
-        if os.path.getmtime(filepath) > cache_mtime:
-            # Cache is stale, regenerate
-            commands = discover_commands()
-            cache_commands(commands)
-            return commands
+    # A cache that still embeds the search index predates the sidecar
+    if not changed and 'commands' in cache and 'skills' in cache and 'search' not in cache:
+        return cache
 
-    # Cache is fresh, load it
-    try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-        return cache['commands']
-    except Exception as e:
-        print(f"Warning: Failed to load cache: {e}")
-        # Regenerate on error
-        commands = discover_commands()
-        cache_commands(commands)
-        return commands
+    new_index = {'version': INDEX_VERSION, 'dirs': dirs, 'files': files}
+    return cache_commands(commands, skills, index=new_index)
+
+
+def load_cached_commands() -> list[dict]:
+    """
+    Load commands from cache, re-parsing only files that changed.
+
+    See `_refresh_cache` for the per-file invalidation rules. A missing,
+    corrupt or pre-index cache is rebuilt.
+
+    Returns:
+        List of command metadata dictionaries
+    """
+    return _refresh_cache()['commands']
 
 
 def load_cached_skills() -> list[dict]:
     """
-    Load skills from cache if present, else regenerate.
+    Load skills from cache, re-parsing only files that changed.
 
     Mirrors `load_cached_commands` but for the `skills` cache key. Safe to call
-    even if an older cache file (pre-skills) exists — falls back to a fresh
-    discovery in that case.
+    even if an older cache file (pre-skills) exists — it is rebuilt.
 
     Returns:
         List of skill metadata dictionaries
     """
-    if not os.path.exists(CACHE_FILE):
-        commands = discover_commands()
-        cache_commands(commands)
-
-    try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-        if 'skills' in cache:
-            return cache['skills']
-    except Exception as e:
-        print(f"Warning: Failed to load cache: {e}")
-
-    # Cache exists but lacks `skills` key (legacy) — regenerate.
-    commands = discover_commands()
-    cache_commands(commands)
-    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-        cache = json.load(f)
-    return cache.get('skills', [])
+    return _refresh_cache().get('skills', [])
 
 
 def get_command_stats() -> dict:
@@ -673,28 +807,7 @@ def get_command_stats() -> dict:
             "generated": "2026-01-17T12:00:00Z"
         }
     """
-    # Load cache or generate
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
-            return {
-                'total': cache['count'],
-                'categories': cache['categories'],
-                'with_modes': cache['stats']['with_modes'],
-                'with_dry_run': cache['stats']['with_dry_run'],
-                'generated': cache['generated']
-            }
-        except Exception:
-            pass
-
-    # Regenerate
-    commands = discover_commands()
-    cache_commands(commands)
-
-    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-        cache = json.load(f)
-
+    cache = _refresh_cache()
     return {
         'total': cache['count'],
         'categories': cache['categories'],
@@ -704,6 +817,54 @@ def get_command_stats() -> dict:
     }
 
 
+# (cache 'generated' stamp, SearchIndex) for the last cache seen in-process
+_SEARCH_MEMO: list = [None, None]
+
+
+def load_search_index() -> SearchIndex:
+    """
+    Load the hub search index over cached commands and skills.
+
+    The index is built whenever `_cache.json` is rewritten and stored in the
+    `_search.json` sidecar next to it (rebuilt here if missing or stale), so
+    plain cache loads never parse it. The wrapping `SearchIndex` is reused
+    in-process until the cache is regenerated.
+
+    Returns:
+        SearchIndex (see utils/search_index.py)
+    """
+    cache = _refresh_cache()
+    if _SEARCH_MEMO[0] != cache['generated'] or _SEARCH_MEMO[1] is None:
+        search = _read_search_index(cache['generated'])
+        if search is None:
+            search = build_search_index(cache['commands'], cache.get('skills', []))
+            _write_search_index(cache['generated'], search)
+        _SEARCH_MEMO[:] = [
+            cache['generated'],
+            SearchIndex(search, cache['commands'], cache.get('skills', [])),
+        ]
+    return _SEARCH_MEMO[1]
+
+
+def search(query: str, limit: int = 10) -> list[dict]:
+    """
+    Ranked, typo-tolerant search over commands and skills.
+
+    Matches names (exact, prefix, or within 1-2 edits), tags, and TF-IDF
+    weighted words from names, categories and descriptions.
+
+    Args:
+        query: Free text or a (partial/misspelled) command name,
+               e.g. 'lnt', 'code:lint', 'check broken links'
+        limit: Maximum number of results
+
+    Returns:
+        Command/skill dictionaries with added 'kind' ('command' or 'skill')
+        and 'score' keys, best match first
+    """
+    return load_search_index().search(query, limit)
+
+
 def get_commands_by_category(category: str) -> list[dict]:
     """
     Get all commands for a specific category.
@@ -714,8 +875,7 @@ def get_commands_by_category(category: str) -> list[dict]:
     Returns:
         List of command dictionaries for that category
     """
-    commands = load_cached_commands()
-    return [cmd for cmd in commands if cmd['category'] == category]
+    return load_search_index().category(category)
 
 
 def group_commands_by_subcategory(commands: list[dict]) -> dict:
@@ -798,24 +958,7 @@ def get_command_detail(command_name: str) -> dict | None:
     Returns:
         Command dictionary with all metadata, or None if not found
     """
-    commands = load_cached_commands()
-
-    # Try exact match first
-    for cmd in commands:
-        if cmd['name'] == command_name:
-            return cmd
-
-    # Try partial match (category:command or just command)
-    if ':' not in command_name:
-        # User provided just command name, search all categories
-        matches = [cmd for cmd in commands if cmd['name'].endswith(f':{command_name}')]
-        if len(matches) == 1:
-            return matches[0]
-        elif len(matches) > 1:
-            # Multiple matches, return None (caller should disambiguate)
-            return None
-
-    return None
+    return load_search_index().command(command_name)
 
 
 def generate_command_tutorial(command: dict) -> str:
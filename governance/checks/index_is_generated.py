@@ -3,13 +3,19 @@
 A generated index carries the auditor's provenance line. Usage: index_is_generated.py <index.md>"""
 import os, sys
 
+GOV = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GOV not in sys.path:
+    sys.path.insert(0, GOV)
+import fs_snapshot  # noqa: E402  governance/fs_snapshot.py: one shared scan per audit
+
 MARKER = "Generated by"
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
         print("usage: index_is_generated.py <index.md>"); return 2
-    p = os.path.expanduser(sys.argv[1])
-    if not os.path.isfile(p):
+    p = os.path.expanduser(argv[1])
+    if not fs_snapshot.current().isfile(p):
         print("  missing index: %s" % p); return 1
     head = open(p, encoding="utf-8", errors="replace").read(600)
     if MARKER not in head:
@@ -6,6 +6,10 @@ inside a skill — not only the common ``~/.claude/skills/<name>`` top-level
 layout — is still caught. Symlinked directories are not descended into
 (``followlinks=False``), which both flags broken links and avoids link cycles.
 
+The walk goes through the audit's shared `fs_snapshot` (one scandir per
+directory, shared with the other rules reading the same tree); run standalone
+it scans the given path itself.
+
 Directories named exactly ``archive`` and dot-dirs (e.g. ``.git``) are pruned
 from the walk: dead links inside archived/hidden trees are expected, not
 violations (R08 only cares about *load-bearing* links).
@@ -13,29 +17,39 @@ violations (R08 only cares about *load-bearing* links).
 Usage: no_broken_symlinks.py <dir>"""
 import os, sys
 
-def find_broken(d):
+GOV = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GOV not in sys.path:
+    sys.path.insert(0, GOV)
+import fs_snapshot  # noqa: E402  governance/fs_snapshot.py: one shared scan per audit
+
+def _pruned(name):
+    # A dir named exactly `archive` or any dot-dir (e.g. .git) is by definition
+    # not load-bearing, so dead links inside it are expected, not violations
+    # (R08's own rationale). Match on the path component (name), not a
+    # substring — "archived-data" stays in scope, only "archive" is cut.
+    return name == "archive" or name.startswith(".")
+
+
+def find_broken(d, snap=None):
     """Return [(relpath, target), ...] for every broken symlink under d."""
+    snap = snap or fs_snapshot.current()
+    d = os.path.abspath(d)
     broken = []
-    for root, dirs, files in os.walk(d, followlinks=False):
-        # Prune archived/hidden trees in place so os.walk never descends into
-        # them: a dir named exactly `archive` or any dot-dir (e.g. .git) is by
-        # definition not load-bearing, so dead links inside it are expected, not
-        # violations (R08's own rationale). Match on the path component (name),
-        # not a substring — "archived-data" stays in scope, only "archive" is cut.
-        dirs[:] = [n for n in dirs if n != "archive" and not n.startswith(".")]
-        # A broken symlink can't be stat'd as a dir, so os.walk classifies it
-        # under `files`; scan both lists to be safe across platforms.
+    for root, dirs, files in snap.walk(d, prune=_pruned):
+        # A symlink (broken or not) is never descended into and lands in
+        # `files`; scan both lists to be safe.
         for name in sorted(dirs + files):
             p = os.path.join(root, name)
-            if os.path.islink(p) and not os.path.exists(p):
-                broken.append((os.path.relpath(p, d), os.readlink(p)))
+            if snap.islink(p) and not snap.exists(p):
+                broken.append((os.path.relpath(p, d), snap.readlink(p)))
     return broken
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
         print("usage: no_broken_symlinks.py <dir>"); return 2
-    d = os.path.expanduser(sys.argv[1])
-    if not os.path.isdir(d):
+    d = os.path.expanduser(argv[1])
+    if not fs_snapshot.current().isdir(d):
         print("skip: %s is not a directory" % d); return 0
     broken = find_broken(d)
     for n, t in broken:
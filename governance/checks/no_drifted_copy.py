@@ -19,71 +19,179 @@ Two modes (mirrors the R03 checker):
 Needs a consumer surface and >= 1 canon present; on a runner without the canon
 repos the check is vacuous — say so out loud, never a silent pass.
 
-Usage: no_drifted_copy.py <consumer_dir_or_fixture_root> [<canon_dir> ...]
+Comparison is by digest, in one pass: the canon index and the consumer listing
+are built once, then every installed name is checked against its canon. A size
+mismatch is drift without reading either file; equal sizes compare blake2b
+digests. Digests live in a `DigestIndex` of (size, mtime_ns, blake2b) per path,
+so a file is re-hashed only when its stat changes. The index is kept in memory
+for the life of the process (the engine imports this checker once) and, when
+GOVERNANCE_DIGEST_INDEX names a file, persisted there across runs — the canon
+and consumer trees may sit on a slow network home dir.
+
+Listings and stats come from the audit's shared `fs_snapshot` (R01 lists the
+same canons, R02/R08 walk the same consumer tree); standalone, the checker
+scans for itself.
+
+`--json` prints a machine-readable drift report instead of the text lines
+(same exit code).
+
+Usage: no_drifted_copy.py [--json] <consumer_dir_or_fixture_root> [<canon_dir> ...]
 """
-import os, sys
+import hashlib, json, os, sys
+
+GOV = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GOV not in sys.path:
+    sys.path.insert(0, GOV)
+import fs_snapshot  # noqa: E402  governance/fs_snapshot.py: one shared scan per audit
 
 DEFAULT_CANONS = [
     os.path.expanduser("~/projects/dev-tools/savant/src/plugin-api/skills"),
     os.path.expanduser("~/projects/dev-tools/scholar/src/plugin-api/skills"),
 ]
+INDEX_VERSION = 1
+_CHUNK = 1 << 20
 
 
-def skill_md(d, name):
+def skill_md(d, name, snap=None):
     p = os.path.join(d, name, "SKILL.md")
-    return p if os.path.isfile(p) else None
+    return p if (snap or fs_snapshot.current()).isfile(p) else None
 
 
-def canon_index(canon_dirs):
+def canon_index(canon_dirs, snap=None):
     """{skill_name: SKILL.md path} across the given canon dirs (first wins)."""
+    snap = snap or fs_snapshot.current()
     out = {}
     for c in canon_dirs:
-        if os.path.isdir(c):
-            for n in sorted(os.listdir(c)):
-                p = skill_md(c, n)
-                if p:
-                    out.setdefault(n, p)
+        for n in snap.listdir(c):
+            p = skill_md(c, n, snap)
+            if p:
+                out.setdefault(n, p)
     return out
 
 
-def _read(p):
-    with open(p, "rb") as f:
-        return f.read()
-
-
-def resolve(arg):
+class DigestIndex:
+    """{path: [size, mtime_ns, blake2b hex]}; a file is hashed only when its
+    (size, mtime_ns) differs from the stored entry."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    d = json.load(f)
+                if d.get("version") == INDEX_VERSION:
+                    self.entries = d.get("files", {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+    def digest(self, p, st):
+        key = os.path.abspath(p)
+        hit = self.entries.get(key)
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+        h = hashlib.blake2b()
+        with open(p, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b""):
+                h.update(chunk)
+        self.entries[key] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        self.dirty = True
+        return self.entries[key][2]
+
+    def save(self):
+        """Best-effort atomic write; an unwritable index only costs re-hashing."""
+        if not (self.path and self.dirty):
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = "%s.%d.tmp" % (self.path, os.getpid())
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "files": self.entries}, f)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+_INDEXES = {}  # persisted-file path (or None) -> DigestIndex, reused across in-process runs
+
+
+def digest_index():
+    path = os.environ.get("GOVERNANCE_DIGEST_INDEX") or None
+    if path not in _INDEXES:
+        _INDEXES[path] = DigestIndex(path)
+    return _INDEXES[path]
+
+
+def compare(consumer, canons, index, snap=None):
+    """One pass over every installed skill that has a canon. Returns the report:
+    {consumer, canons, compared, drifted: [{name, reason, consumer, canon,
+    consumer_size, canon_size}]}; reason is "size" (decided from stat alone) or
+    "content" (digests differ)."""
+    snap = snap or fs_snapshot.current()
+    canon = canon_index(canons, snap)
+    report = {"consumer": consumer, "canons": canons, "compared": 0, "drifted": []}
+    for name in sorted(set(snap.listdir(consumer)) & set(canon)):
+        cons_md = skill_md(consumer, name, snap)
+        if not cons_md:
+            continue  # not installed here (or structured differently) — not a drifted copy
+        st_cons, st_canon = snap.stat(cons_md), snap.stat(canon[name])
+        report["compared"] += 1
+        if st_cons.st_size != st_canon.st_size:
+            reason = "size"
+        elif index.digest(cons_md, st_cons) != index.digest(canon[name], st_canon):
+            reason = "content"
+        else:
+            continue
+        report["drifted"].append({
+            "name": name, "reason": reason, "consumer": cons_md, "canon": canon[name],
+            "consumer_size": st_cons.st_size, "canon_size": st_canon.st_size,
+        })
+    return report
+
+
+def resolve(arg, canon_args=()):
     """Return (consumer_dir, canon_dirs). FIXTURE mode when arg has consumer/ +
     canon/ subdirs; else LIVE mode (default canons, or extra argv canons)."""
     consumer_sub, canon_sub = os.path.join(arg, "consumer"), os.path.join(arg, "canon")
     if os.path.isdir(consumer_sub) and os.path.isdir(canon_sub):
         return consumer_sub, [canon_sub]
-    canons = [os.path.expanduser(a) for a in sys.argv[2:]] or DEFAULT_CANONS
+    canons = [os.path.expanduser(a) for a in canon_args] or DEFAULT_CANONS
     return arg, [c for c in canons if os.path.isdir(c)]
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("usage: no_drifted_copy.py <consumer_dir_or_fixture_root> [<canon_dir> ...]")
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    args = [a for a in argv[1:] if a != "--json"]
+    as_json = len(args) != len(argv) - 1
+    if not args:
+        print("usage: no_drifted_copy.py [--json] <consumer_dir_or_fixture_root> [<canon_dir> ...]")
         return 2
-    consumer, canons = resolve(sys.argv[1])
-    if not os.path.isdir(consumer):
-        print("  skip: consumer dir absent: %s" % consumer)
-        return 0
-    if not canons:
-        print("  skip: no canon dir present -> drift check is vacuous here")
+    consumer, canons = resolve(args[0], args[1:])
+    snap = fs_snapshot.current()
+    skip = None
+    if not snap.isdir(consumer):
+        skip = "consumer dir absent: %s" % consumer
+    elif not canons:
+        skip = "no canon dir present -> drift check is vacuous here"
+    if skip:
+        if as_json:
+            print(json.dumps({"consumer": consumer, "canons": canons, "skipped": skip}))
+        else:
+            print("  skip: %s" % skip)
         return 0
-    drifted = []
-    for name, canon_md in sorted(canon_index(canons).items()):
-        cons_md = skill_md(consumer, name)
-        if not cons_md:
-            continue  # not installed here (or structured differently) — not a drifted copy
-        if _read(cons_md) != _read(canon_md):
-            drifted.append(name)
-            print("  drifted copy: '%s' SKILL.md differs from canon — re-consume via `plugin update`" % name)
-    if drifted:
-        return 1
-    print("  ok: no consumer skill has drifted from its canon SKILL.md")
-    return 0
+    index = digest_index()
+    report = compare(consumer, canons, index, snap)
+    index.save()
+    if as_json:
+        print(json.dumps(report, indent=2))
+    elif report["drifted"]:
+        for d in report["drifted"]:
+            print("  drifted copy: '%s' SKILL.md differs from canon — re-consume via `plugin update`" % d["name"])
+    else:
+        print("  ok: no consumer skill has drifted from its canon SKILL.md")
+    return 1 if report["drifted"] else 0
 
 
 if __name__ == "__main__":
@@ -1,26 +1,30 @@
 #!/usr/bin/env python3
 """R01 checker: exit 1 if any skill name appears in more than one canon.
 Usage: no_duplicate_canon.py [<canon_skills_dir> ...]
-Defaults to the savant + scholar skill dirs when no args are given."""
+Defaults to the savant + scholar skill dirs when no args are given. Listings come
+from the audit's shared fs_snapshot (R04 lists the same canons)."""
 import os, sys
 
+GOV = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GOV not in sys.path:
+    sys.path.insert(0, GOV)
+import fs_snapshot  # noqa: E402  governance/fs_snapshot.py: one shared scan per audit
+
 DEFAULT_CANONS = [
     os.path.expanduser("~/projects/dev-tools/savant/src/plugin-api/skills"),
     os.path.expanduser("~/projects/dev-tools/scholar/src/plugin-api/skills"),
 ]
 
-def skills_in(d):
-    out = set()
-    if os.path.isdir(d):
-        for n in os.listdir(d):
-            if os.path.isfile(os.path.join(d, n, "SKILL.md")):
-                out.add(n)
-    return out
+def skills_in(d, snap=None):
+    snap = snap or fs_snapshot.current()
+    return {n for n in snap.listdir(d) if snap.isfile(os.path.join(d, n, "SKILL.md"))}
 
-def main():
-    canons = [os.path.expanduser(a) for a in sys.argv[1:]] or DEFAULT_CANONS
-    present = [c for c in canons if os.path.isdir(c)]
-    missing = [c for c in canons if not os.path.isdir(c)]
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    canons = [os.path.expanduser(a) for a in argv[1:]] or DEFAULT_CANONS
+    snap = fs_snapshot.current()
+    present = [c for c in canons if snap.isdir(c)]
+    missing = [c for c in canons if not snap.isdir(c)]
     for c in missing:
         print("  skip: canon dir absent: %s" % c)
     # A cross-canon duplicate needs >=2 canons actually present. On a runner
@@ -31,7 +35,7 @@ def main():
         return 0
     seen, dups = {}, {}
     for c in present:
-        for s in skills_in(c):
+        for s in skills_in(c, snap):
             if s in seen:
                 dups.setdefault(s, [seen[s]]).append(c)
             else:
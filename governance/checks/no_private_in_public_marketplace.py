@@ -71,11 +71,12 @@ def offenders(doc):
     return [(n, ref) for n, ref in repo_refs(doc) if basename(ref) in deny]
 
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
         print("usage: no_private_in_public_marketplace.py <marketplace.json | dir>")
         return 2
-    arg = os.path.expanduser(sys.argv[1])
+    arg = os.path.expanduser(argv[1])
     mpath = resolve(arg)
     if mpath is None:
         print("  skip: no marketplace.json at %s" % arg)
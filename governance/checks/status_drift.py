@@ -102,11 +102,12 @@ def ground_truth(root):
     return manifest_version(root), git_tags(root)
 
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
         print("usage: status_drift.py <repo_root_or_fixture_root>")
         return 2
-    root = sys.argv[1]
+    root = argv[1]
     status_path = os.path.join(root, ".STATUS")
     if not os.path.isfile(status_path):
         print("  skip: no .STATUS at %s -> drift check is vacuous here" % root)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Shared filesystem snapshot for the governance checkers.
+
+Several rules read the same tree: R02/R08 walk ``~/.claude/skills`` for dead
+links, R04 lists it (and the canons) for installed SKILL.md files, R01 lists the
+canons again, R06 stats the index inside it, and the engine's ``inputs`` digest
+walks it once more. Within one audit they all ask one `Snapshot`, so each
+directory is listed once (``os.scandir``) and each path stat'ed at most once —
+audit I/O scales with the tree, not with the number of rules.
+
+  snap = fs_snapshot.current()      # the audit's shared snapshot, or a fresh one
+  for root, dirs, files in snap.walk(d, prune=lambda n: n.startswith(".")): ...
+  snap.listdir(d); snap.isfile(p); snap.islink(p); snap.exists(p); snap.stat(p)
+
+`walk` mirrors ``os.walk(followlinks=False)``: symlinks are listed (a link to a
+directory under ``files``, with no descent), so link cycles are harmless. Point
+lookups (``isfile``/``exists``/``stat``) follow links like their ``os.path``
+namesakes.
+
+The engine opens a `session()` around an audit; outside one, `current()` hands
+out a new snapshot per call, so a checker run standalone (or called repeatedly
+from a test) always sees the live filesystem. Stdlib-only, thread-safe: rules
+run concurrently and may ask for the same directory at once.
+"""
+import contextlib
+import os
+import stat
+import threading
+
+_MISSING = object()
+
+
+class Snapshot:
+    """Point-in-time view of whatever directories and paths are asked for."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirs = {}    # abs dir -> ([(name, is_dir, is_link)], ...) listing, or None if unlistable
+        self._lstat = {}   # abs path -> os.stat_result or _MISSING
+        self._stat = {}    # abs path -> os.stat_result (links followed) or _MISSING
+
+    # -- listing ----------------------------------------------------------
+    def _listing(self, d):
+        d = os.path.abspath(os.path.expanduser(d))
+        hit = self._dirs.get(d, _MISSING)
+        if hit is not _MISSING:
+            return d, hit
+        try:
+            with os.scandir(d) as it:
+                rows = sorted((e.name, e.is_dir(follow_symlinks=False), e.is_symlink()) for e in it)
+        except OSError:
+            rows = None
+        with self._lock:
+            return d, self._dirs.setdefault(d, rows)
+
+    def listdir(self, d):
+        """Entry names of directory `d` (links followed for `d` itself), sorted;
+        [] when it is absent or unreadable."""
+        return [name for name, _, _ in self._listing(d)[1] or ()]
+
+    def walk(self, top, prune=None):
+        """``os.walk(top, followlinks=False)`` over the snapshot, top-down;
+        subdirectories whose name satisfies `prune` are not entered."""
+        stack = [os.path.abspath(os.path.expanduser(top))]
+        while stack:
+            root, rows = self._listing(stack.pop())
+            if rows is None:
+                continue
+            dirs = [n for n, is_dir, _ in rows if is_dir and not (prune and prune(n))]
+            files = [n for n, is_dir, _ in rows if not is_dir]
+            yield root, dirs, files
+            stack.extend(os.path.join(root, n) for n in reversed(dirs))
+
+    # -- point lookups ------------------------------------------------------
+    def lstat(self, p):
+        """os.lstat(p), memoized; None when the path does not exist."""
+        return self._memo(self._lstat, p, os.lstat)
+
+    def stat(self, p):
+        """os.stat(p) (links followed), memoized; None when it does not resolve."""
+        return self._memo(self._stat, p, os.stat)
+
+    def _memo(self, table, p, fn):
+        p = os.path.abspath(os.path.expanduser(p))
+        hit = table.get(p, _MISSING)
+        if hit is _MISSING:
+            try:
+                hit = fn(p)
+            except OSError:
+                hit = None
+            table[p] = hit
+        return hit
+
+    def islink(self, p):
+        st = self.lstat(p)
+        return st is not None and stat.S_ISLNK(st.st_mode)
+
+    def exists(self, p):
+        return self.stat(p) is not None
+
+    def isdir(self, p):
+        st = self.stat(p)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def isfile(self, p):
+        st = self.stat(p)
+        return st is not None and stat.S_ISREG(st.st_mode)
+
+    def readlink(self, p):
+        return os.readlink(os.path.expanduser(p))
+
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def session():
+    """Share one Snapshot among every `current()` caller until exit (one audit)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        outer, _SESSION = _SESSION, _SESSION or Snapshot()
+    try:
+        yield _SESSION
+    finally:
+        with _SESSION_LOCK:
+            _SESSION = outer
+
+
+def current():
+    """The session snapshot while an audit runs; otherwise a fresh one."""
+    return _SESSION or Snapshot()
@@ -14,15 +14,35 @@ applies severity + waivers, and reports. Two modes:
                check, and verify every waiver has an owner + a future expiry.
                Exit 1 if any checker misbehaves.
 
+Checkers run concurrently on a bounded thread pool (--jobs), each under a
+per-rule wall-clock timeout (--timeout; a timed-out checker is an ERROR). By
+default each checks/*.py is imported ONCE and its main(argv) called in-process
+with stdout/stderr captured per thread — no interpreter start per rule.
+--isolate runs every checker in its own subprocess instead; a checker that
+cannot be imported (or has no main(argv)) always falls back to one. --json
+reports each rule's wall time and execution mode. In-process checkers (and the
+`inputs` digest below) read the filesystem through one shared fs_snapshot per
+audit, so a tree several rules inspect is listed and stat'ed once.
+
+A script check may declare `inputs:` — globs over the substituted paths naming
+everything its verdict depends on. With --cache FILE, such a rule's result is
+keyed by a digest of the matched inputs (path, type, size, mtime_ns; for a link
+its target and whether it resolves) plus the cmd and checker file; when the key
+is unchanged the stored result is reported with `cached: true` and the checker
+does not run. Rules without `inputs` always run.
+
 Stdlib + PyYAML. Paths in RULES.yaml are relative to this file's directory.
   python3 run_rules.py [--target DIR] [--index FILE] [--marketplace FILE] [--json] [--selftest]
+                       [--jobs N] [--timeout SECS] [--isolate] [--cache FILE]
 """
-import os, sys, json, subprocess, datetime, argparse
+import os, sys, io, json, queue, inspect, threading, time, traceback, subprocess, datetime, argparse
+import ast, importlib.util, fnmatch, glob, hashlib, stat
 try:
     import yaml
 except ImportError:
     sys.stderr.write("PyYAML required: pip install pyyaml\n"); sys.exit(2)
 import soak  # sibling module: soak-then-flip promotion ledger
+import fs_snapshot  # sibling module: one shared filesystem scan per audit
 
 GOV = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(GOV)  # craft repo root = parent of governance/
@@ -33,6 +53,10 @@ DEF_MARKETPLACE = os.path.join(REPO_ROOT, ".claude-plugin", "marketplace.json")
 # Soak ledger — LOCAL + gitignored (per-machine soak evidence, never committed).
 DEF_STATE = os.path.join(GOV, "STATE.json")
 SOAK_WINDOW_DAYS = 14
+DEF_JOBS = min(8, os.cpu_count() or 1)
+# Per rule. The SessionStart hook gives the WHOLE audit 10s, so a hung checker
+# must be cut off well inside that.
+DEF_TIMEOUT = 8.0
 
 
 def load_rules():
@@ -40,16 +64,272 @@ def load_rules():
         return yaml.safe_load(f)
 
 
-def run_script(cmd_str, subs):
-    """cmd_str like 'checks/x.py {target}'. Returns (rc, output)."""
+def _split_cmd(cmd_str, subs):
     parts = cmd_str.format(**subs).split()
-    script = os.path.join(GOV, parts[0])
+    return os.path.join(GOV, parts[0]), parts
+
+
+def run_script(cmd_str, subs, timeout=None):
+    """cmd_str like 'checks/x.py {target}'. Returns (rc, output). Subprocess mode."""
+    script, parts = _split_cmd(cmd_str, subs)
     if not os.path.exists(script):
         return None, "checker not found: %s" % parts[0]
-    p = subprocess.run([sys.executable, script] + parts[1:], capture_output=True, text=True)
+    try:
+        p = subprocess.run([sys.executable, script] + parts[1:], capture_output=True, text=True,
+                           timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, "checker timed out after %gs" % timeout
     return p.returncode, (p.stdout + p.stderr).rstrip()
 
 
+# --- in-process execution ----------------------------------------------------
+# Each checker is imported once per process; its main(argv) runs on a worker
+# thread while sys.stdout/sys.stderr are routed to that thread's own buffer.
+
+_CHECKERS = {}                  # script path -> main callable, or None (use subprocess)
+_CHECKERS_LOCK = threading.Lock()
+_CAPTURE = threading.local()    # .buf: the current thread's capture buffer
+_KILL_GRACE = 2.0               # seconds a timed-out subprocess gets to be reaped
+
+
+class _ThreadStream(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr: a thread with a capture buffer writes
+    there, every other thread writes through to the original stream."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def write(self, s):
+        buf = getattr(_CAPTURE, "buf", None)
+        (buf if buf is not None else self._fallback).write(s)
+        return len(s)
+
+    def flush(self):
+        if getattr(_CAPTURE, "buf", None) is None:
+            self._fallback.flush()
+
+
+def _importable(script):
+    """True when importing `script` has no side effects beyond definitions: it
+    defines a top-level main(argv) and guards its entry point with
+    `if __name__ == "__main__"`. Anything else only ever runs as a subprocess."""
+    try:
+        with open(script, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), script)
+    except (OSError, SyntaxError, ValueError):
+        return False
+    has_main = any(isinstance(n, ast.FunctionDef) and n.name == "main" and n.args.args
+                   for n in tree.body)
+    has_guard = any(isinstance(n, ast.If) and "__main__" in ast.dump(n.test) for n in tree.body)
+    return has_main and has_guard
+
+
+def load_checker(script):
+    """main(argv) of checks/<x>.py, imported once; None when it can't be called
+    in-process (not import-safe, or fails to import) -> subprocess fallback."""
+    with _CHECKERS_LOCK:
+        if script not in _CHECKERS:
+            fn = None
+            if _importable(script):
+                name = "governance_check_" + os.path.splitext(os.path.basename(script))[0]
+                try:
+                    spec = importlib.util.spec_from_file_location(name, script)
+                    mod = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(mod)
+                    fn = mod.main
+                except BaseException:
+                    fn = None
+            _CHECKERS[script] = fn
+        return _CHECKERS[script]
+
+
+def run_inproc(fn, argv):
+    """Call a checker's main(argv) with this thread's output captured. Mirrors
+    the subprocess exit semantics: None -> 0, SystemExit -> its code, an
+    uncaught exception -> 1 with the traceback in the output."""
+    buf = io.StringIO()
+    _CAPTURE.buf = buf
+    try:
+        rc = fn(argv)
+    except SystemExit as e:
+        rc = e.code
+        if rc is not None and not isinstance(rc, int):
+            print(rc, file=sys.stderr)
+            rc = 1
+    except Exception:
+        traceback.print_exc()
+        rc = 1
+    finally:
+        _CAPTURE.buf = None
+    return (0 if rc is None else rc), buf.getvalue().rstrip()
+
+
+def _plan_check(cmd_str, subs, isolate):
+    """(mode, runner) for one call; mode is "inproc", "subprocess" or "none"."""
+    script, parts = _split_cmd(cmd_str, subs)
+    if not os.path.exists(script):
+        return "none", lambda timeout: (None, "checker not found: %s" % parts[0])
+    fn = None if isolate else load_checker(script)
+    if fn is None:
+        return "subprocess", lambda timeout: run_script(cmd_str, subs, timeout=timeout)
+    return "inproc", lambda timeout: run_inproc(fn, [script] + parts[1:])
+
+
+def run_check(cmd_str, subs, isolate=False, timeout=None):
+    """Returns (rc, output, mode); rc None = checker missing / timed out."""
+    mode, runner = _plan_check(cmd_str, subs, isolate)
+    rc, out = runner(timeout)
+    return rc, out, mode
+
+
+def run_checks(calls, jobs=DEF_JOBS, timeout=DEF_TIMEOUT, isolate=False):
+    """Run [(cmd_str, subs), ...] on up to `jobs` threads. Returns, in input
+    order, {rc, output, mode, wall_ms} per call.
+
+    A call still running `timeout` seconds after it STARTED is reported as
+    rc None ("timed out") and its slot handed to the next call. A subprocess is
+    killed by its own timeout; an in-process checker can't be, so its daemon
+    thread is abandoned and whatever it returns later is discarded."""
+    n = len(calls)
+    results = [None] * n
+    started = [None] * n
+    modes = [None] * n
+    abandoned = set()
+    slots = threading.Semaphore(max(1, jobs))
+    lock = threading.Lock()
+    done = queue.Queue()
+    streams = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = (s if isinstance(s, _ThreadStream) else _ThreadStream(s)
+                              for s in streams)
+
+    def work(i):
+        slots.acquire()
+        started[i] = time.monotonic()
+        cmd, subs = calls[i]
+        mode = "none"
+        try:
+            mode, runner = _plan_check(cmd, subs, isolate)
+            modes[i] = mode
+            rc, out = runner(timeout)
+        except Exception as e:  # runner bug, not a checker verdict
+            rc, out = None, "runner error: %s" % e
+        wall = (time.monotonic() - started[i]) * 1000
+        with lock:
+            if i in abandoned:
+                return
+            results[i] = {"rc": rc, "output": out, "mode": mode, "wall_ms": round(wall, 1)}
+            slots.release()
+        done.put(i)
+
+    def limit(i):
+        # subprocess.run enforces its own timeout; give it a moment to kill the
+        # child and report before the thread is abandoned.
+        return timeout + (_KILL_GRACE if modes[i] == "subprocess" else 0)
+
+    try:
+        for i in range(n):
+            threading.Thread(target=work, args=(i,), daemon=True).start()
+        pending = set(range(n))
+        while pending:
+            deadlines = [started[i] + limit(i) for i in pending if started[i] is not None]
+            wait = max(0.0, min(deadlines) - time.monotonic()) if deadlines else 0.01
+            try:
+                pending.discard(done.get(timeout=wait))
+                continue
+            except queue.Empty:
+                pass
+            now = time.monotonic()
+            for i in list(pending):
+                if started[i] is None or now - started[i] < limit(i):
+                    continue
+                with lock:
+                    if results[i] is None:
+                        abandoned.add(i)
+                        results[i] = {"rc": None, "output": "checker timed out after %gs" % timeout,
+                                      "mode": modes[i] or "none", "wall_ms": round(timeout * 1000, 1)}
+                        slots.release()
+                pending.discard(i)
+    finally:
+        # An abandoned in-process checker may still print: keep the routing
+        # streams installed for the rest of the process so its output lands in
+        # its own (discarded) buffer instead of e.g. the --json report.
+        if not abandoned:
+            sys.stdout, sys.stderr = streams
+    return results
+
+
+# --- per-rule result cache ---------------------------------------------------
+
+RULE_CACHE_VERSION = 1
+
+
+def expand_inputs(patterns, subs):
+    """Sorted paths matched by a rule's `inputs` globs. `~` is expanded. A `**`
+    segment walks everything below its base (symlinks listed, not followed;
+    dot-dirs pruned) and may be followed by one name pattern (`{target}/**/SKILL.md`);
+    every other pattern is a plain glob.glob."""
+    paths = set()
+    for pat in patterns:
+        pat = os.path.expanduser(pat.format(**subs))
+        if "**" not in pat:
+            paths.update(glob.glob(pat))
+            continue
+        base, _, name = pat.partition("**")
+        base, name = base.rstrip("/") or "/", name.strip("/")
+        for root, dirs, files in fs_snapshot.current().walk(base, prune=lambda d: d.startswith(".")):
+            paths.update(os.path.join(root, n) for n in dirs + files
+                         if not name or fnmatch.fnmatch(n, name))
+    return sorted(paths)
+
+
+def input_digest(rule, subs):
+    """Cache key for a rule's result, or None when it declares no `inputs`."""
+    chk = rule.get("check", {}) or {}
+    patterns = chk.get("inputs")
+    if not patterns:
+        return None
+    script, parts = _split_cmd(chk["cmd"], subs)
+    h = hashlib.blake2b(digest_size=16)
+    for part in [json.dumps(parts), json.dumps(patterns), _stat_line(script)]:
+        h.update(part.encode() + b"\0")
+    for p in expand_inputs(patterns, subs):
+        h.update(_stat_line(p).encode() + b"\0")
+    return h.hexdigest()
+
+
+def _stat_line(path):
+    snap = fs_snapshot.current()
+    st = snap.lstat(path)
+    if st is None:
+        return "%s missing" % path
+    if stat.S_ISLNK(st.st_mode):
+        return "%s -> %s %s" % (path, os.readlink(path), snap.exists(path))
+    return "%s %o %d %d" % (path, stat.S_IFMT(st.st_mode), st.st_size, st.st_mtime_ns)
+
+
+def load_rule_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            d = json.load(f)
+        if d.get("version") == RULE_CACHE_VERSION and isinstance(d.get("rules"), dict):
+            return d["rules"]
+    except Exception:
+        pass
+    return {}
+
+
+def save_rule_cache(path, entries):
+    """Best-effort atomic write; a cache that can't be written is just a miss next time."""
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = "%s.%d.tmp" % (path, os.getpid())
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": RULE_CACHE_VERSION, "rules": entries}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def active_waiver(rule):
     today = datetime.date.today().isoformat()
     for w in rule.get("waivers") or []:
@@ -59,18 +339,52 @@ def active_waiver(rule):
     return None
 
 
-def audit(rules_doc, target, index, as_json, marketplace=None):
+def reads_inputs(rule, inputs):
+    """True when the rule's script cmd substitutes any of `inputs` (e.g. "target")."""
+    chk = rule.get("check", {}) or {}
+    return chk.get("kind") == "script" and any("{%s}" % n in chk.get("cmd", "") for n in inputs)
+
+
+def audit(rules_doc, target, index, as_json, marketplace=None,
+          jobs=DEF_JOBS, timeout=DEF_TIMEOUT, isolate=False, inputs=None, cache=None):
+    with fs_snapshot.session():
+        return _audit(rules_doc, target, index, as_json, marketplace, jobs, timeout, isolate,
+                      inputs, cache)
+
+
+def _audit(rules_doc, target, index, as_json, marketplace, jobs, timeout, isolate, inputs, cache):
     subs = {"target": target, "index": index, "marketplace": marketplace}
+    active = [r for r in rules_doc["rules"] if r.get("status") == "active"]
+    if inputs is not None:
+        # Partial re-audit (session hook): only the rules reading a changed input.
+        active = [r for r in active if reads_inputs(r, inputs)]
+    scripted = [r for r in active if (r.get("check", {}) or {}).get("kind", "manual") == "script"]
+    t0 = time.monotonic()
+    stored = load_rule_cache(cache) if cache else {}
+    keys, runs = {}, {}
+    for r in scripted if cache else ():
+        keys[r["id"]] = key = input_digest(r, subs)
+        hit = stored.get(r["id"])
+        if key and hit and hit.get("key") == key:
+            runs[r["id"]] = dict(hit["run"], cached=True, wall_ms=0.0)
+    todo = [r for r in scripted if r["id"] not in runs]
+    for r, run in zip(todo, run_checks([(r["check"]["cmd"], subs) for r in todo], jobs, timeout, isolate)):
+        runs[r["id"]] = dict(run, cached=False)
+        if keys.get(r["id"]) and run["rc"] is not None:  # never cache a missing/timed-out checker
+            stored[r["id"]] = {"key": keys[r["id"]], "run": run}
+    if cache and todo:
+        save_rule_cache(cache, stored)
+    wall_ms = round((time.monotonic() - t0) * 1000, 1)
     results, red = [], 0
-    for r in rules_doc["rules"]:
-        if r.get("status") != "active":
-            continue
+    for r in active:
         chk = r.get("check", {}) or {}
         kind = chk.get("kind", "manual")
         sev = r.get("severity", "warn")
-        rc, out = None, ""
+        rc, out, timing = None, "", {}
         if kind == "script":
-            rc, out = run_script(chk["cmd"], subs)
+            run = runs[r["id"]]
+            rc, out = run["rc"], run["output"]
+            timing = {"wall_ms": run["wall_ms"], "mode": run["mode"], "cached": run["cached"]}
             state = "PASS" if rc == 0 else ("FAIL" if rc else "ERROR")
         elif kind == "external":
             state = "EXTERNAL"  # supplied by skills-audit.py cross-surface auditor; not run here
@@ -84,14 +398,16 @@ def audit(rules_doc, target, index, as_json, marketplace=None):
         # never wave the gate through silently — that defeats the engine.
         if state in ("FAIL", "ERROR") and sev == "error":
             red += 1
-        results.append({"id": r["id"], "severity": sev, "state": state, "kind": kind, "output": out, "waiver": bool(waiver)})
+        results.append(dict({"id": r["id"], "severity": sev, "state": state, "kind": kind, "output": out, "waiver": bool(waiver)}, **timing))
 
     if as_json:
-        print(json.dumps({"results": results, "red": red}, indent=2)); return 1 if red else 0
+        print(json.dumps({"results": results, "red": red, "wall_ms": wall_ms, "jobs": jobs}, indent=2))
+        return 1 if red else 0
     print("GOVERNANCE AUDIT  scope=%s  posture=%s" % (rules_doc.get("scope"), rules_doc.get("posture")))
     for x in results:
         tag = {"PASS": "ok  ", "FAIL": "FAIL", "WAIVED": "waiv", "ERROR": "ERR ", "EXTERNAL": "ext ", "MANUAL": "man "}.get(x["state"], "?")
-        print("  [%s] %-22s %-8s %s" % (tag, x["id"], x["severity"], x["state"]))
+        print("  [%s] %-22s %-8s %s%s" % (tag, x["id"], x["severity"], x["state"],
+                                           " (cached)" if x.get("cached") else ""))
         if x["output"]:
             for line in x["output"].splitlines():
                 print("        " + line)
@@ -99,22 +415,31 @@ def audit(rules_doc, target, index, as_json, marketplace=None):
     return 1 if red else 0
 
 
-def selftest(rules_doc):
+def selftest(rules_doc, jobs=DEF_JOBS, timeout=DEF_TIMEOUT, isolate=False):
     print("GOVERNANCE SELFTEST (meta-validation)")
     bad_meta = 0
     today = datetime.date.today().isoformat()
+    # Every bad/good fixture run goes through one parallel batch up front.
+    # Map every substitution name to the fixture path; a rule's cmd uses
+    # only one of {target}/{index}/{marketplace}, but supplying all three
+    # keeps .format(**subs) from raising KeyError on the unused ones.
+    calls = []
+    for r in rules_doc["rules"]:
+        chk = r.get("check", {}) or {}
+        fx = chk.get("fixtures")
+        if fx:
+            for which in ("bad", "good"):
+                path = os.path.join(GOV, fx[which])
+                calls.append((chk["cmd"], {"target": path, "index": path, "marketplace": path}))
+    with fs_snapshot.session():
+        fixture_rcs = iter(run["rc"] for run in run_checks(calls, jobs, timeout, isolate))
     for r in rules_doc["rules"]:
         rid, sev = r["id"], r.get("severity")
         chk = r.get("check", {}) or {}
         fx = chk.get("fixtures")
         # 1) checker must behave on its fixtures
         if fx:
-            bad_path, good_path = os.path.join(GOV, fx["bad"]), os.path.join(GOV, fx["good"])
-            # Map every substitution name to the fixture path; a rule's cmd uses
-            # only one of {target}/{index}/{marketplace}, but supplying all three
-            # keeps .format(**subs) from raising KeyError on the unused ones.
-            rc_bad, _ = run_script(chk["cmd"], {"target": bad_path, "index": bad_path, "marketplace": bad_path})
-            rc_good, _ = run_script(chk["cmd"], {"target": good_path, "index": good_path, "marketplace": good_path})
+            rc_bad, rc_good = next(fixture_rcs), next(fixture_rcs)
             ok = (rc_bad not in (0, None)) and (rc_good == 0)
             print("  [%s] %-22s fixtures: bad->%s good->%s  %s" % ("ok  " if ok else "FAIL", rid, rc_bad, rc_good, "" if ok else "<-- checker misbehaves"))
             if not ok:
@@ -169,13 +494,24 @@ def main():
                     help="list warn-rules soaked clean >= --window days (advisory)")
     ap.add_argument("--state", default=DEF_STATE, help="soak ledger path (local, gitignored)")
     ap.add_argument("--window", type=int, default=SOAK_WINDOW_DAYS, help="soak window in days")
+    ap.add_argument("--jobs", type=int, default=DEF_JOBS, help="checkers run concurrently (default %(default)s)")
+    ap.add_argument("--timeout", type=float, default=DEF_TIMEOUT,
+                    help="per-rule wall-clock limit in seconds; a timeout is an ERROR (default %(default)s)")
+    ap.add_argument("--isolate", action="store_true",
+                    help="run each checker in its own subprocess instead of in-process")
+    ap.add_argument("--cache", metavar="FILE",
+                    help="per-rule result cache: rules declaring `inputs` whose digest is "
+                         "unchanged are reported from FILE (cached: true) instead of re-run")
+    ap.add_argument("--inputs", type=lambda v: [n for n in v.split(",") if n],
+                    help="audit only script rules whose cmd reads one of these "
+                         "substitutions (comma list of target,index,marketplace)")
     a = ap.parse_args()
     doc = load_rules()
     if a.selftest:
-        return selftest(doc)
+        return selftest(doc, a.jobs, a.timeout, a.isolate)
     if a.promote_check:
         return promote_check(doc, a.state, a.window)
-    return audit(doc, a.target, a.index, a.json, a.marketplace)
+    return audit(doc, a.target, a.index, a.json, a.marketplace, a.jobs, a.timeout, a.isolate, a.inputs, a.cache)
 
 
 if __name__ == "__main__":
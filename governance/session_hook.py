@@ -8,7 +8,12 @@ SessionStart hooks inject context, they cannot block a session — prevention
 lives in the pre-commit + CI gates (PR #1).
 
 Quiet by design: silent when clean, silent on any error (a hook must never break
-a session), and **mtime-cached** so an unchanged skills tree skips re-audit.
+a session), and **fingerprint-cached**: the cache file keeps a Merkle-style hash
+of the skills tree (per-directory mtimes, per-file size + mtime_ns). An
+unchanged tree skips re-audit after one stat per entry; a changed one re-runs
+only the rules whose inputs (``{target}`` / ``{index}``) moved, and keeps the
+cached results of the rest. A change to the engine or RULES.yaml, or a cache
+older than a day, forces a full audit.
 
 Install (global) — wire into ``~/.claude/settings.json`` (do this deliberately;
 it fires in every session):
@@ -23,17 +28,127 @@ Test/override env vars (so dogfood tests stay hermetic):
   GOVERNANCE_SKILLS_DIR  default ~/.claude/skills
   GOVERNANCE_INDEX       default <skills>/SKILLS-INDEX.md
   GOVERNANCE_CACHE       default ~/.claude/.cache/governance-session.json
+  GOVERNANCE_RULE_CACHE  engine per-rule result cache (run_rules.py --cache),
+                         default governance-rules.json next to GOVERNANCE_CACHE
+  GOVERNANCE_DIGEST_INDEX  R04 SKILL.md digest index, default
+                         governance-digests.json next to GOVERNANCE_CACHE
 """
-import os, sys, json, subprocess
+import os, sys, json, subprocess, stat, time, hashlib
 import soak  # sibling module: feeds the soak-then-flip ledger
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 
+CACHE_VERSION = 2
+# Rules whose inputs are not fingerprinted (canon repos, marketplace) are
+# refreshed by a full audit at least this often.
+FULL_AUDIT_TTL = 24 * 3600
+# Never descended into: hidden trees (.git) and build debris. Dot *files* such
+# as .STATUS stay in scope — R09 reads them.
+PRUNE = {"node_modules", "__pycache__"}
+
 
 def _env(name, default):
     return os.environ.get(name) or default
 
 
+def _stamp(path):
+    """[size, mtime_ns] of path (following links), or None when absent."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _listing(path):
+    """{name: readlink target or None} for one directory."""
+    out = {}
+    with os.scandir(path) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False) and (e.name.startswith(".") or e.name in PRUNE):
+                continue
+            out[e.name] = os.readlink(e.path) if e.is_symlink() else None
+    return out
+
+
+def tree_fingerprint(root, prev=None):
+    """Merkle fingerprint of the tree under `root`.
+
+    Returns ``(digest, nodes, changed)``. ``nodes`` maps each directory's relpath
+    ('' = root) to ``{"m": mtime_ns, "e": {name: [link, size, mtime_ns]}, "h":
+    subtree hash}`` (``link`` is the readlink target or None; size/mtime are None
+    for a directory or broken link); feed it back as `prev` next time.
+    ``changed`` is the set of relpaths that differ from `prev`.
+
+    Incremental: a directory whose mtime_ns matches `prev` reuses its stored
+    listing (no scandir), and a directory whose entries and child hashes all
+    match reuses its stored hash (no hashing). Every entry is still stat'ed
+    once — an in-place edit moves the file's mtime, not its directory's.
+    Symlinked directories are followed (consumer skills are usually links into
+    a canon), with an inode guard against link cycles.
+    """
+    prev = prev or {}
+    nodes, changed = {}, set()
+    try:
+        st = os.stat(root)
+    except OSError:
+        return "", nodes, set(prev)
+    digest = _walk(root, "", st, prev, nodes, changed, set())
+    changed.update(rel for rel in prev if rel not in nodes)
+    return digest, nodes, changed
+
+
+def _walk(path, rel, st, prev, nodes, changed, chain):
+    ino = (st.st_dev, st.st_ino)
+    if ino in chain:
+        return ""  # link cycle: this directory is already an ancestor
+    chain.add(ino)
+    old = prev.get(rel)
+    if old is not None and old["m"] == st.st_mtime_ns:
+        links = {n: e[0] for n, e in old["e"].items()}
+    else:
+        try:
+            links = _listing(path)
+        except OSError:
+            links = {}
+    old_e = old["e"] if old is not None else {}
+    prefix = rel + os.sep if rel else ""
+    entries, kids, same = {}, [], old is not None and len(links) == len(old_e)
+    for name in sorted(links):
+        sub, sub_rel = path + os.sep + name, prefix + name
+        try:
+            sst = os.stat(sub)
+        except OSError:
+            sst = None  # broken link (or vanished)
+        if sst is not None and stat.S_ISDIR(sst.st_mode):
+            entry = [links[name], None, None]
+            kid = _walk(sub, sub_rel, sst, prev, nodes, changed, chain)
+            kids.append((name, kid))
+            if kid != prev.get(sub_rel, {}).get("h"):
+                same = False
+        elif sst is not None:
+            entry = [links[name], sst.st_size, sst.st_mtime_ns]
+        else:
+            entry = [links[name], None, None]
+        if old_e.get(name) != entry:
+            changed.add(sub_rel)
+            same = False
+        entries[name] = entry
+    chain.discard(ino)
+    changed.update(prefix + n for n in old_e if n not in entries)
+    if same:
+        digest = old["h"]
+    else:
+        h = hashlib.blake2b(digest_size=16)
+        for name in sorted(entries):
+            h.update(json.dumps([name, entries[name]]).encode())
+        for name, kid in kids:
+            h.update(("%s/%s" % (name, kid)).encode())
+        digest = h.hexdigest()
+    nodes[rel] = {"m": st.st_mtime_ns, "e": entries, "h": digest}
+    return digest
+
+
 def audit_summary():
     """Return a compact RED-only summary string, or '' when clean / N/A."""
     engine = _env("GOVERNANCE_ENGINE", os.path.join(HERE, "run_rules.py"))
@@ -44,36 +159,73 @@ def audit_summary():
     if not os.path.isdir(skills) or not os.path.isfile(engine):
         return ""  # no-op-safe: nothing to audit on this machine
 
-    mtime = int(os.path.getmtime(skills))
-    cached = _read_cache(cache)
-    if cached is not None and cached.get("mtime") == mtime:
-        return cached.get("summary", "")  # unchanged tree → reuse, skip re-audit
+    prev = _read_cache(cache)
+    if not isinstance(prev, dict) or prev.get("version") != CACHE_VERSION:
+        prev = {}
+    digest, tree, changed = tree_fingerprint(skills, prev.get("tree"))
+    index_stamp = _stamp(index)
+    rules_stamp = [_stamp(engine), _stamp(os.path.join(os.path.dirname(engine), "RULES.yaml"))]
+    full = (not prev or prev.get("rules") != rules_stamp
+            or time.time() - prev.get("audited", 0) > FULL_AUDIT_TTL)
+    if not full and digest == prev.get("root") and index_stamp == prev.get("index"):
+        return prev.get("summary", "")  # unchanged tree → reuse, skip re-audit
 
-    summary = _run_audit(engine, skills, index)
-    _write_cache(cache, mtime, summary)
+    # Re-run only the rules whose inputs moved: {target} rules when anything
+    # besides the index changed, {index} rules when the index did.
+    inputs = None
+    if not full:
+        index_rel = os.path.relpath(index, skills)
+        inputs = []
+        if changed - {index_rel}:
+            inputs.append("target")
+        if index_stamp != prev.get("index"):
+            inputs.append("index")
+    rule_cache = os.path.expanduser(_env(
+        "GOVERNANCE_RULE_CACHE", os.path.join(os.path.dirname(cache), "governance-rules.json")))
+    digests = os.path.expanduser(_env(
+        "GOVERNANCE_DIGEST_INDEX", os.path.join(os.path.dirname(cache), "governance-digests.json")))
+    results = _run_audit(engine, skills, index, inputs, rule_cache, digests)
+    if results is None:
+        return ""  # a hook must never break a session
+    if inputs is not None:
+        fresh = {r.get("id"): r for r in results}
+        kept = [fresh.pop(r.get("id"), r) for r in prev.get("results", [])]
+        results = kept + list(fresh.values())
+    # Feed the soak ledger (best-effort) BEFORE the RED early-return — clean audits
+    # are exactly what builds the "soaked clean N days" history that --promote-check
+    # reads. record_audit never raises.
+    soak.record_audit(_env("GOVERNANCE_STATE", os.path.join(HERE, "STATE.json")), results)
+    summary = _summarize(results)
+    _write_cache(cache, {
+        "version": CACHE_VERSION, "root": digest, "tree": tree, "index": index_stamp,
+        "rules": rules_stamp, "audited": prev.get("audited", 0) if inputs is not None else time.time(),
+        "results": results, "summary": summary,
+    })
     return summary
 
 
-def _run_audit(engine, skills, index):
+def _run_audit(engine, skills, index, inputs=None, rule_cache=None, digests=None):
+    """Audit results list, or None when the engine could not be run/parsed."""
+    env = dict(os.environ, GOVERNANCE_DIGEST_INDEX=digests) if digests else None
+    cmd = [sys.executable, engine, "--target", skills, "--index", index, "--json"]
+    if rule_cache:
+        cmd += ["--cache", rule_cache]
+    if inputs is not None:
+        cmd += ["--inputs", ",".join(inputs)]
     try:
-        p = subprocess.run(
-            [sys.executable, engine, "--target", skills, "--index", index, "--json"],
-            capture_output=True, text=True, timeout=10,
-        )
-        data = json.loads(p.stdout)
+        p = subprocess.run(cmd, capture_output=True, text=True, timeout=10, env=env)
+        return json.loads(p.stdout).get("results", [])
     except Exception:
-        return ""  # a hook must never break a session
-    # Feed the soak ledger (best-effort) BEFORE the RED early-return — clean audits
-    # are exactly what builds the "soaked clean N days" history that --promote-check
-    # reads. record_audit never raises.
-    soak.record_audit(_env("GOVERNANCE_STATE", os.path.join(HERE, "STATE.json")),
-                      data.get("results", []))
-    if not data.get("red"):
-        return ""
-    offenders = [r["id"] for r in data.get("results", [])
+        return None
+
+
+def _summarize(results):
+    offenders = [r["id"] for r in results
                  if r.get("severity") == "error" and r.get("state") in ("FAIL", "ERROR")]
+    if not offenders:
+        return ""
     return "GOVERNANCE: %d red — %s (run: python3 governance/run_rules.py)" % (
-        data["red"], ", ".join(offenders) or "see audit")
+        len(offenders), ", ".join(offenders))
 
 
 def _read_cache(path):
@@ -84,11 +236,13 @@ def _read_cache(path):
         return None
 
 
-def _write_cache(path, mtime, summary):
+def _write_cache(path, data):
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"mtime": mtime, "summary": summary}, f)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
     except Exception:
         pass  # cache is best-effort; never fail the hook over it
 
@@ -5,18 +5,27 @@ Fetches releases from GitHub (Code) and Anthropic docs (Desktop), parses
 CHANGELOG.md for structured categorization, and scans for plugin-relevant
 changes. Cross-references findings against current craft state.
 
-Requires: gh CLI (authenticated), curl (for Desktop)
+The three sources (GitHub releases, raw CHANGELOG.md, Desktop release notes)
+are fetched concurrently over HTTP. Each cache entry keeps its own
+ETag/Last-Modified validators: a refresh sends them, and a 304 reuses the
+cached data. A source whose fetch fails falls back to its own stale data.
+
+Requires: gh CLI (authenticated) for the GitHub token, unless GH_TOKEN or
+GITHUB_TOKEN is set
 """
 
 import argparse
-import base64
 import json
 import os
 import re
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -25,11 +34,23 @@ from pathlib import Path
 
 BOX_WIDTH = 63
 PLUGIN_ROOT = Path(__file__).resolve().parent.parent  # scripts/ -> project root
+if str(PLUGIN_ROOT) not in sys.path:
+    sys.path.insert(0, str(PLUGIN_ROOT))
+
+from utils.frontmatter import read_frontmatter  # noqa: E402
 
 # Cache configuration
 CACHE_DIR = Path.home() / ".claude"
 CACHE_FILE = CACHE_DIR / "release-watch-cache.json"
 CACHE_TTL = 86400  # 24 hours
+SCAN_CACHE_FILE = CACHE_DIR / "release-watch-scan.json"
+SCAN_CACHE_VERSION = 1
+
+# Sources (module-level so tests can point them at a local stub server)
+RELEASES_URL = "https://api.github.com/repos/anthropics/claude-code/releases?per_page={per_page}"
+CHANGELOG_URL = "https://raw.githubusercontent.com/anthropics/claude-code/main/CHANGELOG.md"
+GITHUB_API = "https://api.github.com/"
+USER_AGENT = "craft-release-watch"
 
 KEYWORD_CATEGORIES = {
     "plugin_system": [
@@ -66,6 +87,88 @@ CATEGORY_MAP = {
     "fixed": "FIXED",
 }
 
+# Explicit category signals, checked in this order (first hit wins)
+SIGNAL_KEYWORDS = {
+    "BREAKING": ["breaking", "removed", "migration"],
+    "DEPRECATED": ["deprecated"],
+    "FIXED": ["fix", "fixed", "bug fix", "patch", "resolved"],
+}
+# Desktop notes use a narrower FIXED list ("patch" / "resolved" are too
+# common in product prose)
+DESKTOP_FIXED_KEYWORDS = ["fix", "fixed", "bug fix"]
+
+
+class KeywordMatcher:
+    """All keyword lists compiled into one word-boundary alternation.
+
+    ``scan(text)`` makes a single pass over lowercased text and returns a
+    ``KeywordHits``. Matching is overlapping (a lookahead at every word
+    start), so a keyword contained in another at the same position is still
+    found; results equal one ``re.search(rf'\\b{kw}\\b')`` per keyword.
+    """
+
+    def __init__(self, categories, signals, desktop_fixed):
+        self.categories = list(categories)
+        self.signal_order = list(signals)
+        # lowercased keyword -> [[(category index, keyword index, original keyword)], signals]
+        self.by_word = {}
+        for idx, (cat, words) in enumerate(categories.items()):
+            for pos, kw in enumerate(words):
+                self.by_word.setdefault(kw.lower(), [[], set()])[0].append((idx, pos, kw))
+        for sig, words in signals.items():
+            for kw in words:
+                self.by_word.setdefault(kw.lower(), [[], set()])[1].add(sig)
+        for kw in desktop_fixed:
+            self.by_word.setdefault(kw.lower(), [[], set()])[1].add("DESKTOP_FIXED")
+        # Longest first so that, among keywords starting at the same word, the
+        # longer one is tried before its prefix; prefixes are then re-checked
+        # in scan().
+        words = sorted(self.by_word, key=lambda w: (-len(w), w))
+        self.regex = re.compile(r"(?=\b(" + "|".join(re.escape(w) for w in words) + r")\b)")
+        self.prefixes = {
+            w: [p for p in words if p != w and w.startswith(p)] for w in words
+        }
+
+    def scan(self, text_lower):
+        found = set()
+        for m in self.regex.finditer(text_lower):
+            word = m.group(1)
+            found.add(word)
+            pos = m.start()
+            for p in self.prefixes[word]:
+                if p not in found and re.match(r"\b" + re.escape(p) + r"\b", text_lower[pos:]):
+                    found.add(p)
+        return KeywordHits(self, found)
+
+
+class KeywordHits:
+    """Result of one ``KeywordMatcher.scan``"""
+
+    def __init__(self, matcher, words):
+        self.matcher = matcher
+        self.words = words
+        self.signals = set()
+        hits = []
+        for w in words:
+            cats, sigs = matcher.by_word[w]
+            hits.extend(cats)
+            self.signals |= sigs
+        hits.sort()
+        # Original-case keywords in KEYWORD_CATEGORIES order, deduplicated
+        self.keywords = list(dict.fromkeys(kw for _, _, kw in hits))
+        self.first_category = matcher.categories[hits[0][0]] if hits else None
+
+    def signal(self, desktop=False):
+        """First explicit signal category (BREAKING/DEPRECATED/FIXED), or None"""
+        for sig in self.matcher.signal_order:
+            if desktop and sig == "FIXED":
+                if "DESKTOP_FIXED" in self.signals:
+                    return sig
+            elif sig in self.signals:
+                return sig
+        return None
+
+
 # Known model name patterns to scan for in the codebase
 MODEL_PATTERNS = [
     r"claude-3-opus",
@@ -84,6 +187,23 @@ MODEL_PATTERNS = [
 ]
 
 
+def compile_model_regex(patterns):
+    """One regex standing in for a findall per pattern.
+
+    The leading lookahead stops only where some pattern matches; there, one
+    optional capturing lookahead per pattern records that pattern's match.
+    So ``claude-sonnet-4-5`` yields ``claude-sonnet-4``, ``claude-sonnet-4-5``
+    and the generic hit in one step, exactly as the separate findalls would.
+    """
+    anchor = "(?=" + "|".join(f"(?:{p})" for p in patterns) + ")"
+    return re.compile(anchor + "".join(f"(?:(?=({p})))?" for p in patterns))
+
+
+MODEL_REGEX = compile_model_regex(MODEL_PATTERNS)
+
+KEYWORD_MATCHER = KeywordMatcher(KEYWORD_CATEGORIES, SIGNAL_KEYWORDS, DESKTOP_FIXED_KEYWORDS)
+
+
 # ---------------------------------------------------------------------------
 # Box-drawing helpers
 # ---------------------------------------------------------------------------
@@ -168,13 +288,146 @@ def get_cached(source, cache, refresh=False, no_cache=False):
     return None
 
 
-def set_cached(source, data, cache):
-    """Update a source entry in the cache dict and save to disk."""
-    cache[source] = {
-        "timestamp": time.time(),
-        "data": data,
-    }
-    save_cache(cache)
+_CACHE_LOCK = threading.Lock()  # sources are fetched (and cached) concurrently
+
+
+def set_cached(source, data, cache, url=None, etag=None, last_modified=None):
+    """Update a source entry in the cache dict and save to disk.
+
+    ``url`` and the ETag/Last-Modified validators are kept so the next
+    refresh can be a conditional request.
+    """
+    entry = {"timestamp": time.time(), "data": data}
+    if url:
+        entry["url"] = url
+    if etag:
+        entry["etag"] = etag
+    if last_modified:
+        entry["last_modified"] = last_modified
+    with _CACHE_LOCK:
+        cache[source] = entry
+        save_cache(cache)
+
+
+# ---------------------------------------------------------------------------
+# Network layer
+# ---------------------------------------------------------------------------
+
+_TOKEN = []  # memo: [token or None]
+
+
+def github_token():
+    """GitHub token from GH_TOKEN / GITHUB_TOKEN, else `gh auth token` (memoized)."""
+    if not _TOKEN:
+        token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        if not token:
+            try:
+                result = subprocess.run(
+                    ["gh", "auth", "token"], capture_output=True, text=True, timeout=10,
+                )
+                token = result.stdout.strip() if result.returncode == 0 else None
+            except (OSError, subprocess.TimeoutExpired):
+                token = None
+        _TOKEN.append(token)
+    return _TOKEN[0]
+
+
+def http_get(url, headers=None, timeout=30):
+    """GET ``url``. Returns (status, body, headers) with lower-cased header
+    names; status is None when the request never got a response.
+
+    This is the default fetcher. Every fetch function takes ``fetcher=`` with
+    the same signature, so tests can substitute a stub.
+    """
+    headers = dict(headers or {})
+    headers.setdefault("User-Agent", USER_AGENT)
+    if url.startswith(GITHUB_API):
+        headers.setdefault("Accept", "application/vnd.github+json")
+        token = github_token()
+        if token:
+            headers.setdefault("Authorization", f"Bearer {token}")
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            body = resp.read().decode("utf-8", errors="replace")
+            return resp.status, body, {k.lower(): v for k, v in resp.headers.items()}
+    except urllib.error.HTTPError as e:  # includes 304 Not Modified
+        return e.code, "", {k.lower(): v for k, v in (e.headers or {}).items()}
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        return None, str(e), {}
+
+
+def conditional_fetch(source, url, cache, parse, refresh=False, no_cache=False,
+                      fetcher=None, timeout=30):
+    """Fetch one source through its cache entry.
+
+    A fresh entry for the same URL is returned without a request. Otherwise
+    the stored validators go out as If-None-Match / If-Modified-Since; a 304
+    renews the entry and returns its data. A 200 body goes through ``parse``
+    (None or ValueError = unusable). When the fetch fails, the entry's stale
+    data is returned.
+
+    Returns:
+        (data, origin): origin is "cache", "not-modified", "network",
+        "stale", or "failed" (data None)
+    """
+    fetcher = fetcher or http_get
+    entry = {} if no_cache else (cache.get(source) or {})
+    same_url = entry.get("url", url) == url  # pre-validator entries carry no url
+    if entry and same_url and not refresh and is_fresh(entry, source):
+        return entry.get("data"), "cache"
+
+    headers = {}
+    if "data" in entry and entry.get("url") == url:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    status, body, resp_headers = fetcher(url, headers, timeout)
+    if status == 304 and headers:
+        set_cached(source, entry["data"], cache, url=url,
+                   etag=resp_headers.get("etag", entry.get("etag")),
+                   last_modified=resp_headers.get("last-modified", entry.get("last_modified")))
+        return entry["data"], "not-modified"
+    if status == 200:
+        try:
+            data = parse(body)
+        except ValueError:
+            data = None
+        if data is not None:
+            if not no_cache:
+                set_cached(source, data, cache, url=url, etag=resp_headers.get("etag"),
+                           last_modified=resp_headers.get("last-modified"))
+            return data, "network"
+    if entry.get("data") is not None and same_url:
+        return entry["data"], "stale"
+    return None, "failed"
+
+
+def fetch_all(product="all", count=3, since=None, cache=None, refresh=False,
+              no_cache=False, fetcher=None):
+    """Fetch every source ``product`` needs, concurrently.
+
+    Returns:
+        (releases, changelog_content, desktop_releases): [] / None / [] for
+        sources not requested
+    """
+    if cache is None:
+        cache = {}
+    opts = {"cache": cache, "refresh": refresh, "no_cache": no_cache, "fetcher": fetcher}
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        releases = changelog = desktop = None
+        if product in ("all", "code"):
+            releases = pool.submit(fetch_releases, count, since=since, **opts)
+            changelog = pool.submit(fetch_changelog, **opts)
+        if product in ("all", "desktop"):
+            desktop = pool.submit(fetch_desktop_releases, **opts)
+    return (
+        releases.result() if releases else [],
+        changelog.result() if changelog else None,
+        desktop.result() if desktop else [],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -213,52 +466,39 @@ def check_gh_auth():
 # Fetch releases
 # ---------------------------------------------------------------------------
 
-def fetch_releases(count, since=None, cache=None, refresh=False, no_cache=False):
-    """Fetch releases from GitHub via gh CLI.
+def fetch_releases(count, since=None, cache=None, refresh=False, no_cache=False,
+                   fetcher=None):
+    """Fetch releases from the GitHub API.
 
     Uses ?per_page=N to request only the needed releases in a single API call
-    instead of --paginate which fetches all pages. Results are cached for 24h.
+    instead of paginating. Results are cached for 24h and revalidated with a
+    conditional request after that.
     """
     if cache is None:
         cache = {}
 
-    # Check cache first
-    cached = get_cached("github_releases", cache, refresh=refresh, no_cache=no_cache)
-    if cached is not None:
-        return _filter_and_sort(cached, count, since)
-
     # Request more than count when using --since, as we filter afterward
     per_page = min(count * 2, 30) if since else min(count, 30)
-    result = subprocess.run(
-        [
-            "gh", "api",
-            f"repos/anthropics/claude-code/releases?per_page={per_page}",
-        ],
-        capture_output=True, text=True, timeout=30,
+    releases, origin = conditional_fetch(
+        "github_releases", RELEASES_URL.format(per_page=per_page), cache, _parse_releases,
+        refresh=refresh, no_cache=no_cache, fetcher=fetcher, timeout=30,
     )
-    if result.returncode != 0:
-        # Stale fallback: if live fetch fails and stale cache exists, use it
-        stale = cache.get("github_releases", {}).get("data")
-        if stale and not no_cache:
-            print("Warning: Live fetch failed, using stale cache.", file=sys.stderr)
-            return _filter_and_sort(stale, count, since)
-        print(f"Error: Failed to fetch releases.", file=sys.stderr)
-        print(f"Details: {result.stderr.strip()}", file=sys.stderr)
+    if origin == "stale":
+        print("Warning: Live fetch failed, using stale cache.", file=sys.stderr)
+    elif releases is None:
+        print("Error: Failed to fetch releases.", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        releases = json.loads(result.stdout)
-    except json.JSONDecodeError as e:
-        print(f"Error: Failed to parse release data: {e}", file=sys.stderr)
-        sys.exit(1)
+    return _filter_and_sort(list(releases), count, since)
 
-    if not isinstance(releases, list):
-        releases = [releases]
 
-    # Cache the raw releases (before filtering)
-    set_cached("github_releases", releases, cache)
-
-    return _filter_and_sort(releases, count, since)
+def _parse_releases(body):
+    """Release list from an API response body (ValueError when not JSON)."""
+    try:
+        releases = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse release data: {e}") from e
+    return releases if isinstance(releases, list) else [releases]
 
 
 def _filter_and_sort(releases, count, since=None):
@@ -306,7 +546,7 @@ _CHANGELOG_PREFIX_MAP = {
 }
 
 
-def fetch_changelog(cache=None, refresh=False, no_cache=False):
+def fetch_changelog(cache=None, refresh=False, no_cache=False, fetcher=None):
     """Fetch raw CHANGELOG.md content from GitHub.
 
     Returns the text content, or None on failure (graceful degradation).
@@ -314,28 +554,15 @@ def fetch_changelog(cache=None, refresh=False, no_cache=False):
     if cache is None:
         cache = {}
 
-    cached = get_cached("changelog", cache, refresh=refresh, no_cache=no_cache)
-    if cached is not None:
-        return cached
-
-    result = subprocess.run(
-        ["gh", "api", "repos/anthropics/claude-code/contents/CHANGELOG.md",
-         "--jq", ".content"],
-        capture_output=True, text=True, timeout=30,
+    content, origin = conditional_fetch(
+        "changelog", CHANGELOG_URL, cache, lambda body: body or None,
+        refresh=refresh, no_cache=no_cache, fetcher=fetcher, timeout=30,
     )
-    if result.returncode != 0:
+    if origin == "stale":
+        print("Warning: CHANGELOG.md fetch failed, using stale cache.", file=sys.stderr)
+    elif content is None:
         print("Warning: Failed to fetch CHANGELOG.md, continuing without it.",
               file=sys.stderr)
-        return None
-
-    # Decode base64 content
-    try:
-        content = base64.b64decode(result.stdout.strip()).decode("utf-8")
-    except Exception:
-        print("Warning: Failed to decode CHANGELOG.md content.", file=sys.stderr)
-        return None
-
-    set_cached("changelog", content, cache)
     return content
 
 
@@ -402,7 +629,7 @@ def merge_changelog_with_releases(releases, changelog_versions):
 DESKTOP_RELEASE_URL = "https://docs.anthropic.com/en/release-notes/claude-apps"
 
 
-def fetch_desktop_releases(cache=None, refresh=False, no_cache=False):
+def fetch_desktop_releases(cache=None, refresh=False, no_cache=False, fetcher=None):
     """Fetch Claude Desktop/Apps release notes from Anthropic docs.
 
     Returns a list of release dicts with date, title, and body fields,
@@ -411,27 +638,18 @@ def fetch_desktop_releases(cache=None, refresh=False, no_cache=False):
     if cache is None:
         cache = {}
 
-    cached = get_cached("desktop_releases", cache, refresh=refresh, no_cache=no_cache)
-    if cached is not None:
-        return cached
-
-    # Fetch with curl (follows redirects, 10s timeout)
-    result = subprocess.run(
-        ["curl", "-sL", "--max-time", "10", DESKTOP_RELEASE_URL],
-        capture_output=True, text=True, timeout=15,
+    # A page with no parseable entries counts as a failed fetch
+    releases, origin = conditional_fetch(
+        "desktop_releases", DESKTOP_RELEASE_URL, cache,
+        lambda body: _parse_desktop_html(body) or None,
+        refresh=refresh, no_cache=no_cache, fetcher=fetcher, timeout=10,
     )
-    if result.returncode != 0 or not result.stdout.strip():
-        stale = cache.get("desktop_releases", {}).get("data")
-        if stale and not no_cache:
-            print("Warning: Desktop fetch failed, using stale cache.", file=sys.stderr)
-            return stale
+    if origin == "stale":
+        print("Warning: Desktop fetch failed, using stale cache.", file=sys.stderr)
+    elif releases is None:
         print("Warning: Failed to fetch Desktop releases, continuing without them.",
               file=sys.stderr)
         return []
-
-    releases = _parse_desktop_html(result.stdout)
-    if releases:
-        set_cached("desktop_releases", releases, cache)
     return releases
 
 
@@ -520,34 +738,17 @@ def scan_desktop_releases(desktop_releases):
     All entries source-tagged as 'anthropic-docs'.
     """
     findings = {"NEW": [], "DEPRECATED": [], "BREAKING": [], "FIXED": []}
+    seen = {cat: set() for cat in findings}  # summaries already reported
 
     for entry in desktop_releases:
         date = entry.get("date", "unknown")
         title = entry.get("title", "")
         body = entry.get("body", "")
-        combined = f"{title} {body}".lower()
-
-        # Check for plugin-relevant keywords
-        matched_keywords = []
-        for cat_name, keywords in KEYWORD_CATEGORIES.items():
-            for kw in keywords:
-                if re.search(rf'\b{re.escape(kw.lower())}\b', combined):
-                    matched_keywords.append(kw)
-
-        if not matched_keywords:
+        hits = KEYWORD_MATCHER.scan(f"{title} {body}".lower())
+        if not hits.keywords:
             continue
 
-        # Categorize
-        category = "NEW"
-        if any(re.search(rf'\b{re.escape(kw)}\b', combined)
-               for kw in ["breaking", "removed", "migration"]):
-            category = "BREAKING"
-        elif any(re.search(rf'\b{re.escape(kw)}\b', combined)
-                 for kw in ["deprecated"]):
-            category = "DEPRECATED"
-        elif any(re.search(rf'\b{re.escape(kw)}\b', combined)
-                 for kw in ["fix", "fixed", "bug fix"]):
-            category = "FIXED"
+        category = hits.signal(desktop=True) or "NEW"
 
         display = title if title else body[:47] + "..." if len(body) > 50 else body
         if len(display) > 50:
@@ -557,13 +758,13 @@ def scan_desktop_releases(desktop_releases):
             "version": date,
             "category": category,
             "summary": display,
-            "keywords": list(set(matched_keywords)),
+            "keywords": hits.keywords,
             "raw_line": f"{title}: {body[:100]}",
             "source": "anthropic-docs",
             "changelog_enriched": False,
         }
-        existing = [f["summary"] for f in findings[category]]
-        if display not in existing:
+        if display not in seen[category]:
+            seen[category].add(display)
             findings[category].append(finding)
 
     return findings
@@ -582,6 +783,7 @@ def scan_releases(releases):
     Returns a dict of category -> list of finding dicts.
     """
     findings = {"NEW": [], "DEPRECATED": [], "BREAKING": [], "FIXED": []}
+    seen = {cat: set() for cat in findings}  # summaries already reported
 
     for release in releases:
         tag = release.get("tag_name", "unknown")
@@ -601,34 +803,18 @@ def scan_releases(releases):
             if not line_stripped or line_stripped.startswith("#"):
                 continue
 
-            line_lower = line_stripped.lower()
+            # One pass over the line for every keyword list (word-boundary)
+            hits = KEYWORD_MATCHER.scan(line_stripped.lower())
+            if not hits.keywords:
+                continue
 
-            # CHANGELOG category takes precedence if available
+            # CHANGELOG category takes precedence if available, then explicit
+            # breaking/deprecation/fix signals, then the keyword category
             cl_key = line_stripped.lstrip("-* ").strip().lower()[:40]
-            category = changelog_categories.get(cl_key)
-
-            # Otherwise, check explicit breaking/deprecation signals (word-boundary)
-            if category is None:
-                if any(re.search(rf'\b{re.escape(kw)}\b', line_lower)
-                       for kw in ["breaking", "removed", "migration"]):
-                    category = "BREAKING"
-                elif any(re.search(rf'\b{re.escape(kw)}\b', line_lower)
-                         for kw in ["deprecated"]):
-                    category = "DEPRECATED"
-                elif any(re.search(rf'\b{re.escape(kw)}\b', line_lower)
-                         for kw in ["fix", "fixed", "bug fix", "patch", "resolved"]):
-                    category = "FIXED"
-
-            # Check if line contains any plugin-relevant keywords (word-boundary)
-            matched_keywords = []
-            for cat_name, keywords in KEYWORD_CATEGORIES.items():
-                for kw in keywords:
-                    if re.search(rf'\b{re.escape(kw.lower())}\b', line_lower):
-                        matched_keywords.append(kw)
-                        if category is None:
-                            category = CATEGORY_MAP.get(cat_name, "NEW")
-
-            if matched_keywords and category:
+            category = (changelog_categories.get(cl_key) or hits.signal()
+                        or CATEGORY_MAP.get(hits.first_category, "NEW"))
+
+            if category:
                 # Clean up the line for display
                 display = line_stripped.lstrip("-* ").strip()
                 if len(display) > 50:
@@ -638,14 +824,14 @@ def scan_releases(releases):
                     "version": tag,
                     "category": category,
                     "summary": display,
-                    "keywords": list(set(matched_keywords)),
+                    "keywords": hits.keywords,
                     "raw_line": line_stripped,
                     "source": "github",
                     "changelog_enriched": cl_key in changelog_categories,
                 }
                 # Avoid duplicate summaries in the same category
-                existing = [f["summary"] for f in findings[category]]
-                if display not in existing:
+                if display not in seen[category]:
+                    seen[category].add(display)
                     findings[category].append(finding)
 
     return findings
@@ -655,73 +841,140 @@ def scan_releases(releases):
 # Craft state analysis
 # ---------------------------------------------------------------------------
 
-def analyze_craft_state():
-    """Cross-reference against current craft plugin state."""
+SCAN_SUFFIXES = frozenset({".md", ".py", ".sh", ".json", ".yaml", ".yml"})
+SCAN_PRUNE = frozenset({".git", "node_modules", "site"})
+
+
+def load_scan_cache(root):
+    """Per-file model hits from the last scan of `root`, keyed by relative path.
+
+    Entries are ``[mtime_ns, size, [model, ...]]``. A cache written for another
+    checkout, another cache version or another MODEL_PATTERNS list is ignored.
+    """
+    try:
+        data = json.loads(SCAN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION
+            or data.get("root") != str(root) or data.get("patterns") != MODEL_PATTERNS):
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_scan_cache(root, files):
+    """Atomic write of the scan cache (tmp + rename), like save_cache."""
+    data = {"version": SCAN_CACHE_VERSION, "root": str(root),
+            "patterns": MODEL_PATTERNS, "files": files}
+    # The temp file sits beside the target: a rename across filesystems fails
+    try:
+        SCAN_CACHE_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=SCAN_CACHE_FILE.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.chmod(tmp_path, 0o600)
+        os.rename(tmp_path, SCAN_CACHE_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def scan_models(text):
+    """Distinct model strings in `text`, in order of first appearance."""
+    found = {}
+    for m in MODEL_REGEX.finditer(text):
+        for hit in m.groups():
+            if hit is not None:
+                found[hit] = None
+    return list(found)
+
+
+def analyze_craft_state(root=None, use_cache=True):
+    """Cross-reference against current craft plugin state.
+
+    One ``os.walk`` over the checkout: .git, node_modules and site are pruned
+    before descent, and each file is dispatched on its suffix. A file whose
+    (mtime_ns, size) matches the scan cache reuses its recorded model hits
+    instead of being read again.
+
+    Args:
+        root: Checkout to scan (default: PLUGIN_ROOT)
+        use_cache: Read and update SCAN_CACHE_FILE (False for --no-cache)
+    """
+    root = Path(root) if root is not None else PLUGIN_ROOT
     state = {
         "hardcoded_models": [],
         "agent_features": {},
         "hook_events": [],
     }
-
-    # 1. Scan agents for memory, isolation, background fields
-    agents_dir = PLUGIN_ROOT / "agents"
-    if agents_dir.is_dir():
-        for md_file in sorted(agents_dir.rglob("*.md")):
-            relative = md_file.relative_to(PLUGIN_ROOT)
-            content = md_file.read_text(errors="replace")
-            # Parse frontmatter
-            fm_match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-            if fm_match:
-                fm = fm_match.group(1)
-                features = {}
-                for field in ["memory", "isolation", "background"]:
-                    match = re.search(rf"^{field}:\s*(.+)$", fm, re.MULTILINE)
-                    if match:
-                        features[field] = match.group(1).strip()
-                if features:
-                    state["agent_features"][str(relative)] = features
-
-    # 2. Check for hardcoded model names across the codebase
-    extensions = ["*.md", "*.py", "*.sh", "*.json", "*.yaml", "*.yml"]
-    for ext in extensions:
-        for filepath in PLUGIN_ROOT.rglob(ext):
-            # Skip .git directories and node_modules
-            parts = filepath.parts
-            if ".git" in parts or "node_modules" in parts or "site" in parts:
+    previous = load_scan_cache(root) if use_cache else {}
+    scanned = {}
+    agent_files = []
+    hook_files = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SCAN_PRUNE)
+        rel_dir = os.path.relpath(dirpath, root)
+        rel_dir = "" if rel_dir == "." else rel_dir + os.sep
+        for name in sorted(filenames):
+            suffix = os.path.splitext(name)[1]
+            if suffix not in SCAN_SUFFIXES:
                 continue
+            relative = rel_dir + name
+            path = os.path.join(dirpath, name)
+            if suffix == ".md":
+                if relative.startswith("agents" + os.sep):
+                    agent_files.append(relative)
+                elif relative.startswith(("commands" + os.sep, os.path.join("scripts", "hooks") + os.sep)):
+                    hook_files.append(relative)
             try:
-                text = filepath.read_text(errors="replace")
-            except (OSError, PermissionError):
+                st = os.stat(path)
+            except OSError:
                 continue
-            for pattern in MODEL_PATTERNS:
-                matches = re.findall(pattern, text)
-                if matches:
-                    relative = filepath.relative_to(PLUGIN_ROOT)
-                    for m in matches:
-                        entry = {"file": str(relative), "model": m}
-                        if entry not in state["hardcoded_models"]:
-                            state["hardcoded_models"].append(entry)
-
-    # 3. Look at hook patterns in commands
-    commands_dir = PLUGIN_ROOT / "commands"
-    hooks_dir = PLUGIN_ROOT / "scripts" / "hooks"
-    for search_dir in [commands_dir, hooks_dir]:
-        if search_dir and search_dir.is_dir():
-            for f in sorted(search_dir.rglob("*.md")):
-                content = f.read_text(errors="replace")
-                fm_match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-                if fm_match:
-                    fm = fm_match.group(1)
-                    # Look for hook-related fields: hooks, trigger, event
-                    for field in ["hooks", "trigger", "event"]:
-                        match = re.search(rf"^{field}:\s*(.+)$", fm, re.MULTILINE)
-                        if match:
-                            relative = f.relative_to(PLUGIN_ROOT)
-                            state["hook_events"].append({
-                                "file": str(relative),
-                                "field": field,
-                                "value": match.group(1).strip(),
-                            })
+            hit = previous.get(relative)
+            if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                models = hit[2]
+            else:
+                try:
+                    with open(path, errors="replace") as f:
+                        models = scan_models(f.read())
+                except OSError:
+                    continue
+            scanned[relative] = [st.st_mtime_ns, st.st_size, models]
+            # 2. Hardcoded model names; (file, model) pairs are unique per file
+            for model in models:
+                state["hardcoded_models"].append({"file": relative, "model": model})
+
+    if use_cache and scanned != previous:
+        save_scan_cache(root, scanned)
+
+    # 1. Agents: memory, isolation, background fields (frontmatter only)
+    for relative in sorted(agent_files):
+        fm = read_frontmatter(root / relative, errors="replace").fields
+        features = {}
+        for field in ["memory", "isolation", "background"]:
+            value = fm.get(field)
+            if isinstance(value, str):
+                features[field] = value
+        if features:
+            state["agent_features"][relative] = features
+
+    # 3. Hook-related fields (hooks, trigger, event) in commands and hooks
+    for relative in sorted(hook_files):
+        fm = read_frontmatter(root / relative, errors="replace").fields
+        for field in ["hooks", "trigger", "event"]:
+            value = fm.get(field)
+            if isinstance(value, str):
+                state["hook_events"].append({
+                    "file": relative,
+                    "field": field,
+                    "value": value,
+                })
 
     return state
 
@@ -1157,34 +1410,23 @@ examples:
 
     args = parser.parse_args()
 
-    # Prerequisites
-    check_gh_installed()
-    check_gh_auth()
+    # Prerequisites (gh is only needed to supply the API token)
+    if args.product != "desktop" and not (os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")):
+        check_gh_installed()
+        check_gh_auth()
 
     # Load cache
     cache = {} if args.no_cache else load_cache()
 
-    # Fetch Code releases
-    releases = []
-    desktop_releases = []
-
-    if args.product in ("all", "code"):
-        releases = fetch_releases(
-            args.count, since=args.since,
-            cache=cache, refresh=args.refresh, no_cache=args.no_cache,
-        )
-        # Fetch and merge CHANGELOG (enriches releases with structured categories)
-        changelog_content = fetch_changelog(
-            cache=cache, refresh=args.refresh, no_cache=args.no_cache,
-        )
-        if changelog_content:
-            changelog_versions = parse_changelog(changelog_content)
-            releases = merge_changelog_with_releases(releases, changelog_versions)
-
-    if args.product in ("all", "desktop"):
-        desktop_releases = fetch_desktop_releases(
-            cache=cache, refresh=args.refresh, no_cache=args.no_cache,
-        )
+    # Fetch all sources concurrently
+    releases, changelog_content, desktop_releases = fetch_all(
+        args.product, args.count, since=args.since,
+        cache=cache, refresh=args.refresh, no_cache=args.no_cache,
+    )
+    if changelog_content:
+        # Enrich releases with structured CHANGELOG categories
+        changelog_versions = parse_changelog(changelog_content)
+        releases = merge_changelog_with_releases(releases, changelog_versions)
 
     if not releases and not desktop_releases:
         if args.fmt == "json":
@@ -1203,7 +1445,7 @@ examples:
         "NEW": [], "DEPRECATED": [], "BREAKING": [], "FIXED": [],
     }
 
-    craft_state = analyze_craft_state()
+    craft_state = analyze_craft_state(use_cache=not args.no_cache)
     action_items = generate_action_items(findings, craft_state)
 
     # Auto-fix mode
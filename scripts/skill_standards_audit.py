@@ -1,14 +1,14 @@
 """Audit skills/**/SKILL.md against Anthropic authoring standards.
 Mirrors scripts/command-audit.sh: scan -> checks -> score -> exit 0/1/2.
-Reuses commands/_discovery.py:parse_yaml_frontmatter.
+Reuses utils/frontmatter.py (the parser behind commands/_discovery.py).
 """
 import os, sys, re, json, argparse, datetime
 from pathlib import Path
 from collections import namedtuple
 
 REPO = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(REPO / "commands"))
-from _discovery import parse_yaml_frontmatter  # noqa: E402
+sys.path.insert(0, str(REPO))
+from utils.frontmatter import read_frontmatter  # noqa: E402
 
 SKILLS_DIR = REPO / "skills"
 STANDARDS_DOC = REPO / "docs" / "reference" / "SKILL-STANDARDS.md"
@@ -29,7 +29,7 @@ VALID_SKILL_KEYS = {
 Finding = namedtuple("Finding", "severity category path message")  # severity: "error"|"warning"
 
 def load_frontmatter(skill_md: Path) -> dict:
-    return parse_yaml_frontmatter(skill_md.read_text(encoding="utf-8"))
+    return read_frontmatter(skill_md).fields
 
 KEBAB = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
 
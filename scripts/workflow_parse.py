@@ -3,8 +3,9 @@
 
 Mechanical core (Increment 1): reads a WORKFLOW definition (YAML form or the
 frozen shape-DSL form), compiles it to a canonical *wave plan*, structurally
-validates agent outputs (D2 layer 1), computes cascade-aware cache keys (D4),
-and does run-wide semaphore-file arithmetic (D5).
+validates agent outputs (D2 layer 1), computes cascade-aware cache keys (D4)
+backed by a shared content-addressed output store, and leases run-wide
+semaphore slots as per-slot lease files (D5).
 
 Determinism core (validation + hashing + semaphore) is pure stdlib — no
 jsonschema, no node (D2/D3). YAML *input* reading uses PyYAML, already a craft
@@ -12,10 +13,21 @@ dependency; it is imported lazily inside parse_yaml() so the determinism core
 never even touches it.
 """
 
+import contextlib
+import functools
 import hashlib
 import json
 import os
+import random
 import re
+import socket
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: reapers are not serialized
+    fcntl = None
 
 # ---------------------------------------------------------------------------
 # Errors
@@ -53,12 +65,10 @@ def _scalar_ok(value, type_name):
     return False
 
 
-def structural_errors(data, schema):
-    """Return a list of structural error strings (empty == valid). Pure.
-
-    Dialect (v1): every declared key is required; values are primitives
-    (string/number/boolean) or homogeneous arrays (string[]/number[]/
-    boolean[]/object[]). No oneOf, regex, or conditional subschemas (D2).
+def _interpret_schema(data, schema):
+    """Reference interpreter for the v1 dialect: re-reads ``schema`` on every
+    call. ``compile_schema`` must agree with it message-for-message; kept for
+    that equivalence check and the benchmark, not for the hot path.
     """
     errors = []
     if not isinstance(data, dict):
@@ -99,6 +109,114 @@ def structural_errors(data, schema):
     return errors
 
 
+# Exact element types each spec accepts on the fast path. A JSON-decoded
+# output only ever holds these, so one ``set(map(type, value))`` settles a
+# whole array; anything else (bool in a number[], a str subclass, a bad
+# element) drops to the per-element isinstance walk that finds the evidence.
+_FAST_TYPES = {
+    "string": frozenset((str,)),
+    "number": frozenset((int, float)),
+    "boolean": frozenset((bool,)),
+    "object": frozenset((dict,)),
+}
+
+_COMPILED_SCHEMAS = {}
+
+
+def _element_ok(element_type):
+    if element_type == "object":
+        return lambda element: isinstance(element, dict)
+    return lambda element: _scalar_ok(element, element_type)
+
+
+def _compile_key_check(key, type_spec):
+    """One specialized check for one schema key; appends errors, returns None."""
+    if type_spec in _SCALAR_TYPES:
+        ok = _element_ok(type_spec)
+
+        def check(data, errors):
+            if key not in data:
+                errors.append(f"missing required key '{key}' ({type_spec})")
+                return
+            value = data[key]
+            if not ok(value):
+                errors.append(
+                    f"key '{key}': expected {type_spec}, got {type(value).__name__}"
+                )
+
+        return check
+    if type_spec in _ARRAY_TYPES:
+        element_type = type_spec[:-2]
+        fast = _FAST_TYPES[element_type]
+        ok = _element_ok(element_type)
+
+        def check(data, errors):
+            if key not in data:
+                errors.append(f"missing required key '{key}' ({type_spec})")
+                return
+            value = data[key]
+            if not isinstance(value, list):
+                errors.append(
+                    f"key '{key}': expected {type_spec}, got {type(value).__name__}"
+                )
+                return
+            if fast.issuperset(map(type, value)):
+                return
+            for i, element in enumerate(value):
+                if not ok(element):
+                    errors.append(
+                        f"key '{key}'[{i}]: expected {element_type}, "
+                        f"got {type(element).__name__}"
+                    )
+                    return
+
+        return check
+
+    def check(data, errors):
+        if key not in data:
+            errors.append(f"missing required key '{key}' ({type_spec})")
+            return
+        errors.append(f"key '{key}': unknown type spec '{type_spec}'")
+
+    return check
+
+
+def compile_schema(schema):
+    """Compile a v1 output schema to a validator ``data -> [errors]``. Pure.
+
+    The schema is interpreted once into one specialized check per key, then
+    memoized by its canonical JSON form, so a fan-out of hundreds of agents
+    sharing a schema pays for compilation once per process. Error messages
+    are identical to the interpreter's.
+    """
+    signature = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    validator = _COMPILED_SCHEMAS.get(signature)
+    if validator is not None:
+        return validator
+    checks = [_compile_key_check(key, spec) for key, spec in schema.items()]
+
+    def validator(data):
+        if not isinstance(data, dict):
+            return [f"output must be an object, got {type(data).__name__}"]
+        errors = []
+        for check in checks:
+            check(data, errors)
+        return errors
+
+    _COMPILED_SCHEMAS[signature] = validator
+    return validator
+
+
+def structural_errors(data, schema):
+    """Return a list of structural error strings (empty == valid). Pure.
+
+    Dialect (v1): every declared key is required; values are primitives
+    (string/number/boolean) or homogeneous arrays (string[]/number[]/
+    boolean[]/object[]). No oneOf, regex, or conditional subschemas (D2).
+    """
+    return compile_schema(schema)(data)
+
+
 def validate_output(data, schema, stage="?"):
     """Gating check: raise StructuralError on any structural miss (D2).
 
@@ -139,22 +257,22 @@ def _canon_path(raw):
     return s
 
 
-def parse(text, form="auto"):
+def parse(text, form="auto", pipelined=False):
     """Parse a WORKFLOW definition (YAML or shape-DSL) into a canonical plan."""
     if form == "auto":
         form = "dsl" if _looks_like_dsl(text) else "yaml"
     definition = parse_dsl(text) if form == "dsl" else parse_yaml(text)
-    return compile_plan(definition)
+    return compile_plan(definition, pipelined=pipelined)
 
 
 def _looks_like_dsl(text):
     return re.match(r"\s*(pipeline|parallel|agent)\s*\(", text) is not None
 
 
-def parse_file(path):
+def parse_file(path, pipelined=False):
     """Read a WORKFLOW definition file and compile it to a wave plan."""
     with open(path, encoding="utf-8") as handle:
-        return parse(handle.read())
+        return parse(handle.read(), pipelined=pipelined)
 
 
 _SHAPE_SIGNALS = {
@@ -199,9 +317,14 @@ def dry_run_actions(plan):
         if wave["type"] == "parallel":
             fanout = wave["fanout"]
             fan_note = f", fan {fanout['fan']}" if fanout.get("fan", 1) != 1 else ""
+            stream_note = (
+                ", streams per item"
+                if wave.get("release", {}).get("mode") == "per_item"
+                else ""
+            )
             lines.append(
-                f"{wave['id']}: parallel xN over ${{{fanout['over']}}}{fan_note} "
-                f"-> {role}"
+                f"{wave['id']}: parallel xN over ${{{fanout['over']}}}{fan_note}"
+                f"{stream_note} -> {role}"
             )
         elif wave["type"] == "verify":
             command = wave.get("command") or "(auto-detected)"
@@ -230,6 +353,36 @@ def gate_output(data, schema, stage="?", semantic_warning=None):
     }
 
 
+def gate_outputs(outputs, schema, stage="?", semantic_warnings=None):
+    """Batch ``gate_output`` for a whole wave sharing one schema.
+
+    The schema is compiled once for the batch; verdicts come back in input
+    order. ``semantic_warnings`` (optional) is a parallel list of advisory
+    warnings — like ``gate_output``, they never flip ``ok``. A warnings list
+    of a different length is a WorkflowError, so no output goes ungated.
+    """
+    if semantic_warnings is None:
+        semantic_warnings = [None] * len(outputs)
+    elif len(semantic_warnings) != len(outputs):
+        raise WorkflowError(
+            f"stage '{stage}': {len(semantic_warnings)} semantic warnings "
+            f"for {len(outputs)} outputs"
+        )
+    validator = compile_schema(schema)
+    verdicts = []
+    for data, warning in zip(outputs, semantic_warnings):
+        errors = validator(data)
+        verdicts.append(
+            {
+                "stage": stage,
+                "ok": not errors,
+                "structural_errors": errors,
+                "semantic_warning": warning,
+            }
+        )
+    return verdicts
+
+
 def parse_yaml(text):
     """Parse the YAML definition form into a normalized definition dict.
 
@@ -461,112 +614,419 @@ def parse_dsl(text):
     }
 
 
+_BINDING_HEAD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_BINDING_SEGMENT = re.compile(r"\[\](?:\.([A-Za-z_][A-Za-z0-9_]*))?|\.([A-Za-z_][A-Za-z0-9_]*)")
+
+
 def _binding_source(over):
     """The upstream stage id a canonical binding reads from."""
-    match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)", over)
-    if not match:
+    return compile_binding(over)["source"]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_binding(over):
+    head = _BINDING_HEAD.match(over)
+    if not head:
         raise WorkflowError(f"invalid binding {over!r}")
-    return match.group(1)
+    ops = []
+    pos = head.end()
+    while pos < len(over):
+        segment = _BINDING_SEGMENT.match(over, pos)
+        if not segment:
+            raise WorkflowError(f"invalid binding segment in {over!r}")
+        flat_field, field = segment.groups()
+        if segment.group(0).startswith("[]"):
+            ops.append(("flat", flat_field) if flat_field else ("each", None))
+        else:
+            ops.append(("field", field))
+        pos = segment.end()
+    return head.group(0), tuple(ops)
 
 
-def _resolve_binding(over, upstream_outputs):
-    """Walk a canonical binding (stage, [], .field) against real outputs."""
-    source = _binding_source(over)
+def compile_binding(over):
+    """Compile a canonical binding once into its source stage + path ops.
+
+    ``stage[].field.sub`` -> ``{"source": "stage", "ops": [["flat", "field"],
+    ["field", "sub"]]}``. Ops are ``field`` (``.name``), ``each`` (``[]``) and
+    ``flat`` (``[].name``: map over the collection, flatten one level).
+    ``compile_plan`` stores the result in each wave's ``paths`` so executors
+    never re-parse a binding string; ad-hoc callers hit a per-process memo.
+    """
+    source, ops = _compile_binding(over)
+    return {"source": source, "ops": [list(op) for op in ops]}
+
+
+def _flat(items, field, over):
+    for item in items:
+        if not isinstance(item, dict) or field not in item:
+            raise WorkflowError(f"binding {over!r}: element missing field {field!r}")
+        yield from item[field]
+
+
+def _walk_binding(over, upstream_outputs, path=None):
+    """Apply a compiled binding. Returns ``(value, streamed)``.
+
+    ``[]`` levels are chained generators, never intermediate list copies;
+    ``streamed`` says the result is such an iterator rather than a value.
+    """
+    path = path or compile_binding(over)
+    source = path["source"]
     if source not in upstream_outputs:
         raise WorkflowError(f"binding {over!r} references unknown stage {source!r}")
-    value = upstream_outputs[source]
-    rest = over[len(source):]
-    pos = 0
-    while pos < len(rest):
-        if rest[pos:pos + 2] == "[]":
-            pos += 2
-            field_match = re.match(r"\.([A-Za-z_][A-Za-z0-9_]*)", rest[pos:])
-            if field_match:
-                field = field_match.group(1)
-                pos += 1 + len(field)
-                flattened = []
-                for item in value:
-                    if not isinstance(item, dict) or field not in item:
-                        raise WorkflowError(
-                            f"binding {over!r}: element missing field {field!r}"
-                        )
-                    flattened.extend(item[field])
-                value = flattened
-            else:
-                value = list(value)
-        elif rest[pos] == ".":
-            field_match = re.match(r"\.([A-Za-z_][A-Za-z0-9_]*)", rest[pos:])
-            if not field_match:
-                raise WorkflowError(f"invalid binding segment in {over!r}")
-            field = field_match.group(1)
-            pos += 1 + len(field)
-            if not isinstance(value, dict) or field not in value:
-                raise WorkflowError(
-                    f"binding {over!r}: missing field {field!r}"
-                )
-            value = value[field]
-        else:
-            raise WorkflowError(f"invalid binding segment in {over!r}")
-    return value
+    value, streamed = upstream_outputs[source], False
+    for op, arg in path["ops"]:
+        if op == "field":
+            if streamed or not isinstance(value, dict) or arg not in value:
+                raise WorkflowError(f"binding {over!r}: missing field {arg!r}")
+            value = value[arg]
+        elif op == "flat":
+            value, streamed = _flat(value, arg, over), True
+        elif not streamed:  # "each" over a concrete collection
+            value, streamed = iter(value), True
+    return value, streamed
+
+
+def _resolve_binding(over, upstream_outputs, path=None):
+    """Walk a canonical binding (stage, [], .field) against real outputs."""
+    value, streamed = _walk_binding(over, upstream_outputs, path)
+    return list(value) if streamed else value
+
+
+def iter_fanout(over, upstream_outputs, path=None):
+    """Lazily yield a fan-out's bound items (no intermediate copies).
 
+    Same binding semantics and errors as ``resolve_fanout``, but a consumer
+    that only iterates never materializes the flattened collection — an
+    empty binding raises ``EmptyFanoutError`` once iteration ends with
+    nothing yielded.
+    """
+    value, streamed = _walk_binding(over, upstream_outputs, path)
+    if not streamed and not isinstance(value, list):
+        value = (value,)
+    empty = True
+    for item in value:
+        empty = False
+        yield item
+    if empty:
+        raise EmptyFanoutError(_empty_fanout_message(over))
+
+
+def _empty_fanout_message(over):
+    return (
+        f"fan-out '{over}' resolved to an empty array — upstream stage "
+        f"'{_binding_source(over)}' produced no items to fan out over"
+    )
 
-def resolve_fanout(over, upstream_outputs):
+
+def resolve_fanout(over, upstream_outputs, path=None):
     """Resolve a fan-out binding against real upstream outputs (runtime, D6).
 
     Returns the list of bound items. An empty result HARD-ABORTS with an
     EmptyFanoutError that names the upstream stage (D6/FR8) — empty fan-out
     is an upstream bug, not a silently-skipped stage.
     """
-    items = _resolve_binding(over, upstream_outputs)
-    if not isinstance(items, list):
-        items = [items]
-    if len(items) == 0:
-        source = _binding_source(over)
-        raise EmptyFanoutError(
-            f"fan-out '{over}' resolved to an empty array — upstream stage "
-            f"'{source}' produced no items to fan out over"
-        )
-    return items
+    return list(iter_fanout(over, upstream_outputs, path))
+
+
+# --- D5 run-wide semaphore: one lease file per slot (race-free, crash-safe) ---
+#
+# The counter-file arithmetic this replaces was a read-modify-write with no
+# locking: two dispatchers could both read 15, both write 16, and break the
+# ceiling until the next ``sem_reconcile``. Each held slot is now its own lease
+# file under ``<path>.d/``, created with an atomic ``os.link`` (EEXIST == slot
+# taken), so no two holders can ever occupy the same slot and no acquirer
+# waits on another. A lease records its owner (pid, host) and its mtime is the
+# heartbeat; a lease whose owner is dead or whose heartbeat is older than the
+# TTL is leaked and is reaped automatically by the next acquire that finds the
+# ceiling reached. Acquirers and releasers hold a shared ``flock`` of the lease
+# directory (so they never wait on each other) and reapers an exclusive one,
+# re-checking the lease token under it: a slot cannot change hands while a
+# reaper acts, so a reaper only ever removes the lease it judged. ``<path>``
+# itself stays a plain-text mirror of the live count so the run substrate
+# remains inspectable mid-run.
+
+DEFAULT_LEASE_TTL = 1800.0  # seconds without a heartbeat before a lease is leaked
+_LEASE_PREFIX = "slot-"
+_MAX_BACKOFF = 0.25
+
 
+def _lease_dir(path):
+    return path + ".d"
 
-def _sem_write(path, value):
-    value = max(0, int(value))
+
+def _lease_paths(path):
+    directory = _lease_dir(path)
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in names if name.startswith(_LEASE_PREFIX)
+    )
+
+
+def _sem_mirror(path):
+    """Rewrite the human-readable ``<path>`` counter from the lease directory.
+
+    Advisory only — the lease files are the source of truth. Written via a
+    unique temp file + ``os.replace`` so a reader never sees a torn value.
+    """
+    count = len(_lease_paths(path))
     directory = os.path.dirname(path)
     if directory:
         os.makedirs(directory, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as handle:
-        handle.write(str(value))
-    return value
+    tmp = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        handle.write(str(count))
+    os.replace(tmp, path)
+    return count
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _read_lease(lease):
+    try:
+        with open(lease, encoding="utf-8") as handle:
+            return json.loads(handle.read() or "{}")
+    except (OSError, ValueError):
+        return None
+
+
+def _lease_is_stale(lease, ttl, now=None):
+    """A lease is leaked when its owner pid is dead (same host) or its
+    heartbeat (mtime) is older than ``ttl`` seconds."""
+    try:
+        mtime = os.stat(lease).st_mtime
+    except FileNotFoundError:
+        return False
+    return _record_is_stale(_read_lease(lease), mtime, ttl, now)
+
+
+def _record_is_stale(record, mtime, ttl, now=None):
+    now = time.time() if now is None else now
+    if now - mtime > ttl:
+        return True
+    record = record or {}
+    pid = record.get("pid")
+    if pid and record.get("host") == socket.gethostname():
+        return not _pid_alive(int(pid))
+    return False
+
+
+def _try_create_lease(path, slot, record):
+    """Atomically create lease ``slot`` holding ``record``.
+
+    The record is written to a private temp file first and then hard-linked
+    into place, so the lease appears fully written or not at all, and
+    ``os.link`` fails with EEXIST if another holder got there first.
+    """
+    directory = _lease_dir(path)
+    lease = os.path.join(directory, f"{_LEASE_PREFIX}{slot:04d}")
+    tmp = os.path.join(directory, f".tmp-{os.getpid()}-{uuid.uuid4().hex}")
+    with open(tmp, "w", encoding="utf-8") as handle:
+        json.dump(record, handle)
+    try:
+        with _lease_lock(path, exclusive=False):
+            os.link(tmp, lease)
+    except FileExistsError:
+        return None
+    finally:
+        os.unlink(tmp)
+    return lease
+
+
+@contextlib.contextmanager
+def _lease_lock(path, exclusive=True):
+    """``flock`` the lease directory: shared for acquire/release, exclusive
+    for reapers.
+
+    Acquirers and releasers never block each other; they only wait out a
+    reaper (rare, and only at the ceiling). A no-op where ``fcntl`` is
+    unavailable or no lease directory exists yet.
+    """
+    if fcntl is None:
+        yield
+        return
+    try:
+        fd = os.open(_lease_dir(path), os.O_RDONLY)
+    except FileNotFoundError:
+        yield
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def _reap_one(path, lease, ttl):
+    """Remove ``lease`` if (and only if) it is still the stale lease we judged.
+
+    Under the exclusive lease lock the lease is re-opened and its token and
+    heartbeat re-checked through that fd, so a lease another reaper already
+    removed (and an acquirer re-took) is never touched. No acquire or release
+    can run until the lock drops, so the checked file is the one unlinked.
+    """
+    judged = _read_lease(lease)
+    if judged is None or not _lease_is_stale(lease, ttl):
+        return False
+    with _lease_lock(path):
+        try:
+            handle = open(lease, encoding="utf-8")
+        except FileNotFoundError:
+            return False
+        with handle:
+            try:
+                current = json.loads(handle.read() or "{}")
+            except ValueError:
+                current = None
+            checked = os.fstat(handle.fileno())
+            if current != judged or not _record_is_stale(current, checked.st_mtime, ttl):
+                return False
+            os.unlink(lease)
+            return True
+
+
+def sem_reap(path, ttl=DEFAULT_LEASE_TTL):
+    """Return leaked slots to the pool (dead owner or expired heartbeat).
+
+    Returns the number of leases reaped.
+    """
+    reaped = sum(1 for lease in _lease_paths(path) if _reap_one(path, lease, ttl))
+    if reaped:
+        _sem_mirror(path)
+    return reaped
 
 
 def sem_read(path):
-    """Read the run-wide live-agent counter (0 if the file is absent)."""
-    if not os.path.exists(path):
-        return 0
-    with open(path, encoding="utf-8") as handle:
-        text = handle.read().strip()
-    return int(text) if text else 0
+    """Read the run-wide live-agent count (0 if no semaphore exists yet)."""
+    return len(_lease_paths(path))
+
+
+def sem_try_lease(path, ceiling, pid=None, ttl=DEFAULT_LEASE_TTL):
+    """Take one slot without blocking. Returns the lease path, or None at the
+    ceiling.
+
+    ``pid`` is the process whose death should free the slot; leave it None
+    when the caller is a short-lived CLI shim (the heartbeat TTL then governs
+    leak recovery). Leaked leases are reaped before giving up.
+    """
+    os.makedirs(_lease_dir(path), exist_ok=True)
+    record = {
+        "pid": pid,
+        "host": socket.gethostname(),
+        "token": uuid.uuid4().hex,
+        "acquired": time.time(),
+    }
+    for attempt in range(2):
+        taken = {os.path.basename(p) for p in _lease_paths(path)}
+        for slot in range(ceiling):
+            if f"{_LEASE_PREFIX}{slot:04d}" in taken:
+                continue
+            lease = _try_create_lease(path, slot, record)
+            if lease is not None:
+                _sem_mirror(path)
+                return lease
+        if attempt == 0 and not sem_reap(path, ttl):
+            break
+    return None
+
 
+def sem_lease(path, ceiling, timeout=0.0, pid=None, ttl=DEFAULT_LEASE_TTL):
+    """Take one slot, waiting up to ``timeout`` seconds for one to free up.
 
-def sem_acquire(path, ceiling):
-    """Try to take one slot. Increment & return True if below the ceiling,
-    else leave the counter untouched and return False (refuse dispatch)."""
-    current = sem_read(path)
-    if current >= ceiling:
+    Waits with capped exponential backoff rather than spin-polling. Returns
+    the lease path, or None if the ceiling held for the whole timeout.
+    """
+    deadline = time.monotonic() + max(0.0, timeout)
+    delay = 0.005
+    while True:
+        lease = sem_try_lease(path, ceiling, pid=pid, ttl=ttl)
+        if lease is not None:
+            return lease
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay * (0.5 + random.random()), remaining))
+        delay = min(delay * 2, _MAX_BACKOFF)
+
+
+def sem_acquire(path, ceiling, timeout=0.0, pid=None, ttl=DEFAULT_LEASE_TTL):
+    """Try to take one slot. True if a slot was leased, else False (refuse
+    dispatch) — the count never exceeds the ceiling, even under concurrency."""
+    return sem_lease(path, ceiling, timeout=timeout, pid=pid, ttl=ttl) is not None
+
+
+def sem_heartbeat(lease):
+    """Refresh a held lease's heartbeat. Returns False if it was reaped."""
+    try:
+        os.utime(lease)
+    except FileNotFoundError:
         return False
-    _sem_write(path, current + 1)
     return True
 
 
-def sem_release(path):
-    """Release one slot; decrement the counter (floored at 0). Returns new value."""
-    return _sem_write(path, sem_read(path) - 1)
+def sem_release(path, lease=None):
+    """Release ``lease``. Returns the new count, floored at 0.
+
+    Without a lease (callers of the boolean ``sem_acquire``) this is a
+    reconcile-style decrement: the stalest lease — oldest heartbeat — is
+    dropped, exactly as ``sem_reconcile`` would pick it. Dispatchers that
+    hold a lease should always pass it, so no other holder's slot is revoked.
+    """
+    if not lease:
+        return sem_reconcile(path, len(_lease_paths(path)) - 1)
+    with _lease_lock(path, exclusive=False):
+        try:
+            os.unlink(lease)
+        except FileNotFoundError:
+            pass
+    return _sem_mirror(path)
 
 
 def sem_reconcile(path, live_count):
-    """Reset the counter to the actual live-agent count at a wave boundary,
-    healing leaks from a mid-run crash (D5 residual-risk mitigation)."""
-    return _sem_write(path, live_count)
+    """Reset the semaphore to the actual live-agent count at a wave boundary,
+    healing leaks from a mid-run crash (D5 residual-risk mitigation).
+
+    Drops the stalest leases first; pads with ownerless leases if more agents
+    are live than the semaphore knows about.
+    """
+    live_count = max(0, int(live_count))
+
+    def heartbeat(lease):
+        try:
+            return os.stat(lease).st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    with _lease_lock(path):
+        leases = _lease_paths(path)
+        for lease in sorted(leases, key=heartbeat)[: max(0, len(leases) - live_count)]:
+            try:
+                os.unlink(lease)
+            except FileNotFoundError:
+                pass
+    slot = 0
+    while sem_read(path) < live_count:
+        os.makedirs(_lease_dir(path), exist_ok=True)
+        _try_create_lease(
+            path,
+            slot,
+            {"pid": None, "host": socket.gethostname(), "token": uuid.uuid4().hex,
+             "acquired": time.time()},
+        )
+        slot += 1
+    return _sem_mirror(path)
 
 
 def cache_key(stage_block, resolved_input, role_prompt_version):
@@ -589,6 +1049,118 @@ def cache_key(stage_block, resolved_input, role_prompt_version):
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+# --- D4 shared output store: content-addressed by unit_key, LRU-bounded ---
+#
+# Per-run output JSON under ``.craft/workflow-runs/<run-id>/`` only helps a
+# ``--resume`` of that same run. The store is shared by every run of every
+# WORKFLOW definition: an agent output is filed under its ``unit_key`` at
+# ``<root>/<key[:2]>/<key>.json``, so any stage (on any branch, in any run)
+# whose key already exists is replayed with zero model calls. An entry's
+# mtime is its last use — ``store_get`` touches it — which is all ``store_gc``
+# needs to evict least-recently-used entries by size and age.
+
+DEFAULT_STORE_DIR = os.path.join(".craft", "workflow-cache")
+DEFAULT_STORE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_STORE_MAX_AGE_DAYS = 30
+
+
+def store_path(root, key):
+    """Where the output for ``key`` lives in the store (sharded by prefix)."""
+    if not re.fullmatch(r"[0-9a-f]{64}", key or ""):
+        raise WorkflowError(f"invalid cache key {key!r}")
+    return os.path.join(root, key[:2], key + ".json")
+
+
+def store_get(root, key, default=None):
+    """Return the stored output for ``key``, or ``default`` on a miss.
+
+    Pass a sentinel ``default`` to tell a miss from a stored ``None``. A hit
+    refreshes the entry's mtime so LRU eviction keeps it.
+    """
+    path = store_path(root, key)
+    try:
+        with open(path, encoding="utf-8") as handle:
+            record = json.load(handle)
+    except FileNotFoundError:
+        return default
+    except ValueError:
+        # A torn/corrupt entry is a miss, never a crash — and never reused.
+        # Another reader may have hit (and removed) the same entry first.
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        return default
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+    return record.get("output")
+
+
+def store_put(root, key, output, stage=None):
+    """File a gated agent output under ``key``. Atomic; returns the path.
+
+    Only outputs that passed ``gate_output`` belong here — the store is
+    shared, so a structurally bad output would poison every later run.
+    """
+    path = store_path(root, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    record = {"key": key, "stage": stage, "stored": time.time(), "output": output}
+    tmp = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        json.dump(record, handle, sort_keys=True, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def store_gc(
+    root,
+    max_bytes=DEFAULT_STORE_MAX_BYTES,
+    max_age_days=DEFAULT_STORE_MAX_AGE_DAYS,
+    now=None,
+):
+    """Evict entries unused for ``max_age_days``, then least-recently-used
+    entries until the store fits in ``max_bytes``. ``None`` disables a bound.
+
+    Returns ``{"removed", "freed_bytes", "kept", "bytes"}``.
+    """
+    now = time.time() if now is None else now
+    entries = []
+    try:
+        shards = os.scandir(root)
+    except FileNotFoundError:
+        return {"removed": 0, "freed_bytes": 0, "kept": 0, "bytes": 0}
+    with shards:
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(shard.path) as files:
+                for entry in files:
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+    entries.sort()  # oldest use first
+    removed = freed = 0
+    total = sum(size for _, size, _ in entries)
+    cutoff = None if max_age_days is None else now - max_age_days * 86400
+    kept = []
+    for mtime, size, path in entries:
+        too_old = cutoff is not None and mtime < cutoff
+        too_big = max_bytes is not None and total > max_bytes
+        if too_old or too_big:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            removed += 1
+            freed += size
+            total -= size
+        else:
+            kept.append(path)
+    return {"removed": removed, "freed_bytes": freed, "kept": len(kept), "bytes": total}
+
+
 def build_deps(plan):
     """Derive the stage dependency graph from a wave plan's bindings (D4).
 
@@ -638,12 +1210,253 @@ def cascade_invalidate(stages, changed, deps):
     return invalid
 
 
-def compile_plan(definition):
+# --- D4 incremental resume planner: exact re-run set + reuse map ---
+#
+# A run records, per stage, the cache key and gated output of every unit of
+# work it dispatched (``record_stage``) under ``<run-dir>/stages/``. The
+# planner walks the CURRENT plan in wave order, recomputes each unit's key
+# against the current definition block, role version and resolved input, and
+# marks it ``reuse`` when that key was recorded (or is in the shared store)
+# and ``rerun`` otherwise. A ``parallel`` stage is keyed per fan-out item x
+# replica, so a 200-wide fan-out whose upstream grew by three items re-runs
+# three agents, not the wave. Items that can only be bound once a re-running
+# upstream produces output are reported as ``pending``.
+
+
+class _Pending:
+    """Placeholder for an upstream output that only a re-run can produce."""
+
+    def __repr__(self):
+        return "<pending>"
+
+
+_PENDING = _Pending()
+
+
+def stage_units(wave, upstream_outputs):
+    """The units of work a wave dispatches, as their resolved inputs.
+
+    An ``agent``/``loop``/``verify`` stage is one unit whose input is its
+    resolved ``input`` binding (None if unbound). A ``parallel`` stage is one
+    unit per bound item per ``fan`` replica: ``{"item": ..., "replica": r}``.
+    These are the ``resolved_input`` values ``cache_key`` hashes.
+    """
+    fanout = wave["fanout"]
+    paths = wave.get("paths") or {}
+    if fanout.get("kind") != "dynamic":
+        binding = wave.get("input")
+        if not binding:
+            return [None]
+        return [_resolve_binding(binding, upstream_outputs, paths.get("input"))]
+    items = resolve_fanout(fanout["over"], upstream_outputs, paths.get("over"))
+    fan = fanout.get("fan", 1)
+    return [{"item": item, "replica": r} for item in items for r in range(fan)]
+
+
+# Wave fields derived from the definition for the executor — HOW a stage is
+# scheduled (``release``) and its precompiled binding ``paths`` — not what it
+# computes. Excluded from unit keys so a pipelined run and a wave-barrier run
+# of the same definition share cache entries.
+_DERIVED_KEYS = ("release", "paths")
+
+
+def unit_key(wave, resolved_input, role_version):
+    """``cache_key`` of one unit of ``wave`` — the key recorded and stored."""
+    block = {k: v for k, v in wave.items() if k not in _DERIVED_KEYS}
+    return cache_key(block, resolved_input, role_version)
+
+
+def record_stage(run_dir, stage_id, role_version, units):
+    """Persist a stage's ``(key, output)`` units for a later resume plan.
+
+    ``units`` is in dispatch order (the order ``stage_units`` returns).
+    Written atomically so a crash mid-run never leaves a torn record.
+    """
+    directory = os.path.join(run_dir, "stages")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{stage_id}.json")
+    record = {
+        "stage": stage_id,
+        "role_version": role_version,
+        "units": [{"key": key, "output": output} for key, output in units],
+    }
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        json.dump(record, handle, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def load_run_record(run_dir):
+    """Load every ``record_stage`` record of a prior run: ``{stage_id: record}``."""
+    directory = os.path.join(run_dir, "stages")
+    records = {}
+    try:
+        names = sorted(os.listdir(directory))
+    except FileNotFoundError:
+        raise WorkflowError(f"no recorded stages under {directory!r}") from None
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(directory, name), encoding="utf-8") as handle:
+            record = json.load(handle)
+        records[record["stage"]] = record
+    return records
+
+
+def _known_outputs(upstream_outputs, binding):
+    """Upstream view for planning: drop pending elements of a ``[]`` source.
+
+    Returns ``(outputs, partial)``; raises ``LookupError`` if the binding can
+    not be resolved at all until its source re-runs.
+    """
+    source = _binding_source(binding)
+    value = upstream_outputs.get(source, _PENDING)
+    if value is _PENDING:
+        raise LookupError(source)
+    if isinstance(value, list) and any(v is _PENDING for v in value):
+        if not binding[len(source):].startswith("[]"):
+            raise LookupError(source)
+        known = [v for v in value if v is not _PENDING]
+        return dict(upstream_outputs, **{source: known}), True
+    return upstream_outputs, False
+
+
+def resume_plan(plan, records, role_versions=None, store_root=None):
+    """Decide ``reuse`` / ``rerun`` for every unit of ``plan`` (D4).
+
+    Args:
+        plan: the CURRENT compiled wave plan.
+        records: ``load_run_record(run_dir)`` of the prior run.
+        role_versions: ``{role: version}``; a role absent here keeps the
+            version the prior run recorded.
+        store_root: optional shared output store; a unit whose key is there
+            is reused even if the prior run never dispatched it.
+
+    Returns a JSON-ready dict: per-stage actions, per-unit keys, the reuse
+    map ``{key: {"stage", "unit", "source"}}`` and totals.
+    """
+    role_versions = role_versions or {}
+    outputs = {}
+    stages = []
+    reuse_map = {}
+    totals = {"reuse": 0, "rerun": 0}
+    for wave in plan["waves"]:
+        stage_id = wave["id"]
+        record = records.get(stage_id) or {}
+        version = role_versions.get(wave.get("role"), record.get("role_version"))
+        entry = {"id": stage_id, "role_version": version, "pending": False, "units": []}
+        stages.append(entry)
+
+        if wave["type"] == "verify":
+            # Exit status is authoritative (D8) — a verify gate never replays.
+            entry.update(action="rerun", reason="verify gates always re-run")
+            outputs[stage_id] = _PENDING
+            totals["rerun"] += 1
+            continue
+
+        over = wave["fanout"].get("over")
+        dynamic = wave["fanout"].get("kind") == "dynamic"
+        bindings = [b for b in (over, wave.get("input")) if b]
+        view, partial = outputs, False
+        try:
+            for binding in bindings:
+                view, was_partial = _known_outputs(view, binding)
+                if was_partial and not (dynamic and binding == over):
+                    # Only fan-out items can be planned one by one; a unit
+                    # that reads the whole list needs every element.
+                    raise LookupError(_binding_source(binding))
+                partial = partial or was_partial
+            resolved = stage_units(wave, view)
+        except LookupError as exc:
+            entry.update(
+                action="rerun",
+                reason=f"upstream stage '{exc.args[0]}' re-runs",
+                pending=True,
+            )
+            outputs[stage_id] = _PENDING
+            continue
+        except EmptyFanoutError:
+            if not partial:
+                raise
+            resolved = []
+
+        prior = {u["key"]: u["output"] for u in record.get("units", [])}
+        produced = []
+        for index, resolved_input in enumerate(resolved):
+            key = unit_key(wave, resolved_input, version)
+            source = None
+            if key in prior:
+                source, output = "run", prior[key]
+            elif store_root is not None:
+                output = store_get(store_root, key, _PENDING)
+                if output is not _PENDING:
+                    source = "store"
+            if source:
+                reuse_map[key] = {"stage": stage_id, "unit": index, "source": source}
+                produced.append(output)
+                totals["reuse"] += 1
+            else:
+                produced.append(_PENDING)
+                totals["rerun"] += 1
+            entry["units"].append(
+                {"unit": index, "key": key, "action": "reuse" if source else "rerun"}
+            )
+
+        actions = {u["action"] for u in entry["units"]}
+        entry["pending"] = partial
+        if partial or "rerun" in actions:
+            entry["action"] = "partial" if "reuse" in actions else "rerun"
+        else:
+            entry["action"] = "reuse"
+        if dynamic:
+            outputs[stage_id] = produced + ([_PENDING] if partial else [])
+        else:
+            outputs[stage_id] = produced[0] if produced else _PENDING
+    return {"stages": stages, "reuse": reuse_map, "totals": totals}
+
+
+def _release_rule(wave, previous, types):
+    """How a wave's units are released in the pipelined schedule.
+
+    ``per_item``: a ``parallel`` stage bound through ``src[]`` of a
+    ``parallel`` upstream — each upstream unit maps to its own downstream
+    items, so they are released as soon as that one unit passes its gate.
+    ``barrier``: everything else waits for its upstream stages to close —
+    the stages it binds to, or (if unbound) the stage before it, so fixed
+    control flow is preserved.
+    """
+    over = wave["fanout"].get("over") if wave["fanout"].get("kind") == "dynamic" else None
+    if over and not wave.get("input"):
+        source = _binding_source(over)
+        if types.get(source) == "parallel" and over[len(source):].startswith("[]"):
+            return {"mode": "per_item", "upstream": [source]}
+    upstream = sorted(
+        {_binding_source(b) for b in (over, wave.get("input")) if b}
+    )
+    if not upstream and previous is not None:
+        upstream = [previous]
+    return {"mode": "barrier", "upstream": upstream}
+
+
+def release_rules(plan):
+    """``{stage_id: release rule}`` for every wave (see ``_release_rule``)."""
+    rules, types, previous = {}, {}, None
+    for wave in plan["waves"]:
+        rules[wave["id"]] = wave.get("release") or _release_rule(wave, previous, types)
+        types[wave["id"]] = wave["type"]
+        previous = wave["id"]
+    return rules
+
+
+def compile_plan(definition, pipelined=False):
     """Compile a normalized definition dict into the canonical wave plan.
 
     The wave plan is the deterministic normal form D1 reproduces: identical
     upstream definitions (and, for dynamic fan-out, identical upstream
-    outputs) produce identical waves.
+    outputs) produce identical waves. With ``pipelined=True`` every wave also
+    carries its per-item ``release`` rule and the plan's ``schedule`` is
+    ``pipelined`` — what ``StreamScheduler`` executes.
     """
     waves = []
     seen = set()
@@ -682,14 +1495,145 @@ def compile_plan(definition):
                 "input": stage.get("input"),
                 "command": stage.get("command"),  # set only for type=verify (D8)
                 "max_iter": stage.get("max_iter"),  # set only for type=loop
+                # Bindings compiled once here; executors never re-parse them.
+                "paths": {
+                    "over": compile_binding(fanout["over"]) if "over" in fanout else None,
+                    "input": compile_binding(stage["input"]) if stage.get("input") else None,
+                },
             }
         )
         seen.add(stage["id"])
-    return {
+    plan = {
         "name": definition.get("name"),
         "max_concurrent": definition.get("max_concurrent", DEFAULT_CEILING),
+        "schedule": "pipelined" if pipelined else "waves",
         "waves": waves,
     }
+    if pipelined:
+        for wave, rule in zip(waves, release_rules(plan).values()):
+            wave["release"] = rule
+    return plan
+
+
+# --- pipelined execution: release downstream items per upstream element ---
+
+
+def _unit_order(unit_id):
+    return tuple(int(part) for part in unit_id.split("/"))
+
+
+class StreamScheduler:
+    """Executor helper for the pipelined schedule (no global wave barrier).
+
+    A ``per_item`` stage's units are released the moment the upstream unit
+    they derive from passes ``gate_output``; a ``barrier`` stage's units are
+    released once every upstream stage has closed (all its units finished).
+    A unit that fails its gate releases nothing downstream (failure
+    isolation). Unit ids encode their lineage (``"<upstream unit>/<j>"``),
+    and outputs are assembled in lineage order, so a barrier consumer sees
+    exactly the input the wave schedule would have given it (D1).
+
+    Usage: dispatch ``start()``'s units, then for each finished agent call
+    ``complete(stage, unit, output, ok)`` and dispatch what it returns, until
+    ``finished``. Each unit is ``{"stage", "unit", "input"}``.
+    """
+
+    def __init__(self, plan, upstream_outputs=None):
+        self.waves = {wave["id"]: wave for wave in plan["waves"]}
+        self.order = [wave["id"] for wave in plan["waves"]]
+        self.rules = release_rules(plan)
+        self.seed = dict(upstream_outputs or {})
+        self.results = {sid: {} for sid in self.order}  # unit -> (ok, output)
+        self.released = {sid: set() for sid in self.order}
+        self.opened = set()
+        self.closed = set()
+
+    @property
+    def finished(self):
+        return len(self.closed) == len(self.order)
+
+    @property
+    def outputs(self):
+        """Gated outputs of every closed stage, shaped like the wave schedule's."""
+        return {sid: self._stage_output(sid) for sid in self.order if sid in self.closed}
+
+    def _stage_output(self, stage_id):
+        passed = [
+            output
+            for unit, (ok, output) in sorted(
+                self.results[stage_id].items(), key=lambda kv: _unit_order(kv[0])
+            )
+            if ok
+        ]
+        if self.waves[stage_id]["type"] == "parallel":
+            return passed
+        return passed[0] if passed else None
+
+    def _units(self, stage_id, upstream_outputs, prefix=""):
+        wave = self.waves[stage_id]
+        if wave["type"] == "parallel" and prefix:
+            value, streamed = _walk_binding(
+                wave["fanout"]["over"], upstream_outputs, (wave.get("paths") or {}).get("over")
+            )
+            items = value if streamed or isinstance(value, list) else [value]
+            fan = wave["fanout"].get("fan", 1)
+            inputs = [{"item": item, "replica": r} for item in items for r in range(fan)]
+        else:
+            inputs = stage_units(wave, upstream_outputs)
+        units = []
+        for j, resolved_input in enumerate(inputs):
+            unit_id = f"{prefix}{j}"
+            self.released[stage_id].add(unit_id)
+            units.append({"stage": stage_id, "unit": unit_id, "input": resolved_input})
+        return units
+
+    def _advance(self):
+        """Open barrier stages whose upstream closed; close drained stages."""
+        released = []
+        progress = True
+        while progress:
+            progress = False
+            for stage_id in self.order:
+                rule = self.rules[stage_id]
+                upstream_closed = all(u in self.closed for u in rule["upstream"])
+                if stage_id not in self.opened and rule["mode"] == "barrier" and upstream_closed:
+                    self.opened.add(stage_id)
+                    view = dict(self.seed, **self.outputs)
+                    released.extend(self._units(stage_id, view))
+                    progress = True
+                if (
+                    stage_id not in self.closed
+                    and (stage_id in self.opened or rule["mode"] == "per_item")
+                    and upstream_closed
+                    and len(self.results[stage_id]) == len(self.released[stage_id])
+                ):
+                    if rule["mode"] == "per_item" and not self.released[stage_id]:
+                        over = self.waves[stage_id]["fanout"]["over"]
+                        raise EmptyFanoutError(_empty_fanout_message(over))
+                    self.closed.add(stage_id)
+                    progress = True
+        return released
+
+    def start(self):
+        """Release every unit that is ready before any agent has run."""
+        return self._advance()
+
+    def complete(self, stage_id, unit_id, output, ok=True):
+        """Record a finished unit (``ok`` = its gate verdict); return newly
+        released units."""
+        if unit_id not in self.released.get(stage_id, ()):
+            raise WorkflowError(f"unit {stage_id}:{unit_id} was never released")
+        if unit_id in self.results[stage_id]:
+            raise WorkflowError(f"unit {stage_id}:{unit_id} completed twice")
+        self.results[stage_id][unit_id] = (ok, output)
+        released = []
+        if ok:
+            for downstream in self.order:
+                rule = self.rules[downstream]
+                if rule["mode"] == "per_item" and rule["upstream"] == [stage_id]:
+                    view = dict(self.seed, **{stage_id: [output]})
+                    released.extend(self._units(downstream, view, prefix=f"{unit_id}/"))
+        return released + self._advance()
 
 
 # ---------------------------------------------------------------------------
@@ -707,11 +1651,35 @@ def main(argv=None):
     import argparse
     import sys
 
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["gc"]:
+        return _gc_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         prog="workflow_parse",
         description="Compile a WORKFLOW definition (YAML or shape-DSL) to a wave plan.",
     )
     parser.add_argument("file", help="path to a WORKFLOW-*.yaml or shape-DSL file")
+    parser.add_argument(
+        "--resume-plan",
+        metavar="RUN_DIR",
+        help="emit the per-stage/per-item reuse vs re-run plan against a prior run",
+    )
+    parser.add_argument(
+        "--role-versions",
+        metavar="FILE",
+        help="JSON {role: version} for --resume-plan (default: the prior run's)",
+    )
+    parser.add_argument(
+        "--store",
+        default=DEFAULT_STORE_DIR,
+        help="shared output store consulted by --resume-plan",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="emit per-item release rules (downstream items start before the wave ends)",
+    )
     parser.add_argument(
         "-n",
         "--dry-run",
@@ -721,7 +1689,7 @@ def main(argv=None):
     args = parser.parse_args(argv)
 
     try:
-        plan = parse_file(args.file)
+        plan = parse_file(args.file, pipelined=args.pipelined)
     except WorkflowError as exc:
         print(f"workflow error: {exc}", file=sys.stderr)
         return 2
@@ -729,6 +1697,27 @@ def main(argv=None):
         print(f"no such file: {args.file}", file=sys.stderr)
         return 2
 
+    if args.resume_plan:
+        try:
+            role_versions = None
+            if args.role_versions:
+                with open(args.role_versions, encoding="utf-8") as handle:
+                    role_versions = json.load(handle)
+            result = resume_plan(
+                plan,
+                load_run_record(args.resume_plan),
+                role_versions=role_versions,
+                store_root=args.store,
+            )
+        except WorkflowError as exc:
+            print(f"workflow error: {exc}", file=sys.stderr)
+            return 2
+        except (OSError, ValueError) as exc:
+            print(f"resume-plan error: {exc}", file=sys.stderr)
+            return 2
+        print(json.dumps(result, indent=2))
+        return 0
+
     if args.dry_run:
         name = plan.get("name") or "(unnamed)"
         print(f"DRY RUN: {name}  (run-wide ceiling: {plan['max_concurrent']})")
@@ -740,6 +1729,46 @@ def main(argv=None):
     return 0
 
 
+def _gc_main(argv):
+    """``workflow_parse.py gc`` — evict the shared output store (D4)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="workflow_parse gc",
+        description="Evict stale / least-recently-used entries from the shared output store.",
+    )
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR, help="store root directory")
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_STORE_MAX_BYTES,
+        help="evict LRU entries until the store fits (0 = unbounded)",
+    )
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=DEFAULT_STORE_MAX_AGE_DAYS,
+        help="evict entries unused for this long (0 = no age limit)",
+    )
+    parser.add_argument("--json", action="store_true", help="emit the result as JSON")
+    args = parser.parse_args(argv)
+
+    result = store_gc(
+        args.store,
+        max_bytes=args.max_bytes or None,
+        max_age_days=args.max_age_days or None,
+    )
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(
+            f"gc {args.store}: removed {result['removed']} "
+            f"({result['freed_bytes']} bytes), kept {result['kept']} "
+            f"({result['bytes']} bytes)"
+        )
+    return 0
+
+
 if __name__ == "__main__":
     import sys
 
@@ -18,6 +18,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import pytest
+
 
 # ---------------------------------------------------------------------------
 # Project paths
@@ -192,3 +194,23 @@ def make_edit_json(file_path: str, cwd: str) -> dict[str, Any]:
         },
         "cwd": cwd,
     }
+
+
+# ---------------------------------------------------------------------------
+# Microbenchmarks
+# ---------------------------------------------------------------------------
+
+BENCHMARK_XFAIL_REASON = (
+    "microbenchmark: wall-clock timing is a soft signal on shared CI runners, not a "
+    "release gate"
+)
+
+
+def timing_bound(ok: bool, detail: str) -> None:
+    """Soft-check a wall-clock bound in a ``benchmark_xfail`` test.
+
+    A missed bound xfails the test instead of failing it. Call it only after
+    the test's correctness assertions, which stay hard failures.
+    """
+    if not ok:
+        pytest.xfail(f"{BENCHMARK_XFAIL_REASON}: {detail}")
@@ -10,6 +10,8 @@ Covers:
 - Backup/restore
 """
 
+import difflib
+import re
 import unittest
 import tempfile
 from pathlib import Path
@@ -26,6 +28,7 @@ from utils.claude_md_section_editor import (
     SectionParser, SectionEditor, Section,
     format_section_list, get_section_diff, calculate_change_stats
 )
+from utils.claude_md_document import ClaudeMdDocument, EditBuffer
 
 
 class TestSectionParsing(unittest.TestCase):
@@ -233,6 +236,146 @@ class TestDiffGeneration(unittest.TestCase):
         self.assertAlmostEqual(stats["diff_percent"], 66.7, places=1)
 
 
+class TestClaudeMdDocument(unittest.TestCase):
+    """Test the shared section tree and its incremental edits."""
+
+    SAMPLE = (
+        "# Title\n\nIntro\n\n"
+        "## Setup\n\nInstall it.\n\n### Details\n\nMore.\n\n"
+        "## [Usage](docs/usage.md) *guide*\n\nRun it.\n"
+    )
+
+    def _tree(self, document):
+        return [(h.level, h.name, h.line, h.end) for h in document.headings]
+
+    def test_heading_tree(self):
+        """Headings carry line numbers, subtree ends and parent links."""
+        doc = ClaudeMdDocument.from_text(self.SAMPLE)
+
+        title, setup, details, usage = doc.headings
+        self.assertEqual([title], doc.roots)
+        self.assertEqual([setup, usage], title.children)
+        self.assertIs(details.parent, setup)
+        self.assertEqual((setup.line, setup.end), (4, 12))
+        self.assertEqual(title.end, len(doc.lines))
+
+    def test_views(self):
+        """Flat, per-level and title views agree with the heading lines."""
+        doc = ClaudeMdDocument.from_text(self.SAMPLE)
+
+        self.assertEqual(
+            [(h.name, start, end) for h, start, end in doc.flat_sections()],
+            [("Title", 0, 4), ("Setup", 4, 8), ("Details", 8, 12),
+             ("[Usage](docs/usage.md) *guide*", 12, 16)],
+        )
+        self.assertEqual(
+            [(name, start, end) for name, _, start, end in doc.sections(2)],
+            [("header", 0, 4), ("Setup", 4, 12),
+             ("[Usage](docs/usage.md) *guide*", 12, 16)],
+        )
+        self.assertEqual(doc.titles(2), ["Title", "Setup", "Usage guide"])
+
+    def test_replace_lines_matches_reparse(self):
+        """Splicing lines leaves the same tree as parsing the result."""
+        doc = ClaudeMdDocument.from_text(self.SAMPLE)
+        doc.headings  # Build before editing
+
+        doc.replace_lines(4, 8, ["## Install", "", "# Appendix", ""])
+
+        fresh = ClaudeMdDocument(doc.lines)
+        self.assertEqual(self._tree(doc), self._tree(fresh))
+        self.assertEqual(doc.text, fresh.text)
+
+    def test_replace_text_matches_str_replace(self):
+        """replace_text edits like str.replace, across line breaks too."""
+        for old, new in [("it.", "it now."), ("\n\n### Details", ""),
+                         ("Intro\n", "# Moved\n"), ("missing", "x")]:
+            doc = ClaudeMdDocument.from_text(self.SAMPLE)
+            doc.headings
+
+            count = doc.replace_text(old, new)
+
+            expected = self.SAMPLE.replace(old, new)
+            self.assertEqual(count, self.SAMPLE.count(old))
+            self.assertEqual(doc.text, expected)
+            self.assertEqual(doc.lines, expected.split("\n"))
+            self.assertEqual(self._tree(doc),
+                             self._tree(ClaudeMdDocument.from_text(expected)))
+
+    def test_line_of(self):
+        """Character offsets map back to their line."""
+        doc = ClaudeMdDocument.from_text(self.SAMPLE)
+
+        self.assertEqual(doc.line_of(0), 0)
+        self.assertEqual(doc.line_of(doc.text.index("## Setup")), 4)
+        self.assertEqual(doc.line_of(len(doc.text)), len(doc.lines) - 1)
+
+
+class TestEditBuffer(unittest.TestCase):
+    """Test pending line edits, their materialization and diff."""
+
+    LINES = ["# Title", "", "v1.0 released", "progress: 10%", "see /craft:old", "end"]
+
+    def _udiff(self, before, after):
+        return "".join(
+            line + "\n" for line in difflib.unified_diff(
+                before, after, "a/CLAUDE.md", "b/CLAUDE.md", lineterm=""
+            )
+        )
+
+    def test_sub_matches_re_subn(self):
+        """sub() gives re.subn results, including matches across lines."""
+        text = "\n".join(self.LINES)
+        for pattern, repl in [(r"\d+", "N"), (r"released\nprogress", "X"),
+                              (r"^(\w+):", r"\1 ="), (r"missing", "")]:
+            edits = EditBuffer(self.LINES)
+            count = edits.sub(pattern, repl, flags=re.MULTILINE)
+
+            expected, expected_count = re.subn(pattern, repl, text, flags=re.MULTILINE)
+            self.assertEqual(edits.text, expected)
+            self.assertEqual(count, expected_count)
+
+    def test_edits_compose(self):
+        """Covering edits supersede earlier ones; partial overlaps are refused."""
+        edits = EditBuffer(self.LINES)
+        edits.sub(r"10%", "50%")
+        self.assertEqual(edits.current(3, 4), ["progress: 50%"])
+
+        # Rewriting the whole line builds on the substitution
+        self.assertEqual(edits.map_lines(
+            lambda line: [f"<!-- {line} -->"] if "progress" in line else None
+        ), 1)
+        self.assertIn("<!-- progress: 50% -->", edits.lines)
+
+        self.assertTrue(edits.delete(4, 6))
+        self.assertIsNone(edits.current(5, 6))    # Already deleted
+        self.assertFalse(edits.replace(5, 7, []))  # Partial overlap
+        self.assertEqual(
+            edits.lines, ["# Title", "", "v1.0 released", "<!-- progress: 50% -->"]
+        )
+
+    def test_diff_matches_difflib(self):
+        """The diff built from edit spans equals difflib's for the same result."""
+        lines = [f"line {i}" for i in range(20)]
+        edits = EditBuffer(lines)
+        edits.replace(2, 4, ["new a"])
+        edits.delete(5, 6)
+        edits.replace(15, 15, ["inserted"])
+        edits.replace(19, 20, ["line 19"])  # No-op edit
+
+        self.assertEqual(edits.diff(), self._udiff(lines, edits.lines))
+        self.assertEqual(EditBuffer(lines).diff(), "")
+
+    def test_document_diff(self):
+        """A document diffs its current lines against the parsed ones."""
+        lines = [f"line {i}" for i in range(20)]
+        doc = ClaudeMdDocument(lines)
+        doc.replace_lines(10, 12, [])
+        doc.replace_lines(1, 2, ["first", "second"])
+
+        self.assertEqual(doc.diff(), self._udiff(lines, doc.lines))
+
+
 class TestSectionFormatting(unittest.TestCase):
     """Test section list formatting."""
 
@@ -195,6 +195,43 @@ More content.
         self.assertIn("docs/architecture.md", fixer.content)  # Still present in comment
 
 
+    def test_fixes_compose_on_one_line(self):
+        """Later fixes see earlier ones; the diff covers both."""
+        claude_md = self.path / "CLAUDE.md"
+        claude_md.write_text("""# Test Plugin
+
+**Progress:** 60% - see [plan](docs/plan.md)
+
+- /craft:old stale command
+""")
+        fixer = CLAUDEMDFixer(claude_md)
+        fixer.fix_status_sync(Issue(
+            severity=Severity.WARNING, category="status_sync",
+            message="Progress mismatch: CLAUDE.md=60% vs .STATUS=85%",
+            fixable=True, fix_method="update_progress"
+        ))
+        fixer.fix_broken_link(Issue(
+            severity=Severity.ERROR, category="broken_link",
+            message="Link points to non-existent file: docs/plan.md",
+            fixable=True, fix_method="remove_link"
+        ))
+        fixer.fix_stale_command(Issue(
+            severity=Severity.ERROR, category="stale_command",
+            message="Command /craft:old no longer exists",
+            fixable=True, fix_method="remove_command"
+        ))
+
+        self.assertIn(
+            "<!-- **Progress:** 85% - see [plan](docs/plan.md) --> (link broken)",
+            fixer.content,
+        )
+        self.assertNotIn("/craft:old", fixer.content)
+        self.assertEqual(claude_md.read_text().count("60%"), 1)  # Not written yet
+        diff = fixer.diff()
+        self.assertIn("-**Progress:** 60% - see [plan](docs/plan.md)", diff)
+        self.assertIn("-- /craft:old stale command", diff)
+
+
 class TestProgressFix(unittest.TestCase):
     """Test progress sync fixing."""
 
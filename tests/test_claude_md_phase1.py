@@ -10,6 +10,7 @@ Covers:
 """
 
 import unittest
+import unittest.mock
 import tempfile
 import json
 import os
@@ -23,7 +24,8 @@ import pytest
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.claude_md_detector import CLAUDEMDDetector, ProjectInfo
+from utils import claude_md_detector
+from utils.claude_md_detector import CLAUDEMDDetector, ProjectInfo, SNAPSHOT_FILE, project_snapshot
 from utils.claude_md_updater_simple import SimpleCLAUDEMDUpdater, MetricChange
 
 pytestmark = [pytest.mark.integration, pytest.mark.claude_md]
@@ -268,6 +270,114 @@ Title: Test Package
                        f"100 version extractions took {version_elapsed:.3f}s, should be < 0.1s")
 
 
+class TestProjectSnapshot(unittest.TestCase):
+    """Test the shared, persisted ProjectInfo snapshot."""
+
+    def setUp(self):
+        """Create a small craft plugin."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir)
+        (self.path / ".claude-plugin").mkdir()
+        (self.path / ".claude-plugin" / "plugin.json").write_text(json.dumps({
+            "name": "snap-plugin",
+            "version": "1.0.0"
+        }))
+        (self.path / "commands" / "docs").mkdir(parents=True)
+        (self.path / "commands" / "check.md").write_text("# Check")
+        (self.path / "commands" / "docs" / "update.md").write_text("# Update")
+        claude_md_detector._SNAPSHOTS.clear()
+        self.scans = 0
+        original = CLAUDEMDDetector.detect
+
+        def counting_detect(detector):
+            self.scans += 1
+            return original(detector)
+
+        patcher = unittest.mock.patch.object(CLAUDEMDDetector, "detect", counting_detect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temp directory."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        claude_md_detector._SNAPSHOTS.clear()
+
+    def test_scans_once_per_process(self):
+        """Repeated lookups reuse the first scan."""
+        first = project_snapshot(self.path)
+        for _ in range(5):
+            self.assertIs(project_snapshot(self.path), first)
+        self.assertEqual(self.scans, 1)
+        self.assertEqual(first.commands, ["check.md", "docs/update.md"])
+
+    def test_persisted_across_processes(self):
+        """A new process (empty memo) loads the cache file instead of scanning."""
+        info = project_snapshot(self.path)
+        self.assertTrue((self.path / SNAPSHOT_FILE).exists())
+        claude_md_detector._SNAPSHOTS.clear()
+        self.assertEqual(project_snapshot(self.path), info)
+        self.assertEqual(self.scans, 1)
+
+    def test_nested_command_invalidates(self):
+        """A file added in a subdirectory changes that directory's mtime."""
+        project_snapshot(self.path)
+        (self.path / "commands" / "docs" / "sync.md").write_text("# Sync")
+        claude_md_detector._SNAPSHOTS.clear()
+        info = project_snapshot(self.path)
+        self.assertEqual(self.scans, 2)
+        self.assertIn("docs/sync.md", info.commands)
+
+    def test_manifest_change_invalidates(self):
+        """A version bump in plugin.json is picked up in the same process."""
+        project_snapshot(self.path)
+        (self.path / ".claude-plugin" / "plugin.json").write_text(json.dumps({
+            "name": "snap-plugin",
+            "version": "1.10.0"
+        }))
+        self.assertEqual(project_snapshot(self.path).version, "1.10.0")
+
+    def test_corrupt_cache_rescans(self):
+        """An unreadable cache file falls back to a scan and is rewritten."""
+        project_snapshot(self.path)
+        (self.path / SNAPSHOT_FILE).write_text("{not json")
+        claude_md_detector._SNAPSHOTS.clear()
+        self.assertEqual(project_snapshot(self.path).name, "snap-plugin")
+        self.assertEqual(self.scans, 2)
+        json.loads((self.path / SNAPSHOT_FILE).read_text())
+
+    def test_entry_points_share_snapshot(self):
+        """Sync, auditor and populator consume one scan between them."""
+        from utils.claude_md_auditor import CLAUDEMDAuditor
+        from utils.claude_md_sync import CLAUDEMDSync
+        from utils.claude_md_template_populator import TemplatePopulator
+
+        (self.path / "CLAUDE.md").write_text("# Snap\n\n**Version:** 1.0.0\n")
+        CLAUDEMDSync(self.path / "CLAUDE.md")._detect()
+        CLAUDEMDAuditor(self.path / "CLAUDE.md").audit()
+        self.assertEqual(TemplatePopulator(self.path, "craft-plugin")._count_commands(), 2)
+        self.assertEqual(self.scans, 1)
+
+    def test_reference_generator_uses_snapshot(self):
+        """generate_all() writes every reference file from one scan."""
+        from utils.claude_md_sync import ReferenceFileGenerator
+
+        (self.path / "agents").mkdir()
+        (self.path / "agents" / "helper.md").write_text("---\nmodel: haiku\n---\n")
+        (self.path / "tests").mkdir()
+        (self.path / "tests" / "test_a.py").write_text("def test_a():\n    pass\n")
+
+        written = ReferenceFileGenerator(self.path).generate_all()
+
+        reference = self.path / ".claude" / "reference"
+        self.assertEqual(
+            sorted(Path(p).name for p in written),
+            ["agents.md", "project-structure.md", "test-suite.md"],
+        )
+        self.assertIn("**2 commands**", (reference / "project-structure.md").read_text())
+        self.assertEqual(self.scans, 1)
+
+
 class TestSimpleCLAUDEMDUpdater(unittest.TestCase):
     """Test simple metric updater."""
 
@@ -8,6 +8,7 @@ Covers:
 - Anti-pattern detection across both modules
 """
 
+import io
 import unittest
 import tempfile
 import json
@@ -33,6 +34,11 @@ from utils.claude_md_sync import (
     sync_claude_md,
     ANTI_PATTERNS,
     DEFAULT_BUDGET,
+    batch_exit_code,
+    expand_repos,
+    run_batch,
+    sync_repo,
+    sync_repos,
 )
 from utils.claude_md_optimizer import (
     CLAUDEMDOptimizer,
@@ -46,6 +52,7 @@ from utils.claude_md_optimizer import (
     P2_SECTION_NAMES,
     POINTER_PREFIX,
 )
+from utils.claude_md_writer import WriteTransaction, backup_path
 
 pytestmark = [pytest.mark.integration, pytest.mark.claude_md]
 
@@ -253,6 +260,40 @@ class TestCLAUDEMDSync(unittest.TestCase):
         # File should remain unchanged
         self.assertEqual(claude_md.read_text(), original_content)
 
+    def test_sync_dry_run_diff(self):
+        """Dry runs report the fix and metric edits as one unified diff."""
+        claude_md = self._write_claude_md(VERSION_MISMATCH_CLAUDE_MD)
+
+        syncer = CLAUDEMDSync(claude_md, budget=500)
+        result = syncer.sync(fix=True, dry_run=True, scope="warnings")
+
+        self.assertTrue(result.diff.startswith("--- a/CLAUDE.md\n+++ b/CLAUDE.md\n@@ "))
+        self.assertIn("-**Current Version:** v0.9.0 | **Tests:** 10 passing", result.diff)
+        self.assertIn("+**Current Version:** v1.0.0 | **Tests:** 0 passing", result.diff)
+
+        # A real run writes exactly what the dry run showed
+        syncer = CLAUDEMDSync(claude_md, budget=500)
+        self.assertEqual(syncer.sync(fix=True, scope="warnings").diff, result.diff)
+        self.assertIn("**Current Version:** v1.0.0 | **Tests:** 0 passing", claude_md.read_text())
+
+    def test_sync_fix_and_optimize_write_once(self):
+        """Fix + optimize commit together; the backup holds the pre-sync file."""
+        original = VERSION_MISMATCH_CLAUDE_MD + BLOATED_CLAUDE_MD
+        claude_md = self._write_claude_md(original)
+
+        syncer = CLAUDEMDSync(claude_md, budget=50)
+        result = syncer.sync(fix=True, optimize=True, scope="warnings")
+
+        self.assertIsNotNone(result.optimize_result)
+        self.assertTrue(result.optimize_result.actions)
+        final = claude_md.read_text()
+        self.assertIn("**Current Version:** v1.0.0", final)
+        self.assertLess(len(final.split("\n")), len(original.split("\n")))
+        self.assertEqual(backup_path(claude_md).read_text(), original)
+
+        # The dry-run diff of the same run applies the fixes and the cuts
+        self.assertIn("+**Current Version:** v1.0.0", result.diff)
+
     def test_sync_anti_pattern_detection(self):
         """CLAUDEMDSync detects anti-patterns in bloated content."""
         claude_md = self._write_claude_md(BLOATED_CLAUDE_MD)
@@ -527,6 +568,39 @@ class TestCLAUDEMDOptimizer(unittest.TestCase):
         self.assertIsInstance(result, OptimizeResult)
         self.assertGreater(result.before_lines, 0)
 
+    def test_optimizer_p1_cuts_use_live_spans(self):
+        """Cutting a large P1 section does not shift later cuts into P0 content."""
+        agents = "".join(f"| agent-{i} | role {i} |\n" for i in range(30))
+        content = (
+            "# Project\n\nIntro\n\n"
+            "## Agents\n\n" + agents + "\n"
+            "## Execution Modes\n\n| Mode | Use |\n|---|---|\n| default | normal |\n\n"
+            "## Quick Commands\n\n```bash\nmake test\nmake lint\nmake docs\n```\n"
+        )
+        claude_md = self._write_claude_md(content)
+
+        optimizer = CLAUDEMDOptimizer(claude_md, budget=15)
+        optimizer.optimize(dry_run=False)
+
+        result = claude_md.read_text()
+        self.assertNotIn("agent-0", result)
+        self.assertNotIn("| default | normal |", result)
+        self.assertIn("## Quick Commands\n\n```bash\nmake test\nmake lint\nmake docs\n```", result)
+
+    def test_optimizer_dry_run_matches_real_run(self):
+        """Dry runs make the same edits in memory and report them as a diff."""
+        claude_md = self._write_claude_md(BLOATED_CLAUDE_MD)
+        original_content = claude_md.read_text()
+
+        planned = CLAUDEMDOptimizer(claude_md, budget=50).optimize(dry_run=True)
+        self.assertEqual(claude_md.read_text(), original_content)
+        self.assertTrue(planned.diff.startswith("--- a/CLAUDE.md\n+++ b/CLAUDE.md\n@@ "))
+
+        applied = CLAUDEMDOptimizer(claude_md, budget=50).optimize(dry_run=False)
+        self.assertEqual(planned.after_lines, applied.after_lines)
+        self.assertEqual(len(planned.actions), len(applied.actions))
+        self.assertEqual(planned.diff, applied.diff)
+
     def test_optimizer_section_info(self):
         """SectionInfo dataclass properties work correctly."""
         section = SectionInfo(
@@ -621,6 +695,81 @@ class TestCLAUDEMDOptimizer(unittest.TestCase):
 # TestAntiPatterns
 # ---------------------------------------------------------------------------
 
+class TestWriteTransaction(unittest.TestCase):
+    """Test the shared atomic write-back."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir)
+        self.claude_md = self.path / "CLAUDE.md"
+        self.claude_md.write_text("# Project\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _leftovers(self):
+        return [p.name for p in self.path.iterdir() if p.name.endswith(".tmp")]
+
+    def test_identical_content_not_rewritten(self):
+        """Unchanged files keep their mtime and get no backup."""
+        os.utime(self.claude_md, ns=(1, 1))
+        with WriteTransaction(backup=[self.claude_md]) as txn:
+            txn.write(self.claude_md, "# Project\n")
+        self.assertEqual(txn.commit(), [])
+        self.assertEqual(self.claude_md.stat().st_mtime_ns, 1)
+        self.assertFalse(backup_path(self.claude_md).exists())
+
+    def test_commit_writes_all_and_backs_up_once(self):
+        """Several stages of one file back up the pre-transaction content."""
+        detail = self.path / "docs" / "DETAIL.md"
+        txn = WriteTransaction(backup=[self.claude_md])
+        txn.write(self.claude_md, "# Project\nfirst\n")
+        txn.write(self.claude_md, "# Project\nsecond\n")
+        txn.append(detail, "a\n")
+        txn.append(detail, "b\n")
+        self.assertEqual(txn.read(detail), "a\nb\n")
+
+        written = txn.commit()
+
+        self.assertEqual(len(written), 2)
+        self.assertEqual(self.claude_md.read_text(), "# Project\nsecond\n")
+        self.assertEqual(detail.read_text(), "a\nb\n")
+        self.assertEqual(backup_path(self.claude_md).read_text(), "# Project\n")
+        self.assertEqual(self._leftovers(), [])
+
+    def test_failure_leaves_targets_untouched(self):
+        """An error inside the block discards everything staged."""
+        with self.assertRaises(RuntimeError):
+            with WriteTransaction(backup=[self.claude_md]) as txn:
+                txn.write(self.claude_md, "changed\n")
+                raise RuntimeError("boom")
+        self.assertEqual(self.claude_md.read_text(), "# Project\n")
+        self.assertFalse(backup_path(self.claude_md).exists())
+
+        # A failed temp write leaves no temp files and no partial targets
+        detail = self.path / "DETAIL.md"
+        txn = WriteTransaction()
+        txn.write(detail, "new\n")
+        txn.write(self.claude_md, "changed\n")
+        with patch("utils.claude_md_writer.os.fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                txn.commit()
+        self.assertEqual(self.claude_md.read_text(), "# Project\n")
+        self.assertFalse(detail.exists())
+        self.assertEqual(self._leftovers(), [])
+
+    def test_symlink_target_updated_in_place(self):
+        """A symlinked CLAUDE.md keeps its link; the real file changes."""
+        real = self.path / "real.md"
+        real.write_text("old\n")
+        link = self.path / "LINKED.md"
+        link.symlink_to(real)
+        with WriteTransaction() as txn:
+            txn.write(link, "new\n")
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(real.read_text(), "new\n")
+
+
 class TestAntiPatterns(unittest.TestCase):
     """Focused anti-pattern detection tests using CLAUDEMDSync."""
 
@@ -935,5 +1084,90 @@ class TestGlobalFlagResolution(unittest.TestCase):
         self.assertIs(opt_resolve, resolve_claude_md_path)
 
 
+class TestBatchSync(unittest.TestCase):
+    """Test --repos batch mode: repo expansion, records, streaming, exit code."""
+
+    def setUp(self):
+        """Create three repos (clean, over budget, no CLAUDE.md)."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir)
+        for name in ("alpha", "beta", "gamma"):
+            (self.root / name).mkdir()
+        (self.root / "alpha" / "CLAUDE.md").write_text("# Alpha\n\nShort.\n")
+        (self.root / "beta" / "CLAUDE.md").write_text(
+            "# Beta\n\n### v1.2.0 Released 2025\n" + "line\n" * 30
+        )
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_expand_glob(self):
+        """A directory glob maps each repo to its CLAUDE.md."""
+        paths = expand_repos(str(self.root / "*"))
+        self.assertEqual([p.parent.name for p in paths], ["alpha", "beta", "gamma"])
+        self.assertTrue(all(p.name == "CLAUDE.md" for p in paths))
+
+    def test_expand_list_file(self):
+        """A list file is read line by line, relative to itself."""
+        listing = self.root / "repos.txt"
+        listing.write_text("# fleet\nalpha\n\nbe*\n")
+        paths = expand_repos(str(listing))
+        self.assertEqual([p.parent.name for p in paths], ["alpha", "beta"])
+
+    def test_sync_repo_records(self):
+        """Records carry status, counts and timing; a missing file is not raised."""
+        alpha = sync_repo(self.root / "alpha" / "CLAUDE.md")
+        self.assertEqual(alpha["status"], "clean")
+        self.assertIn("elapsed_ms", alpha)
+        beta = sync_repo(self.root / "beta" / "CLAUDE.md", budget=10)
+        self.assertEqual(beta["budget"], 10)
+        self.assertGreater(beta["anti_patterns"], 0)
+        self.assertNotEqual(beta["status"], "clean")
+        gamma = sync_repo(self.root / "gamma" / "CLAUDE.md")
+        self.assertEqual(gamma["status"], "missing")
+
+    def test_sync_repo_failure_is_reported(self):
+        """An exception inside the pipeline becomes a failed record."""
+        with patch("utils.claude_md_sync.CLAUDEMDSync.sync", side_effect=RuntimeError("boom")):
+            record = sync_repo(self.root / "alpha" / "CLAUDE.md")
+        self.assertEqual(record["status"], "failed")
+        self.assertIn("boom", record["error"])
+
+    def test_pool_matches_sequential(self):
+        """The process pool yields the same records as a sequential run."""
+        paths = expand_repos(str(self.root / "*"))
+        strip = lambda recs: sorted(
+            ({k: v for k, v in r.items() if k != "elapsed_ms"} for r in recs),
+            key=lambda r: r["repo"],
+        )
+        sequential = strip(sync_repos(paths, jobs=1, budget=10))
+        pooled = strip(sync_repos(paths, jobs=2, budget=10))
+        self.assertEqual(pooled, sequential)
+        self.assertEqual(len(sequential), 3)
+
+    def test_run_batch_json_lines(self):
+        """JSON output is one object per repo; a missing repo fails the batch."""
+        out = io.StringIO()
+        code = run_batch(str(self.root / "*"), jobs=1, output="json", stream=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(code, 1)
+
+    def test_run_batch_table(self):
+        """The table ends with per-status totals."""
+        out = io.StringIO()
+        code = run_batch(str(self.root / "alpha"), jobs=1, stream=out)
+        self.assertEqual(code, 0)
+        self.assertIn("1 repos in", out.getvalue())
+        self.assertIn("1 clean", out.getvalue())
+
+    def test_exit_code_strict(self):
+        """--strict also fails on repos with errors."""
+        records = [{"status": "clean"}, {"status": "errors"}]
+        self.assertEqual(batch_exit_code(records), 0)
+        self.assertEqual(batch_exit_code(records, strict=True), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,15 +6,21 @@ Ensures both utilities work correctly before building interactive workflow.
 """
 
 import unittest
+import shutil
 import sys
+import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from helpers import timing_bound
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.docs_detector import DocsDetector
+import utils.docs_detector as docs_detector
+from utils.docs_detector import CorpusFile, DocsCorpus, DocsDetector
 from utils.help_file_validator import HelpFileValidator, IssueType
 
 pytestmark = [pytest.mark.integration, pytest.mark.docs]
@@ -148,6 +154,114 @@ def run_tests():
     return result.wasSuccessful()
 
 
+class TestDocsCorpus(unittest.TestCase):
+    """Shared corpus: every file read once, line numbers by bisect"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir)
+        (self.root / "docs" / "guide").mkdir(parents=True)
+        (self.root / "commands" / "docs").mkdir(parents=True)
+        (self.root / "docs" / "index.md").write_text(
+            "# Craft v1.0.0\n\n12 commands, WIP\n```bash\n/craft:docs:feature\n```\n"
+        )
+        (self.root / "docs" / "guide" / "a.md").write_text("Draft\nsee 2.0.0\nWIPE, no marker\n")
+        (self.root / "README.md").write_text("craft and Craft: 3 skills\n")
+        for name in ("update", "check"):
+            (self.root / "commands" / "docs" / f"{name}.md").write_text(
+                f"---\ndescription: {name}\n---\n# /craft:docs:{name}\n"
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_line_number_matches_newline_count(self):
+        text = "a\nbb\n\nccc\n"
+        doc = CorpusFile(Path("x.md"), "x.md", text)
+        for offset in range(len(text)):
+            self.assertEqual(doc.line_number(offset), text[:offset].count("\n") + 1)
+        self.assertEqual(doc.context(3, 4), "bb")
+
+    def test_detect_all_reads_each_file_once(self):
+        reads = []
+        real = docs_detector._safe_read_file
+
+        def counting(path):
+            reads.append(path)
+            return real(path)
+
+        with patch.object(docs_detector, "_safe_read_file", counting):
+            results = DocsDetector(str(self.root)).detect_all("2.0.0")
+        self.assertEqual(len(reads), len(set(reads)))
+        self.assertEqual(results["version_refs"].items[0]["line"], 1)
+        self.assertEqual(results["stale_examples"].items[0]["line"], 5)
+
+    def test_status_markers_are_whole_words(self):
+        result = DocsDetector(str(self.root)).detect_outdated_status()
+        found = {(i["file"], i["line"], i["status_type"]) for i in result.items}
+        self.assertEqual(found, {
+            (str(Path("docs/index.md")), 3, "Work In Progress marker"),
+            (str(Path("docs/guide/a.md")), 1, "Draft status"),
+        })
+
+    def test_standalone_detector_gets_fresh_corpus(self):
+        detector = DocsDetector(str(self.root))
+        self.assertIsInstance(detector.corpus, DocsCorpus)
+        self.assertIsNot(detector.corpus, detector.corpus)
+        self.assertIsNone(detector._corpus)
+
+    @pytest.mark.benchmark_xfail
+    def test_benchmark_450_pages(self):
+        """detect_all over 450 pages stays under a second; one dense page is linear"""
+        line = "v1.2.3 ships 99 commands and 9 skills (WIP)\n"
+        for i in range(450):
+            (self.root / "docs" / f"page{i}.md").write_text("# Page\n\n" + line * 20)
+        t0 = time.perf_counter()
+        results = DocsDetector(str(self.root)).detect_all("2.0.0")
+        elapsed = time.perf_counter() - t0
+        self.assertEqual(results["version_refs"].count, 450 * 20 + 1)
+
+        dense = CorpusFile(Path("dense.md"), "dense.md", line * 20000)
+        offsets = [m.start() for m in docs_detector.re.finditer("v1", dense.text)]
+        t0 = time.perf_counter()
+        lines = [dense.line_number(o) for o in offsets]
+        bisect_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        legacy = [dense.text[:o].count("\n") + 1 for o in offsets[:2000]]
+        legacy_ms = (time.perf_counter() - t0) * 1000
+        self.assertEqual(lines[:2000], legacy)
+        timing_bound(elapsed < 1.0, f"detect_all took {elapsed:.2f}s")
+        timing_bound(bisect_ms < legacy_ms, f"bisect {bisect_ms:.1f}ms vs {legacy_ms:.1f}ms")
+
+class TestParallelDetection(unittest.TestCase):
+    """detect_all(parallel=True) matches the sequential run and times each check"""
+
+    def setUp(self):
+        self.detector = DocsDetector(str(Path(__file__).parent.parent))
+
+    @staticmethod
+    def _untimed(results):
+        return {k: (r.category, r.found, r.count, r.items, r.details) for k, r in results.items()}
+
+    def test_parallel_matches_sequential(self):
+        sequential = self.detector.detect_all("2.5.1")
+        parallel = self.detector.detect_all("2.5.1", parallel=True, workers=2)
+        self.assertEqual(list(parallel), [key for key, _, _ in docs_detector.DETECTORS])
+        self.assertEqual(self._untimed(parallel), self._untimed(sequential))
+        self.assertIsNone(docs_detector._WORKER)
+
+    def test_every_result_is_timed(self):
+        for parallel in (False, True):
+            results = self.detector.detect_all("2.5.1", parallel=parallel)
+            for key, result in results.items():
+                self.assertGreater(result.elapsed_ms, 0.0, key)
+
+    def test_falls_back_to_threads_without_process_pool(self):
+        with patch.object(docs_detector, "ProcessPoolExecutor", side_effect=OSError("no sem_open")):
+            results = self.detector.detect_all("2.5.1", parallel=True)
+        self.assertEqual(self._untimed(results), self._untimed(self.detector.detect_all("2.5.1")))
+
+
 if __name__ == '__main__':
     success = run_tests()
     sys.exit(0 if success else 1)
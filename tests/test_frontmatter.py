@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tests for utils/frontmatter.py — the shared single-pass frontmatter reader."""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import frontmatter as fmod  # noqa: E402
+from utils.frontmatter import (  # noqa: E402
+    parse_fields,
+    read_frontmatter,
+    split_frontmatter,
+    strip_frontmatter,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.commands]
+
+REPO = Path(__file__).parent.parent
+
+DOC = """---
+name: demo
+description: A demo command
+arguments:
+  - name: mode
+    description: Run mode
+    required: false
+  - name: path
+tags:
+  - alpha
+  - beta
+---
+
+# /craft:demo - Title
+
+Body text.
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    fmod.clear_cache()
+    yield
+    fmod.clear_cache()
+
+
+def test_split_returns_typed_result():
+    fm = split_frontmatter(DOC)
+    assert fm.present
+    assert fm.raw.startswith("name: demo") and fm.raw.endswith("  - beta")
+    assert fm.body_line == 13
+    assert DOC[fm.body_offset:].startswith("\n# /craft:demo")
+    assert fm.get("name") == "demo"
+    assert fm.fields["arguments"] == [
+        {"name": "mode", "description": "Run mode", "required": "false"},
+        {"name": "path"},
+    ]
+    assert fm.fields["tags"] == ["alpha", "beta"]
+
+
+def test_yaml_parse_is_typed_and_fresh():
+    fm = split_frontmatter(DOC)
+    data = fm.yaml()
+    assert data["arguments"][0]["required"] is False
+    data["name"] = "mutated"
+    assert fm.yaml()["name"] == "demo"
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "# No frontmatter\n",
+    "----\nname: x\n----\n",
+    "---\nname: x\nnever closed\n",
+    "text\n---\nname: x\n---\n",
+])
+def test_absent_frontmatter(text):
+    fm = split_frontmatter(text)
+    assert not fm.present
+    assert fm.fields == {} and fm.yaml() is None
+    assert strip_frontmatter(text) == text
+
+
+def test_empty_block_and_trailing_whitespace_fence():
+    fm = split_frontmatter("---\n---\nbody\n")
+    assert fm.present and fm.raw == "" and fm.yaml() is None
+    fm = split_frontmatter("---  \nname: x\n---\t\nbody\n")
+    assert fm.fields == {"name": "x"}
+    assert strip_frontmatter("---  \nname: x\n---\t\nbody\n") == "body\n"
+
+
+def test_matches_legacy_discovery_regex_on_repo_files():
+    """The scanner agrees with the regex it replaced on every command/skill."""
+    legacy = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+    files = sorted((REPO / "commands").rglob("*.md")) + sorted((REPO / "skills").rglob("SKILL.md"))
+    assert files
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        match = legacy.match(text)
+        fm = split_frontmatter(text)
+        if match:
+            assert fm.raw == match.group(1), path
+        assert fm.fields == (parse_fields(match.group(1)) if match else {}), path
+
+
+def test_read_stops_at_closing_fence(tmp_path):
+    path = tmp_path / "cmd.md"
+    # The body is not valid UTF-8: reading it would raise.
+    path.write_bytes(b"---\nname: x\n---\n" + b"\xff\xfe" * 64)
+    fm = read_frontmatter(path)
+    assert fm.fields == {"name": "x"}
+    assert fm.body_offset == len("---\nname: x\n---\n")
+
+
+def test_read_is_memoized_by_mtime_and_size(tmp_path, monkeypatch):
+    path = tmp_path / "cmd.md"
+    path.write_text("---\nname: one\n---\n")
+    opens = []
+    real_open = open
+    monkeypatch.setattr(fmod, "open", lambda *a, **k: opens.append(a[0]) or real_open(*a, **k),
+                        raising=False)
+
+    assert read_frontmatter(path).get("name") == "one"
+    assert read_frontmatter(str(path)).get("name") == "one"
+    assert len(opens) == 1
+
+    path.write_text("---\nname: three\n---\n")  # size changes
+    assert read_frontmatter(path).get("name") == "three"
+    st = path.stat()
+    path.write_text("---\nname: four!\n---\n")  # same size, new mtime
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert read_frontmatter(path).get("name") == "four!"
+    assert len(opens) == 3
+
+
+def test_read_errors_replace(tmp_path):
+    path = tmp_path / "agent.md"
+    path.write_bytes(b"---\nmemory: \xffon\n---\n")
+    with pytest.raises(UnicodeDecodeError):
+        read_frontmatter(path)
+    assert read_frontmatter(path, errors="replace").get("memory") == "�on"
@@ -27,6 +27,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from helpers import timing_bound
 
 pytestmark = [pytest.mark.e2e, pytest.mark.dogfood, pytest.mark.governance]
 
@@ -291,7 +292,8 @@ HOOK = GOV_DIR / "session_hook.py"
 
 
 def _run_hook(env_overrides: dict, stdin: str = "") -> subprocess.CompletedProcess:
-    env = dict(os.environ, GOVERNANCE_ENGINE=str(RUN), **env_overrides)
+    env = dict(os.environ, GOVERNANCE_ENGINE=str(RUN))
+    env.update(env_overrides)
     return subprocess.run(
         [sys.executable, str(HOOK)], input=stdin,
         capture_output=True, text=True, timeout=20, env=env,
@@ -301,7 +303,7 @@ def _run_hook(env_overrides: dict, stdin: str = "") -> subprocess.CompletedProce
 class TestSessionHook:
     """SessionStart visibility hook: emits a RED-only summary into session
     context, silent when clean, no-op when the skills tree is absent, and
-    mtime-cached. Hermetic — temp skills dirs + temp cache, never live ~/.claude."""
+    fingerprint-cached. Hermetic — temp skills dirs + temp cache, never live ~/.claude."""
 
     def test_dead_symlink_emits_red_additionalcontext(self, tmp_path: Path):
         skills = tmp_path / "skills"; skills.mkdir()
@@ -324,17 +326,116 @@ class TestSessionHook:
                        "GOVERNANCE_CACHE": str(tmp_path / "c.json")})
         assert r.returncode == 0 and r.stdout.strip() == ""
 
-    def test_mtime_cache_written_and_reused(self, tmp_path: Path):
+    def test_fingerprint_cache_written_and_reused(self, tmp_path: Path):
         skills = tmp_path / "skills"; skills.mkdir()
         (skills / "dead").symlink_to("/nonexistent")
         cache = tmp_path / "cache.json"
         r1 = _run_hook({"GOVERNANCE_SKILLS_DIR": str(skills), "GOVERNANCE_CACHE": str(cache)})
         assert cache.is_file()
         data = json.loads(cache.read_text(encoding="utf-8"))
-        assert "mtime" in data and "red" in data["summary"]
+        assert data["root"] and "dead" in data["tree"][""]["e"] and "red" in data["summary"]
         r2 = _run_hook({"GOVERNANCE_SKILLS_DIR": str(skills), "GOVERNANCE_CACHE": str(cache)})
         assert r1.stdout == r2.stdout, "unchanged tree should reuse the cached summary"
 
+    def test_nested_change_invalidates_cache(self, tmp_path: Path):
+        """A dead link added two levels down leaves the skills dir mtime alone."""
+        skills = tmp_path / "skills"; (skills / "a" / "refs").mkdir(parents=True)
+        env = {"GOVERNANCE_SKILLS_DIR": str(skills), "GOVERNANCE_CACHE": str(tmp_path / "c.json")}
+        assert _run_hook(env).stdout.strip() == ""
+        before = os.stat(skills).st_mtime_ns
+        (skills / "a" / "refs" / "dead").symlink_to("/nonexistent")
+        assert os.stat(skills).st_mtime_ns == before
+        assert "R08-no-dead-links" in _run_hook(env).stdout
+
+    def test_changed_tree_reruns_only_rules_reading_it(self, tmp_path: Path):
+        engine = tmp_path / "engine.py"
+        engine.write_text(
+            "import json, sys\n"
+            "open(sys.argv[0] + '.log', 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+            "rs = [{'id': 'R01', 'severity': 'error', 'state': 'FAIL'},\n"
+            "      {'id': 'R08', 'severity': 'error', 'state': 'PASS'}]\n"
+            "if '--inputs' in sys.argv: rs = rs[1:]\n"
+            "print(json.dumps({'results': rs}))\n")
+        skills = tmp_path / "skills"; (skills / "a").mkdir(parents=True)
+        (skills / "a" / "SKILL.md").write_text("one", encoding="utf-8")
+        env = {"GOVERNANCE_ENGINE": str(engine), "GOVERNANCE_SKILLS_DIR": str(skills),
+               "GOVERNANCE_CACHE": str(tmp_path / "c.json"),
+               "GOVERNANCE_STATE": str(tmp_path / "STATE.json")}
+        assert "R01" in _run_hook(env).stdout
+        _run_hook(env)  # clean tree: served from cache, engine not run
+        (skills / "a" / "SKILL.md").write_text("two!", encoding="utf-8")
+        assert "R01" in _run_hook(env).stdout, "R01 is kept from the cache"
+        calls = Path(str(engine) + ".log").read_text(encoding="utf-8").splitlines()
+        assert len(calls) == 2
+        assert "--inputs" not in calls[0] and calls[1].endswith("--inputs target")
+        assert all("--cache %s" % (tmp_path / "governance-rules.json") in c for c in calls)
+
+
+sys.path.insert(0, str(GOV_DIR))
+import session_hook  # noqa: E402  (sibling module under governance/)
+
+
+class TestTreeFingerprint:
+    """Merkle fingerprint behind the hook cache: stable when clean, localizes a
+    change to its path, reuses stored listings for unchanged directories."""
+
+    def _tree(self, root: Path, n: int) -> None:
+        for i in range(n):
+            d = root / ("skill-%03d" % i)
+            (d / "references").mkdir(parents=True)
+            (d / "SKILL.md").write_text("---\nname: s%d\n---\n" % i, encoding="utf-8")
+            (d / "references" / "notes.md").write_text("notes", encoding="utf-8")
+
+    def test_clean_tree_is_stable(self, tmp_path: Path):
+        self._tree(tmp_path, 3)
+        digest, nodes, changed = session_hook.tree_fingerprint(str(tmp_path))
+        assert os.path.join("skill-000", "references", "notes.md") in changed and len(nodes) == 7
+        again = session_hook.tree_fingerprint(str(tmp_path), nodes)
+        assert again[0] == digest and again[2] == set()
+
+    def test_edit_add_and_remove_are_localized(self, tmp_path: Path):
+        self._tree(tmp_path, 3)
+        digest, nodes, _ = session_hook.tree_fingerprint(str(tmp_path))
+        (tmp_path / "skill-001" / "references" / "notes.md").write_text("edited!", encoding="utf-8")
+        d2, nodes, changed = session_hook.tree_fingerprint(str(tmp_path), nodes)
+        assert d2 != digest and changed == {os.path.join("skill-001", "references", "notes.md")}
+        import shutil
+        shutil.rmtree(tmp_path / "skill-002")
+        d3, nodes, changed = session_hook.tree_fingerprint(str(tmp_path), nodes)
+        assert d3 != d2 and "skill-002" in changed and "skill-002" not in nodes
+        assert os.path.join("skill-002", "references") in changed
+
+    def test_unchanged_dirs_are_not_relisted(self, tmp_path: Path, monkeypatch):
+        self._tree(tmp_path, 4)
+        _, nodes, _ = session_hook.tree_fingerprint(str(tmp_path))
+        listed = []
+        real = session_hook._listing
+        monkeypatch.setattr(session_hook, "_listing", lambda p: listed.append(p) or real(p))
+        (tmp_path / "skill-000" / "extra.md").write_text("x", encoding="utf-8")
+        session_hook.tree_fingerprint(str(tmp_path), nodes)
+        assert listed == [str(tmp_path / "skill-000")]
+
+    def test_symlinked_skill_is_followed_and_cycles_stop(self, tmp_path: Path):
+        canon = tmp_path / "canon" / "s"; canon.mkdir(parents=True)
+        (canon / "SKILL.md").write_text("v1", encoding="utf-8")
+        (canon / "loop").symlink_to(canon)
+        skills = tmp_path / "skills"; skills.mkdir()
+        (skills / "s").symlink_to(canon)
+        digest, nodes, _ = session_hook.tree_fingerprint(str(skills))
+        (canon / "SKILL.md").write_text("v2", encoding="utf-8")
+        assert session_hook.tree_fingerprint(str(skills), nodes)[0] != digest
+
+    @pytest.mark.benchmark_xfail
+    def test_benchmark_clean_500_skill_tree(self, tmp_path: Path):
+        import time
+        self._tree(tmp_path, 500)
+        _, nodes, _ = session_hook.tree_fingerprint(str(tmp_path))
+        t0 = time.perf_counter()
+        _, _, changed = session_hook.tree_fingerprint(str(tmp_path), nodes)
+        warm = time.perf_counter() - t0
+        assert changed == set()
+        timing_bound(warm < 0.025, f"warm fingerprint took {warm * 1000:.1f}ms")
+
 
 # ---------------------------------------------------------------------------
 # 7. Soak-then-flip ledger + cross-repo wrapper (PR #3)
@@ -538,3 +639,293 @@ class TestDriftedCopyChecker:
         """Against the real surface, R04 must be clean or vacuously skip — never a
         false positive (a noisy WARN would stamp last_red and block soak promotion)."""
         assert _run(DRIFT_CHK, os.path.expanduser("~/.claude/skills")).returncode == 0
+
+    def _checker(self):
+        sys.path.insert(0, str(CHECKS))
+        try:
+            import no_drifted_copy
+            return no_drifted_copy
+        finally:
+            sys.path.remove(str(CHECKS))
+
+    def _tree(self, root: Path, bodies: dict) -> None:
+        for side, names in bodies.items():
+            for name, body in names.items():
+                (root / side / name).mkdir(parents=True)
+                (root / side / name / "SKILL.md").write_text(body, encoding="utf-8")
+
+    def test_json_report_names_every_drift(self, tmp_path: Path):
+        self._tree(tmp_path, {"consumer": {"same": "abc", "edited": "abX", "longer": "abcd", "local": "x"},
+                              "canon": {"same": "abc", "edited": "abc", "longer": "abc", "absent": "x"}})
+        r = _run(DRIFT_CHK, "--json", str(tmp_path))
+        report = json.loads(r.stdout)
+        assert r.returncode == 1 and report["compared"] == 3
+        assert {(d["name"], d["reason"]) for d in report["drifted"]} == {
+            ("edited", "content"), ("longer", "size")}
+
+    def test_size_mismatch_is_rejected_without_reading(self, tmp_path: Path, monkeypatch):
+        mod = self._checker()
+        self._tree(tmp_path, {"consumer": {"s": "abcd"}, "canon": {"s": "abc"}})
+        monkeypatch.setattr(mod, "open", lambda *a, **k: pytest.fail("read %s" % (a,)), raising=False)
+        report = mod.compare(str(tmp_path / "consumer"), [str(tmp_path / "canon")], mod.DigestIndex())
+        assert report["drifted"][0]["reason"] == "size"
+
+    def test_digest_index_rehashes_only_on_stat_change(self, tmp_path: Path, monkeypatch):
+        mod = self._checker()
+        self._tree(tmp_path, {"consumer": {"s": "abc"}, "canon": {"s": "abc"}})
+        path = tmp_path / "digests.json"
+        monkeypatch.setenv("GOVERNANCE_DIGEST_INDEX", str(path))
+        monkeypatch.setattr(mod, "_INDEXES", {})
+        assert mod.main(["x", str(tmp_path)]) == 0
+        assert len(json.loads(path.read_text())["files"]) == 2
+
+        fresh = mod.DigestIndex(str(path))  # a new process: loads the persisted digests
+        hashed = []
+        real = mod.hashlib.blake2b
+        monkeypatch.setattr(mod.hashlib, "blake2b", lambda: hashed.append(1) or real())
+        consumer, canon = str(tmp_path / "consumer"), [str(tmp_path / "canon")]
+        assert mod.compare(consumer, canon, fresh)["drifted"] == [] and hashed == []
+        (tmp_path / "consumer" / "s" / "SKILL.md").write_text("abX", encoding="utf-8")
+        st = (tmp_path / "canon" / "s" / "SKILL.md").stat()
+        os.utime(tmp_path / "consumer" / "s" / "SKILL.md", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert mod.compare(consumer, canon, fresh)["drifted"][0]["reason"] == "content"
+        assert len(hashed) == 1, "only the edited copy is re-hashed"
+
+
+# ---------------------------------------------------------------------------
+# 10. Parallel engine: in-process checkers, timeouts, subprocess fallback
+# ---------------------------------------------------------------------------
+
+# Checker convention: a main(argv) plus a __main__ guard -> importable in-process.
+GUARD = '\nif __name__ == "__main__":\n    import sys\n    sys.exit(main(sys.argv))\n'
+
+
+def _rule(rid, cmd, severity="error"):
+    return {"id": rid, "severity": severity, "status": "active", "gates": ["ci"],
+            "check": {"kind": "script", "cmd": cmd}, "waivers": []}
+
+
+class TestParallelEngine:
+    def _engine(self):
+        sys.path.insert(0, str(GOV_DIR))
+        try:
+            import run_rules  # governance/run_rules.py
+            return run_rules
+        finally:
+            sys.path.remove(str(GOV_DIR))
+
+    def _audit_json(self, doc, capsys, **kw):
+        rc = self._engine().audit(doc, target=str(BAD_FX), index=str(BAD_FX), as_json=True, **kw)
+        return rc, json.loads(capsys.readouterr().out)
+
+    def test_json_reports_wall_time_and_mode(self):
+        result = _run(RUN, "--target", str(BAD_FX), "--index", str(BAD_FX), "--json")
+        data = json.loads(result.stdout)
+        scripted = [r for r in data["results"] if r["kind"] == "script"]
+        assert scripted and all(r["mode"] == "inproc" and r["wall_ms"] >= 0 for r in scripted)
+        assert data["wall_ms"] >= 0 and data["jobs"] >= 1
+
+    def test_inproc_and_isolated_modes_agree(self):
+        args = ("--target", str(BAD_FX), "--index", str(BAD_FX), "--json")
+        inproc = json.loads(_run(RUN, *args).stdout)
+        isolated = json.loads(_run(RUN, *args, "--isolate").stdout)
+        assert {r["mode"] for r in isolated["results"] if r["kind"] == "script"} == {"subprocess"}
+        strip = lambda d: [(r["id"], r["state"], r["output"]) for r in d["results"]]
+        assert strip(inproc) == strip(isolated)
+        assert inproc["red"] == isolated["red"] >= 1
+
+    def test_hung_checker_times_out_as_error_without_blocking(self, tmp_path, capsys):
+        hang = tmp_path / "hang.py"
+        hang.write_text("import time\ndef main(argv):\n    time.sleep(30)\n" + GUARD)
+        doc = {"rules": [_rule("RH-hang", "%s {target}" % hang),
+                         _rule("R02-no-hand-links", "checks/no_broken_symlinks.py {target}")]}
+        rc, data = self._audit_json(doc, capsys, jobs=1, timeout=0.5)
+        states = {r["id"]: r for r in data["results"]}
+        assert rc == 1
+        assert states["RH-hang"]["state"] == "ERROR" and "timed out" in states["RH-hang"]["output"]
+        # jobs=1: the slot held by the hung checker was handed on
+        assert states["R02-no-hand-links"]["state"] == "FAIL"
+        assert data["wall_ms"] < 5000
+
+    def test_abandoned_checker_output_never_reaches_stdout(self, tmp_path, capsys):
+        import time
+
+        late = tmp_path / "late.py"
+        late.write_text("import time\ndef main(argv):\n    time.sleep(0.3)\n"
+                        "    print('LATE-OUTPUT')\n" + GUARD)
+        rc, data = self._audit_json({"rules": [_rule("RL-late", str(late))]}, capsys,
+                                    timeout=0.1)
+        assert data["results"][0]["state"] == "ERROR"
+        time.sleep(0.5)  # the abandoned checker prints after the report
+        print("after")  # the main thread still writes through
+        out = capsys.readouterr().out
+        assert "after" in out and "LATE-OUTPUT" not in out
+
+    def test_isolated_hung_checker_is_killed(self, tmp_path, capsys):
+        hang = tmp_path / "hang.py"
+        hang.write_text("import time\ntime.sleep(30)\n")
+        rc, data = self._audit_json({"rules": [_rule("RH-hang", str(hang))]}, capsys,
+                                    timeout=0.5, isolate=True)
+        assert data["results"][0]["state"] == "ERROR" and data["results"][0]["mode"] == "subprocess"
+
+    def test_crash_and_script_only_checkers(self, tmp_path, capsys):
+        crash = tmp_path / "crash.py"
+        crash.write_text("def main(argv):\n    raise RuntimeError('boom')\n" + GUARD)
+        script_only = tmp_path / "script_only.py"
+        script_only.write_text("import sys\nprint('from a subprocess')\nsys.exit(3)\n")
+        doc = {"rules": [_rule("RC-crash", str(crash)), _rule("RS-script", str(script_only))]}
+        rc, data = self._audit_json(doc, capsys)
+        crash_r, script_r = data["results"]
+        assert crash_r["state"] == "FAIL" and "RuntimeError: boom" in crash_r["output"]
+        assert crash_r["mode"] == "inproc"
+        assert script_r["state"] == "FAIL" and script_r["mode"] == "subprocess"
+        assert script_r["output"] == "from a subprocess"
+
+    def test_concurrent_output_is_captured_per_rule(self, tmp_path, capsys):
+        rules = []
+        for i in range(6):
+            chk = tmp_path / ("chatty%d.py" % i)
+            chk.write_text(
+                "import time\ndef main(argv):\n"
+                "    for _ in range(20):\n"
+                "        print('rule-%d'); time.sleep(0.001)\n"
+                "    return 0\n" % i + GUARD)
+            rules.append(_rule("RC%d" % i, str(chk)))
+        rc, data = self._audit_json({"rules": rules}, capsys, jobs=6)
+        assert rc == 0
+        for i, r in enumerate(data["results"]):
+            assert r["output"].splitlines() == ["rule-%d" % i] * 20
+
+
+# ---------------------------------------------------------------------------
+# 11. Per-rule result cache keyed by declared input globs
+# ---------------------------------------------------------------------------
+
+class TestRuleResultCache:
+    R02_CMD = "checks/no_broken_symlinks.py {target}"
+
+    def _engine(self):
+        return TestParallelEngine()._engine()
+
+    def _audit(self, doc, target, cache, capsys):
+        self._engine().audit(doc, target=str(target), index=str(target), as_json=True,
+                             cache=str(cache))
+        return {r["id"]: r for r in json.loads(capsys.readouterr().out)["results"]}
+
+    def _doc(self):
+        cached = dict(_rule("R02-no-hand-links", self.R02_CMD))
+        cached["check"] = dict(cached["check"], inputs=["{target}/**"])
+        return {"rules": [cached, _rule("R08-no-dead-links", self.R02_CMD)]}
+
+    def test_unchanged_inputs_are_reported_from_cache(self, tmp_path, capsys):
+        target = tmp_path / "skills"; (target / "a").mkdir(parents=True)
+        (target / "a" / "dead").symlink_to("/nonexistent")
+        cache = tmp_path / "rules.json"
+        first = self._audit(self._doc(), target, cache, capsys)
+        assert first["R02-no-hand-links"]["cached"] is False and cache.is_file()
+        second = self._audit(self._doc(), target, cache, capsys)
+        assert second["R02-no-hand-links"]["cached"] is True
+        assert second["R02-no-hand-links"]["state"] == "FAIL"
+        assert second["R02-no-hand-links"]["output"] == first["R02-no-hand-links"]["output"]
+        # no declared inputs -> always re-run
+        assert second["R08-no-dead-links"]["cached"] is False
+
+    def test_input_change_reruns_the_rule(self, tmp_path, capsys):
+        target = tmp_path / "skills"; (target / "a").mkdir(parents=True)
+        dead = target / "a" / "dead"
+        dead.symlink_to("/nonexistent")
+        cache = tmp_path / "rules.json"
+        self._audit(self._doc(), target, cache, capsys)
+        dead.unlink()
+        (target / "a" / "live").symlink_to(target)
+        again = self._audit(self._doc(), target, cache, capsys)
+        assert again["R02-no-hand-links"]["cached"] is False
+        assert again["R02-no-hand-links"]["state"] == "PASS"
+
+    def test_link_target_vanishing_invalidates(self, tmp_path, capsys):
+        """The link itself is untouched; only whether it resolves changes."""
+        real = tmp_path / "canon"; real.mkdir()
+        target = tmp_path / "skills"; target.mkdir()
+        (target / "s").symlink_to(real)
+        cache = tmp_path / "rules.json"
+        assert self._audit(self._doc(), target, cache, capsys)["R02-no-hand-links"]["state"] == "PASS"
+        real.rmdir()
+        again = self._audit(self._doc(), target, cache, capsys)["R02-no-hand-links"]
+        assert again["cached"] is False and again["state"] == "FAIL"
+
+    def test_expand_inputs_globs(self, tmp_path):
+        eng = self._engine()
+        (tmp_path / "a" / ".git").mkdir(parents=True)
+        (tmp_path / "a" / ".git" / "HEAD").write_text("x")
+        (tmp_path / "a" / "SKILL.md").write_text("x")
+        (tmp_path / "a" / "notes.md").write_text("x")
+        subs = {"target": str(tmp_path)}
+        assert eng.expand_inputs(["{target}/**/SKILL.md"], subs) == [str(tmp_path / "a" / "SKILL.md")]
+        assert eng.expand_inputs(["{target}/*/SKILL.md", "{target}/missing"], subs) == [
+            str(tmp_path / "a" / "SKILL.md")]
+        assert str(tmp_path / "a" / ".git" / "HEAD") not in eng.expand_inputs(["{target}/**"], subs)
+
+
+# ---------------------------------------------------------------------------
+# 12. Shared filesystem snapshot: one scan per audit, standalone still works
+# ---------------------------------------------------------------------------
+
+import fs_snapshot  # noqa: E402  (sibling module under governance/)
+
+
+class TestFsSnapshot:
+    def _tree(self, root: Path) -> None:
+        (root / "a" / "refs").mkdir(parents=True)
+        (root / "a" / "SKILL.md").write_text("x", encoding="utf-8")
+        (root / "a" / "refs" / "dead").symlink_to("/nonexistent")
+        (root / "a" / "loop").symlink_to(root)
+        (root / ".git").mkdir()
+        (root / "f.txt").write_text("x", encoding="utf-8")
+
+    def test_walk_matches_os_walk_without_following_links(self, tmp_path: Path):
+        self._tree(tmp_path)
+        mine = [(r, sorted(d), sorted(f)) for r, d, f in fs_snapshot.Snapshot().walk(str(tmp_path))]
+        ref = [(r, sorted(d), sorted(f)) for r, d, f in os.walk(str(tmp_path))]
+        # os.walk lists a symlink-to-dir under dirs (without descending); the
+        # snapshot files it with the other links.
+        norm = lambda rows: sorted((r, sorted(d + f)) for r, d, f in rows)
+        assert norm(mine) == norm(ref)
+        pruned = [r for r, _, _ in fs_snapshot.Snapshot().walk(str(tmp_path), prune=lambda n: n.startswith("."))]
+        assert str(tmp_path / ".git") not in pruned
+
+    def test_point_lookups_follow_links(self, tmp_path: Path):
+        self._tree(tmp_path)
+        snap = fs_snapshot.Snapshot()
+        assert snap.isfile(str(tmp_path / "a" / "loop" / "a" / "SKILL.md"))
+        assert snap.islink(str(tmp_path / "a" / "refs" / "dead"))
+        assert not snap.exists(str(tmp_path / "a" / "refs" / "dead"))
+        assert snap.listdir(str(tmp_path / "nope")) == []
+
+    def test_session_shares_one_scan_across_rules(self, tmp_path: Path, capsys, monkeypatch):
+        (tmp_path / "consumer" / "s").mkdir(parents=True)
+        (tmp_path / "canon" / "s").mkdir(parents=True)
+        for side in ("consumer", "canon"):
+            (tmp_path / side / "s" / "SKILL.md").write_text("same", encoding="utf-8")
+        scanned = []
+        real = fs_snapshot.os.scandir
+        monkeypatch.setattr(fs_snapshot.os, "scandir", lambda p: scanned.append(p) or real(p))
+        r02 = _rule("R02-no-hand-links", "checks/no_broken_symlinks.py {target}")
+        r02["check"]["inputs"] = ["{target}/**"]
+        doc = {"rules": [r02, _rule("R08-no-dead-links", "checks/no_broken_symlinks.py {target}"),
+                         _rule("R04-consume-not-copy", "checks/no_drifted_copy.py {target}")]}
+        TestParallelEngine()._engine().audit(doc, target=str(tmp_path), index=str(tmp_path),
+                                             as_json=True, cache=str(tmp_path / ".c" / "r.json"))
+        states = {r["id"]: r["state"] for r in json.loads(capsys.readouterr().out)["results"]}
+        assert set(states.values()) == {"PASS"}
+        assert len(scanned) == len(set(scanned)), "a directory was listed more than once"
+
+    def test_standalone_checker_sees_live_filesystem(self, tmp_path: Path):
+        """Outside an audit session nothing is memoized between calls."""
+        sys.path.insert(0, str(CHECKS))
+        try:
+            import no_broken_symlinks
+        finally:
+            sys.path.remove(str(CHECKS))
+        assert no_broken_symlinks.find_broken(str(tmp_path)) == []
+        (tmp_path / "dead").symlink_to("/nonexistent")
+        assert no_broken_symlinks.find_broken(str(tmp_path)) == [("dead", "/nonexistent")]
@@ -376,3 +376,174 @@ def test_missing_frontmatter_handling():
         # Cleanup
         if test_file.exists():
             test_file.unlink()
+
+
+# ─── Per-File Index Tests ────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def isolated_tree(tmp_path, monkeypatch):
+    """A throwaway commands/ + skills/ tree wired into the discovery module."""
+    import commands._discovery as disc
+
+    commands_dir = tmp_path / "commands"
+    (commands_dir / "code").mkdir(parents=True)
+    (commands_dir / "hub.md").write_text("---\nname: hub\ndescription: Hub\n---\n# Hub\n")
+    (commands_dir / "code" / "lint.md").write_text("---\ndescription: Lint\n---\n# Lint\n")
+    skill_dir = tmp_path / "skills" / "release" / "ship"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("---\nname: ship\ndescription: Ship it\n---\n")
+
+    monkeypatch.setattr(disc, "COMMANDS_DIR", str(commands_dir))
+    monkeypatch.setattr(disc, "SKILLS_DIR", str(tmp_path / "skills"))
+    monkeypatch.setattr(disc, "PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(disc, "CACHE_FILE", str(commands_dir / "_cache.json"))
+
+    parsed = []
+    real_command_record = disc._command_record
+    real_skill_record = disc._skill_record
+
+    def counting_command_record(filepath, rel_path, content):
+        parsed.append(rel_path)
+        return real_command_record(filepath, rel_path, content)
+
+    def counting_skill_record(filepath, content):
+        parsed.append(os.path.relpath(filepath, disc.SKILLS_DIR))
+        return real_skill_record(filepath, content)
+
+    monkeypatch.setattr(disc, "_command_record", counting_command_record)
+    monkeypatch.setattr(disc, "_skill_record", counting_skill_record)
+    return disc, tmp_path, parsed
+
+
+def _bump(path: Path, text: str):
+    """Rewrite a file in place and force a distinct mtime."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+def test_index_first_load_parses_every_file(isolated_tree):
+    disc, _, parsed = isolated_tree
+    names = sorted(c["name"] for c in disc.load_cached_commands())
+    assert names == ["code:lint", "hub"]
+    assert sorted(parsed) == ["code/lint.md", "hub.md", "release/ship/SKILL.md"]
+
+
+def test_index_unchanged_tree_parses_nothing(isolated_tree):
+    disc, tmp_path, parsed = isolated_tree
+    disc.load_cached_commands()
+    parsed.clear()
+    cache_mtime = os.stat(disc.CACHE_FILE).st_mtime_ns
+    disc.load_cached_commands()
+    disc.load_cached_skills()
+    disc.get_command_stats()
+    assert parsed == []
+    assert os.stat(disc.CACHE_FILE).st_mtime_ns == cache_mtime  # not rewritten
+
+
+def test_index_reparses_only_the_edited_file(isolated_tree):
+    disc, tmp_path, parsed = isolated_tree
+    disc.load_cached_commands()
+    parsed.clear()
+    _bump(tmp_path / "commands" / "code" / "lint.md", "---\ndescription: Lint v2\n---\n")
+    commands = {c["name"]: c for c in disc.load_cached_commands()}
+    assert parsed == ["code/lint.md"]
+    assert commands["code:lint"]["description"] == "Lint v2"
+    assert commands["hub"]["description"] == "Hub"
+
+
+def test_index_touch_without_content_change_is_not_reparsed(isolated_tree):
+    disc, tmp_path, parsed = isolated_tree
+    disc.load_cached_commands()
+    parsed.clear()
+    hub = tmp_path / "commands" / "hub.md"
+    _bump(hub, hub.read_text())
+    disc.load_cached_commands()
+    assert parsed == []
+
+
+def test_index_picks_up_added_and_removed_files(isolated_tree):
+    disc, tmp_path, parsed = isolated_tree
+    disc.load_cached_commands()
+    parsed.clear()
+    (tmp_path / "commands" / "code" / "fmt.md").write_text("---\ndescription: Format\n---\n")
+    (tmp_path / "commands" / "hub.md").unlink()
+    names = sorted(c["name"] for c in disc.load_cached_commands())
+    assert names == ["code:fmt", "code:lint"]
+    assert parsed == ["code/fmt.md"]
+
+
+def test_index_rebuilds_a_legacy_cache_without_index(isolated_tree):
+    disc, tmp_path, parsed = isolated_tree
+    Path(disc.CACHE_FILE).write_text(json.dumps({"commands": [], "skills": []}))
+    assert len(disc.load_cached_commands()) == 2
+    assert json.loads(Path(disc.CACHE_FILE).read_text())["index"]["version"] == disc.INDEX_VERSION
+
+
+# ─── Search Index Tests ──────────────────────────────────────────────────────
+
+
+def _search_tree(isolated_tree):
+    disc, tmp_path, parsed = isolated_tree
+    commands_dir = Path(disc.COMMANDS_DIR)
+    (commands_dir / "docs").mkdir()
+    (commands_dir / "docs" / "lint.md").write_text(
+        "---\ndescription: Lint markdown docs\n---\n# Lint docs\n")
+    (commands_dir / "docs" / "check-links.md").write_text(
+        "---\ndescription: Find broken internal links\ntags: [links, validation]\n---\n")
+    (commands_dir / "code" / "release.md").write_text(
+        "---\ndescription: Cut a release and publish it\n---\n")
+    return disc
+
+
+def test_search_exact_prefix_and_typo(isolated_tree):
+    disc = _search_tree(isolated_tree)
+    assert [m["name"] for m in disc.search("code:lint")][:1] == ["code:lint"]
+    assert [m["name"] for m in disc.search("/craft:code:lint")][:1] == ["code:lint"]
+    assert {m["name"] for m in disc.search("lint")[:2]} == {"code:lint", "docs:lint"}
+    assert disc.search("relea")[0]["name"] == "code:release"
+    assert disc.search("relase")[0]["name"] == "code:release"
+    top = disc.search("lnt", limit=1)
+    assert len(top) == 1 and top[0]["name"] in ("code:lint", "docs:lint")
+    assert top[0]["kind"] == "command" and top[0]["score"] > 0
+
+
+def test_search_ranks_descriptions_and_includes_skills(isolated_tree):
+    disc = _search_tree(isolated_tree)
+    assert disc.search("broken links")[0]["name"] == "docs:check-links"
+    assert disc.search("validation")[0]["name"] == "docs:check-links"  # tag
+    ship = disc.search("ship")[0]
+    assert (ship["name"], ship["kind"]) == ("ship", "skill")
+    assert disc.search("") == [] and disc.search("zzzzqqq") == []
+
+
+def test_search_index_lives_in_cache_and_backs_lookups(isolated_tree):
+    disc = _search_tree(isolated_tree)
+    assert disc.get_command_detail("release")["name"] == "code:release"
+    assert disc.get_command_detail("lint") is None  # ambiguous: code:lint, docs:lint
+    assert disc.get_command_detail("docs:lint")["file"] == os.path.join("docs", "lint.md")
+    assert {c["name"] for c in disc.get_commands_by_category("docs")} == {"docs:lint", "docs:check-links"}
+    cache = json.loads(Path(disc.CACHE_FILE).read_text())
+    assert "search" not in cache  # loads of the cache never parse the index
+    sidecar = json.loads((Path(disc.COMMANDS_DIR) / disc.SEARCH_FILE_NAME).read_text())
+    assert sidecar["generated"] == cache["generated"]
+    assert sidecar["search"]["version"] == disc.SEARCH_VERSION
+    assert "lint" in sidecar["search"]["tokens"]
+
+
+def test_search_index_sidecar_rebuilt_when_stale(isolated_tree):
+    disc = _search_tree(isolated_tree)
+    sidecar = Path(disc.COMMANDS_DIR) / disc.SEARCH_FILE_NAME
+    sidecar.write_text("{not json")
+    disc._SEARCH_MEMO[:] = [None, None]
+    assert disc.search("relea")[0]["name"] == "code:release"
+    assert json.loads(sidecar.read_text())["search"]["version"] == disc.SEARCH_VERSION
+
+
+def test_search_index_follows_edits(isolated_tree):
+    disc = _search_tree(isolated_tree)
+    assert disc.search("deploy") == []
+    _bump(Path(disc.COMMANDS_DIR) / "code" / "release.md",
+          "---\ndescription: Deploy a release\n---\n")
+    assert disc.search("deploy")[0]["name"] == "code:release"
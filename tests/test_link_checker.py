@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for link_checker.py
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from helpers import timing_bound
+
+pytestmark = [pytest.mark.unit, pytest.mark.docs]
+
+from utils.link_checker import (
+    MISSING_ANCHOR, MISSING_FILE, LinkChecker, heading_anchors, iter_links, slugify,
+)
+from utils.docs_update_orchestrator import DocsUpdateOrchestrator
+
+
+class TestSlugsAndLinks(unittest.TestCase):
+    """Anchor slugs (mkdocs toc) and link extraction"""
+
+    def test_slugify_matches_mkdocs_toc(self):
+        self.assertEqual(slugify("Quick Start"), "quick-start")
+        self.assertEqual(slugify("`/craft:code:ci-fix` — CI Fix"), "craftcodeci-fix-ci-fix")
+        self.assertEqual(slugify("Deeper cuts — prioritised"), "deeper-cuts-prioritised")
+        self.assertEqual(slugify("**Bold** [link](x.md) ✅"), "bold-link")
+
+    def test_heading_anchors(self):
+        text = (
+            "---\ntitle: x\n---\n# Setup\n## Setup\n## Custom {#my-id}\n"
+            "```bash\n# not a heading\n```\n<a id=\"raw\"></a>\n### Closed ##\n"
+        )
+        self.assertEqual(heading_anchors(text), {"setup", "setup_1", "my-id", "raw", "closed"})
+
+    def test_links_outside_code_only(self):
+        text = (
+            "[a](a.md) `[b](b.md)` ![img](i.png \"title\")\n"
+            "```\n[c](c.md)\n```text\n[d](d.md)\n```\n"
+            "[![badge](badge.svg)](e.md)\n[ref]: <f.md>\n"
+        )
+        targets = [t for _, t in iter_links(text)]
+        self.assertEqual(targets, ["a.md", "i.png", "badge.svg", "e.md", "f.md"])
+
+
+class TestLinkChecker(unittest.TestCase):
+    """Resolution against the docs tree, ignore rules and suggestions"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir)
+        docs = self.root / "docs"
+        (docs / "guide").mkdir(parents=True)
+        (docs / "img").mkdir()
+        (docs / "img" / "logo.png").write_bytes(b"png")
+        (docs / "guide" / "setup.md").write_text("# Setup\n## Install Steps\n")
+        (docs / "index.md").write_text(
+            "# Home\n"
+            "[ok](guide/setup.md#install-steps) [dir](guide/) [img](img/logo.png)\n"
+            "[moved](setup.md) [gone](nowhere.md)\n"
+            "[anchor](guide/setup.md#Install-Steps) [self](#home) [bad](#nope)\n"
+            "[ext](https://example.com) [tpl]({docs_url}/x.md) [abs](/guide/setup.md)\n"
+        )
+        (self.root / "README.md").write_text("[docs](docs/index.md) [x](docs/missing.md)\n")
+        (self.root / ".linkcheck-ignore").write_text(
+            "### Known\nFile: `docs/index.md`\nTarget: `nowhere.md`\n"
+        )
+        self.checker = LinkChecker(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _broken(self, rel):
+        return {b.link: b for b in self.checker.check_file(self.root / rel)}
+
+    def test_docs_page(self):
+        broken = self._broken("docs/index.md")
+        self.assertEqual(set(broken), {"setup.md", "nowhere.md", "guide/setup.md#Install-Steps", "#nope"})
+        self.assertEqual(broken["setup.md"].reason, MISSING_FILE)
+        self.assertEqual(broken["setup.md"].suggestion, "guide/setup.md")
+        self.assertEqual(broken["setup.md"].line, 3)
+        self.assertEqual(broken["nowhere.md"].ignored, "Known")
+        self.assertEqual(broken["guide/setup.md#Install-Steps"].reason, MISSING_ANCHOR)
+        self.assertEqual(broken["guide/setup.md#Install-Steps"].suggestion, "guide/setup.md#install-steps")
+        self.assertIsNone(broken["#nope"].suggestion)
+
+    def test_root_file_resolves_from_project_root(self):
+        broken = self._broken("README.md")
+        self.assertEqual(list(broken), ["docs/missing.md"])
+
+    def test_files_only(self):
+        text = (self.root / "docs" / "index.md").read_text()
+        broken = self.checker.check_text(self.root / "docs" / "index.md", text, anchors=False)
+        self.assertEqual({b.reason for b in broken}, {MISSING_FILE})
+
+    def test_orchestrator_applies_suggestion(self):
+        items = [b.to_item() for b in self.checker.check_file(self.root / "docs" / "index.md")
+                 if b.suggestion and not b.ignored]
+        orchestrator = DocsUpdateOrchestrator(str(self.root), "v1.0.0")
+        files, changes = orchestrator._apply_broken_link_fixes(items)
+        self.assertEqual(files, {"docs/index.md"})
+        broken = self._broken("docs/index.md")
+        self.assertEqual(set(broken), {"nowhere.md", "#nope"})
+
+    @pytest.mark.benchmark_xfail
+    def test_benchmark_450_pages(self):
+        """450 linked pages check in well under a second"""
+        docs = self.root / "docs" / "many"
+        docs.mkdir()
+        for i in range(450):
+            body = "".join(
+                f"## Section {j}\n[next](page{(i + 1) % 450}.md#section-{j}) "
+                f"[home](../index.md) `[code](x.md)`\n"
+                for j in range(20)
+            )
+            (docs / f"page{i}.md").write_text(f"# Page {i}\n{body}")
+        t0 = time.perf_counter()
+        broken = LinkChecker(self.root).check_docs()
+        elapsed = time.perf_counter() - t0
+        self.assertFalse([b for b in broken if "many" in b.file])
+        timing_bound(elapsed < 0.5, f"check_docs took {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,14 @@
 import importlib.util
 import json
 import os
+import shutil
 import subprocess
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
+from helpers import timing_bound
 
 SCRIPT = os.path.join(os.path.dirname(__file__), "..", "scripts", "release-watch.py")
 PLUGIN_DIR = os.path.join(os.path.dirname(__file__), "..")
@@ -16,7 +20,7 @@ pytestmark = [pytest.mark.e2e, pytest.mark.dogfood]
 
 # Skip tests that require authenticated gh CLI
 requires_gh = pytest.mark.skipif(
-    subprocess.run(
+    shutil.which("gh") is None or subprocess.run(
         ["gh", "auth", "status"], capture_output=True
     ).returncode != 0,
     reason="gh CLI not authenticated",
@@ -179,6 +183,126 @@ class TestCache:
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# Unit tests: Concurrent conditional fetch layer (local stub server)
+# ---------------------------------------------------------------------------
+
+STUB_PAGES = {
+    "/releases": ('[{"tag_name": "v2.1.60", "published_at": "2026-02-26", "body": "x"}]',
+                  "application/json"),
+    "/CHANGELOG.md": ("## 2.1.60\n- Added plugin hooks\n", "text/plain"),
+    "/desktop": ("<h3>February 25, 2026</h3><p><strong>New plugin feature</strong></p>",
+                 "text/html"),
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+    down = False
+    hits = []
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        type(self).hits.append((path, self.headers.get("If-None-Match")))
+        time.sleep(self.delay)
+        if self.down or path not in STUB_PAGES:
+            self.send_response(503)
+            self.end_headers()
+            return
+        body, ctype = STUB_PAGES[path]
+        etag = '"%x"' % (hash(body) & 0xFFFFFFFF)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        data = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch, tmp_path):
+    _StubHandler.delay, _StubHandler.down, _StubHandler.hits = 0.0, False, []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = "http://127.0.0.1:%d" % server.server_address[1]
+    monkeypatch.setattr(rw, "RELEASES_URL", base + "/releases?per_page={per_page}")
+    monkeypatch.setattr(rw, "CHANGELOG_URL", base + "/CHANGELOG.md")
+    monkeypatch.setattr(rw, "DESKTOP_RELEASE_URL", base + "/desktop")
+    monkeypatch.setattr(rw, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(rw, "CACHE_FILE", tmp_path / "cache.json")
+    yield _StubHandler
+    server.shutdown()
+    server.server_close()
+
+
+class TestFetchLayer:
+    """fetch_all against a local HTTP stub: concurrency, 304s, per-source stale fallback."""
+
+    def test_sources_fetched_concurrently(self, stub_server):
+        stub_server.delay = 0.4
+        t0 = time.perf_counter()
+        releases, changelog, desktop = rw.fetch_all("all", 3, cache={})
+        elapsed = time.perf_counter() - t0
+        assert releases[0]["tag_name"] == "v2.1.60"
+        assert changelog.startswith("## 2.1.60")
+        assert desktop[0]["date"] == "February 25, 2026"
+        assert elapsed < 1.0, f"three 0.4s sources took {elapsed:.2f}s"
+
+    def test_refresh_sends_validators_and_reuses_on_304(self, stub_server):
+        cache = {}
+        first = rw.fetch_all("all", 3, cache=cache)
+        assert all(cache[k].get("etag") for k in ("github_releases", "changelog", "desktop_releases"))
+        stub_server.hits.clear()
+        assert rw.fetch_all("all", 3, cache=cache) == first
+        assert stub_server.hits == [], "fresh entries must not touch the network"
+        again = rw.fetch_all("all", 3, cache=cache, refresh=True)
+        assert again == first
+        assert len(stub_server.hits) == 3 and all(etag for _, etag in stub_server.hits)
+        saved = json.loads(rw.CACHE_FILE.read_text())
+        assert saved["changelog"]["etag"] == cache["changelog"]["etag"]
+
+    def test_stale_fallback_is_per_source(self, stub_server, capsys):
+        cache = {}
+        rw.fetch_all("all", 3, cache=cache)
+        del cache["desktop_releases"]
+        for entry in cache.values():
+            entry["timestamp"] -= rw.CACHE_TTL + 1
+        stub_server.down = True
+        releases, changelog, desktop = rw.fetch_all("all", 3, cache=cache)
+        assert releases[0]["tag_name"] == "v2.1.60" and changelog
+        assert desktop == []
+        err = capsys.readouterr().err
+        assert "using stale cache" in err and "Failed to fetch Desktop" in err
+
+    def test_no_cache_skips_validators_and_storage(self, stub_server):
+        cache = {"changelog": {"timestamp": 0, "data": "old", "etag": '"x"',
+                               "url": rw.CHANGELOG_URL}}
+        content = rw.fetch_changelog(cache=cache, no_cache=True)
+        assert content.startswith("## 2.1.60")
+        assert stub_server.hits == [("/CHANGELOG.md", None)]
+        assert cache["changelog"]["data"] == "old" and not rw.CACHE_FILE.exists()
+
+    def test_injected_fetcher(self):
+        calls = []
+
+        def fetcher(url, headers, timeout):
+            calls.append(url)
+            return 200, "## 1.0.0\n- Fixed x\n", {"etag": '"e"'}
+
+        cache = {}
+        assert rw.fetch_changelog(cache=cache, fetcher=fetcher, no_cache=True).startswith("## 1.0.0")
+        assert calls == [rw.CHANGELOG_URL]
+
+
 # ---------------------------------------------------------------------------
 # Unit tests: CHANGELOG parser
 # ---------------------------------------------------------------------------
@@ -305,6 +429,181 @@ class TestWordBoundary:
         )
 
 
+# ---------------------------------------------------------------------------
+# Unit tests: Precompiled keyword matcher (+ benchmark fixture)
+# ---------------------------------------------------------------------------
+
+YEAR_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "release_watch", "releases-year.json")
+
+
+def _legacy_line_scan(line_lower):
+    """The per-keyword re.search loop KeywordMatcher replaced (reference)."""
+    import re
+    signal = None
+    for sig, kws in rw.SIGNAL_KEYWORDS.items():
+        if any(re.search(rf'\b{re.escape(kw)}\b', line_lower) for kw in kws):
+            signal = sig
+            break
+    keywords, first = [], None
+    for cat, kws in rw.KEYWORD_CATEGORIES.items():
+        for kw in kws:
+            if re.search(rf'\b{re.escape(kw.lower())}\b', line_lower):
+                keywords.append(kw)
+                first = first or cat
+    return signal, keywords, first
+
+
+def _load_year():
+    with open(YEAR_FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher: one pass per line, same hits as the per-keyword regexes."""
+
+    def test_parity_with_per_keyword_regex_on_fixture(self):
+        year = _load_year()
+        lines = [ln.strip().lower() for r in year["releases"] for ln in r["body"].split("\n")]
+        lines += ["bug fix for prefix", "claude_ vars", "patched fixture", "a bug fix: fixed"]
+        for line in lines:
+            hits = rw.KEYWORD_MATCHER.scan(line)
+            signal, keywords, first = _legacy_line_scan(line)
+            assert hits.signal() == signal, line
+            assert hits.keywords == list(dict.fromkeys(keywords)), line
+            assert hits.first_category == first, line
+
+    def test_prefix_keyword_at_same_position(self):
+        m = rw.KeywordMatcher({"a": ["bug fix", "bug"]}, {"FIXED": ["fix"]}, [])
+        hits = m.scan("a bug fix landed")
+        assert hits.keywords == ["bug fix", "bug"] and hits.signal() == "FIXED"
+
+    def test_desktop_fixed_list_is_narrower(self):
+        hits = rw.KEYWORD_MATCHER.scan("plugin patch")
+        assert hits.signal() == "FIXED" and hits.signal(desktop=True) is None
+
+    def test_scan_dedups_summaries(self):
+        body = "- Added plugin hooks\n- Added plugin hooks\n"
+        findings = rw.scan_releases([{"tag_name": "v1", "body": body}])
+        assert len(findings["NEW"]) == 1
+
+    @pytest.mark.benchmark_xfail
+    def test_benchmark_year_of_releases(self):
+        """--count 100 with CHANGELOG enrichment stays well under 100ms."""
+        import copy
+        year = _load_year()
+        versions = rw.parse_changelog(year["changelog"])
+        releases = rw.merge_changelog_with_releases(copy.deepcopy(year["releases"][:100]), versions)
+        t0 = time.perf_counter()
+        findings = rw.scan_releases(releases)
+        elapsed = time.perf_counter() - t0
+        lines = [ln.strip().lower() for r in releases for ln in r["body"].split("\n")]
+        t0 = time.perf_counter()
+        for line in lines:
+            _legacy_line_scan(line)
+        legacy = time.perf_counter() - t0
+        assert sum(len(v) for v in findings.values()) > 0
+        timing_bound(elapsed < 0.1 and elapsed < legacy,
+                     f"scan {elapsed * 1000:.1f}ms vs legacy {legacy * 1000:.1f}ms")
+
+
+# ---------------------------------------------------------------------------
+# Unit tests: One-pass craft state scan
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def scan_tree(monkeypatch, tmp_path):
+    """A small checkout plus an isolated scan cache."""
+    monkeypatch.setattr(rw, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(rw, "SCAN_CACHE_FILE", tmp_path / "cache" / "scan.json")
+    root = tmp_path / "repo"
+    (root / "agents").mkdir(parents=True)
+    (root / "agents" / "a.md").write_text("---\nmemory: project\n---\nuses claude-opus-4-6\n")
+    (root / "commands").mkdir()
+    (root / "commands" / "c.md").write_text("---\nhooks: PreToolUse\n---\n")
+    (root / "lib.py").write_text('M = "claude-sonnet-4-5"  # and claude-3.5-haiku\n')
+    (root / "notes.txt").write_text("claude-opus-4")
+    for skipped in ("node_modules/pkg", ".git", "site"):
+        (root / skipped).mkdir(parents=True)
+        (root / skipped / "x.md").write_text("claude-haiku-4-5")
+    return root
+
+
+def _findall_models(text):
+    """The per-pattern re.findall loop MODEL_REGEX replaced (reference)."""
+    import re
+    found = []
+    for pattern in rw.MODEL_PATTERNS:
+        for m in re.findall(pattern, text):
+            if m not in found:
+                found.append(m)
+    return found
+
+
+class TestCraftStateScan:
+    """analyze_craft_state: one pruned walk, one regex, mtime-keyed scan cache."""
+
+    def test_combined_regex_matches_per_pattern_findall(self):
+        year = _load_year()
+        texts = [r["body"] for r in year["releases"]] + [year["changelog"]]
+        texts.append("claude-sonnet-4-5 claude-3.5-sonnet claude-opus-4-6-20260101 claude-3-haiku")
+        for text in texts:
+            assert sorted(rw.scan_models(text)) == sorted(_findall_models(text))
+
+    def test_walk_prunes_and_dispatches_on_suffix(self, scan_tree):
+        state = rw.analyze_craft_state(scan_tree)
+        files = {e["file"] for e in state["hardcoded_models"]}
+        assert files == {os.path.join("agents", "a.md"), "lib.py"}
+        models = {e["model"] for e in state["hardcoded_models"] if e["file"] == "lib.py"}
+        assert models == {"claude-sonnet-4", "claude-sonnet-4-5", "claude-3.5-haiku"}
+        assert state["agent_features"] == {os.path.join("agents", "a.md"): {"memory": "project"}}
+        assert state["hook_events"][0]["value"] == "PreToolUse"
+
+    def test_unchanged_files_are_not_reread(self, scan_tree, monkeypatch):
+        first = rw.analyze_craft_state(scan_tree)
+        assert rw.SCAN_CACHE_FILE.exists()
+        monkeypatch.setattr(rw, "scan_models", lambda text: pytest.fail("re-read an unchanged file"))
+        assert rw.analyze_craft_state(scan_tree) == first
+
+    def test_changed_file_is_rescanned(self, scan_tree):
+        rw.analyze_craft_state(scan_tree)
+        lib = scan_tree / "lib.py"
+        lib.write_text("nothing here, longer than before\n")
+        os.utime(lib, ns=(1, 1))
+        files = {e["file"] for e in rw.analyze_craft_state(scan_tree)["hardcoded_models"]}
+        assert "lib.py" not in files
+
+    def test_scan_cache_written_beside_its_own_path(self, scan_tree, monkeypatch, tmp_path):
+        monkeypatch.setattr(rw, "SCAN_CACHE_FILE", tmp_path / "elsewhere" / "scan.json")
+        rw.analyze_craft_state(scan_tree)
+        assert rw.SCAN_CACHE_FILE.exists()
+        assert not (tmp_path / "cache").exists()  # nothing staged under CACHE_DIR
+
+    def test_no_cache_leaves_no_file(self, scan_tree):
+        rw.analyze_craft_state(scan_tree, use_cache=False)
+        assert not rw.SCAN_CACHE_FILE.exists()
+
+    @pytest.mark.benchmark_xfail
+    def test_benchmark_node_modules_checkout(self, scan_tree):
+        """A heavy node_modules costs nothing; a warm scan skips every read."""
+        for i in range(300):
+            d = scan_tree / "node_modules" / f"p{i}"
+            d.mkdir()
+            for ext in ("md", "json", "py"):
+                (d / f"f.{ext}").write_text("x" * 2000)
+        for i in range(200):
+            (scan_tree / "commands" / f"c{i}.md").write_text("body " * 400)
+        t0 = time.perf_counter()
+        cold = rw.analyze_craft_state(scan_tree)
+        cold_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        warm = rw.analyze_craft_state(scan_tree)
+        warm_ms = (time.perf_counter() - t0) * 1000
+        assert cold == warm
+        timing_bound(warm_ms < cold_ms and warm_ms < 100,
+                     f"warm {warm_ms:.1f}ms vs cold {cold_ms:.1f}ms")
+
+
 # ---------------------------------------------------------------------------
 # Unit tests: Desktop source
 # ---------------------------------------------------------------------------
@@ -3,11 +3,14 @@
 Test suite for scripts/workflow_parse.py — the deterministic workflow-engine core.
 
 Covers Increment 1 of the workflow-engine plan (mechanical core):
-  - Structural output validator (D2 layer 1, gating)
+  - Structural output validator (D2 layer 1, gating) — compiled + batch gate
   - YAML form + shape-DSL form -> identical wave plan (D1, D3)
   - Empty fan-out hard error naming upstream (D6 / FR8)
   - Cache-key hash + downstream cascade invalidation (D4)
-  - Run-wide semaphore-file arithmetic (D5 / FR7)
+  - Shared content-addressed output store + LRU gc (D4)
+  - Incremental resume planner: per-item reuse / re-run map (D4)
+  - Pipelined schedule: per-item release across stages (StreamScheduler)
+  - Run-wide semaphore leases: ceiling, blocking acquire, leak reaping (D5 / FR7)
 
 Pure stdlib core (no jsonschema, no node). YAML input reading uses PyYAML,
 already a craft dependency.
@@ -25,6 +28,8 @@ import workflow_parse as wp  # noqa: E402
 
 from pathlib import Path  # noqa: E402
 
+from helpers import timing_bound  # noqa: E402
+
 PLUGIN_DIR = Path(__file__).resolve().parent.parent
 
 pytestmark = [pytest.mark.unit, pytest.mark.orchestrator]
@@ -85,6 +90,88 @@ def test_validate_output_passes_silently_when_valid():
     assert wp.validate_output({"confirmed": True}, {"confirmed": "boolean"}, stage="verify") is None
 
 
+# ---------------------------------------------------------------------------
+# D2 layer 1 — compiled, memoized validators + batch gate
+# ---------------------------------------------------------------------------
+
+SCHEMA_CASES = [
+    ({"findings": [{"x": 1}, {"y": 2}]}, {"findings": "object[]"}),
+    ({"findings": [{"x": 1}, 3]}, {"findings": "object[]"}),
+    ({"scores": [1, 2.5, True]}, {"scores": "number[]"}),
+    ({"flags": [True, 0]}, {"flags": "boolean[]"}),
+    ({"dims": "oops"}, {"dims": "string[]"}),
+    ({"score": True}, {"score": "number"}),
+    ({}, {"a": "string", "b": "number[]"}),
+    ({"a": 1}, {"a": "date"}),
+    ([1, 2], {"a": "string"}),
+]
+
+
+@pytest.mark.parametrize("data,schema", SCHEMA_CASES)
+def test_compiled_validator_agrees_with_the_interpreter(data, schema):
+    assert wp.compile_schema(schema)(data) == wp._interpret_schema(data, schema)
+
+
+def test_compile_schema_is_memoized_by_schema_content():
+    first = wp.compile_schema({"a": "string", "b": "number[]"})
+    # Same schema, different dict identity and key order -> same validator.
+    assert wp.compile_schema({"b": "number[]", "a": "string"}) is first
+    assert wp.compile_schema({"a": "string"}) is not first
+
+
+def test_compiled_array_check_accepts_str_subclasses_like_the_interpreter():
+    class Tag(str):
+        pass
+
+    assert wp.compile_schema({"tags": "string[]"})({"tags": ["a", Tag("b")]}) == []
+
+
+def test_gate_outputs_validates_a_whole_wave_in_order():
+    verdicts = wp.gate_outputs(
+        [{"confirmed": True}, {}, {"confirmed": "no"}],
+        {"confirmed": "boolean"},
+        stage="verify",
+        semantic_warnings=[None, None, "odd"],
+    )
+    assert [v["ok"] for v in verdicts] == [True, False, False]
+    assert verdicts[2]["semantic_warning"] == "odd"
+    assert all(v["stage"] == "verify" for v in verdicts)
+
+
+def test_gate_outputs_rejects_a_short_warnings_list():
+    with pytest.raises(wp.WorkflowError, match="1 semantic warnings for 2 outputs"):
+        wp.gate_outputs([{}, {}], {"confirmed": "boolean"}, semantic_warnings=["x"])
+
+
+@pytest.mark.benchmark_xfail
+def test_compiled_validator_outpaces_the_interpreter():
+    import time
+
+    schema = {"findings": "object[]", "scores": "number[]", "summary": "string"}
+    wave = [
+        {
+            "findings": [{"line": i} for i in range(2000)],
+            "scores": [float(i) for i in range(2000)],
+            "summary": "ok",
+        }
+        for _ in range(200)
+    ]
+
+    start = time.perf_counter()
+    interpreted = [wp._interpret_schema(out, schema) for out in wave]
+    interp_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    verdicts = wp.gate_outputs(wave, schema)
+    compiled_s = time.perf_counter() - start
+
+    assert [v["structural_errors"] for v in verdicts] == interpreted
+    timing_bound(
+        compiled_s * 2 <= interp_s,
+        f"compiled {compiled_s * 1000:.1f}ms vs interpreter {interp_s * 1000:.1f}ms",
+    )
+
+
 # ---------------------------------------------------------------------------
 # D1 / D3 — both definition forms compile to an identical wave plan
 # ---------------------------------------------------------------------------
@@ -262,6 +349,58 @@ def test_dot_field_missing_on_object_is_a_workflow_error():
     assert "missing" in str(exc.value)
 
 
+def test_compile_plan_precompiles_binding_paths():
+    waves = {w["id"]: w for w in wp.parse(YAML_FORM)["waves"]}
+    assert waves["verify"]["paths"]["over"] == {
+        "source": "cover",
+        "ops": [["flat", "findings"]],
+    }
+    assert waves["cover"]["paths"]["over"] == {
+        "source": "decompose",
+        "ops": [["field", "dimensions"]],
+    }
+    assert waves["synthesize"]["paths"] == {
+        "over": None,
+        "input": {"source": "verify", "ops": [["each", None]]},
+    }
+
+
+def test_malformed_binding_segment_fails_at_compile_time():
+    bad = "name: b\nstages:\n  - id: d\n    type: agent\n  - id: c\n    type: parallel\n    over: d.x-y\n    agent: { role: r }"
+    with pytest.raises(wp.WorkflowError) as exc:
+        wp.parse(bad)
+    assert "segment" in str(exc.value)
+
+
+def test_resolve_uses_the_precompiled_path_not_the_string():
+    path = wp.compile_binding("cover[].findings")
+    upstream = {"cover": [{"findings": [1, 2]}, {"findings": [3]}]}
+    # The label is only used in messages; resolution follows the compiled ops.
+    assert wp.resolve_fanout("label", upstream, path=path) == [1, 2, 3]
+
+
+def test_iter_fanout_is_lazy_across_flatten_levels():
+    pulled = []
+
+    def reviewers():
+        for i in range(3):
+            pulled.append(i)
+            yield {"findings": [f"f{i}a", f"f{i}b"]}
+
+    # A one-shot generator upstream: nothing may be copied up front.
+    items = wp.iter_fanout("cover[].findings", {"cover": reviewers()})
+    assert next(items) == "f0a"
+    assert pulled == [0]
+    assert list(items) == ["f0b", "f1a", "f1b", "f2a", "f2b"]
+
+
+def test_iter_fanout_empty_raises_after_iteration():
+    items = wp.iter_fanout("cover[].findings", {"cover": [{"findings": []}]})
+    with pytest.raises(wp.EmptyFanoutError) as exc:
+        list(items)
+    assert "cover" in str(exc.value)
+
+
 # ---------------------------------------------------------------------------
 # D4 — cache-key hash (content hash of the three components)
 # ---------------------------------------------------------------------------
@@ -299,6 +438,101 @@ def test_cache_key_changes_when_definition_block_changes():
     )
 
 
+# ---------------------------------------------------------------------------
+# D4 — shared content-addressed output store (cross-run reuse + LRU gc)
+# ---------------------------------------------------------------------------
+
+def test_store_round_trips_an_output_under_its_cache_key(tmp_path):
+    key = wp.cache_key({"id": "cover"}, {"target": "src/"}, "reviewer@v1")
+    path = wp.store_put(str(tmp_path), key, {"findings": [{"x": 1}]}, stage="cover")
+    assert path == str(tmp_path / key[:2] / f"{key}.json")
+    assert wp.store_get(str(tmp_path), key) == {"findings": [{"x": 1}]}
+
+
+def test_store_miss_returns_none(tmp_path):
+    key = wp.cache_key({"id": "cover"}, {}, "r@v1")
+    assert wp.store_get(str(tmp_path), key) is None
+
+
+def test_store_is_shared_across_runs_and_definitions(tmp_path):
+    # Two different runs whose stage hashes to the same key share one entry.
+    block = {"id": "cover", "type": "parallel", "role": "reviewer"}
+    first = wp.cache_key(block, {"dim": "security"}, "reviewer@v1")
+    wp.store_put(str(tmp_path), first, {"findings": []})
+    again = wp.cache_key(dict(block), {"dim": "security"}, "reviewer@v1")
+    assert wp.store_get(str(tmp_path), again) == {"findings": []}
+
+
+def test_store_rejects_a_malformed_key(tmp_path):
+    with pytest.raises(wp.WorkflowError):
+        wp.store_put(str(tmp_path), "../escape", {})
+
+
+def test_store_treats_a_corrupt_entry_as_a_miss(tmp_path):
+    key = wp.cache_key({"id": "x"}, {}, "r@v1")
+    path = wp.store_put(str(tmp_path), key, {"ok": True})
+    Path(path).write_text("{not json")
+    assert wp.store_get(str(tmp_path), key) is None
+    assert not Path(path).exists()
+
+
+def test_store_two_readers_of_a_corrupt_entry(tmp_path, monkeypatch):
+    key = wp.cache_key({"id": "x"}, {}, "r@v1")
+    path = wp.store_put(str(tmp_path), key, {"ok": True})
+    Path(path).write_text("{not json")
+    real_unlink = os.unlink
+
+    def unlink_after_other_reader(target):
+        real_unlink(target)  # the other reader removes it first ...
+        real_unlink(target)  # ... so ours finds nothing
+
+    monkeypatch.setattr(wp.os, "unlink", unlink_after_other_reader)
+    assert wp.store_get(str(tmp_path), key) is None
+
+
+def test_store_gc_evicts_by_age_then_least_recently_used(tmp_path):
+    import time
+
+    root = str(tmp_path)
+    now = time.time()
+    keys = [wp.cache_key({"id": f"s{i}"}, {}, "r@v1") for i in range(4)]
+    for i, key in enumerate(keys):
+        path = wp.store_put(root, key, {"pad": "x" * 100})
+        # s0 unused for 60 days; s1..s3 used progressively more recently.
+        age = 60 * 86400 if i == 0 else (4 - i) * 60
+        os.utime(path, (now - age, now - age))
+    budget = sum(os.path.getsize(wp.store_path(root, k)) for k in keys[2:])
+    result = wp.store_gc(root, max_bytes=budget, max_age_days=30, now=now)
+    assert result["removed"] == 2
+    assert result["kept"] == 2
+    assert wp.store_get(root, keys[0]) is None  # too old
+    assert wp.store_get(root, keys[1]) is None  # least recently used
+    assert wp.store_get(root, keys[3]) == {"pad": "x" * 100}
+
+
+def test_store_hit_refreshes_recency(tmp_path):
+    import time
+
+    root = str(tmp_path)
+    key = wp.cache_key({"id": "x"}, {}, "r@v1")
+    path = wp.store_put(root, key, {})
+    old = time.time() - 90 * 86400
+    os.utime(path, (old, old))
+    wp.store_get(root, key)
+    assert wp.store_gc(root, max_bytes=None, max_age_days=30)["removed"] == 0
+
+
+def test_cli_gc_subcommand_reports_json(tmp_path, capsys):
+    import json
+
+    root = str(tmp_path / "store")
+    wp.store_put(root, wp.cache_key({"id": "x"}, {}, "r@v1"), {})
+    rc = wp.main(["gc", "--store", root, "--max-bytes", "1", "--json"])
+    assert rc == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["removed"] == 1 and result["kept"] == 0
+
+
 # ---------------------------------------------------------------------------
 # D4 — downstream cascade invalidation
 # ---------------------------------------------------------------------------
@@ -375,6 +609,19 @@ def test_semaphore_release_decrements_and_floors_at_zero(tmp_path):
     assert wp.sem_release(path) == 0
 
 
+def test_semaphore_leaseless_release_drops_only_the_stalest_lease(tmp_path):
+    import time
+
+    path = str(tmp_path / "semaphore.count")
+    fresh = wp.sem_lease(path, ceiling=5)  # the lowest-numbered slot
+    stale = wp.sem_lease(path, ceiling=5)
+    old = time.time() - 120
+    os.utime(stale, (old, old))
+    assert wp.sem_release(path) == 1
+    assert not os.path.exists(stale)
+    assert os.path.exists(fresh)
+
+
 def test_semaphore_reconcile_resets_to_live_agent_count(tmp_path):
     # Residual-risk mitigation: a mid-run crash between increment and dispatch
     # leaks a count; reconcile against the live-agent manifest at wave boundary.
@@ -385,6 +632,420 @@ def test_semaphore_reconcile_resets_to_live_agent_count(tmp_path):
     assert wp.sem_read(path) == 1
 
 
+def _hammer_semaphore(path, ceiling, rounds, occupancy, peak, lock, failures):
+    # Worker for the stress test: lease, prove occupancy <= ceiling, release.
+    import time
+
+    for _ in range(rounds):
+        lease = wp.sem_lease(path, ceiling, timeout=20.0)
+        if lease is None:
+            with lock:
+                failures.value += 1
+            continue
+        with lock:
+            occupancy.value += 1
+            peak.value = max(peak.value, occupancy.value)
+        time.sleep(0.001)
+        with lock:
+            occupancy.value -= 1
+        wp.sem_release(path, lease)
+
+
+@pytest.mark.integration
+def test_semaphore_ceiling_holds_under_concurrent_acquire(tmp_path):
+    # The old counter was a read-modify-write race; leases must never let
+    # more than `ceiling` holders in, however hard many processes hammer it.
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("fork")
+    path = str(tmp_path / "semaphore.count")
+    ceiling = 3
+    occupancy, peak, failures = ctx.Value("i", 0), ctx.Value("i", 0), ctx.Value("i", 0)
+    lock = ctx.Lock()
+    workers = [
+        ctx.Process(
+            target=_hammer_semaphore,
+            args=(path, ceiling, 25, occupancy, peak, lock, failures),
+        )
+        for _ in range(12)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert failures.value == 0
+    assert 1 <= peak.value <= ceiling
+    assert wp.sem_read(path) == 0
+
+
+def test_semaphore_leases_one_file_per_slot_and_mirrors_the_count(tmp_path):
+    path = str(tmp_path / "semaphore.count")
+    lease = wp.sem_lease(path, ceiling=4)
+    assert lease is not None and os.path.exists(lease)
+    assert (tmp_path / "semaphore.count").read_text() == "1"
+    assert wp.sem_release(path, lease) == 0
+    assert not os.path.exists(lease)
+
+
+def test_semaphore_blocking_acquire_times_out_at_ceiling(tmp_path):
+    path = str(tmp_path / "semaphore.count")
+    assert wp.sem_acquire(path, ceiling=1) is True
+    assert wp.sem_lease(path, ceiling=1, timeout=0.05) is None
+
+
+def test_semaphore_blocking_acquire_wakes_when_a_slot_frees(tmp_path):
+    import threading
+
+    path = str(tmp_path / "semaphore.count")
+    held = wp.sem_lease(path, ceiling=1)
+    threading.Timer(0.05, wp.sem_release, args=(path, held)).start()
+    assert wp.sem_lease(path, ceiling=1, timeout=5.0) is not None
+
+
+def test_semaphore_reaps_a_lease_whose_owner_died(tmp_path):
+    import subprocess
+
+    path = str(tmp_path / "semaphore.count")
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()  # a pid that is certainly gone
+    assert wp.sem_acquire(path, ceiling=1, pid=child.pid) is True
+    # The only slot is leaked by a dead owner -> returned automatically.
+    assert wp.sem_acquire(path, ceiling=1) is True
+    assert wp.sem_read(path) == 1
+
+
+def test_semaphore_reaps_a_lease_with_an_expired_heartbeat(tmp_path):
+    import time
+
+    path = str(tmp_path / "semaphore.count")
+    lease = wp.sem_lease(path, ceiling=1)
+    old = time.time() - 120
+    os.utime(lease, (old, old))
+    assert wp.sem_acquire(path, ceiling=1, ttl=60) is True
+
+
+def test_semaphore_late_reaper_spares_a_retaken_slot(tmp_path, monkeypatch):
+    import time
+
+    path = str(tmp_path / "semaphore.count")
+    lease = wp.sem_lease(path, ceiling=1)
+    old = time.time() - 120
+    os.utime(lease, (old, old))
+    judged = wp._read_lease(lease)
+    # Another reaper frees the slot and a new holder takes it ...
+    assert wp.sem_reap(path, ttl=60) == 1
+    retaken = wp.sem_lease(path, ceiling=1)
+    assert retaken == lease
+    # ... while a slower reaper still acts on its earlier (stale) judgment.
+    monkeypatch.setattr(wp, "_read_lease", lambda _: judged)
+    monkeypatch.setattr(wp, "_lease_is_stale", lambda *a, **k: True)
+    assert wp._reap_one(path, lease, ttl=60) is False
+    monkeypatch.undo()
+    assert wp._read_lease(lease)["token"] != judged["token"]
+    assert wp.sem_read(path) == 1
+
+
+def test_semaphore_heartbeat_keeps_a_live_lease(tmp_path):
+    import time
+
+    path = str(tmp_path / "semaphore.count")
+    lease = wp.sem_lease(path, ceiling=1)
+    old = time.time() - 120
+    os.utime(lease, (old, old))
+    assert wp.sem_heartbeat(lease) is True
+    assert wp.sem_acquire(path, ceiling=1, ttl=60) is False
+
+
+# ---------------------------------------------------------------------------
+# D4 — incremental resume planner (per-stage / per-item reuse vs re-run)
+# ---------------------------------------------------------------------------
+
+ROLE_VERSIONS = {
+    "task-analyzer": "ta@v1",
+    "reviewer": "rv@v1",
+    "verifier": "vf@v1",
+    "docs-architect": "da@v1",
+}
+
+
+def _fake_agent(wave, unit):
+    # Deterministic stand-in outputs keyed off the unit's resolved input.
+    if wave["id"] == "decompose":
+        return {"dimensions": ["security", "perf", "style"]}
+    if wave["id"] == "cover":
+        return {"findings": [f"{unit['item']}-1", f"{unit['item']}-2"]}
+    if wave["id"] == "verify":
+        return {"confirmed": True}
+    return {"report": "ok"}
+
+
+def _record_run(run_dir, plan, role_versions, agent=_fake_agent, records=None):
+    # Execute a plan with fake agents, recording every unit like the skill does.
+    outputs = {}
+    for wave in plan["waves"]:
+        version = role_versions.get(wave["role"])
+        units = wp.stage_units(wave, outputs)
+        recorded = [
+            (wp.unit_key(wave, unit, version), agent(wave, unit)) for unit in units
+        ]
+        wp.record_stage(str(run_dir), wave["id"], version, recorded)
+        produced = [output for _, output in recorded]
+        outputs[wave["id"]] = produced if wave["type"] == "parallel" else produced[0]
+    return wp.load_run_record(str(run_dir))
+
+
+def test_resume_plan_reuses_everything_when_nothing_changed(tmp_path):
+    plan = wp.parse(YAML_FORM)
+    records = _record_run(tmp_path, plan, ROLE_VERSIONS)
+    result = wp.resume_plan(plan, records, ROLE_VERSIONS)
+    assert [s["action"] for s in result["stages"]] == ["reuse"] * 4
+    assert result["totals"]["rerun"] == 0
+    # 1 decompose + 3 cover + 6 findings x fan 2 verify + 1 synthesize
+    assert result["totals"]["reuse"] == 1 + 3 + 12 + 1
+
+
+def test_resume_plan_cascades_a_role_bump_downstream(tmp_path):
+    plan = wp.parse(YAML_FORM)
+    records = _record_run(tmp_path, plan, ROLE_VERSIONS)
+    bumped = dict(ROLE_VERSIONS, reviewer="rv@v2")
+    result = wp.resume_plan(plan, records, bumped)
+    actions = {s["id"]: s for s in result["stages"]}
+    assert actions["decompose"]["action"] == "reuse"
+    assert actions["cover"]["action"] == "rerun"
+    assert [u["action"] for u in actions["cover"]["units"]] == ["rerun"] * 3
+    # verify cannot be bound until cover re-runs -> pending, not guessed.
+    assert actions["verify"]["action"] == "rerun" and actions["verify"]["pending"]
+    assert actions["synthesize"]["pending"]
+
+
+def test_resume_plan_reruns_only_new_fanout_items(tmp_path):
+    plan = wp.parse(YAML_FORM)
+    records = _record_run(tmp_path / "prior", plan, ROLE_VERSIONS)
+    # decompose re-ran this time and added a fourth dimension.
+    waves = {w["id"]: w for w in plan["waves"]}
+    new_decompose = {"dimensions": ["security", "perf", "style", "docs"]}
+    wp.record_stage(
+        str(tmp_path / "prior"),
+        "decompose",
+        "ta@v1",
+        [(wp.unit_key(waves["decompose"], None, "ta@v1"), new_decompose)],
+    )
+    records = wp.load_run_record(str(tmp_path / "prior"))
+    result = wp.resume_plan(plan, records, ROLE_VERSIONS)
+    cover = [s for s in result["stages"] if s["id"] == "cover"][0]
+    assert cover["action"] == "partial"
+    assert [u["action"] for u in cover["units"]] == ["reuse", "reuse", "reuse", "rerun"]
+    verify = [s for s in result["stages"] if s["id"] == "verify"][0]
+    # findings of the three reused reviewers stay cached; the new reviewer's
+    # findings are only bindable after it runs.
+    assert verify["pending"] is True
+    assert len(verify["units"]) == 12
+    assert {u["action"] for u in verify["units"]} == {"reuse"}
+    # synthesize reads every finding, so it waits for the new ones.
+    synthesize = [s for s in result["stages"] if s["id"] == "synthesize"][0]
+    assert synthesize["action"] == "rerun"
+    assert synthesize["pending"] is True
+    assert synthesize["units"] == []
+    assert all(v["stage"] != "synthesize" for v in result["reuse"].values())
+
+
+def test_resume_plan_reuses_units_from_the_shared_store(tmp_path):
+    plan = wp.parse(YAML_FORM)
+    records = _record_run(tmp_path / "run", plan, ROLE_VERSIONS)
+    del records["synthesize"]
+    synth = [w for w in plan["waves"] if w["id"] == "synthesize"][0]
+    verify_outputs = [{"confirmed": True}] * 12
+    key = wp.unit_key(synth, verify_outputs, "da@v1")
+    wp.store_put(str(tmp_path / "store"), key, {"report": "cached"})
+    result = wp.resume_plan(plan, records, ROLE_VERSIONS, store_root=str(tmp_path / "store"))
+    assert result["stages"][-1]["action"] == "reuse"
+    assert result["reuse"][key]["source"] == "store"
+
+
+def test_resume_plan_reruns_over_a_corrupt_store_entry(tmp_path):
+    plan = wp.parse(YAML_FORM)
+    records = _record_run(tmp_path / "run", plan, ROLE_VERSIONS)
+    del records["synthesize"]
+    synth = [w for w in plan["waves"] if w["id"] == "synthesize"][0]
+    key = wp.unit_key(synth, [{"confirmed": True}] * 12, "da@v1")
+    store = tmp_path / "store"
+    wp.store_put(str(store), key, {"report": "cached"})
+    Path(wp.store_path(str(store), key)).write_text("{not json", encoding="utf-8")
+    result = wp.resume_plan(plan, records, ROLE_VERSIONS, store_root=str(store))
+    assert result["stages"][-1]["action"] == "rerun"
+    assert key not in result["reuse"]
+
+
+def test_resume_plan_reuses_what_the_skill_stored(tmp_path):
+    # Store every unit exactly as SKILL.md step 5 says (store_put by unit_key),
+    # with no run record at all: --resume-plan must find each of them.
+    plan = wp.parse(YAML_FORM)
+    store = str(tmp_path / "store")
+    outputs = {}
+    for wave in plan["waves"]:
+        version = ROLE_VERSIONS.get(wave["role"])
+        produced = []
+        for unit in wp.stage_units(wave, outputs):
+            output = _fake_agent(wave, unit)
+            wp.store_put(store, wp.unit_key(wave, unit, version), output)
+            produced.append(output)
+        outputs[wave["id"]] = produced if wave["type"] == "parallel" else produced[0]
+    result = wp.resume_plan(plan, {}, ROLE_VERSIONS, store_root=store)
+    assert {s["action"] for s in result["stages"]} == {"reuse"}
+    assert {v["source"] for v in result["reuse"].values()} == {"store"}
+
+
+def test_resume_plan_always_reruns_a_verify_gate(tmp_path):
+    plan = wp.parse(VERIFY_WORKFLOW)
+    records = _record_run(tmp_path, plan, {"coder": "c@v1"}, agent=lambda w, u: {})
+    result = wp.resume_plan(plan, records)
+    assert [s["action"] for s in result["stages"]] == ["reuse", "rerun"]
+
+
+def test_cli_resume_plan_emits_json(tmp_path, capsys):
+    import json
+
+    definition = tmp_path / "WORKFLOW-x.yaml"
+    definition.write_text(YAML_FORM)
+    _record_run(tmp_path / "run", wp.parse(YAML_FORM), ROLE_VERSIONS)
+    rc = wp.main(
+        ["--resume-plan", str(tmp_path / "run"), "--store", str(tmp_path / "s"), str(definition)]
+    )
+    assert rc == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["totals"]["rerun"] == 0
+
+
+def test_cli_resume_plan_without_records_exits_nonzero(tmp_path, capsys):
+    definition = tmp_path / "WORKFLOW-x.yaml"
+    definition.write_text(YAML_FORM)
+    rc = wp.main(["--resume-plan", str(tmp_path / "none"), str(definition)])
+    assert rc == 2
+    assert "no recorded stages" in capsys.readouterr().err
+
+
+# ---------------------------------------------------------------------------
+# Pipelined schedule — per-item release instead of a global wave barrier
+# ---------------------------------------------------------------------------
+
+def test_pipelined_plan_carries_per_item_release_rules():
+    plan = wp.parse(YAML_FORM, pipelined=True)
+    assert plan["schedule"] == "pipelined"
+    rules = {w["id"]: w["release"] for w in plan["waves"]}
+    assert rules["decompose"] == {"mode": "barrier", "upstream": []}
+    # cover binds a single agent's array: nothing to stream from.
+    assert rules["cover"] == {"mode": "barrier", "upstream": ["decompose"]}
+    # verify binds cover[].findings: each reviewer's findings stream on.
+    assert rules["verify"] == {"mode": "per_item", "upstream": ["cover"]}
+    assert rules["synthesize"] == {"mode": "barrier", "upstream": ["verify"]}
+
+
+def test_default_plan_stays_wave_scheduled():
+    plan = wp.parse(YAML_FORM)
+    assert plan["schedule"] == "waves"
+    assert all("release" not in w for w in plan["waves"])
+
+
+def test_pipelined_and_wave_plans_share_unit_keys():
+    wave = wp.parse(YAML_FORM)["waves"][2]
+    piped = wp.parse(YAML_FORM, pipelined=True)["waves"][2]
+    unit = {"item": "f", "replica": 0}
+    assert wp.unit_key(wave, unit, "v1") == wp.unit_key(piped, unit, "v1")
+
+
+def _drive(scheduler, agent, pick):
+    # Run a scheduler to completion; `pick` chooses which in-flight unit ends next.
+    inflight = list(scheduler.start())
+    trace = []
+    while inflight:
+        unit = pick(inflight)
+        inflight.remove(unit)
+        trace.append((unit["stage"], unit["unit"]))
+        output, ok = agent(unit)
+        inflight.extend(scheduler.complete(unit["stage"], unit["unit"], output, ok))
+    return trace
+
+
+def _stream_agent(unit):
+    stage = unit["stage"]
+    if stage == "decompose":
+        return {"dimensions": ["security", "perf", "style"]}, True
+    if stage == "cover":
+        item = unit["input"]["item"]
+        return {"findings": [f"{item}-1", f"{item}-2"]}, True
+    if stage == "verify":
+        return {"confirmed": unit["input"]["item"]}, True
+    return {"report": unit["input"]}, True
+
+
+def test_stream_scheduler_releases_downstream_before_the_wave_ends():
+    scheduler = wp.StreamScheduler(wp.parse(YAML_FORM, pipelined=True))
+    # Always finish the NEWEST in-flight unit: the slow reviewers lag behind.
+    trace = _drive(scheduler, _stream_agent, pick=lambda inflight: inflight[-1])
+    stages = [stage for stage, _ in trace]
+    first_verify = stages.index("verify")
+    last_cover = len(stages) - 1 - stages[::-1].index("cover")
+    assert first_verify < last_cover  # no global barrier between cover and verify
+    assert scheduler.finished
+
+
+def test_stream_scheduler_matches_the_wave_schedule_output_order():
+    scheduler = wp.StreamScheduler(wp.parse(YAML_FORM, pipelined=True))
+    _drive(scheduler, _stream_agent, pick=lambda inflight: inflight[-1])
+    verified = [v["confirmed"] for v in scheduler.outputs["verify"]]
+    # Same order resolve_fanout("cover[].findings") x fan 2 gives a wave run.
+    expected = [
+        f for d in ("security", "perf", "style") for f in (f"{d}-1", f"{d}-2") for _ in (0, 1)
+    ]
+    assert verified == expected
+    synth = scheduler.outputs["synthesize"]["report"]
+    assert [v["confirmed"] for v in synth] == expected
+
+
+def test_stream_scheduler_failed_gate_releases_nothing_downstream():
+    def agent(unit):
+        output, ok = _stream_agent(unit)
+        if unit["stage"] == "cover" and unit["input"]["item"] == "perf":
+            return {}, False
+        return output, ok
+
+    scheduler = wp.StreamScheduler(wp.parse(YAML_FORM, pipelined=True))
+    trace = _drive(scheduler, agent, pick=lambda inflight: inflight[0])
+    assert sum(1 for stage, _ in trace if stage == "verify") == 8  # 2 dims x 2 x fan 2
+    assert len(scheduler.outputs["cover"]) == 2
+
+
+def test_stream_scheduler_empty_per_item_fanout_hard_aborts():
+    def agent(unit):
+        if unit["stage"] == "cover":
+            return {"findings": []}, True
+        return _stream_agent(unit)
+
+    scheduler = wp.StreamScheduler(wp.parse(YAML_FORM, pipelined=True))
+    with pytest.raises(wp.EmptyFanoutError) as exc:
+        _drive(scheduler, agent, pick=lambda inflight: inflight[0])
+    assert "cover" in str(exc.value)
+
+
+def test_stream_scheduler_rejects_an_unreleased_unit():
+    scheduler = wp.StreamScheduler(wp.parse(YAML_FORM, pipelined=True))
+    scheduler.start()
+    with pytest.raises(wp.WorkflowError):
+        scheduler.complete("verify", "0/0", {"confirmed": True})
+
+
+def test_cli_pipelined_flag_emits_release_rules(tmp_path, capsys):
+    import json
+
+    path = tmp_path / "WORKFLOW-x.yaml"
+    path.write_text(YAML_FORM)
+    assert wp.main(["--pipelined", str(path)]) == 0
+    plan = json.loads(capsys.readouterr().out)
+    assert plan["schedule"] == "pipelined"
+    assert plan["waves"][2]["release"]["mode"] == "per_item"
+
+
 # ---------------------------------------------------------------------------
 # Increment 2 — executor support: file load, CLI emit, hybrid D2 gate
 # ---------------------------------------------------------------------------
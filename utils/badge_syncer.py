@@ -83,9 +83,10 @@ class BadgeSyncer:
 
     @property
     def project_info(self):
-        """Lazy-load project info from CLAUDEMDDetector."""
+        """Lazy-load project info from the shared project snapshot."""
         if self._project_info is None and self.claude_md_detector:
-            self._project_info = self.claude_md_detector.detect()
+            from claude_md_detector import project_snapshot
+            self._project_info = project_snapshot(self.project_root)
         return self._project_info
 
     def sync_badges(
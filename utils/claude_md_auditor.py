@@ -22,9 +22,13 @@ from typing import List, Optional, Set
 
 # Import project detector - handle both module and script usage
 try:
-    from .claude_md_detector import CLAUDEMDDetector
+    from .claude_md_detector import project_snapshot
+    from .claude_md_document import ClaudeMdDocument
+    from .link_checker import MISSING_FILE, LinkChecker
 except ImportError:
-    from claude_md_detector import CLAUDEMDDetector
+    from claude_md_detector import project_snapshot
+    from claude_md_document import ClaudeMdDocument
+    from link_checker import MISSING_FILE, LinkChecker
 
 
 class Severity(Enum):
@@ -73,6 +77,16 @@ class CLAUDEMDAuditor:
         if self.path.exists():
             self.content = self.path.read_text()
             self.lines = self.content.split("\n")
+        self._document: Optional[ClaudeMdDocument] = None
+        self._document_lines: Optional[List[str]] = None
+
+    @property
+    def document(self) -> ClaudeMdDocument:
+        """Section tree of ``self.lines`` (rebuilt when they are replaced)."""
+        if self._document is None or self._document_lines is not self.lines:
+            self._document = ClaudeMdDocument(self.lines)
+            self._document_lines = self.lines
+        return self._document
 
     def audit(self) -> List[Issue]:
         """Run all validation checks.
@@ -105,8 +119,7 @@ class CLAUDEMDAuditor:
             return issues  # No version found in CLAUDE.md
 
         # Detect project and get actual version
-        detector = CLAUDEMDDetector(self.project_root)
-        project_info = detector.detect()
+        project_info = project_snapshot(self.project_root)
 
         if not project_info:
             return issues  # Can't detect project type
@@ -163,31 +176,27 @@ class CLAUDEMDAuditor:
     def check_broken_links(self) -> List[Issue]:
         """Find broken internal links.
 
+        Links resolve the same way as in the docs link checker
+        (utils/link_checker.py): code blocks are skipped, ``#anchor``
+        fragments and titles are stripped, and .linkcheck-ignore applies.
+
         Returns:
             List of broken link issues
         """
         issues = []
 
-        # Extract internal links
-        internal_links = self._extract_internal_links()
-
-        for link, line_num in internal_links:
-            # Skip external URLs
-            if link.startswith("http"):
+        checker = LinkChecker(self.project_root)
+        for broken in checker.check_text(self.path, self.content, anchors=False):
+            if broken.ignored or broken.reason != MISSING_FILE:
                 continue
-
-            # Resolve link path
-            target = self._resolve_link_path(link)
-
-            if not target.exists():
-                issues.append(Issue(
-                    severity=Severity.ERROR,
-                    category="broken_link",
-                    message=f"Link points to non-existent file: {link}",
-                    line_number=line_num,
-                    fixable=True,
-                    fix_method="remove_link"
-                ))
+            issues.append(Issue(
+                severity=Severity.ERROR,
+                category="broken_link",
+                message=f"Link points to non-existent file: {broken.link}",
+                line_number=broken.line,
+                fixable=True,
+                fix_method="remove_link"
+            ))
 
         return issues
 
@@ -200,8 +209,7 @@ class CLAUDEMDAuditor:
         issues = []
 
         # Detect project type to determine required sections
-        detector = CLAUDEMDDetector(self.project_root)
-        project_info = detector.detect()
+        project_info = project_snapshot(self.project_root)
 
         if not project_info:
             return issues
@@ -364,63 +372,13 @@ class CLAUDEMDAuditor:
                 return i
         return None
 
-    def _extract_internal_links(self) -> List[tuple]:
-        """Extract internal file links from CLAUDE.md.
-
-        Returns:
-            List of (link, line_number) tuples
-        """
-        links = []
-
-        # Markdown link pattern: [text](path)
-        pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-
-        for i, line in enumerate(self.lines, 1):
-            for match in re.finditer(pattern, line):
-                link = match.group(2)
-                # Filter internal links (not http/https/mailto)
-                if not link.startswith(("http://", "https://", "mailto:", "#")):
-                    links.append((link, i))
-
-        return links
-
-    def _resolve_link_path(self, link: str) -> Path:
-        """Resolve link to absolute path.
-
-        Args:
-            link: Link from markdown (relative or absolute)
-
-        Returns:
-            Resolved path
-        """
-        # Absolute from project root
-        if link.startswith("/"):
-            return self.project_root / link.lstrip("/")
-
-        # Relative from CLAUDE.md location
-        return (self.path.parent / link).resolve()
-
     def _extract_section_headers(self) -> List[str]:
         """Extract section headers (H1, H2) from CLAUDE.md.
 
         Returns:
             List of section titles
         """
-        sections = []
-
-        # Pattern: ## Section Title or # Section Title
-        pattern = r'^##?\s+(.+)$'
-
-        for line in self.lines:
-            match = re.match(pattern, line)
-            if match:
-                # Remove markdown formatting
-                title = match.group(1)
-                title = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', title)  # Remove links
-                title = re.sub(r'[*_`]', '', title)  # Remove emphasis
-                sections.append(title.strip())
-
-        return sections
+        return self.document.titles(2)
 
     def _extract_progress_from_claude_md(self) -> Optional[int]:
         """Extract progress percentage from CLAUDE.md.
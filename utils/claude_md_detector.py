@@ -5,15 +5,40 @@ CLAUDE.md Project Type Detector
 Detects craft-specific project types for CLAUDE.md generation/updating.
 Integrates with existing project-detector skill patterns.
 
+``detect()`` rescans commands/, skills/, agents/ and tests/ on every call.
+Callers that only need the current answer use ``project_snapshot()``: it
+computes ``ProjectInfo`` once per process and persists it to
+``.craft/cache/project-info.json``, keyed by a fingerprint of the manifest
+stats and the mtimes of the scanned directories (adding, removing or renaming
+a command changes its directory's mtime), so a ``/craft:check`` run scans the
+tree at most once.
+
 Version: 1.0.0
 Author: Craft Plugin
 """
 
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
+SNAPSHOT_FILE = Path(".craft") / "cache" / "project-info.json"
+SNAPSHOT_VERSION = 1
+
+# Files whose content decides the project type, name and version
+SNAPSHOT_MANIFESTS = (
+    ".claude-plugin/plugin.json", "package.json", "pyproject.toml", "DESCRIPTION",
+    "NAMESPACE", "_pkgdown.yml", "_quarto.yml", "course.yml", "src",
+)
+# Directories listed non-recursively (tests: glob, weeks: iterdir)
+SNAPSHOT_FLAT_DIRS = ("tests", "tests/testthat", "weeks")
+# Directories scanned with rglob: every subdirectory's mtime counts
+SNAPSHOT_TREE_DIRS = ("commands", "skills", "agents")
+
+# abs project path -> (fingerprint, ProjectInfo or None)
+_SNAPSHOTS: Dict[str, tuple] = {}
+
 
 @dataclass
 class ProjectInfo:
@@ -447,17 +472,126 @@ class CLAUDEMDDetector:
         return "0.0.0"
 
 
+def _stat_key(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def snapshot_fingerprint(path: Path = None) -> List[Any]:
+    """Cheap change key for ``detect()``'s inputs.
+
+    Stats the manifests and the scanned directories only; no file under
+    commands/, skills/ or agents/ is read or stat'ed.
+
+    Args:
+        path: Project directory (default: current directory)
+
+    Returns:
+        JSON-serializable list of ``[relpath, [mtime_ns, size] or None]``
+    """
+    root = os.path.abspath(path or Path.cwd())
+    entries: List[Any] = [["version", SNAPSHOT_VERSION]]
+    for rel in SNAPSHOT_MANIFESTS + SNAPSHOT_FLAT_DIRS:
+        entries.append([rel, _stat_key(os.path.join(root, rel))])
+    for top in SNAPSHOT_TREE_DIRS:
+        stack = [top]
+        while stack:
+            rel = stack.pop()
+            key = _stat_key(os.path.join(root, rel))
+            entries.append([rel, key])
+            if key is None:
+                continue
+            try:
+                with os.scandir(os.path.join(root, rel)) as it:
+                    subdirs = sorted(e.name for e in it if e.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+            stack.extend(f"{rel}/{name}" for name in reversed(subdirs))
+    return entries
+
+
+def _load_snapshot(cache_file: Path, fingerprint: List[Any]):
+    """Persisted ProjectInfo for ``fingerprint``; a ``(hit, info)`` pair."""
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return False, None
+    info = data.get("info")
+    if info is None:
+        return True, None
+    try:
+        return True, ProjectInfo(**info)
+    except TypeError:
+        return False, None
+
+
+def _save_snapshot(cache_file: Path, fingerprint: List[Any], info: Optional[ProjectInfo]) -> None:
+    """Write the snapshot atomically; a read-only tree just skips persisting."""
+    payload = {"fingerprint": fingerprint, "info": asdict(info) if info else None}
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload, indent=2, default=str) + "\n")
+        os.replace(tmp, cache_file)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def project_snapshot(path: Path = None, use_cache: bool = True) -> Optional[ProjectInfo]:
+    """Shared ProjectInfo for a project, scanned at most once per change.
+
+    Lookup order: the in-process memo, then ``.craft/cache/project-info.json``,
+    then a full ``CLAUDEMDDetector.detect()`` (which refreshes both). Each
+    layer is only trusted while ``snapshot_fingerprint()`` still matches, so
+    a command added mid-process is picked up on the next call.
+
+    Args:
+        path: Project directory (default: current directory)
+        use_cache: False forces a rescan (the result is still stored)
+
+    Returns:
+        ProjectInfo if detected, None otherwise
+    """
+    root = Path(os.path.abspath(path or Path.cwd()))
+    key = str(root)
+    fingerprint = snapshot_fingerprint(root)
+    cache_file = root / SNAPSHOT_FILE
+
+    if use_cache:
+        memo = _SNAPSHOTS.get(key)
+        if memo is not None and memo[0] == fingerprint:
+            return memo[1]
+        hit, info = _load_snapshot(cache_file, fingerprint)
+        if hit:
+            _SNAPSHOTS[key] = (fingerprint, info)
+            return info
+
+    info = CLAUDEMDDetector(root).detect()
+    _SNAPSHOTS[key] = (fingerprint, info)
+    _save_snapshot(cache_file, fingerprint, info)
+    return info
+
+
 def detect_project(path: Path = None) -> Optional[ProjectInfo]:
     """Convenience function to detect project type.
 
+    Served from ``project_snapshot()``, so repeated calls do not rescan.
+
     Args:
         path: Project directory (default: current directory)
 
     Returns:
         ProjectInfo if detected, None otherwise
     """
-    detector = CLAUDEMDDetector(path)
-    return detector.detect()
+    return project_snapshot(path)
 
 
 if __name__ == "__main__":
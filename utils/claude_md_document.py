@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+CLAUDE.md Document Model
+
+One parse of a CLAUDE.md shared by the optimizer, section editor, auditor
+and sync pipeline: the lines, every ATX heading (``#`` .. ``######``) as a
+tree with line spans, and a lazily built line-offset table for mapping
+character offsets back to lines.
+
+Edits go through ``replace_lines`` / ``replace_text``. Only the replaced
+lines are re-scanned for headings: every line keeps a slot holding its
+``Heading`` (or None), and an edit splices those slots the way it splices
+the lines. Line numbers, the tree links and ``text`` are refreshed lazily
+on the next read, so a run of edits costs O(edited lines) each plus one
+O(lines) pass, instead of a full re-parse per edit.
+
+``EditBuffer`` is the write-side counterpart for rewrites that are planned
+against one snapshot (fixer, sync fixes and metric updates): edits are
+recorded as line spans of the base lines, the result is materialized once,
+and the unified diff is built from the recorded spans.
+
+Views:
+  - ``flat_sections()``  heading -> next heading of any level (section editor)
+  - ``sections(level)``  split at headings of exactly ``level``, with the
+                         lines before the first one as "header" (optimizer)
+  - ``titles(max_level)`` cleaned H1..max_level titles (auditor, sync)
+  - ``Heading.end``      subtree span: next heading of the same or higher level
+
+Version: 1.0.0
+Author: Craft Plugin
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate, compress
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_EMPHASIS_RE = re.compile(r"[*_`]")
+
+
+@dataclass(eq=False)
+class Heading:
+    """A heading line and its place in the section tree."""
+    level: int                 # 1 for #, 2 for ##, ...
+    name: str                  # Heading text, stripped
+    line: int                  # 0-indexed line number
+    end: int = 0               # Exclusive end of the subtree span
+    parent: Optional["Heading"] = field(default=None, repr=False)
+    children: List["Heading"] = field(default_factory=list, repr=False)
+
+    @property
+    def title(self) -> str:
+        """Heading text without link targets or emphasis markers."""
+        return _EMPHASIS_RE.sub("", _LINK_RE.sub(r"\1", self.name)).strip()
+
+
+def _scan(lines: Iterable[str]) -> List[Optional[Heading]]:
+    """One slot per line: its Heading, or None (line numbers set later)."""
+    marks: List[Optional[Heading]] = []
+    for line in lines:
+        match = HEADING_RE.match(line) if line.startswith("#") else None
+        marks.append(Heading(len(match.group(1)), match.group(2).strip(), 0) if match else None)
+    return marks
+
+
+def _hunk_range(start: int, length: int) -> str:
+    """Unified-diff range for ``length`` lines from 0-indexed ``start``."""
+    if length == 1:
+        return str(start + 1)
+    return f"{start if length == 0 else start + 1},{length}"
+
+
+def _unified_diff(base: List[str], edits: Iterable[Tuple[int, int, List[str]]],
+                  name: str, context: int) -> str:
+    """Unified diff of ``base`` under sorted, non-overlapping line edits.
+
+    Hunks come straight from the edit spans (trimmed of unchanged
+    leading/trailing lines), so no sequence matching is run.
+    """
+    changes: List[Tuple[int, int, List[str]]] = []
+    for start, end, new in edits:
+        lead = 0
+        while lead < min(end - start, len(new)) and base[start + lead] == new[lead]:
+            lead += 1
+        trail = 0
+        while (trail < min(end - start, len(new)) - lead
+               and base[end - 1 - trail] == new[len(new) - 1 - trail]):
+            trail += 1
+        start, end, new = start + lead, end - trail, new[lead:len(new) - trail]
+        if start == end and not new:
+            continue
+        if changes and changes[-1][1] == start:  # Adjacent: one -/+ block
+            prev_start, _, prev_new = changes.pop()
+            start, new = prev_start, prev_new + new
+        changes.append((start, end, new))
+    if not changes:
+        return ""
+
+    out = [f"--- a/{name}", f"+++ b/{name}"]
+    shift = 0
+    i = 0
+    while i < len(changes):
+        j = i
+        while j + 1 < len(changes) and changes[j + 1][0] - changes[j][1] <= 2 * context:
+            j += 1
+        hunk_start = max(changes[i][0] - context, 0)
+        hunk_end = min(changes[j][1] + context, len(base))
+        body: List[str] = []
+        pos = hunk_start
+        delta = 0
+        for start, end, new in changes[i:j + 1]:
+            body.extend(" " + line for line in base[pos:start])
+            body.extend("-" + line for line in base[start:end])
+            body.extend("+" + line for line in new)
+            delta += len(new) - (end - start)
+            pos = end
+        body.extend(" " + line for line in base[pos:hunk_end])
+        old_len = hunk_end - hunk_start
+        out.append(
+            f"@@ -{_hunk_range(hunk_start, old_len)} "
+            f"+{_hunk_range(hunk_start + shift, old_len + delta)} @@"
+        )
+        out.extend(body)
+        shift += delta
+        i = j + 1
+    return "\n".join(out) + "\n"
+
+
+class ClaudeMdDocument:
+    """Lines of a CLAUDE.md plus their heading tree, kept in step on edit."""
+
+    def __init__(self, lines: List[str]):
+        """Parse ``lines`` (copied; the caller's list is not modified)."""
+        self.lines: List[str] = list(lines)
+        self._base = list(lines)
+        self._origin: List[Optional[int]] = list(range(len(self.lines)))
+        self._marks = _scan(self.lines)
+        self._headings: Optional[List[Heading]] = None
+        self._roots: List[Heading] = []
+        self._text: Optional[str] = None
+        self._offsets: Optional[List[int]] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "ClaudeMdDocument":
+        return cls(text.split("\n"))
+
+    @classmethod
+    def from_path(cls, path: Path) -> "ClaudeMdDocument":
+        return cls.from_text(Path(path).read_text())
+
+    # ------------------------------------------------------------------
+    # Headings
+    # ------------------------------------------------------------------
+
+    @property
+    def headings(self) -> List[Heading]:
+        """Every heading in line order, with ``line`` and tree links current."""
+        if self._headings is None:
+            marks = self._marks
+            headings = list(filter(None, marks))
+            for heading, line in zip(headings, compress(range(len(marks)), marks)):
+                heading.line = line
+            self._headings = headings
+            self._link()
+        return self._headings
+
+    @property
+    def roots(self) -> List[Heading]:
+        """Top of the heading tree (headings with no enclosing heading)."""
+        self.headings
+        return self._roots
+
+    def _link(self) -> None:
+        """Rebuild parent/children/end from the sorted heading list."""
+        self._roots = []
+        stack: List[Heading] = []
+        for h in self._headings:
+            h.children = []
+            while stack and stack[-1].level >= h.level:
+                stack.pop().end = h.line
+            h.parent = stack[-1] if stack else None
+            (h.parent.children if h.parent else self._roots).append(h)
+            stack.append(h)
+        for h in stack:
+            h.end = len(self.lines)
+
+    # ------------------------------------------------------------------
+    # Text and offsets
+    # ------------------------------------------------------------------
+
+    @property
+    def text(self) -> str:
+        """``"\\n".join(lines)``, cached until the next edit."""
+        if self._text is None:
+            self._text = "\n".join(self.lines)
+        return self._text
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """Character offset of each line start in ``text``."""
+        if self._offsets is None:
+            widths = map((1).__add__, map(len, self.lines))
+            self._offsets = list(accumulate(widths, initial=0))[:len(self.lines)]
+        return self._offsets
+
+    def line_of(self, offset: int) -> int:
+        """0-indexed line containing character ``offset`` of ``text``."""
+        return max(bisect_right(self.line_offsets, offset) - 1, 0)
+
+    def span_text(self, start: int, end: int) -> str:
+        return "\n".join(self.lines[start:end])
+
+    # ------------------------------------------------------------------
+    # Changes since parse
+    # ------------------------------------------------------------------
+
+    def changes(self) -> List[Tuple[int, int, List[str]]]:
+        """Edits so far as (start, end, new_lines) spans of the parsed lines.
+
+        Every line remembers the parsed line it came from (None once an
+        edit rewrote it), so this is one pass over the lines.
+        """
+        out: List[Tuple[int, int, List[str]]] = []
+        added: List[str] = []
+        expect = 0
+        for line, origin in zip(self.lines, self._origin):
+            if origin is None:
+                added.append(line)
+                continue
+            if origin != expect or added:
+                out.append((expect, origin, added))
+                added = []
+            expect = origin + 1
+        if expect != len(self._base) or added:
+            out.append((expect, len(self._base), added))
+        return out
+
+    def diff(self, name: str = "CLAUDE.md", context: int = 3) -> str:
+        """Unified diff from the parsed lines to the current ones."""
+        return _unified_diff(self._base, self.changes(), name, context)
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def flat_sections(self) -> List[Tuple[Heading, int, int]]:
+        """(heading, start, end) with each span ending at the next heading."""
+        headings = self.headings
+        bounds = [h.line for h in headings[1:]] + [len(self.lines)]
+        return [(h, h.line, end) for h, end in zip(headings, bounds)]
+
+    def sections(self, level: int) -> List[Tuple[str, Optional[Heading], int, int]]:
+        """Split at headings of exactly ``level``.
+
+        Lines before the first such heading form a ``"header"`` section
+        (heading None) when there are any; a document with no heading of
+        that level is one ``"header"`` section.
+
+        Returns:
+            List of (name, heading, start_line, end_line)
+        """
+        marks = [h for h in self.headings if h.level == level]
+        out: List[Tuple[str, Optional[Heading], int, int]] = []
+        if not marks:
+            if self.lines:
+                out.append(("header", None, 0, len(self.lines)))
+            return out
+        if marks[0].line > 0:
+            out.append(("header", None, 0, marks[0].line))
+        bounds = [h.line for h in marks[1:]] + [len(self.lines)]
+        out.extend((h.name, h, h.line, end) for h, end in zip(marks, bounds))
+        return out
+
+    def section_span(self, heading: Heading) -> Tuple[int, int]:
+        """Current (start, end) of ``heading``'s span in ``sections(heading.level)``.
+
+        Reads the per-line slots directly, so it stays cheap between edits.
+        """
+        marks = self._marks
+        heading.line = start = marks.index(heading)
+        for end in range(start + 1, len(marks)):
+            mark = marks[end]
+            if mark is not None and mark.level == heading.level:
+                return start, end
+        return start, len(marks)
+
+    def titles(self, max_level: int = 2) -> List[str]:
+        """Cleaned titles of headings up to ``max_level``, in order."""
+        return [h.title for h in self.headings if h.level <= max_level]
+
+    # ------------------------------------------------------------------
+    # Editing
+    # ------------------------------------------------------------------
+
+    def replace_lines(self, start: int, end: int, new_lines: List[str]) -> None:
+        """Replace ``lines[start:end]``, scanning only the new lines."""
+        new_lines = list(new_lines)
+        self.lines[start:end] = new_lines
+        self._origin[start:end] = [None] * len(new_lines)
+        self._marks[start:end] = _scan(new_lines)
+        self._headings = None
+        self._text = None
+        self._offsets = None
+
+    def replace_text(self, old: str, new: str = "") -> int:
+        """``text.replace(old, new)`` applied as line-span edits.
+
+        Returns:
+            Number of occurrences replaced
+        """
+        if not old:
+            return 0
+        text = self.text
+        pos = text.find(old)
+        if pos == -1:
+            return 0
+
+        # Line spans touched by a hit (through the line holding the character
+        # after it, so a hit ending in "\n" takes the line it joins onto);
+        # spans sharing a line merge. Each is [first, last, start, end] with
+        # start/end the character range of those whole lines.
+        spans: List[List[int]] = []
+        count = 0
+        line, counted = 0, 0
+        while pos != -1:
+            line += text.count("\n", counted, pos)
+            hit_end = pos + len(old)
+            last = line + text.count("\n", pos, hit_end)
+            line_end = text.find("\n", hit_end)
+            line_end = len(text) if line_end == -1 else line_end
+            if spans and line <= spans[-1][1]:
+                spans[-1][1], spans[-1][3] = last, line_end
+            else:
+                spans.append([line, last, text.rfind("\n", 0, pos) + 1, line_end])
+            line, counted = last, hit_end
+            count += 1
+            pos = text.find(old, hit_end)
+
+        # Splice last-first so earlier line numbers stay valid; only the
+        # spans are re-split and re-scanned.
+        for first, last, seg_start, seg_end in reversed(spans):
+            segment = text[seg_start:seg_end].replace(old, new).split("\n")
+            self.lines[first:last + 1] = segment
+            self._origin[first:last + 1] = [None] * len(segment)
+            self._marks[first:last + 1] = _scan(segment)
+        self._headings = None
+        self._text = text.replace(old, new)
+        self._offsets = None
+        return count
+
+
+class EditBuffer:
+    """Pending line-span edits against fixed base lines.
+
+    Every edit is ``(start, end, new_lines)`` in base line numbers, so
+    recording one never shifts another and regexes run once over the base
+    text (see ``sub``). An edit may cover earlier edits completely: it supersedes them,
+    the caller having built its replacement from ``current()``. One that
+    partly overlaps, or lies inside, an earlier edit is refused, as a
+    sequential rewrite would find its target already gone.
+    """
+
+    def __init__(self, lines: List[str]):
+        self.base = ClaudeMdDocument(lines)
+        self._edits: List[Tuple[int, int, List[str]]] = []
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._lines: Optional[List[str]] = None
+        self._text: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _window(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """Index range of recorded edits inside [start, end), or None on overlap."""
+        lo = bisect_right(self._ends, start)
+        hi = bisect_left(self._starts, end)
+        for a, b, _ in self._edits[lo:hi]:
+            if a < start or b > end:
+                return None
+        return lo, max(lo, hi)
+
+    def current(self, start: int, end: int) -> Optional[List[str]]:
+        """Base lines ``[start, end)`` with the edits inside them applied.
+
+        None when an edit overlaps the span without fitting inside it
+        (e.g. the lines were already deleted as part of a larger edit).
+        """
+        window = self._window(start, end)
+        if window is None:
+            return None
+        out: List[str] = []
+        pos = start
+        for a, b, new in self._edits[window[0]:window[1]]:
+            out.extend(self.base.lines[pos:a])
+            out.extend(new)
+            pos = b
+        out.extend(self.base.lines[pos:end])
+        return out
+
+    def replace(self, start: int, end: int, new_lines: List[str]) -> bool:
+        """Record base lines ``[start, end)`` -> ``new_lines``.
+
+        Returns:
+            False if refused because it overlaps an earlier edit
+        """
+        window = self._window(start, end)
+        if window is None:
+            return False
+        lo, hi = window
+        self._edits[lo:hi] = [(start, end, list(new_lines))]
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+        self._lines = self._text = None
+        return True
+
+    def delete(self, start: int, end: int) -> bool:
+        return self.replace(start, end, [])
+
+    def map_lines(self, func: Callable[[str], Optional[List[str]]]) -> int:
+        """Rewrite the current lines one at a time.
+
+        ``func(line)`` returns None to keep the line, or its replacement
+        lines (``[]`` deletes it). Lines already removed by a larger edit
+        are not visited.
+
+        Returns:
+            Number of lines ``func`` rewrote
+        """
+        rewritten = 0
+        for i in range(len(self.base.lines)):
+            current = self.current(i, i + 1)
+            if current is None:
+                continue
+            out: List[str] = []
+            hits = 0
+            for line in current:
+                new = func(line)
+                if new is None:
+                    out.append(line)
+                else:
+                    out.extend(new)
+                    hits += 1
+            if hits and self.replace(i, i + 1, out):
+                rewritten += hits
+        return rewritten
+
+    def sub(self, pattern: Union[str, "re.Pattern"],
+            repl: Union[str, Callable[["re.Match"], str]],
+            flags: int = 0) -> int:
+        """``re.subn`` over the base text, recorded as line edits.
+
+        Matches are found in the base text. Lines that already carry an
+        edit are re-matched on their current content, so substitutions
+        compose like successive ``re.subn`` calls. A buffer with no lines
+        (missing file) has nothing to substitute.
+
+        Returns:
+            Number of substitutions recorded
+        """
+        if not self.base.lines:
+            return 0
+        regex = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        text = self.base.text
+        offsets = self.base.line_offsets
+        # Group matches by the line span they touch: [first, last, [matches]]
+        groups: List[list] = []
+        for match in regex.finditer(text):
+            # Through the line holding the character after the match, so a
+            # match that ends in "\n" takes the line it joins onto
+            first = self.base.line_of(match.start())
+            last = self.base.line_of(match.end())
+            if groups and first <= groups[-1][1]:
+                groups[-1][1] = max(groups[-1][1], last)
+                groups[-1][2].append(match)
+            else:
+                groups.append([first, last, [match]])
+
+        done = 0
+        for first, last, matches in groups:
+            window = self._window(first, last + 1)
+            if window is None:
+                continue
+            if window[0] < window[1]:
+                segment = "\n".join(self.current(first, last + 1))
+                segment, hits = regex.subn(repl, segment)
+                if hits and self.replace(first, last + 1, segment.split("\n")):
+                    done += hits
+                continue
+            seg_start = offsets[first]
+            pieces: List[str] = []
+            pos = seg_start
+            for match in matches:
+                pieces.append(text[pos:match.start()])
+                pieces.append(repl(match) if callable(repl) else match.expand(repl))
+                pos = match.end()
+            seg_end = offsets[last] + len(self.base.lines[last])
+            pieces.append(text[pos:seg_end])
+            if self.replace(first, last + 1, "".join(pieces).split("\n")):
+                done += len(matches)
+        return done
+
+    # ------------------------------------------------------------------
+    # Result
+    # ------------------------------------------------------------------
+
+    @property
+    def edits(self) -> List[Tuple[int, int, List[str]]]:
+        """Recorded edits in line order."""
+        return list(self._edits)
+
+    @property
+    def lines(self) -> List[str]:
+        """Base lines with every edit applied (built once per change)."""
+        if self._lines is None:
+            out: List[str] = []
+            pos = 0
+            for start, end, new in self._edits:
+                out.extend(self.base.lines[pos:start])
+                out.extend(new)
+                pos = end
+            out.extend(self.base.lines[pos:])
+            self._lines = out
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self.lines)
+        return self._text
+
+    @property
+    def changed(self) -> bool:
+        """True when the result differs from the base."""
+        return self.text != self.base.text
+
+    def document(self) -> ClaudeMdDocument:
+        """The result as a document whose ``diff()`` starts from the base."""
+        document = ClaudeMdDocument(self.base.lines)
+        for start, end, new in reversed(self._edits):
+            document.replace_lines(start, end, new)
+        return document
+
+    def diff(self, name: str = "CLAUDE.md", context: int = 3) -> str:
+        """Unified diff of the recorded edits ("" when nothing changed)."""
+        return _unified_diff(self.base.lines, self._edits, name, context)
@@ -13,7 +13,6 @@ Author: Craft Plugin
 """
 
 import re
-import shutil
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -22,10 +21,14 @@ from typing import List, Optional
 # Import auditor for issue detection
 try:
     from .claude_md_auditor import CLAUDEMDAuditor, Issue, Severity
-    from .claude_md_detector import CLAUDEMDDetector
+    from .claude_md_detector import project_snapshot
+    from .claude_md_document import EditBuffer
+    from .claude_md_writer import WriteTransaction
 except ImportError:
     from claude_md_auditor import CLAUDEMDAuditor, Issue, Severity
-    from claude_md_detector import CLAUDEMDDetector
+    from claude_md_detector import project_snapshot
+    from claude_md_document import EditBuffer
+    from claude_md_writer import WriteTransaction
 
 
 @dataclass
@@ -48,16 +51,30 @@ class CLAUDEMDFixer:
         """
         self.path = Path(claude_md_path)
         self.project_root = self.path.parent
-        self.content = ""
-        self.lines = []
+        lines = []
 
         if self.path.exists():
-            self.content = self.path.read_text()
-            self.lines = self.content.split("\n")
+            lines = self.path.read_text().split("\n")
+
+        # Fixes are recorded against the file as read and materialized once
+        self.edits = EditBuffer(lines)
 
         # Initialize auditor
         self.auditor = CLAUDEMDAuditor(claude_md_path)
 
+    @property
+    def content(self) -> str:
+        """CLAUDE.md text with the fixes so far applied."""
+        return self.edits.text
+
+    @property
+    def lines(self) -> List[str]:
+        return self.edits.lines
+
+    def diff(self) -> str:
+        """Unified diff of the fixes so far ("" when none changed anything)."""
+        return self.edits.diff(self.path.name)
+
     def fix_all(self, scope: str = "errors", dry_run: bool = False, interactive: bool = False) -> List[FixResult]:
         """Fix all auto-fixable issues.
 
@@ -108,8 +125,7 @@ class CLAUDEMDFixer:
             Fix result
         """
         # Get actual version from project
-        detector = CLAUDEMDDetector(self.project_root)
-        project_info = detector.detect()
+        project_info = project_snapshot(self.project_root)
 
         if not project_info:
             return FixResult(
@@ -139,10 +155,8 @@ class CLAUDEMDFixer:
 
         lines_changed = 0
         for pattern, replacement in patterns:
-            new_content, count = re.subn(pattern, replacement, self.content, flags=re.MULTILINE)
+            count = self.edits.sub(pattern, replacement, flags=re.MULTILINE)
             if count > 0:
-                self.content = new_content
-                self.lines = self.content.split("\n")
                 lines_changed = count
                 break
 
@@ -175,18 +189,9 @@ class CLAUDEMDFixer:
         command = cmd_match.group(1)
 
         # Remove lines containing the command
-        lines_changed = 0
-        new_lines = []
-        for line in self.lines:
-            if command in line:
-                lines_changed += 1
-                # Skip this line (remove it)
-                continue
-            new_lines.append(line)
-
-        if lines_changed > 0:
-            self.lines = new_lines
-            self.content = "\n".join(self.lines)
+        lines_changed = self.edits.map_lines(
+            lambda line: [] if command in line else None
+        )
 
         return FixResult(
             success=lines_changed > 0,
@@ -217,19 +222,9 @@ class CLAUDEMDFixer:
         link = link_match.group(1)
 
         # Comment out the line with the broken link
-        lines_changed = 0
-        new_lines = []
-        for line in self.lines:
-            if link in line:
-                # Comment out the line
-                new_lines.append(f"<!-- {line.strip()} --> (link broken)")
-                lines_changed += 1
-            else:
-                new_lines.append(line)
-
-        if lines_changed > 0:
-            self.lines = new_lines
-            self.content = "\n".join(self.lines)
+        lines_changed = self.edits.map_lines(
+            lambda line: [f"<!-- {line.strip()} --> (link broken)"] if link in line else None
+        )
 
         return FixResult(
             success=lines_changed > 0,
@@ -268,10 +263,8 @@ class CLAUDEMDFixer:
 
         lines_changed = 0
         for pattern, replacement in patterns:
-            new_content, count = re.subn(pattern, replacement, self.content, flags=re.IGNORECASE)
+            count = self.edits.sub(pattern, replacement, flags=re.IGNORECASE)
             if count > 0:
-                self.content = new_content
-                self.lines = self.content.split("\n")
                 lines_changed = count
                 break
 
@@ -346,14 +339,11 @@ class CLAUDEMDFixer:
     def _save_changes(self):
         """Save changes to CLAUDE.md file.
 
-        Creates backup before saving.
+        Written atomically after a backup snapshot; skipped when the fixes
+        left the content unchanged.
         """
-        # Create backup
-        backup_path = self.path.parent / f".{self.path.name}.backup"
-        shutil.copy2(self.path, backup_path)
-
-        # Write changes
-        self.path.write_text(self.content)
+        with WriteTransaction(backup=[self.path]) as txn:
+            txn.write(self.path, self.content)
 
     def generate_report(self, results: List[FixResult]) -> str:
         """Generate fix report.
@@ -428,6 +418,8 @@ def main():
     # Generate report
     report = fixer.generate_report(results)
     print(report)
+    if args.dry_run and fixer.diff():
+        print(fixer.diff())
 
     # Exit code
     if not results:
@@ -21,7 +21,6 @@ Author: Craft Plugin
 import json
 import os
 import re
-import shutil
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,8 +29,12 @@ from typing import Dict, List, Optional, Tuple
 # Import project detector - handle both module and script usage
 try:
     from .claude_md_detector import CLAUDEMDDetector
+    from .claude_md_document import ClaudeMdDocument
+    from .claude_md_writer import WriteTransaction
 except ImportError:
     from claude_md_detector import CLAUDEMDDetector
+    from claude_md_document import ClaudeMdDocument
+    from claude_md_writer import WriteTransaction
 
 
 # ---------------------------------------------------------------------------
@@ -182,6 +185,7 @@ class OptimizeResult:
     actions: List[OptimizationAction] = field(default_factory=list)
     detail_files_created: List[str] = field(default_factory=list)
     pointers_added: List[str] = field(default_factory=list)
+    diff: str = ""  # Unified diff of CLAUDE.md (also on dry runs)
 
     @property
     def within_budget(self) -> bool:
@@ -218,29 +222,47 @@ class CLAUDEMDOptimizer:
         print(optimizer.generate_report(result))
     """
 
-    def __init__(self, claude_md_path: Path, budget: int = None):
+    def __init__(self, claude_md_path: Path, budget: int = None,
+                 document: ClaudeMdDocument = None):
         """Initialize optimizer.
 
         Args:
             claude_md_path: Path to CLAUDE.md file
             budget: Line budget (default: read from plugin.json/package.json or 150)
+            document: Content to optimize instead of the file on disk, e.g.
+                      sync fixes not yet written. The next optimize() edits
+                      it, so its diff also covers the edits it carries.
         """
         self.path = Path(claude_md_path)
         self.project_root = self.path.parent
         self.content = ""
         self.lines: List[str] = []
+        self._working = document
 
-        if self.path.exists():
+        if document is not None:
+            self.lines = list(document.lines)
+            self.content = "\n".join(self.lines)
+        elif self.path.exists():
             self.content = self.path.read_text()
             self.lines = self.content.split("\n")
 
         self.budget = budget if budget is not None else self._read_budget()
+        self._document: Optional[ClaudeMdDocument] = None
+
+    @property
+    def document(self) -> ClaudeMdDocument:
+        """Section tree of ``self.lines`` (rebuilt when they are replaced)."""
+        if self._document is None or self._document_lines is not self.lines:
+            self._document = ClaudeMdDocument(self.lines)
+            self._document_lines = self.lines
+        return self._document
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def analyze(self, lines: List[str] = None) -> List[SectionInfo]:
+    def analyze(self, lines: List[str] = None,
+                document: ClaudeMdDocument = None) -> List[SectionInfo]:
         """Analyze CLAUDE.md sections and classify by priority.
 
         Parses H2 headers to identify section boundaries, then classifies
@@ -250,15 +272,22 @@ class CLAUDEMDOptimizer:
         Args:
             lines: Optional lines to analyze (default: self.lines).
                    Pass working lines to avoid mutating optimizer state.
+            document: Already-parsed working document; takes precedence
+                      over *lines* and is not re-scanned.
 
         Returns:
             List of SectionInfo objects sorted by appearance order
         """
-        target_lines = lines if lines is not None else self.lines
-        if not target_lines:
+        if document is None:
+            target_lines = lines if lines is not None else self.lines
+            if not target_lines:
+                return []
+            document = (self.document if lines is None
+                        else ClaudeMdDocument(target_lines))
+        elif not document.lines:
             return []
 
-        raw_sections = self._parse_sections(target_lines)
+        raw_sections = self._parse_sections(document=document)
         classified: List[SectionInfo] = []
 
         for name, start, end, content in raw_sections:
@@ -312,7 +341,8 @@ class CLAUDEMDOptimizer:
 
         return actions
 
-    def optimize(self, dry_run: bool = False) -> OptimizeResult:
+    def optimize(self, dry_run: bool = False,
+                 txn: Optional[WriteTransaction] = None) -> OptimizeResult:
         """Run full optimization: detect bloat, move to detail files, add pointers.
 
         Algorithm:
@@ -326,8 +356,14 @@ class CLAUDEMDOptimizer:
                c. Replace section with pointer line
             6. Verify final line count is within budget
 
+        Dry runs make the same in-memory edits (so line counts, later
+        steps and ``diff`` match a real run) but write no files. Real runs
+        stage CLAUDE.md and every detail file in one write transaction.
+
         Args:
             dry_run: If True, compute actions without writing any files
+            txn: Transaction to stage the writes in (the caller commits it);
+                 by default one is created and committed here
 
         Returns:
             OptimizeResult with before/after metrics and action list
@@ -337,9 +373,12 @@ class CLAUDEMDOptimizer:
         detail_files_created: List[str] = []
         pointers_added: List[str] = []
 
-        # Working copy of content
-        working_content = self.content
-        working_lines = list(self.lines)
+        # Working copy of content; edits re-parse only the lines they touch
+        working = self._working or ClaudeMdDocument(self.lines)
+        self._working = None
+        own_txn = txn is None
+        if own_txn:
+            txn = WriteTransaction(backup=[self.path])
 
         # --- Step 1: Remove P2 sections ---
         sections = self.analyze()
@@ -362,52 +401,56 @@ class CLAUDEMDOptimizer:
             )
             actions.append(action)
 
-            if not dry_run:
-                # Move content to detail file
-                if target:
-                    created = self.move_to_detail_file(
-                        section.content, target, section.name
-                    )
-                    if created and target not in detail_files_created:
-                        detail_files_created.append(target)
+            # Move content to detail file
+            if target and not dry_run:
+                created = self.move_to_detail_file(
+                    section.content, target, section.name, txn
+                )
+                if created and target not in detail_files_created:
+                    detail_files_created.append(target)
 
-                # Replace section with pointer or remove entirely
-                if pointer:
-                    replacement_lines = [pointer, ""]
-                    pointers_added.append(pointer)
-                else:
-                    replacement_lines = []
+            # Replace section with pointer or remove entirely
+            if pointer:
+                replacement_lines = [pointer, ""]
+                pointers_added.append(pointer)
+            else:
+                replacement_lines = []
 
-                working_lines = (
-                    working_lines[:section.start_line]
-                    + replacement_lines
-                    + working_lines[section.end_line:]
-                )
+            working.replace_lines(
+                section.start_line, section.end_line, replacement_lines
+            )
 
         # --- Step 2: Remove pattern-based bloat ---
         pattern_actions = self._detect_pattern_bloat()
+        absent: set = set()  # Contents known missing since the last edit
         for action in pattern_actions:
             # Only apply if content still present (not already removed by P2 pass)
-            if action.content and action.content in "\n".join(working_lines):
+            if not action.content or action.content in absent:
+                continue
+            if action.content not in working.text:
+                absent.add(action.content)
+            else:
                 actions.append(action)
-                if not dry_run:
-                    if action.target_file:
-                        created = self.move_to_detail_file(
-                            action.content, action.target_file, action.section_name
-                        )
-                        if created and action.target_file not in detail_files_created:
-                            detail_files_created.append(action.target_file)
-
-                    # Remove matched content from working lines
-                    joined = "\n".join(working_lines)
-                    joined = joined.replace(action.content, "")
-                    working_lines = joined.split("\n")
+                if action.target_file and not dry_run:
+                    created = self.move_to_detail_file(
+                        action.content, action.target_file, action.section_name, txn
+                    )
+                    if created and action.target_file not in detail_files_created:
+                        detail_files_created.append(action.target_file)
+
+                # Remove matched content from working lines
+                working.replace_text(action.content, "")
+                absent.clear()
 
         # --- Step 3: Check if still over budget; trim P1 if needed ---
-        current_count = len(working_lines)
+        current_count = len(working.lines)
         if current_count > self.budget:
-            # Re-parse working lines without mutating self
-            updated_sections = self.analyze(lines=working_lines)
+            # The working document already tracks its sections: no re-parse
+            updated_sections = self.analyze(document=working)
+            headings = {
+                heading.line: heading
+                for _, heading, _, _ in working.sections(2) if heading
+            }
 
             p1_sections = [
                 s for s in updated_sections
@@ -420,6 +463,13 @@ class CLAUDEMDOptimizer:
                 if current_count <= self.budget:
                     break
 
+                # Earlier cuts shift later sections: take the live span
+                heading = headings.get(section.start_line)
+                if heading is not None:
+                    start, end = working.section_span(heading)
+                else:
+                    start, end = section.start_line, section.end_line
+
                 target = self._default_target_for_section(section.name)
                 pointer = self.generate_pointer(
                     target, section.name
@@ -435,36 +485,34 @@ class CLAUDEMDOptimizer:
                 )
                 actions.append(action)
 
-                if not dry_run:
-                    if target:
-                        created = self.move_to_detail_file(
-                            section.content, target, section.name
-                        )
-                        if created and target not in detail_files_created:
-                            detail_files_created.append(target)
-
-                    if pointer:
-                        replacement_lines = [pointer, ""]
-                        pointers_added.append(pointer)
-                    else:
-                        replacement_lines = []
-
-                    working_lines = (
-                        working_lines[:section.start_line]
-                        + replacement_lines
-                        + working_lines[section.end_line:]
+                if target and not dry_run:
+                    created = self.move_to_detail_file(
+                        section.content, target, section.name, txn
                     )
+                    if created and target not in detail_files_created:
+                        detail_files_created.append(target)
+
+                if pointer:
+                    replacement_lines = [pointer, ""]
+                    pointers_added.append(pointer)
+                else:
+                    replacement_lines = []
 
-                current_count = len(working_lines)
+                working.replace_lines(start, end, replacement_lines)
+
+                current_count = len(working.lines)
 
         # --- Step 4: Clean up consecutive blank lines ---
-        working_lines = self._collapse_blank_lines(working_lines)
+        working_lines = self._collapse_blank_lines(working)
 
         # --- Step 5: Write result ---
         after_lines = len(working_lines)
+        diff = working.diff(self.path.name) if actions else ""
 
         if not dry_run and actions:
-            self._save(working_lines)
+            self._save(working_lines, txn)
+        if own_txn:
+            txn.commit()
 
         # Update internal state to reflect final result
         if not dry_run and actions:
@@ -478,10 +526,12 @@ class CLAUDEMDOptimizer:
             actions=actions,
             detail_files_created=detail_files_created,
             pointers_added=pointers_added,
+            diff=diff,
         )
 
     def move_to_detail_file(self, content: str, target_file: str,
-                            section_title: str) -> bool:
+                            section_title: str,
+                            txn: Optional[WriteTransaction] = None) -> bool:
         """Move content to a detail file, creating if needed.
 
         If the target file already exists, the content is appended under
@@ -492,28 +542,31 @@ class CLAUDEMDOptimizer:
             content: Markdown content to move
             target_file: Relative path from project root (e.g. "docs/VERSION-HISTORY.md")
             section_title: Title for the section in the detail file
+            txn: Transaction to stage the write in (the caller commits it);
+                 by default the file is written immediately
 
         Returns:
             True if file was created (new), False if appended to existing
         """
         target_path = self.project_root / target_file
         created = False
+        own_txn = txn is None
+        if own_txn:
+            txn = WriteTransaction()
 
-        # Ensure parent directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if target_path.exists():
-            existing = target_path.read_text()
+        if txn.exists(target_path):
             # Append under a separator
             separator = f"\n\n---\n\n## {section_title}\n\n"
-            target_path.write_text(existing + separator + content.strip() + "\n")
+            txn.append(target_path, separator + content.strip() + "\n")
         else:
             # Create new file with header
             file_title = target_path.stem.replace("-", " ").replace("_", " ").title()
             header = f"# {file_title}\n\n"
-            target_path.write_text(header + content.strip() + "\n")
+            txn.write(target_path, header + content.strip() + "\n")
             created = True
 
+        if own_txn:
+            txn.commit()
         return created
 
     def generate_pointer(self, target_file: str, description: str) -> str:
@@ -689,47 +742,25 @@ class CLAUDEMDOptimizer:
 
         return DEFAULT_BUDGET
 
-    def _parse_sections(self, lines: List[str] = None) -> List[Tuple[str, int, int, str]]:
+    def _parse_sections(self, lines: List[str] = None,
+                        document: ClaudeMdDocument = None) -> List[Tuple[str, int, int, str]]:
         """Parse CLAUDE.md into sections by H2 headers.
 
         Content before the first H2 is captured as "header".
 
         Args:
             lines: Lines to parse (default: self.lines)
+            document: Parsed document to read instead of *lines*
 
         Returns:
             List of (name, start_line, end_line, content) tuples
         """
-        target_lines = lines if lines is not None else self.lines
-        sections: List[Tuple[str, int, int, str]] = []
-        current_name: Optional[str] = None
-        current_start = 0
-
-        for i, line in enumerate(target_lines):
-            header_match = re.match(r"^##\s+(.+)$", line)
-            if header_match:
-                # Close previous section
-                if current_name is not None:
-                    content = "\n".join(target_lines[current_start:i])
-                    sections.append((current_name, current_start, i, content))
-                elif i > 0:
-                    # Content before first H2 -> "header"
-                    content = "\n".join(target_lines[0:i])
-                    sections.append(("header", 0, i, content))
-
-                current_name = header_match.group(1).strip()
-                current_start = i
-
-        # Close final section
-        if current_name is not None:
-            content = "\n".join(target_lines[current_start:])
-            sections.append((current_name, current_start, len(target_lines), content))
-        elif not sections and target_lines:
-            # Entire file is header (no H2 sections)
-            content = "\n".join(target_lines)
-            sections.append(("header", 0, len(target_lines), content))
-
-        return sections
+        if document is None:
+            document = self.document if lines is None else ClaudeMdDocument(lines)
+        return [
+            (name, start, end, document.span_text(start, end))
+            for name, _, start, end in document.sections(2)
+        ]
 
     def _classify_section(self, name: str) -> Tuple[str, int]:
         """Classify a section by its name into a priority tier.
@@ -830,51 +861,54 @@ class CLAUDEMDOptimizer:
 
         return actions
 
-    def _collapse_blank_lines(self, lines: List[str]) -> List[str]:
+    def _collapse_blank_lines(self, document: ClaudeMdDocument) -> List[str]:
         """Collapse runs of 3+ consecutive blank lines down to 2.
 
+        The cleanup is made as edits on ``document``, so its diff covers it.
+
         Args:
-            lines: Input lines
+            document: Working document (edited in place)
 
         Returns:
             Cleaned lines with excess blank lines removed
         """
-        result: List[str] = []
+        lines = document.lines
+        excess: List[List[int]] = []  # Spans of blank lines past the second
         blank_count = 0
 
-        for line in lines:
+        for i, line in enumerate(lines):
             if line.strip() == "":
                 blank_count += 1
-                if blank_count <= 2:
-                    result.append(line)
+                if blank_count == 3:
+                    excess.append([i, i + 1])
+                elif blank_count > 3:
+                    excess[-1][1] = i + 1
             else:
                 blank_count = 0
-                result.append(line)
 
-        # Strip trailing blank lines
-        while result and result[-1].strip() == "":
-            result.pop()
+        # Strip trailing blank lines and ensure file ends with newline
+        # (single empty string at end)
+        end = len(lines)
+        while end and lines[end - 1].strip() == "":
+            end -= 1
+        document.replace_lines(end, len(lines), [""])
 
-        # Ensure file ends with newline (single empty string at end)
-        result.append("")
+        for start, stop in reversed(excess):
+            if start < end:
+                document.replace_lines(start, min(stop, end), [])
 
-        return result
+        return document.lines
 
-    def _save(self, lines: List[str]) -> None:
-        """Save optimized content to CLAUDE.md with backup.
+    def _save(self, lines: List[str], txn: WriteTransaction) -> None:
+        """Stage optimized content for CLAUDE.md.
 
-        Creates a backup at .CLAUDE.md.backup before overwriting.
+        The transaction snapshots .CLAUDE.md.backup when it commits.
 
         Args:
             lines: Optimized lines to write
+            txn: Transaction to stage the write in
         """
-        # Create backup
-        backup_path = self.project_root / ".CLAUDE.md.backup"
-        if self.path.exists():
-            shutil.copy2(self.path, backup_path)
-
-        # Write optimized content
-        self.path.write_text("\n".join(lines))
+        txn.write(self.path, "\n".join(lines))
 
 
 # ---------------------------------------------------------------------------
@@ -1009,6 +1043,8 @@ if __name__ == "__main__":
     print(report)
 
     if args.dry_run:
+        if result.diff:
+            print(result.diff)
         print("(Dry run - no changes applied. Remove --dry-run to apply)\n")
 
     if args.strict and not result.within_budget:
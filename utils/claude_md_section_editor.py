@@ -8,11 +8,17 @@ Version: 1.0.0
 Author: Craft Plugin
 """
 
-import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+try:
+    from .claude_md_document import ClaudeMdDocument
+    from .claude_md_writer import WriteTransaction
+except ImportError:
+    from claude_md_document import ClaudeMdDocument
+    from claude_md_writer import WriteTransaction
+
 
 @dataclass
 class Section:
@@ -35,7 +41,8 @@ class SectionParser:
         """
         self.path = claude_md_path
         self.content = claude_md_path.read_text()
-        self.lines = self.content.split("\n")
+        self.document = ClaudeMdDocument.from_text(self.content)
+        self.lines = self.document.lines
 
     def parse_sections(self) -> List[Section]:
         """Parse CLAUDE.md into sections.
@@ -43,46 +50,16 @@ class SectionParser:
         Returns:
             List of Section objects
         """
-        sections = []
-        current_section = None
-        current_start = 0
-
-        for i, line in enumerate(self.lines):
-            # Detect headers
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-
-            if header_match:
-                # Save previous section
-                if current_section is not None:
-                    sections.append(Section(
-                        name=current_section["name"],
-                        start_line=current_section["start"],
-                        end_line=i,
-                        content="\n".join(self.lines[current_section["start"]:i]),
-                        level=current_section["level"]
-                    ))
-
-                # Start new section
-                level = len(header_match.group(1))
-                name = header_match.group(2).strip()
-
-                current_section = {
-                    "name": name,
-                    "start": i,
-                    "level": level
-                }
-
-        # Add final section
-        if current_section is not None:
-            sections.append(Section(
-                name=current_section["name"],
-                start_line=current_section["start"],
-                end_line=len(self.lines),
-                content="\n".join(self.lines[current_section["start"]:]),
-                level=current_section["level"]
-            ))
-
-        return sections
+        return [
+            Section(
+                name=heading.name,
+                start_line=start,
+                end_line=end,
+                content=self.document.span_text(start, end),
+                level=heading.level
+            )
+            for heading, start, end in self.document.flat_sections()
+        ]
 
     def get_section(self, name: str) -> Optional[Section]:
         """Get section by name (case-insensitive).
@@ -159,8 +136,9 @@ class SectionEditor:
         # Replace section lines
         new_lines = lines[:section.start_line] + new_content.split("\n") + lines[section.end_line:]
 
-        # Write back
-        self.path.write_text("\n".join(new_lines))
+        # Write back (atomic)
+        with WriteTransaction() as txn:
+            txn.write(self.path, "\n".join(new_lines))
 
         return True
 
@@ -183,8 +161,9 @@ class SectionEditor:
         # Remove section lines
         new_lines = lines[:section.start_line] + lines[section.end_line:]
 
-        # Write back
-        self.path.write_text("\n".join(new_lines))
+        # Write back (atomic)
+        with WriteTransaction() as txn:
+            txn.write(self.path, "\n".join(new_lines))
 
         return True
 
@@ -9,7 +9,7 @@ Orchestrates a 4-phase sync pipeline for CLAUDE.md files:
   Phase 4: Fix     - Auto-fix issues with backup creation (optional, --fix flag)
 
 Merges logic from:
-  - claude_md_detector.py  (CLAUDEMDDetector, ProjectInfo)
+  - claude_md_detector.py  (ProjectInfo, project_snapshot)
   - claude_md_updater_simple.py (SimpleCLAUDEMDUpdater, MetricChange)
   - claude_md_auditor.py (CLAUDEMDAuditor, Issue, Severity)
   - claude_md_fixer.py (CLAUDEMDFixer, FixResult)
@@ -18,21 +18,32 @@ Version: 1.0.0
 Author: Craft Plugin
 """
 
+import glob
 import json
 import os
 import re
-import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # Import project detector - handle both module and script usage
 try:
-    from .claude_md_detector import CLAUDEMDDetector, ProjectInfo
+    from .claude_md_detector import ProjectInfo, project_snapshot
+    from .claude_md_document import ClaudeMdDocument, EditBuffer
+    from .claude_md_optimizer import CLAUDEMDOptimizer, OptimizeResult
+    from .claude_md_writer import WriteTransaction
+    from .link_checker import MISSING_FILE, LinkChecker
 except ImportError:
-    from claude_md_detector import CLAUDEMDDetector, ProjectInfo
+    from claude_md_detector import ProjectInfo, project_snapshot
+    from claude_md_document import ClaudeMdDocument, EditBuffer
+    from claude_md_optimizer import CLAUDEMDOptimizer, OptimizeResult
+    from claude_md_writer import WriteTransaction
+    from link_checker import MISSING_FILE, LinkChecker
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +93,9 @@ ANTI_PATTERNS = [
 ]
 """Anti-patterns that should be blocked from CLAUDE.md."""
 
+# Compiled once per process (each batch worker imports this module once)
+_ANTI_PATTERN_RES = [(ap, re.compile(ap["pattern"], re.MULTILINE)) for ap in ANTI_PATTERNS]
+
 
 # ---------------------------------------------------------------------------
 # Shared Data Classes
@@ -149,6 +163,8 @@ class SyncResult:
     anti_patterns_found: List[dict] = field(default_factory=list)
     line_count: int = 0
     budget: int = DEFAULT_BUDGET
+    diff: str = ""  # Unified diff of fixes, metric updates and cuts (also on dry runs)
+    optimize_result: Optional[OptimizeResult] = None
 
     @property
     def has_errors(self) -> bool:
@@ -216,8 +232,18 @@ class CLAUDEMDSync:
         # Resolve budget
         self.budget = budget if budget is not None else self._resolve_budget()
 
-        # Lazy-initialised detector result
+        # Lazy-initialised detector result and section tree
         self._project_info: Optional[ProjectInfo] = None
+        self._document: Optional[ClaudeMdDocument] = None
+        self._document_lines: Optional[List[str]] = None
+
+    @property
+    def document(self) -> ClaudeMdDocument:
+        """Section tree of ``self.lines`` (rebuilt when they are replaced)."""
+        if self._document is None or self._document_lines is not self.lines:
+            self._document = ClaudeMdDocument(self.lines)
+            self._document_lines = self.lines
+        return self._document
 
     # ------------------------------------------------------------------
     # Public API
@@ -235,7 +261,7 @@ class CLAUDEMDSync:
 
         Args:
             fix:      Apply auto-fixes for detected issues (Phase 4).
-            optimize: Aggressively trim bloat when fixing.
+            optimize: Run the budget optimizer on the synced content.
             dry_run:  Preview changes without writing to disk.
             section:  Restrict metric updates to a section ("all", "status",
                       "commands", "testing").
@@ -287,14 +313,34 @@ class CLAUDEMDSync:
                 fixable=False,
             ))
 
-        # Phase 4: Fix (optional)
+        # Phase 4: Fix (optional). Fixes and metric updates are recorded
+        # against one snapshot; the optimizer continues from them. CLAUDE.md,
+        # its backup and any detail files are written in one transaction
+        # (never on a dry run).
+        edits = EditBuffer(self.lines)
         fix_results: List[FixResult] = []
         if fix:
-            fix_results = self._fix(issues, scope=scope, dry_run=dry_run)
+            fix_results = self._fix(issues, scope=scope, dry_run=dry_run, edits=edits)
 
-        # Apply metric updates (unless dry_run)
-        if metric_changes and not dry_run:
-            self._apply_metric_changes(metric_changes)
+        if metric_changes:
+            self._apply_metric_changes(metric_changes, edits)
+
+        txn = WriteTransaction(backup=[self.path])
+        final_lines = edits.lines
+        optimize_result: Optional[OptimizeResult] = None
+        if optimize:
+            optimizer = CLAUDEMDOptimizer(
+                self.path, budget=self.budget, document=edits.document()
+            )
+            optimize_result = optimizer.optimize(dry_run=dry_run, txn=txn)
+            final_lines = optimizer.lines
+
+        if optimize_result and optimize_result.actions:
+            diff = optimize_result.diff
+        else:
+            diff = edits.diff(self.path.name)
+        if not dry_run:
+            self._write_lines(final_lines, txn)
 
         return SyncResult(
             project_info=project_info,
@@ -304,6 +350,8 @@ class CLAUDEMDSync:
             anti_patterns_found=anti_patterns,
             line_count=len(self.lines),
             budget=self.budget,
+            diff=diff,
+            optimize_result=optimize_result,
         )
 
     def detect_anti_patterns(self) -> List[dict]:
@@ -329,8 +377,8 @@ class CLAUDEMDSync:
             if in_code_block:
                 continue
 
-            for ap in ANTI_PATTERNS:
-                if re.search(ap["pattern"], line, re.MULTILINE):
+            for ap, regex in _ANTI_PATTERN_RES:
+                if regex.search(line):
                     entry: dict = {
                         "name": ap["name"],
                         "line_number": line_num,
@@ -416,6 +464,19 @@ class CLAUDEMDSync:
                 )
             sections.append("")
 
+        # Optimization
+        opt = result.optimize_result
+        if opt is not None:
+            if opt.actions:
+                sections.append(
+                    f"Optimized ({opt.before_lines} -> {opt.after_lines} lines):"
+                )
+                for action in opt.actions:
+                    sections.append(f"  {action.description}")
+            else:
+                sections.append("Optimized: nothing to cut")
+            sections.append("")
+
         # Fix results
         if result.fix_results:
             applied = [r for r in result.fix_results if r.success]
@@ -468,14 +529,13 @@ class CLAUDEMDSync:
     # ------------------------------------------------------------------
 
     def _detect(self) -> Optional[ProjectInfo]:
-        """Run project detection (cached).
+        """Run project detection (shared project snapshot).
 
         Returns:
             ProjectInfo or None if detection fails.
         """
         if self._project_info is None:
-            detector = CLAUDEMDDetector(self.project_root)
-            self._project_info = detector.detect()
+            self._project_info = project_snapshot(self.project_root)
         return self._project_info
 
     # ------------------------------------------------------------------
@@ -657,49 +717,59 @@ class CLAUDEMDSync:
             )
         return None
 
-    def _apply_metric_changes(self, changes: List[MetricChange]) -> None:
-        """Apply metric changes to in-memory content and write to disk.
+    def _apply_metric_changes(
+        self,
+        changes: List[MetricChange],
+        edits: Optional[EditBuffer] = None,
+    ) -> None:
+        """Record metric changes as edits; write them when no buffer is given.
 
         Uses the same regex-replacement strategy as SimpleCLAUDEMDUpdater.
 
         Args:
             changes: List of MetricChange objects to apply.
+            edits: Buffer shared with the fix phase (written by the caller).
         """
-        updated = self.content
+        own = edits is None
+        if own:
+            edits = EditBuffer(self.lines)
 
         for change in changes:
             if change.name == "Version":
                 version_num = change.after.replace("v", "")
-                updated = re.sub(
-                    change.pattern,
-                    lambda m, v=version_num: m.group(1) + v,
-                    updated,
-                )
+                edits.sub(change.pattern, lambda m, v=version_num: m.group(1) + v)
             elif change.name in ("Commands", "Skills", "Agents"):
                 count = change.after.split()[0]
-                updated = re.sub(
-                    change.pattern,
-                    lambda m, c=count: m.group(1) + c + m.group(2),
-                    updated,
-                )
+                edits.sub(change.pattern, lambda m, c=count: m.group(1) + c + m.group(2))
             elif change.name == "Tests":
                 count = change.after.split()[0]
-                updated = re.sub(
-                    change.pattern,
-                    lambda m, c=count: m.group(1) + c,
-                    updated,
-                )
+                edits.sub(change.pattern, lambda m, c=count: m.group(1) + c)
             elif change.name == "Documentation":
                 percent = change.after.replace("%", "")
-                updated = re.sub(
-                    change.pattern,
-                    lambda m, p=percent: m.group(1) + p + "%",
-                    updated,
-                )
+                edits.sub(change.pattern, lambda m, p=percent: m.group(1) + p + "%")
 
-        self.content = updated
-        self.lines = updated.split("\n")
-        self.path.write_text(updated)
+        if own:
+            self._write_lines(edits.lines)
+
+    def _write_lines(
+        self,
+        lines: List[str],
+        txn: Optional[WriteTransaction] = None,
+    ) -> None:
+        """Adopt ``lines`` as the content and commit them to disk.
+
+        Args:
+            lines: New CLAUDE.md lines.
+            txn: Transaction holding other staged files (e.g. detail files);
+                 by default a new one. Nothing is written when every staged
+                 file already has this content.
+        """
+        self.lines = list(lines)
+        self.content = "\n".join(self.lines)
+        if txn is None:
+            txn = WriteTransaction(backup=[self.path])
+        txn.write(self.path, self.content)
+        txn.commit()
 
     # ------------------------------------------------------------------
     # Phase 3: Audit
@@ -786,28 +856,21 @@ class CLAUDEMDSync:
         return issues
 
     def _check_broken_links(self) -> List[Issue]:
-        """Find broken internal file links."""
+        """Find broken internal file links (resolved by utils/link_checker.py)."""
         issues: List[Issue] = []
 
-        link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-        for line_num, line in enumerate(self.lines, 1):
-            for match in link_pattern.finditer(line):
-                link = match.group(2)
-
-                # Skip external / anchor links
-                if link.startswith(("http://", "https://", "mailto:", "#")):
-                    continue
-
-                target = self._resolve_link_path(link)
-                if not target.exists():
-                    issues.append(Issue(
-                        severity=Severity.ERROR,
-                        category="broken_link",
-                        message=f"Link points to non-existent file: {link}",
-                        line_number=line_num,
-                        fixable=True,
-                        fix_method="remove_link",
-                    ))
+        checker = LinkChecker(self.project_root)
+        for broken in checker.check_text(self.path, self.content, anchors=False):
+            if broken.ignored or broken.reason != MISSING_FILE:
+                continue
+            issues.append(Issue(
+                severity=Severity.ERROR,
+                category="broken_link",
+                message=f"Link points to non-existent file: {broken.link}",
+                line_number=broken.line,
+                fixable=True,
+                fix_method="remove_link",
+            ))
 
         return issues
 
@@ -881,15 +944,18 @@ class CLAUDEMDSync:
         issues: List[Issue],
         scope: str = "errors",
         dry_run: bool = False,
+        edits: Optional[EditBuffer] = None,
     ) -> List[FixResult]:
         """Apply auto-fixes for fixable issues.
 
-        Creates a backup before any modifications.
+        The write (when there is one) snapshots .CLAUDE.md.backup first.
 
         Args:
             issues: Issues from audit phase.
             scope: Fix scope - "errors", "warnings", or "all".
             dry_run: Preview fixes without writing to disk.
+            edits: Buffer to record into; the caller writes it. When None
+                   the fixes are written here (unless dry_run).
 
         Returns:
             List of FixResult objects.
@@ -900,27 +966,27 @@ class CLAUDEMDSync:
         if not fixable:
             return []
 
-        # Create backup before fixing
-        if not dry_run:
-            self._create_backup()
+        own = edits is None
+        if own:
+            edits = EditBuffer(self.lines)
 
         results: List[FixResult] = []
         for issue in fixable:
-            result = self._apply_fix(issue, dry_run)
+            result = self._apply_fix(issue, edits)
             results.append(result)
 
         # Persist changes
-        if not dry_run and any(r.success for r in results):
-            self.path.write_text(self.content)
+        if own and not dry_run:
+            self._write_lines(edits.lines)
 
         return results
 
-    def _apply_fix(self, issue: Issue, dry_run: bool) -> FixResult:
+    def _apply_fix(self, issue: Issue, edits: EditBuffer) -> FixResult:
         """Route an issue to its fix handler.
 
         Args:
             issue: Issue to fix.
-            dry_run: Preview only.
+            edits: Buffer the fix is recorded into.
 
         Returns:
             FixResult describing outcome.
@@ -940,12 +1006,11 @@ class CLAUDEMDSync:
                 description=f"Unknown fix method: {issue.fix_method}",
             )
 
-        return handler(issue, dry_run)
+        return handler(issue, edits)
 
-    def _fix_version_mismatch(self, issue: Issue, dry_run: bool) -> FixResult:
+    def _fix_version_mismatch(self, issue: Issue, edits: EditBuffer) -> FixResult:
         """Fix version mismatch by updating CLAUDE.md to match source."""
-        detector = CLAUDEMDDetector(self.project_root)
-        project_info = detector.detect()
+        project_info = project_snapshot(self.project_root)
 
         if not project_info:
             return FixResult(
@@ -976,13 +1041,8 @@ class CLAUDEMDSync:
 
         lines_changed = 0
         for pattern, replacement in patterns:
-            new_content, count = re.subn(
-                pattern, replacement, self.content, flags=re.MULTILINE
-            )
+            count = edits.sub(pattern, replacement, flags=re.MULTILINE)
             if count > 0:
-                if not dry_run:
-                    self.content = new_content
-                    self.lines = self.content.split("\n")
                 lines_changed = count
                 break
 
@@ -993,7 +1053,7 @@ class CLAUDEMDSync:
             lines_changed=lines_changed,
         )
 
-    def _fix_stale_command(self, issue: Issue, dry_run: bool) -> FixResult:
+    def _fix_stale_command(self, issue: Issue, edits: EditBuffer) -> FixResult:
         """Remove references to a deleted command."""
         cmd_match = re.search(r"(/craft:[a-z0-9:-]+)", issue.message)
         if not cmd_match:
@@ -1004,18 +1064,9 @@ class CLAUDEMDSync:
             )
 
         command = cmd_match.group(1)
-        lines_changed = 0
-        new_lines = []
-
-        for line in self.lines:
-            if command in line:
-                lines_changed += 1
-                continue  # drop the line
-            new_lines.append(line)
-
-        if lines_changed > 0 and not dry_run:
-            self.lines = new_lines
-            self.content = "\n".join(self.lines)
+        lines_changed = edits.map_lines(
+            lambda line: [] if command in line else None  # drop the line
+        )
 
         return FixResult(
             success=lines_changed > 0,
@@ -1024,7 +1075,7 @@ class CLAUDEMDSync:
             lines_changed=lines_changed,
         )
 
-    def _fix_broken_link(self, issue: Issue, dry_run: bool) -> FixResult:
+    def _fix_broken_link(self, issue: Issue, edits: EditBuffer) -> FixResult:
         """Comment out a broken link."""
         link_match = re.search(r"file: (.+)$", issue.message)
         if not link_match:
@@ -1035,19 +1086,9 @@ class CLAUDEMDSync:
             )
 
         link = link_match.group(1)
-        lines_changed = 0
-        new_lines = []
-
-        for line in self.lines:
-            if link in line:
-                new_lines.append(f"<!-- {line.strip()} --> (link broken)")
-                lines_changed += 1
-            else:
-                new_lines.append(line)
-
-        if lines_changed > 0 and not dry_run:
-            self.lines = new_lines
-            self.content = "\n".join(self.lines)
+        lines_changed = edits.map_lines(
+            lambda line: [f"<!-- {line.strip()} --> (link broken)"] if link in line else None
+        )
 
         return FixResult(
             success=lines_changed > 0,
@@ -1056,7 +1097,7 @@ class CLAUDEMDSync:
             lines_changed=lines_changed,
         )
 
-    def _fix_status_sync(self, issue: Issue, dry_run: bool) -> FixResult:
+    def _fix_status_sync(self, issue: Issue, edits: EditBuffer) -> FixResult:
         """Fix progress mismatch by syncing from .STATUS."""
         progress_match = re.search(
             r"CLAUDE\.md=(\d+)%.*\.STATUS=(\d+)%", issue.message
@@ -1078,13 +1119,8 @@ class CLAUDEMDSync:
 
         lines_changed = 0
         for pattern, replacement in patterns:
-            new_content, count = re.subn(
-                pattern, replacement, self.content, flags=re.IGNORECASE
-            )
+            count = edits.sub(pattern, replacement, flags=re.IGNORECASE)
             if count > 0:
-                if not dry_run:
-                    self.content = new_content
-                    self.lines = self.content.split("\n")
                 lines_changed = count
                 break
 
@@ -1127,25 +1163,21 @@ class CLAUDEMDSync:
         if not commands_dir.exists():
             return set()
 
+        project_info = self._detect()
+        if project_info and project_info.type == "craft-plugin":
+            rels = [Path(rel) for rel in project_info.commands]
+        else:
+            rels = [f.relative_to(commands_dir) for f in commands_dir.rglob("*.md")]
+
         commands: set = set()
-        for cmd_file in commands_dir.rglob("*.md"):
-            rel = cmd_file.relative_to(commands_dir)
+        for rel in rels:
             cmd_name = "/craft:" + str(rel.with_suffix("")).replace("/", ":")
             commands.add(cmd_name)
         return commands
 
     def _extract_section_headers(self) -> List[str]:
         """Extract H1/H2 section headers from CLAUDE.md."""
-        sections: List[str] = []
-        pattern = re.compile(r"^##?\s+(.+)$")
-        for line in self.lines:
-            match = pattern.match(line)
-            if match:
-                title = match.group(1)
-                title = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", title)
-                title = re.sub(r"[*_`]", "", title)
-                sections.append(title.strip())
-        return sections
+        return self.document.titles(2)
 
     def _extract_progress_from_content(self) -> Optional[int]:
         """Extract progress percentage from CLAUDE.md."""
@@ -1178,16 +1210,6 @@ class CLAUDEMDSync:
                 return i
         return None
 
-    # ------------------------------------------------------------------
-    # Helpers: Link Resolution
-    # ------------------------------------------------------------------
-
-    def _resolve_link_path(self, link: str) -> Path:
-        """Resolve an internal markdown link to an absolute path."""
-        if link.startswith("/"):
-            return self.project_root / link.lstrip("/")
-        return (self.path.parent / link).resolve()
-
     # ------------------------------------------------------------------
     # Helpers: Status Parsing
     # ------------------------------------------------------------------
@@ -1251,19 +1273,9 @@ class CLAUDEMDSync:
         return [i for i in issues if i.severity == Severity.ERROR]
 
     # ------------------------------------------------------------------
-    # Helpers: Backup & Budget
+    # Helpers: Budget
     # ------------------------------------------------------------------
 
-    def _create_backup(self) -> Path:
-        """Create a backup of CLAUDE.md before modifying.
-
-        Returns:
-            Path to the backup file.
-        """
-        backup_path = self.path.parent / f".{self.path.name}.backup"
-        shutil.copy2(self.path, backup_path)
-        return backup_path
-
     def _resolve_budget(self) -> int:
         """Resolve line budget from config files.
 
@@ -1318,23 +1330,46 @@ class ReferenceFileGenerator:
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
         self.reference_dir = self.project_root / ".claude" / "reference"
+        self._txn: Optional[WriteTransaction] = None
+        self._project_info: Optional[ProjectInfo] = None
+
+    def _detect(self) -> Optional[ProjectInfo]:
+        """Shared project snapshot (same source as CLAUDEMDSync)."""
+        if self._project_info is None:
+            self._project_info = project_snapshot(self.project_root)
+        return self._project_info
 
     def generate_all(self) -> List[str]:
-        """Generate all reference files. Returns list of files written."""
+        """Generate all reference files. Returns list of files generated.
+
+        Files are committed together; unchanged files are not rewritten.
+        """
         self.reference_dir.mkdir(parents=True, exist_ok=True)
         written: List[str] = []
 
-        for gen_func in (
-            self._generate_agents,
-            self._generate_test_suite,
-            self._generate_project_structure,
-        ):
-            path = gen_func()
-            if path:
-                written.append(str(path))
+        try:
+            with WriteTransaction() as self._txn:
+                for gen_func in (
+                    self._generate_agents,
+                    self._generate_test_suite,
+                    self._generate_project_structure,
+                ):
+                    path = gen_func()
+                    if path:
+                        written.append(str(path))
+        finally:
+            self._txn = None
 
         return written
 
+    def _write(self, out: Path, text: str) -> None:
+        """Stage a reference file in the running transaction (or write it now)."""
+        if self._txn is not None:
+            self._txn.write(out, text)
+            return
+        with WriteTransaction() as txn:
+            txn.write(out, text)
+
     def _generate_agents(self) -> Optional[Path]:
         """Generate agents.md from agents/ directory."""
         agents_dir = self.project_root / "agents"
@@ -1377,7 +1412,7 @@ class ReferenceFileGenerator:
         lines.append("")
 
         out = self.reference_dir / "agents.md"
-        out.write_text("\n".join(lines))
+        self._write(out, "\n".join(lines))
         return out
 
     def _generate_test_suite(self) -> Optional[Path]:
@@ -1425,7 +1460,7 @@ class ReferenceFileGenerator:
         ])
 
         out = self.reference_dir / "test-suite.md"
-        out.write_text("\n".join(lines))
+        self._write(out, "\n".join(lines))
         return out
 
     def _generate_project_structure(self) -> Optional[Path]:
@@ -1436,9 +1471,15 @@ class ReferenceFileGenerator:
         agents_dir = self.project_root / "agents"
         specs_dir = self.project_root / "docs" / "specs"
 
-        cmd_count = len(list(commands_dir.rglob("*.md"))) if commands_dir.exists() else 0
-        skill_count = len(list(skills_dir.rglob("SKILL.md"))) if skills_dir.exists() else 0
-        agent_count = len(list(agents_dir.rglob("*.md"))) if agents_dir.exists() else 0
+        project_info = self._detect()
+        if project_info and project_info.type == "craft-plugin":
+            cmd_count = len(project_info.commands)
+            skill_count = len(project_info.skills)
+            agent_count = len(project_info.agents)
+        else:
+            cmd_count = len(list(commands_dir.rglob("*.md"))) if commands_dir.exists() else 0
+            skill_count = len(list(skills_dir.rglob("SKILL.md"))) if skills_dir.exists() else 0
+            agent_count = len(list(agents_dir.rglob("*.md"))) if agents_dir.exists() else 0
         spec_count = len(list(
             specs_dir.rglob("SPEC-*.md")
         )) if specs_dir.exists() else 0
@@ -1479,7 +1520,7 @@ class ReferenceFileGenerator:
         ]
 
         out = self.reference_dir / "project-structure.md"
-        out.write_text("\n".join(lines))
+        self._write(out, "\n".join(lines))
         return out
 
 
@@ -1535,6 +1576,221 @@ def sync_claude_md(
     return result, report
 
 
+# ---------------------------------------------------------------------------
+# Batch Mode (--repos)
+# ---------------------------------------------------------------------------
+
+# Sync options shared by every repo of a batch. Workers receive them once
+# through the pool initializer; each task only carries a repo path.
+_BATCH_OPTIONS: Dict[str, Any] = {}
+
+
+def expand_repos(spec: str) -> List[Path]:
+    """Resolve a ``--repos`` argument to CLAUDE.md paths.
+
+    Args:
+        spec: A glob (``~/projects/*``, ``src/**/CLAUDE.md``) or a file
+              listing one path or glob per line (blank lines and ``#``
+              comments skipped). Directories map to their CLAUDE.md.
+
+    Returns:
+        Sorted, de-duplicated CLAUDE.md paths (which may not exist).
+    """
+    expanded = os.path.expanduser(spec)
+    if os.path.isfile(expanded) and not expanded.endswith(".md"):
+        base = os.path.dirname(os.path.abspath(expanded))
+        with open(expanded) as fh:
+            patterns = [
+                os.path.join(base, os.path.expanduser(line.strip()))
+                for line in fh
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+    else:
+        patterns = [expanded]
+
+    paths = set()
+    for pattern in patterns:
+        for match in sorted(glob.glob(pattern, recursive=True)) or [pattern]:
+            path = Path(match)
+            paths.add((path / "CLAUDE.md") if path.is_dir() else path)
+    return sorted(paths)
+
+
+def sync_repo(claude_md_path: Path, **options: Any) -> Dict[str, Any]:
+    """Sync one CLAUDE.md and summarise it as a JSON-ready record.
+
+    Never raises: a repo that cannot be synced is reported with status
+    ``failed`` so one bad checkout does not abort a batch.
+
+    Args:
+        claude_md_path: Path to the CLAUDE.md file.
+        **options: ``fix``, ``optimize``, ``dry_run``, ``section``,
+                   ``scope`` and ``budget``; missing keys fall back to the
+                   batch options, then to the ``CLAUDEMDSync`` defaults.
+
+    Returns:
+        Dict with ``repo``, ``path``, ``status`` (clean, drift, errors,
+        missing, failed), issue/fix counts, ``line_count``, ``budget``
+        and ``elapsed_ms``.
+    """
+    options = {**_BATCH_OPTIONS, **options}
+    path = Path(claude_md_path)
+    start = time.perf_counter()
+    record: Dict[str, Any] = {"repo": str(path.parent), "path": str(path)}
+
+    if not path.is_file():
+        record["status"] = "missing"
+    else:
+        try:
+            syncer = CLAUDEMDSync(path, budget=options.get("budget"))
+            result = syncer.sync(
+                fix=options.get("fix", False),
+                optimize=options.get("optimize", False),
+                dry_run=options.get("dry_run", False),
+                section=options.get("section", "all"),
+                scope=options.get("scope", "errors"),
+            )
+        except Exception as e:  # noqa: BLE001 - reported per repo
+            record["status"] = "failed"
+            record["error"] = f"{type(e).__name__}: {e}"
+        else:
+            if result.has_errors:
+                status = "errors"
+            elif result.is_clean:
+                status = "clean"
+            else:
+                status = "drift"
+            record.update(
+                status=status,
+                version=result.project_info.version if result.project_info else None,
+                errors=sum(i.severity == Severity.ERROR for i in result.issues),
+                warnings=sum(i.severity == Severity.WARNING for i in result.issues),
+                metric_changes=len(result.metric_changes),
+                anti_patterns=len(result.anti_patterns_found),
+                fixes_applied=sum(f.success for f in result.fix_results),
+                line_count=result.line_count,
+                budget=result.budget,
+            )
+
+    record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return record
+
+
+def _init_batch_worker(options: Dict[str, Any]) -> None:
+    global _BATCH_OPTIONS
+    _BATCH_OPTIONS = dict(options)
+
+
+def _sync_in_worker(claude_md_path: str) -> Dict[str, Any]:
+    return sync_repo(Path(claude_md_path))
+
+
+def sync_repos(
+    paths: List[Path],
+    jobs: Optional[int] = None,
+    **options: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Sync many CLAUDE.md files, yielding records as each one completes.
+
+    With ``jobs`` > 1 the repos are spread over a process pool; each worker
+    imports this module (and compiles the anti-pattern regexes) once and
+    receives ``options`` once. Where no process pool can start, or it
+    breaks, the remaining repos run in this process.
+
+    Args:
+        paths: CLAUDE.md paths (see ``expand_repos``).
+        jobs: Worker processes (default: CPU count; 1 = sequential).
+        **options: Shared sync options, as for ``sync_repo``.
+
+    Yields:
+        ``sync_repo`` records in completion order.
+    """
+    pending = [str(p) for p in paths]
+    jobs = min(jobs or os.cpu_count() or 1, len(pending))
+
+    if jobs > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                     initargs=(options,)) as pool:
+                futures = {pool.submit(_sync_in_worker, p): p for p in pending}
+                for future in as_completed(futures):
+                    record = future.result()
+                    pending.remove(futures[future])
+                    yield record
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # finish whatever is left in-process
+
+    for path in list(pending):
+        yield sync_repo(Path(path), **options)
+
+
+BATCH_COLUMNS = ("status", "errors", "warnings", "metric_changes", "elapsed_ms")
+
+
+def format_batch_row(record: Dict[str, Any]) -> str:
+    """One summary-table row for a ``sync_repo`` record."""
+    cells = [f"{record.get(col, '-')!s:>9}" for col in BATCH_COLUMNS]
+    return " ".join(cells) + f"  {record['repo']}"
+
+
+def batch_exit_code(records: List[Dict[str, Any]], strict: bool = False) -> int:
+    """Aggregated exit code for a batch.
+
+    Returns:
+        1 if any repo is missing or failed, or (with *strict*) has errors;
+        0 otherwise.
+    """
+    bad = {"missing", "failed"} | ({"errors"} if strict else set())
+    return 1 if any(r["status"] in bad for r in records) else 0
+
+
+def run_batch(spec: str, jobs: Optional[int] = None, output: str = "table",
+              strict: bool = False, stream=None, **options: Any) -> int:
+    """``--repos`` entry point: stream results and return the exit code.
+
+    Args:
+        spec: ``--repos`` glob or list file.
+        jobs: Worker processes.
+        output: ``"table"`` (rows as they finish, then totals) or
+                ``"json"`` (one JSON object per line).
+        strict: Count repos with errors as failures.
+        stream: Output file (default: stdout).
+        **options: Shared sync options.
+
+    Returns:
+        Process exit code (see ``batch_exit_code``).
+    """
+    stream = stream or sys.stdout
+    paths = expand_repos(spec)
+    if not paths:
+        print(f"Error: no repositories match {spec!r}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    if output == "table":
+        print(" ".join(f"{col:>9}" for col in ("status", "errors", "warnings", "drift", "ms"))
+              + "  repo", file=stream)
+
+    records: List[Dict[str, Any]] = []
+    for record in sync_repos(paths, jobs=jobs, **options):
+        records.append(record)
+        if output == "json":
+            print(json.dumps(record), file=stream)
+        else:
+            print(format_batch_row(record), file=stream)
+        stream.flush()
+
+    if output == "table":
+        counts: Dict[str, int] = {}
+        for record in records:
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n{len(records)} repos in {elapsed:.0f}ms: {summary}", file=stream)
+
+    return batch_exit_code(records, strict=strict)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -1595,9 +1851,48 @@ if __name__ == "__main__":
         action="store_true",
         help="Generate .claude/reference/ files from project state",
     )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Line budget override (default: per-repo config, then 150)",
+    )
+    parser.add_argument(
+        "--repos",
+        metavar="GLOB|FILE",
+        help="Sync every CLAUDE.md matched by a glob or listed in a file",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes for --repos (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output",
+        default="table",
+        choices=["table", "json"],
+        help="--repos output: summary table or JSON lines (default: table)",
+    )
 
     args = parser.parse_args()
 
+    if args.repos:
+        sys.exit(run_batch(
+            args.repos,
+            jobs=args.jobs,
+            output=args.output,
+            strict=args.strict,
+            fix=args.fix,
+            optimize=args.optimize,
+            dry_run=args.dry_run,
+            section=args.section,
+            scope=args.scope,
+            budget=args.budget,
+        ))
+
     # Handle --generate-reference
     if args.generate_reference:
         project_root = Path(args.file).parent if args.file else Path.cwd()
@@ -1623,7 +1918,7 @@ if __name__ == "__main__":
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
 
-    syncer = CLAUDEMDSync(Path(file_path))
+    syncer = CLAUDEMDSync(Path(file_path), budget=args.budget)
     result = syncer.sync(
         fix=args.fix,
         optimize=args.optimize,
@@ -1633,6 +1928,8 @@ if __name__ == "__main__":
     )
     report = syncer.generate_report(result)
     print(report)
+    if args.dry_run and result.diff:
+        print(result.diff)
 
     if args.strict and result.has_errors:
         sys.exit(1)
@@ -13,6 +13,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+# Import project snapshot - handle both module and script usage
+try:
+    from .claude_md_detector import project_snapshot
+except ImportError:
+    from claude_md_detector import project_snapshot
+
 
 class TemplatePopulator:
     """Populates template variables from project analysis."""
@@ -27,6 +33,7 @@ class TemplatePopulator:
         self.path = project_path
         self.type = project_type
         self.variables: Dict[str, Any] = {}
+        self._project_info = None
 
     def populate_all(self) -> Dict[str, Any]:
         """Populate all variables for project type.
@@ -221,8 +228,18 @@ class TemplatePopulator:
 
     # Helper methods
 
+    def _plugin_snapshot(self):
+        """Shared ProjectInfo when the project is a craft plugin, else None."""
+        if self._project_info is None:
+            self._project_info = project_snapshot(self.path) or False
+        if self._project_info and self._project_info.type == "craft-plugin":
+            return self._project_info
+        return None
+
     def _count_commands(self) -> int:
         """Count command files."""
+        if info := self._plugin_snapshot():
+            return len(info.commands)
         commands_dir = self.path / "commands"
         if not commands_dir.exists():
             return 0
@@ -233,12 +250,17 @@ class TemplatePopulator:
         skills_dir = self.path / "skills"
         if not skills_dir.exists():
             return 0
-        nested = list(skills_dir.rglob("SKILL.md"))
+        if info := self._plugin_snapshot():
+            nested = info.skills
+        else:
+            nested = list(skills_dir.rglob("SKILL.md"))
         top_level = [p for p in skills_dir.glob("*.md")]
         return len(nested) + len(top_level)
 
     def _count_agents(self) -> int:
         """Count agent files."""
+        if info := self._plugin_snapshot():
+            return len(info.agents)
         agents_dir = self.path / "agents"
         if not agents_dir.exists():
             return 0
@@ -15,6 +15,11 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
+try:
+    from .claude_md_writer import WriteTransaction
+except ImportError:
+    from claude_md_writer import WriteTransaction
+
 
 class ChangeType(Enum):
     """Types of changes that can be detected."""
@@ -336,7 +341,8 @@ class CLAUDEMDUpdater:
                 updated_content = self._apply_single_change(updated_content, change)
 
         if not dry_run:
-            self.path.write_text(updated_content)
+            with WriteTransaction() as txn:
+                txn.write(self.path, updated_content)
 
         return updated_content
 
@@ -15,6 +15,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+try:
+    from .claude_md_writer import WriteTransaction
+except ImportError:
+    from claude_md_writer import WriteTransaction
+
 
 @dataclass
 class MetricChange:
@@ -252,7 +257,8 @@ class SimpleCLAUDEMDUpdater:
                 )
 
         if not dry_run:
-            self.path.write_text(updated)
+            with WriteTransaction() as txn:
+                txn.write(self.path, updated)
 
         return updated
 
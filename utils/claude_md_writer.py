@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+CLAUDE.md Write Transactions
+
+One write-back path for every CLAUDE.md mutator (sync, fixer, optimizer,
+section editor, updaters, reference files):
+file outputs are staged in memory and committed together.
+
+Commit:
+  1. Drop staged files whose bytes already match the disk (no write, no
+     mtime change, nothing for file watchers to pick up)
+  2. Write each remaining file to a temp file beside it and fsync it
+  3. Rename the backup snapshot, then every temp file, into place
+
+A failure before step 3 removes the temp files and leaves every target
+untouched; a killed process never leaves a half-written CLAUDE.md. The
+backup (``.<name>.backup``) is taken once per transaction, from the
+content before the transaction, however many mutators staged the file.
+
+Version: 1.0.0
+Author: Craft Plugin
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+def backup_path(path: Path) -> Path:
+    """Backup location for ``path`` (``CLAUDE.md`` -> ``.CLAUDE.md.backup``)."""
+    return path.parent / f".{path.name}.backup"
+
+
+def _target(path: Path) -> Path:
+    """Resolve symlinks so a linked CLAUDE.md is updated, not replaced."""
+    return Path(os.path.realpath(path))
+
+
+class WriteTransaction:
+    """Stage file writes in memory and commit them together.
+
+    Usage:
+        with WriteTransaction(backup=[claude_md]) as txn:
+            txn.write(claude_md, new_text)
+            txn.append(detail, more)
+
+    Leaving the block commits; an exception discards everything staged.
+    """
+
+    def __init__(self, backup: Iterable[Path] = ()):
+        """Initialize transaction.
+
+        Args:
+            backup: Files to snapshot to ``.<name>.backup`` when they change
+        """
+        self._backup = {_target(Path(p)) for p in backup}
+        self._staged: Dict[Path, List[str]] = {}  # Content as chunks (cheap appends)
+
+    def __enter__(self) -> "WriteTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    @property
+    def staged(self) -> List[Path]:
+        """Paths with staged content, in staging order."""
+        return list(self._staged)
+
+    def exists(self, path: Path) -> bool:
+        """True if ``path`` is staged or exists on disk."""
+        target = _target(Path(path))
+        return target in self._staged or target.exists()
+
+    def read(self, path: Path) -> Optional[str]:
+        """Staged content of ``path``, else its content on disk (None if missing)."""
+        target = _target(Path(path))
+        chunks = self._staged.get(target)
+        if chunks is None:
+            try:
+                return target.read_text()
+            except FileNotFoundError:
+                return None
+        if len(chunks) > 1:
+            chunks[:] = ["".join(chunks)]
+        return chunks[0]
+
+    def write(self, path: Path, content: str) -> None:
+        """Stage ``content`` as the new content of ``path``."""
+        self._staged[_target(Path(path))] = [content]
+
+    def append(self, path: Path, text: str) -> None:
+        """Stage ``text`` at the end of ``path`` (created if missing)."""
+        target = _target(Path(path))
+        if target not in self._staged:
+            self._staged[target] = [self.read(target) or ""]
+        self._staged[target].append(text)
+
+    def discard(self) -> None:
+        """Drop everything staged; nothing is written."""
+        self._staged.clear()
+
+    def commit(self) -> List[Path]:
+        """Write every staged file that changed.
+
+        Returns:
+            Paths actually written (empty when everything was identical)
+        """
+        changed: Dict[Path, bytes] = {}
+        for path, chunks in self._staged.items():
+            data = "".join(chunks).encode()
+            try:
+                if path.read_bytes() == data:
+                    continue
+            except FileNotFoundError:
+                pass
+            changed[path] = data
+        self._staged.clear()
+        if not changed:
+            return []
+
+        # Stage everything beside its target first; rename only once all
+        # temp files are safely on disk
+        renames: List[tuple] = []
+        try:
+            for path in changed:
+                if path in self._backup and path.exists():
+                    backup = backup_path(path)
+                    renames.append((self._write_temp(backup, path.read_bytes(), path), backup))
+            for path, data in changed.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                renames.append((self._write_temp(path, data, path), path))
+        except BaseException:
+            for tmp, _ in renames:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+            raise
+
+        for tmp, path in renames:
+            os.replace(tmp, path)
+        for directory in {path.parent for _, path in renames}:
+            self._fsync_dir(directory)
+        return list(changed)
+
+    @staticmethod
+    def _write_temp(dest: Path, data: bytes, mode_from: Path) -> Path:
+        """Write ``data`` to a temp file beside ``dest`` and fsync it.
+
+        The temp file takes the permissions of ``mode_from`` when it exists.
+        """
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            if mode_from.exists():
+                shutil.copymode(mode_from, tmp)
+        except BaseException:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
+        return tmp
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist the renames (best effort; not supported everywhere)."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -12,16 +12,38 @@ Detects 9 types of documentation issues:
 7. Inconsistent terminology (craft vs Craft)
 8. Missing cross-references (related commands not linked)
 9. Outdated architecture diagrams (Mermaid diagrams)
+
+Every detector reads through a `DocsCorpus`: ``detect_all`` loads it once, so
+each docs page, root file and command file is listed and read a single time
+across all nine checks. A `CorpusFile` keeps the newline offsets of its text,
+so turning a match offset into a line number is a ``bisect``.
+
+``detect_all(parallel=True)`` runs the checks concurrently: the regex-heavy
+ones in a process pool (they are CPU-bound and would contend for the GIL),
+the rest in threads. Every result carries its ``elapsed_ms``.
 """
 
 import re
 import os
-import yaml
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+# Import through the plugin root so a bare ``frontmatter`` can never resolve to
+# the PyPI python-frontmatter package when this file runs as a script.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from utils.frontmatter import read_frontmatter  # noqa: E402
+from utils.link_checker import LinkChecker  # noqa: E402
+
 
 @dataclass
 class DetectionResult:
@@ -31,6 +53,7 @@ class DetectionResult:
     count: int
     items: List[Dict[str, str]] = field(default_factory=list)
     details: str = ""
+    elapsed_ms: float = 0.0
 
     def summary(self) -> str:
         """Human-readable summary"""
@@ -41,6 +64,172 @@ class DetectionResult:
         return f"{self.category}: {self.count} {item_desc} need updating"
 
 
+def _safe_read_file(file_path: Path) -> Optional[str]:
+    """
+    Safely read file content, handling encoding errors and other I/O issues.
+
+    Args:
+        file_path: Path to file to read
+
+    Returns:
+        File content as string, or None if file cannot be read
+    """
+    try:
+        with open(file_path, encoding='utf-8') as f:
+            return f.read()
+    except (UnicodeDecodeError, OSError, PermissionError):
+        # Skip binary/corrupted files or files we can't read
+        return None
+
+
+class CorpusFile:
+    """One document's text plus the offset where each of its lines starts"""
+
+    __slots__ = ("path", "rel", "text", "_starts", "_lines")
+
+    def __init__(self, path: Path, rel: str, text: str):
+        self.path = path
+        self.rel = rel
+        self.text = text
+        self._starts: Optional[List[int]] = None
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def line_starts(self) -> List[int]:
+        """Offset of the first character of every line (built on first use)"""
+        if self._starts is None:
+            starts = [0]
+            find = self.text.find
+            pos = find('\n')
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = find('\n', pos + 1)
+            self._starts = starts
+        return self._starts
+
+    @property
+    def lines(self) -> List[str]:
+        """``text.split('\\n')``, shared by the line-oriented detectors"""
+        if self._lines is None:
+            self._lines = self.text.split('\n')
+        return self._lines
+
+    def line_number(self, offset: int) -> int:
+        """1-based line containing ``offset``"""
+        return bisect_right(self.line_starts, offset)
+
+    def context(self, start: int, end: int, width: int = 80) -> str:
+        """Stripped text from the line of ``start`` to the end of the line of ``end``"""
+        line_start = self.line_starts[self.line_number(start) - 1]
+        line_end = self.text.find('\n', end)
+        if line_end == -1:
+            line_end = len(self.text)
+        context = self.text[line_start:line_end].strip()
+        return context[:width] + '...' if len(context) > width else context
+
+
+class DocsCorpus:
+    """
+    The documents the detectors read, each listed and read at most once.
+
+    Files are loaded lazily and memoized, so a detector run on its own only
+    reads what it needs, while ``detect_all`` shares one corpus across all
+    nine checks. Unreadable files (binary, bad encoding, broken links) are
+    absent: ``file()`` returns None and the listings skip them.
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.docs_dir = project_root / "docs"
+        self.commands_dir = project_root / "commands"
+        self._root = os.path.abspath(project_root)
+        self._files: Dict[str, Optional[CorpusFile]] = {}
+        self._docs: Optional[List[Path]] = None
+        self._commands: Optional[List[Path]] = None
+        self._names: Dict[Path, Optional[str]] = {}
+
+    def file(self, path: Path) -> Optional[CorpusFile]:
+        """The document at ``path`` (relative or absolute), or None when it cannot be read"""
+        key = os.path.abspath(path)
+        if key not in self._files:
+            text = _safe_read_file(path)
+            doc = None
+            if text is not None:
+                doc = CorpusFile(Path(path), os.path.relpath(key, self._root), text)
+            self._files.setdefault(key, doc)
+        return self._files[key]
+
+    def text(self, path: Path) -> Optional[str]:
+        """Content of the document at ``path``, or None"""
+        doc = self.file(path)
+        return doc.text if doc else None
+
+    def _load(self, paths: List[Path]) -> List[CorpusFile]:
+        docs = (self.file(p) for p in paths)
+        return [d for d in docs if d is not None]
+
+    def doc_paths(self) -> List[Path]:
+        """``docs/**/*.md``"""
+        if self._docs is None:
+            self._docs = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
+        return self._docs
+
+    def command_paths(self) -> List[Path]:
+        """``commands/**/*.md``"""
+        if self._commands is None:
+            self._commands = (list(self.commands_dir.rglob("*.md"))
+                              if self.commands_dir.exists() else [])
+        return self._commands
+
+    def docs(self, *root_files: str) -> List[CorpusFile]:
+        """Readable docs pages, followed by the named files at the project root"""
+        return self._load(self.doc_paths() + [self.project_root / name for name in root_files])
+
+    def commands(self) -> List[CorpusFile]:
+        """Readable command files"""
+        return self._load(self.command_paths())
+
+    def command_name(self, path: Path) -> Optional[str]:
+        """First ``/craft:...`` reference in a command file's first 500 characters"""
+        if path not in self._names:
+            doc = self.file(path)
+            match = re.search(r'/craft:[^\s]+', doc.text[:500]) if doc else None
+            self._names[path] = match.group(0) if match else None
+        return self._names[path]
+
+
+# The nine checks in report order: (result key, method, CPU-bound regex scan)
+DETECTORS: List[Tuple[str, str, bool]] = [
+    ('version_refs', 'detect_version_references', True),
+    ('command_counts', 'detect_command_counts', True),
+    ('broken_links', 'detect_broken_links', True),
+    ('stale_examples', 'detect_stale_examples', True),
+    ('missing_help', 'detect_missing_help', False),
+    ('outdated_status', 'detect_outdated_status', True),
+    ('inconsistent_terms', 'detect_inconsistent_terminology', True),
+    ('missing_xrefs', 'detect_missing_cross_references', False),
+    ('outdated_diagrams', 'detect_outdated_diagrams', True),
+]
+
+ROOT_FILES = ("README.md", "CLAUDE.md", "CHANGELOG.md")
+
+# Detector (with its loaded corpus) used by process-pool workers. Set in the
+# parent before the pool starts, so forked workers inherit the corpus; workers
+# started any other way build their own in `_init_worker`.
+_WORKER: Optional["DocsDetector"] = None
+
+
+def _init_worker(project_root: str) -> None:
+    global _WORKER
+    if _WORKER is None or _WORKER.project_root != Path(project_root):
+        _WORKER = DocsDetector(project_root)
+        _WORKER._corpus = DocsCorpus(_WORKER.project_root)
+
+
+def _run_in_worker(method: str, args: tuple) -> DetectionResult:
+    return _WORKER._timed(method, args)
+
+
 class DocsDetector:
     """Detect outdated documentation across 9 categories"""
 
@@ -48,64 +237,88 @@ class DocsDetector:
         self.project_root = Path(project_root)
         self.docs_dir = self.project_root / "docs"
         self.commands_dir = self.project_root / "commands"
+        self._corpus: Optional[DocsCorpus] = None
 
     def _safe_read_file(self, file_path: Path) -> Optional[str]:
-        """
-        Safely read file content, handling encoding errors and other I/O issues.
-
-        Args:
-            file_path: Path to file to read
+        """Read a file's text, or None when it cannot be read"""
+        return _safe_read_file(file_path)
 
-        Returns:
-            File content as string, or None if file cannot be read
-        """
-        try:
-            with open(file_path, encoding='utf-8') as f:
-                return f.read()
-        except (UnicodeDecodeError, OSError, PermissionError):
-            # Skip binary/corrupted files or files we can't read
-            return None
+    @property
+    def corpus(self) -> DocsCorpus:
+        """The corpus shared by the current ``detect_all``, else a fresh one"""
+        return self._corpus or DocsCorpus(self.project_root)
 
-    def detect_all(self, current_version: str = None) -> Dict[str, DetectionResult]:
+    def detect_all(self, current_version: str = None, parallel: bool = False,
+                   workers: Optional[int] = None) -> Dict[str, DetectionResult]:
         """
         Run all 9 detection checks
 
         Args:
             current_version: Current craft version (e.g., "2.6.0")
+            parallel: Run the checks concurrently (CPU-bound regex scans in
+                a process pool, the others in threads)
+            workers: Process pool size (default: one per CPU-bound check,
+                capped at the CPU count)
 
         Returns:
-            Dictionary of category -> DetectionResult
+            Dictionary of category -> DetectionResult (in DETECTORS order),
+            each with its ``elapsed_ms``
         """
-        results = {}
-
-        # 1. Version references
-        results['version_refs'] = self.detect_version_references(current_version)
-
-        # 2. Command counts
-        results['command_counts'] = self.detect_command_counts()
-
-        # 3. Broken links (requires external tool, placeholder)
-        results['broken_links'] = self.detect_broken_links()
-
-        # 4. Stale examples
-        results['stale_examples'] = self.detect_stale_examples()
-
-        # 5. Missing command documentation
-        results['missing_help'] = self.detect_missing_help()
-
-        # 6. Outdated status markers
-        results['outdated_status'] = self.detect_outdated_status()
-
-        # 7. Inconsistent terminology
-        results['inconsistent_terms'] = self.detect_inconsistent_terminology()
-
-        # 8. Missing cross-references
-        results['missing_xrefs'] = self.detect_missing_cross_references()
-
-        # 9. Outdated architecture diagrams
-        results['outdated_diagrams'] = self.detect_outdated_diagrams()
-
-        return results
+        self._corpus = DocsCorpus(self.project_root)
+        try:
+            if parallel:
+                return self._detect_parallel(current_version, workers)
+            return {
+                key: self._timed(method, self._detector_args(key, current_version))
+                for key, method, _ in DETECTORS
+            }
+        finally:
+            self._corpus = None
+
+    @staticmethod
+    def _detector_args(key: str, current_version: Optional[str]) -> tuple:
+        return (current_version,) if key == 'version_refs' else ()
+
+    def _timed(self, method: str, args: tuple) -> DetectionResult:
+        start = time.perf_counter()
+        result = getattr(self, method)(*args)
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def _detect_parallel(self, current_version: Optional[str],
+                         workers: Optional[int]) -> Dict[str, DetectionResult]:
+        global _WORKER
+        # Load everything up front: threads then share it, and forked
+        # workers inherit it instead of re-reading.
+        self._corpus.docs(*ROOT_FILES)
+        self._corpus.commands()
+
+        cpu = [(k, m) for k, m, cpu_bound in DETECTORS if cpu_bound]
+        io = [(k, m) for k, m, cpu_bound in DETECTORS if not cpu_bound]
+        workers = workers or min(len(cpu), os.cpu_count() or 1)
+        results: Dict[str, DetectionResult] = {}
+
+        _WORKER = self
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(str(self.project_root),)) as procs:
+                # Processes start (fork) before any detector thread exists
+                futures = {k: procs.submit(_run_in_worker, m, self._detector_args(k, current_version))
+                           for k, m in cpu}
+                with ThreadPoolExecutor(max_workers=len(io)) as threads:
+                    futures.update({k: threads.submit(self._timed, m, self._detector_args(k, current_version))
+                                    for k, m in io})
+                results = {k: f.result() for k, f in futures.items()}
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable process pool (sandbox, no semaphores): threads only
+            with ThreadPoolExecutor(max_workers=len(DETECTORS)) as threads:
+                futures = {k: threads.submit(self._timed, m, self._detector_args(k, current_version))
+                           for k, m, _ in DETECTORS if k not in results}
+                results.update({k: f.result() for k, f in futures.items()})
+        finally:
+            _WORKER = None
+
+        return {key: results[key] for key, _, _ in DETECTORS}
 
     def detect_version_references(self, current_version: str = None) -> DetectionResult:
         """
@@ -137,39 +350,17 @@ class DocsDetector:
         version_pattern = re.compile(r'v?(\d+\.\d+\.\d+)')
 
         # Search docs/ and key files
-        search_files = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
-        search_files.extend([
-            self.project_root / "README.md",
-            self.project_root / "CLAUDE.md",
-            self.project_root / "CHANGELOG.md"
-        ])
-
-        for file_path in search_files:
-            if not file_path.exists():
-                continue
-
-            content = self._safe_read_file(file_path)
-            if content is None:
-                continue
-
+        for doc in self.corpus.docs("README.md", "CLAUDE.md", "CHANGELOG.md"):
             # Find all version references
-            for match in version_pattern.finditer(content):
+            for match in version_pattern.finditer(doc.text):
                 found_version = match.group(1)
                 if found_version != current_version:
-                    # Get context (line containing the version)
-                    line_num = content[:match.start()].count('\n') + 1
-                    line_start = content.rfind('\n', 0, match.start()) + 1
-                    line_end = content.find('\n', match.end())
-                    if line_end == -1:
-                        line_end = len(content)
-                    context = content[line_start:line_end].strip()
-
                     outdated_refs.append({
-                        'file': str(file_path.relative_to(self.project_root)),
-                        'line': line_num,
+                        'file': doc.rel,
+                        'line': doc.line_number(match.start()),
                         'old_version': found_version,
                         'new_version': current_version,
-                        'context': context[:80] + '...' if len(context) > 80 else context
+                        'context': doc.context(match.start(), match.end())
                     })
 
         return DetectionResult(
@@ -203,39 +394,20 @@ class DocsDetector:
             (r'(\d+)\s+skills?', 'skills', actual_counts['skills']),
             (r'(\d+)\s+agents?', 'agents', actual_counts['agents']),
         ]
+        count_patterns = [(re.compile(p, re.IGNORECASE), t, c) for p, t, c in count_patterns]
 
-        search_files = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
-        search_files.extend([
-            self.project_root / "README.md",
-            self.project_root / "CLAUDE.md"
-        ])
-
-        for file_path in search_files:
-            if not file_path.exists():
-                continue
-
-            content = self._safe_read_file(file_path)
-            if content is None:
-                continue
-
+        for doc in self.corpus.docs("README.md", "CLAUDE.md"):
             for pattern, element_type, actual_count in count_patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
+                for match in pattern.finditer(doc.text):
                     found_count = int(match.group(1))
                     if found_count != actual_count:
-                        line_num = content[:match.start()].count('\n') + 1
-                        line_start = content.rfind('\n', 0, match.start()) + 1
-                        line_end = content.find('\n', match.end())
-                        if line_end == -1:
-                            line_end = len(content)
-                        context = content[line_start:line_end].strip()
-
                         outdated_counts.append({
-                            'file': str(file_path.relative_to(self.project_root)),
-                            'line': line_num,
+                            'file': doc.rel,
+                            'line': doc.line_number(match.start()),
                             'element_type': element_type,
                             'old_count': found_count,
                             'new_count': actual_count,
-                            'context': context[:80] + '...' if len(context) > 80 else context
+                            'context': doc.context(match.start(), match.end())
                         })
 
         return DetectionResult(
@@ -252,7 +424,7 @@ class DocsDetector:
 
         # Count commands (all .md files in commands/ directory)
         if self.commands_dir.exists():
-            counts['commands'] = len(list(self.commands_dir.rglob("*.md")))
+            counts['commands'] = len(self.corpus.command_paths())
 
         # Count skills (check skills/ directory)
         skills_dir = self.project_root / "skills"
@@ -270,15 +442,30 @@ class DocsDetector:
         """
         Detect broken internal links
 
-        Note: This is a placeholder - actual implementation should use
-        /craft:docs:check-links or markdown-link-check
+        Checks every relative link and ``#anchor`` in the docs pages and
+        README.md against the existing files and heading anchors (see
+        utils/link_checker.py). Links listed in .linkcheck-ignore are counted
+        in the details but not reported. Items carry ``old_link`` and, when
+        the fix is unambiguous, ``new_link`` for the orchestrator's auto-fix.
         """
-        # Placeholder - would normally integrate with linkcheck tool
+        corpus = self.corpus
+        checker = LinkChecker(self.project_root, reader=corpus.text)
+
+        broken_links = []
+        ignored = 0
+        for doc in corpus.docs("README.md"):
+            for broken in checker.check_text(doc.path, doc.text, line_of=doc.line_number):
+                if broken.ignored:
+                    ignored += 1
+                else:
+                    broken_links.append(broken.to_item())
+
         return DetectionResult(
             "Broken Links",
-            False,
-            0,
-            details="Use /craft:docs:check-links for link validation"
+            len(broken_links) > 0,
+            len(broken_links),
+            broken_links,
+            f"Found {len(broken_links)} broken internal links ({ignored} ignored via .linkcheck-ignore)"
         )
 
     def detect_stale_examples(self) -> DetectionResult:
@@ -298,22 +485,18 @@ class DocsDetector:
             (r'/craft:docs:generate', 'Old command (use /craft:docs:update --force)'),
             (r'--mode\s+default', 'Old flag syntax (use --orch=default)'),
         ]
+        compiled = [(re.compile(p), p, reason) for p, reason in stale_patterns]
+        any_stale = re.compile('|'.join(p for p, _ in stale_patterns))
 
-        search_files = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
-
-        for file_path in search_files:
-            if not file_path.exists():
-                continue
-
-            content = self._safe_read_file(file_path)
-            if content is None:
+        for doc in self.corpus.docs():
+            if '```' not in doc.text or not any_stale.search(doc.text):
                 continue
 
             # Check if file contains code blocks
             in_code_block = False
             code_block_start = 0
 
-            for i, line in enumerate(content.split('\n'), 1):
+            for i, line in enumerate(doc.lines, 1):
                 if line.startswith('```'):
                     if in_code_block:
                         # End of code block
@@ -324,10 +507,10 @@ class DocsDetector:
                         code_block_start = i
 
                 if in_code_block:
-                    for pattern, reason in stale_patterns:
-                        if re.search(pattern, line):
+                    for regex, pattern, reason in compiled:
+                        if regex.search(line):
                             stale_examples.append({
-                                'file': str(file_path.relative_to(self.project_root)),
+                                'file': doc.rel,
                                 'line': i,
                                 'pattern': pattern,
                                 'reason': reason,
@@ -356,23 +539,23 @@ class DocsDetector:
         missing_help = []
 
         if self.commands_dir.exists():
-            for cmd_file in self.commands_dir.rglob("*.md"):
-                content = self._safe_read_file(cmd_file)
-                if content is None:
+            for cmd_file in self.corpus.command_paths():
+                # Only the frontmatter block is read, never the body
+                try:
+                    fm = read_frontmatter(cmd_file)
+                except (UnicodeDecodeError, OSError):
                     continue
 
                 # Check for YAML frontmatter
-                if not content.startswith('---'):
+                if not fm.present:
                     missing_help.append({
                         'file': str(cmd_file.relative_to(self.project_root)),
                         'issue': 'No YAML frontmatter',
                         'severity': 'high'
                     })
                 else:
-                    # Extract frontmatter
                     try:
-                        _, frontmatter, _ = content.split('---', 2)
-                        data = yaml.safe_load(frontmatter)
+                        data = fm.yaml()
 
                         if not data or 'description' not in data:
                             missing_help.append({
@@ -406,43 +589,32 @@ class DocsDetector:
         """
         outdated_status = []
 
-        # Search for status markers
+        # Search for status markers (whole words)
         status_patterns = [
-            (r'\bWIP\b', 'Work In Progress marker'),
-            (r'\bIn Progress\b', 'In Progress marker'),
-            (r'\bDraft\b', 'Draft status'),
-            (r'\bPlanned\b', 'Planned status'),
+            ('WIP', 'Work In Progress marker'),
+            ('In Progress', 'In Progress marker'),
+            ('Draft', 'Draft status'),
+            ('Planned', 'Planned status'),
         ]
+        # The leading character class lets the scan skip ahead between
+        # candidates; a bare leading \b would be tried at every offset.
+        heads = ''.join(sorted({word[0] for word, _ in status_patterns}))
+        any_status = re.compile(
+            rf'(?=[{heads}])\b(?:' + '|'.join(f'({re.escape(w)})' for w, _ in status_patterns) + r')\b'
+        )
 
-        search_files = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
-        search_files.append(self.project_root / "CLAUDE.md")
-
-        for file_path in search_files:
-            if not file_path.exists():
-                continue
-
-            content = self._safe_read_file(file_path)
-
-
-            if content is None:
-
-
-                continue
-
-            for pattern, status_type in status_patterns:
-                for match in re.finditer(pattern, content):
-                    line_num = content[:match.start()].count('\n') + 1
-                    line_start = content.rfind('\n', 0, match.start()) + 1
-                    line_end = content.find('\n', match.end())
-                    if line_end == -1:
-                        line_end = len(content)
-                    context = content[line_start:line_end].strip()
-
+        for doc in self.corpus.docs("CLAUDE.md"):
+            # One pass over the text; hits are still reported pattern by pattern
+            by_pattern = [[] for _ in status_patterns]
+            for match in any_status.finditer(doc.text):
+                by_pattern[match.lastindex - 1].append(match)
+            for (_, status_type), matches in zip(status_patterns, by_pattern):
+                for match in matches:
                     outdated_status.append({
-                        'file': str(file_path.relative_to(self.project_root)),
-                        'line': line_num,
+                        'file': doc.rel,
+                        'line': doc.line_number(match.start()),
                         'status_type': status_type,
-                        'context': context[:80] + '...' if len(context) > 80 else context
+                        'context': doc.context(match.start(), match.end())
                     })
 
         return DetectionResult(
@@ -464,23 +636,8 @@ class DocsDetector:
         """
         inconsistencies = []
 
-        search_files = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
-        search_files.extend([
-            self.project_root / "README.md",
-            self.project_root / "CLAUDE.md"
-        ])
-
-        for file_path in search_files:
-            if not file_path.exists():
-                continue
-
-            content = self._safe_read_file(file_path)
-
-
-            if content is None:
-
-
-                continue
+        for doc in self.corpus.docs("README.md", "CLAUDE.md"):
+            content = doc.text
 
             # Check for mixed capitalization of "craft"
             lowercase_craft = len(re.findall(r'\bcraft\b', content))
@@ -492,7 +649,7 @@ class DocsDetector:
             # Only count as inconsistent if we have mixed usage outside commands
             if lowercase_craft > craft_commands and uppercase_craft > 0:
                 inconsistencies.append({
-                    'file': str(file_path.relative_to(self.project_root)),
+                    'file': doc.rel,
                     'issue': f'Mixed capitalization: {lowercase_craft} "craft", {uppercase_craft} "Craft"',
                     'type': 'capitalization'
                 })
@@ -520,14 +677,8 @@ class DocsDetector:
 
         # Check each command file for cross-references
         if self.commands_dir.exists():
-            for cmd_file in self.commands_dir.rglob("*.md"):
-                content = self._safe_read_file(cmd_file)
-
-                if content is None:
-
-                    continue
-
-                cmd_name = self._extract_command_name(cmd_file)
+            for doc in self.corpus.commands():
+                cmd_name = self.corpus.command_name(doc.path)
                 if not cmd_name:
                     continue
 
@@ -536,9 +687,9 @@ class DocsDetector:
 
                 # Check if related commands are mentioned
                 for related_cmd in related:
-                    if related_cmd not in content:
+                    if related_cmd not in doc.text:
                         missing_xrefs.append({
-                            'file': str(cmd_file.relative_to(self.project_root)),
+                            'file': doc.rel,
                             'command': cmd_name,
                             'missing_reference': related_cmd,
                             'reason': 'Related command not mentioned'
@@ -569,25 +720,15 @@ class DocsDetector:
             r'/craft:docs:generate',
         ]
 
-        search_files = list(self.docs_dir.rglob("*.md")) if self.docs_dir.exists() else []
-
-        for file_path in search_files:
-            if not file_path.exists():
-                continue
-
-            content = self._safe_read_file(file_path)
-
-
-            if content is None:
-
-
+        for doc in self.corpus.docs():
+            if '```mermaid' not in doc.text:
                 continue
 
             # Find Mermaid diagram blocks
             in_mermaid = False
             mermaid_start = 0
 
-            for i, line in enumerate(content.split('\n'), 1):
+            for i, line in enumerate(doc.lines, 1):
                 if '```mermaid' in line:
                     in_mermaid = True
                     mermaid_start = i
@@ -598,7 +739,7 @@ class DocsDetector:
                     for pattern in deprecated_patterns:
                         if re.search(pattern, line):
                             outdated_diagrams.append({
-                                'file': str(file_path.relative_to(self.project_root)),
+                                'file': doc.rel,
                                 'line': i,
                                 'diagram_start': mermaid_start,
                                 'issue': f'References removed command: {pattern}',
@@ -617,40 +758,37 @@ class DocsDetector:
         """Build map of related commands (parent/child, similar purpose)"""
         relationships = defaultdict(list)
 
+        corpus = self.corpus
+
         # Simple heuristic: commands in same directory are related
-        if self.commands_dir.exists():
-            for cmd_file in self.commands_dir.rglob("*.md"):
-                cmd_name = self._extract_command_name(cmd_file)
-                if not cmd_name:
-                    continue
+        by_dir: Dict[Path, List[Path]] = defaultdict(list)
+        for cmd_file in corpus.command_paths():
+            by_dir[cmd_file.parent].append(cmd_file)
 
-                # Add parent directory commands as related
-                parent_dir = cmd_file.parent
-                if parent_dir != self.commands_dir:
-                    for sibling in parent_dir.glob("*.md"):
-                        if sibling != cmd_file:
-                            sibling_name = self._extract_command_name(sibling)
-                            if sibling_name:
-                                relationships[cmd_name].append(sibling_name)
+        for cmd_file in corpus.command_paths():
+            cmd_name = corpus.command_name(cmd_file)
+            if not cmd_name:
+                continue
+
+            # Add parent directory commands as related
+            parent_dir = cmd_file.parent
+            if parent_dir != self.commands_dir:
+                for sibling in by_dir[parent_dir]:
+                    if sibling != cmd_file:
+                        sibling_name = corpus.command_name(sibling)
+                        if sibling_name:
+                            relationships[cmd_name].append(sibling_name)
 
         return dict(relationships)
 
     def _extract_command_name(self, cmd_file: Path) -> Optional[str]:
         """Extract command name from file path or frontmatter"""
         # Try to extract from first line (e.g., "# /craft:do - Title")
-        with open(cmd_file, encoding='utf-8') as f:
-            first_lines = f.read(500)
-
-        match = re.search(r'/craft:[^\s]+', first_lines)
-        if match:
-            return match.group(0)
-
-        return None
+        return self.corpus.command_name(cmd_file)
 
 
 def main():
     """CLI interface for docs detector"""
-    import sys
     import json
 
     project_root = sys.argv[1] if len(sys.argv) > 1 else "."
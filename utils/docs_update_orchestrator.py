@@ -66,12 +66,17 @@ class DocsUpdateOrchestrator:
         self.current_version = current_version
         self.results: List[UpdateResult] = []
 
-    def run_detection(self) -> Dict[str, Dict]:
+    def run_detection(self, parallel: bool = True, workers: Optional[int] = None) -> Dict[str, Dict]:
         """
         Run detection utilities to identify documentation issues.
 
+        Args:
+            parallel: Run the detectors concurrently (see DocsDetector.detect_all)
+            workers: Process pool size for the CPU-bound detectors
+
         Returns:
-            Dictionary of detected issues by category
+            Dictionary of detected issues by category, each with the
+            detector's ``elapsed_ms``
         """
         try:
             # Import detection utilities
@@ -82,7 +87,7 @@ class DocsUpdateOrchestrator:
             validator = HelpFileValidator(str(self.project_root))
 
             # Run comprehensive detection
-            all_results = detector.detect_all(self.current_version)
+            all_results = detector.detect_all(self.current_version, parallel=parallel, workers=workers)
 
             # Flatten to simple dict format
             detection_results = {}
@@ -93,6 +98,7 @@ class DocsUpdateOrchestrator:
                     "count": detection_result.count,
                     "items": detection_result.items,
                     "details": detection_result.details,
+                    "elapsed_ms": detection_result.elapsed_ms,
                 }
 
             # Add badge detection
@@ -382,9 +388,11 @@ class DocsUpdateOrchestrator:
                 new_link = item.get("new_link", "")
 
                 if old_link and new_link:
-                    # Escape for markdown link format
-                    pattern = re.escape(old_link)
-                    updated = re.sub(pattern, new_link, content)
+                    # Only the link target: "](old" inline or "]: old" definitions
+                    pattern = rf"(\]\(\s*<?|^[ ]{{0,3}}\[[^\]]+\]:[ \t]*<?){re.escape(old_link)}(?=>?[\s)]|$)"
+                    updated = re.sub(
+                        pattern, lambda m: m.group(1) + new_link, content, flags=re.MULTILINE
+                    )
 
                     if updated != content:
                         file_path.write_text(updated)
@@ -605,6 +613,13 @@ def main():
     )
     parser.add_argument("--version", default="v2.7.0", help="Current version")
     parser.add_argument("--project-root", default=".", help="Project root directory")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Processes for the CPU-bound detectors (1 = run detectors sequentially)"
+    )
+    parser.add_argument(
+        "--timings", action="store_true", help="Print per-detector timing"
+    )
 
     args = parser.parse_args()
 
@@ -612,7 +627,16 @@ def main():
     orchestrator = DocsUpdateOrchestrator(args.project_root, args.version)
 
     print("🔍 Detecting documentation issues...")
-    detection_results = orchestrator.run_detection()
+    detection_results = orchestrator.run_detection(
+        parallel=args.jobs != 1, workers=args.jobs
+    )
+
+    if args.timings:
+        print("\n⏱  Detection timing (slowest first)")
+        timed = [(k, r) for k, r in detection_results.items() if "elapsed_ms" in r]
+        for category, result in sorted(timed, key=lambda kv: -kv[1]["elapsed_ms"]):
+            print(f"  {category:<20} {result['elapsed_ms']:>8.1f} ms")
+        print()
 
     if not detection_results:
         print("✅ No documentation issues detected")
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Frontmatter - Single-pass YAML frontmatter reader shared across craft
+
+Every markdown surface in the plugin (commands, skills, agents, hooks) opens
+with a ``---`` fenced frontmatter block. This module is the one place that
+finds it:
+
+- ``read_frontmatter(path)`` reads a file only up to the closing fence (the
+  body is never loaded) and memoizes the result per process, keyed by
+  (path, mtime_ns, size).
+- ``split_frontmatter(text)`` does the same scan over content already in
+  memory, for callers that need the body too.
+- ``parse_fields(raw)`` is the lightweight, dependency-free parser behind
+  ``commands/_discovery.py`` (flat keys, lists, list-of-mapping items).
+- ``Frontmatter.yaml()`` is the full PyYAML parse, for validators.
+
+A fence is a line that is exactly ``---`` (trailing whitespace allowed). A file
+whose first line is not a fence, or whose block is never closed, has no
+frontmatter.
+"""
+
+import copy
+import functools
+import io
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, Union
+
+FENCE = "---"
+
+
+@dataclass(frozen=True)
+class Frontmatter:
+    """Result of scanning one document for its frontmatter block"""
+    present: bool
+    raw: str = ""          # text between the fences, without the fences
+    body_line: int = 1     # 1-based line number where the body starts
+    body_offset: int = 0   # offset of the body (for files: CRLF counted as one)
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Lightweight parse of ``raw`` (see ``parse_fields``); a fresh dict"""
+        return parse_fields(self.raw) if self.present else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Single top-level field from the lightweight parse"""
+        return self.fields.get(key, default)
+
+    def yaml(self) -> Any:
+        """
+        Full PyYAML parse of ``raw``.
+
+        Returns None when there is no frontmatter or the block is empty.
+        Raises yaml.YAMLError on malformed YAML, ImportError without PyYAML.
+        """
+        if not self.present:
+            return None
+        return copy.deepcopy(_load_yaml(self.raw))
+
+
+NO_FRONTMATTER = Frontmatter(present=False)
+
+
+def _is_fence(line: str) -> bool:
+    return line.rstrip() == FENCE
+
+
+def _scan(readline: Callable[[], str]) -> Frontmatter:
+    """Consume lines up to and including the closing fence; never further."""
+    first = readline()
+    if not first or not _is_fence(first):
+        return NO_FRONTMATTER
+    offset = len(first)
+    lines = []
+    while True:
+        line = readline()
+        if not line:
+            return NO_FRONTMATTER  # unterminated block
+        offset += len(line)
+        if _is_fence(line):
+            break
+        lines.append(line)
+    raw = "".join(lines)
+    if raw.endswith("\n"):
+        raw = raw[:-1]
+    return Frontmatter(
+        present=True,
+        raw=raw,
+        body_line=len(lines) + 3,
+        body_offset=offset,
+    )
+
+
+def split_frontmatter(text: str) -> Frontmatter:
+    """Scan in-memory content; ``text[result.body_offset:]`` is the body."""
+    if not text.startswith(FENCE):
+        return NO_FRONTMATTER
+    return _scan(io.StringIO(text, newline="").readline)
+
+
+def strip_frontmatter(text: str) -> str:
+    """Content with its frontmatter block (if any) removed"""
+    return text[split_frontmatter(text).body_offset:]
+
+
+# (resolved path, errors) -> ((mtime_ns, size), Frontmatter)
+_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Frontmatter]] = {}
+
+
+def read_frontmatter(path: Union[str, Path], errors: str = "strict") -> Frontmatter:
+    """
+    Read a file's frontmatter without reading its body.
+
+    Memoized per process by (path, mtime_ns, size): an unchanged file is
+    answered from memory after a single stat.
+
+    Args:
+        path: Markdown file
+        errors: Decoding error handler for each line ("strict",
+            "replace", ...)
+
+    Raises:
+        OSError: File cannot be stat'ed or opened
+        UnicodeDecodeError: Undecodable frontmatter with errors="strict"
+    """
+    key = (os.path.abspath(path), errors)
+    st = os.stat(key[0])
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    # Binary + per-line decode: a text-mode reader would decode a whole
+    # buffer, body included.
+    with open(key[0], "rb") as f:
+        result = _scan(lambda: _decode_line(f.readline(), errors))
+    _CACHE[key] = (stamp, result)
+    return result
+
+
+def _decode_line(line: bytes, errors: str) -> str:
+    text = line.decode("utf-8", errors)
+    if text.endswith("\r\n"):
+        text = text[:-2] + "\n"
+    return text
+
+
+def clear_cache() -> None:
+    """Forget every memoized read (and parsed YAML block)"""
+    _CACHE.clear()
+    _load_yaml.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_yaml(raw: str) -> Any:
+    import yaml
+    return yaml.safe_load(raw)
+
+
+def parse_fields(raw: str) -> Dict[str, Any]:
+    """
+    Dependency-free parse of a frontmatter block.
+
+    Supports:
+    - Simple key: value pairs
+    - Arrays with - items (at any indent level)
+    - Nested objects in arrays (for arguments)
+
+    Args:
+        raw: Text between the fences
+
+    Returns:
+        Dictionary of frontmatter fields
+    """
+    metadata = {}
+
+    current_key = None
+    current_array = []
+    current_obj = {}
+    in_array = False
+    in_nested_obj = False
+    array_item_indent = None  # Track indent level of array items
+
+    for line in raw.split('\n'):
+        line = line.rstrip()
+
+        # Skip empty lines
+        if not line:
+            continue
+
+        # Determine indentation level
+        indent = len(line) - len(line.lstrip())
+        stripped = line.lstrip()
+
+        # Top-level key-value pair (indent=0)
+        if indent == 0 and ':' in stripped and not stripped.startswith('-'):
+            # Save previous array if exists
+            if in_array and current_key:
+                # Save last nested object if exists
+                if in_nested_obj and current_obj:
+                    current_array.append(current_obj)
+                    current_obj = {}
+
+                metadata[current_key] = current_array
+                current_array = []
+                in_array = False
+                in_nested_obj = False
+                array_item_indent = None
+
+            # Parse new key-value
+            key, value = stripped.split(':', 1)
+            key = key.strip()
+            value = value.strip()
+
+            if value:
+                # Simple value
+                metadata[key] = value
+                current_key = key
+            else:
+                # Array follows
+                current_key = key
+                in_array = True
+                current_array = []
+
+        # Array item (starts with - at some indent level)
+        elif in_array and stripped.startswith('-'):
+            # Save previous nested object if exists
+            if in_nested_obj and current_obj:
+                current_array.append(current_obj)
+                current_obj = {}
+                in_nested_obj = False
+
+            # Track array item indent level
+            if array_item_indent is None:
+                array_item_indent = indent
+
+            # Parse array item
+            item_content = stripped[1:].strip()  # Remove '-' and whitespace
+
+            if ':' in item_content:
+                # Array item with inline key:value (e.g., "- name: mode")
+                # Start a new nested object
+                in_nested_obj = True
+                key, value = item_content.split(':', 1)
+                key = key.strip()
+                value = value.strip()
+                current_obj = {key: value}
+            else:
+                # Simple array item
+                current_array.append(item_content)
+
+        # Nested object field (more indented than array item)
+        elif in_array and in_nested_obj and indent > array_item_indent and ':' in stripped:
+            # Parse key-value for nested object
+            key, value = stripped.split(':', 1)
+            key = key.strip()
+            value = value.strip()
+            current_obj[key] = value
+
+    # Save final array if exists
+    if in_array and current_key:
+        # Save last nested object if exists
+        if in_nested_obj and current_obj:
+            current_array.append(current_obj)
+
+        metadata[current_key] = current_array
+
+    return metadata
@@ -15,12 +15,21 @@ Validates 8 issue types:
 
 import re
 import os
+import sys
 import yaml
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Import through the plugin root so a bare ``frontmatter`` can never resolve to
+# the PyPI python-frontmatter package when this file runs as a script.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from utils.frontmatter import split_frontmatter  # noqa: E402
+
 
 class IssueType(Enum):
     """Types of help file issues"""
@@ -144,7 +153,8 @@ class HelpFileValidator:
         expected_category = self._get_expected_category(cmd_file)
 
         # Check for YAML frontmatter
-        if not content.startswith('---'):
+        fm = split_frontmatter(content)
+        if not fm.present:
             return CommandHelp(
                 file_path=cmd_file,
                 has_frontmatter=False,
@@ -154,16 +164,7 @@ class HelpFileValidator:
 
         # Parse frontmatter
         try:
-            parts = content.split('---', 2)
-            if len(parts) < 3:
-                return CommandHelp(
-                    file_path=cmd_file,
-                    has_frontmatter=False,
-                    command_name=command_name,
-                    category=expected_category
-                )
-
-            frontmatter = yaml.safe_load(parts[1])
+            frontmatter = fm.yaml()
             if not frontmatter:
                 # Empty frontmatter (---\n---) is treated as incomplete, not missing
                 return CommandHelp(
@@ -423,7 +424,6 @@ class HelpFileValidator:
 
 def main():
     """CLI interface for help file validator"""
-    import sys
     import json
 
     project_root = sys.argv[1] if len(sys.argv) > 1 else "."
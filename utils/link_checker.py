@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Link Checker - Offline validation of internal markdown links and anchors
+
+Checks every relative link (``[text](path)``, ``![alt](img)``, reference
+definitions ``[id]: path``) and every ``#anchor`` without a network or an
+external tool:
+
+- ``LinkIndex`` is built once: the set of files and directories under
+  ``docs/`` plus, per page, the set of heading anchors, slugified the way
+  mkdocs' ``toc`` extension does (duplicates get ``_1``, ``_2``...; explicit
+  ``{#id}`` attributes and HTML ``id``/``name`` attributes count too).
+- ``LinkChecker.check_text`` then resolves each link against those sets; a
+  file or anchor check is a set lookup. Files outside ``docs/`` (README.md,
+  CLAUDE.md) fall back to a memoized ``os.path.exists``.
+
+Links inside fenced code blocks and inline code spans are not links. Known
+broken links listed in ``.linkcheck-ignore`` are reported with their ignore
+category instead of as failures. A broken link whose fix is unambiguous (the
+file exists elsewhere under a unique name, or the anchor only differs by
+slugification) carries a ``suggestion``, which the docs orchestrator applies.
+
+Usage:
+    checker = LinkChecker(project_root)
+    broken = checker.check_text(path, text)        # List[BrokenLink]
+    report = checker.check_docs()                  # every docs page
+"""
+
+import difflib
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+try:
+    from .linkcheck_ignore_parser import IgnoreRules, parse_linkcheck_ignore
+except ImportError:
+    from linkcheck_ignore_parser import IgnoreRules, parse_linkcheck_ignore
+
+
+MISSING_FILE = "missing file"
+MISSING_ANCHOR = "missing anchor"
+
+# [text](target "title") -- one level of nested brackets, so a linked badge
+# [![alt](img)](target) yields the outer target (the image is scanned from
+# the text group).
+_INLINE_LINK = re.compile(
+    r'!?\[((?:[^\[\]]|\[[^\[\]]*\])*)\]\(\s*(<[^>]*>|[^)\s]*)(?:\s+(?:"[^"]*"|\'[^\']*\'|\([^)]*\)))?\s*\)'
+)
+_REF_DEF = re.compile(r'^[ ]{0,3}\[[^\]]+\]:[ \t]*(<[^>]*>|\S+)', re.MULTILINE)
+_FENCE = re.compile(r'^[ \t]*(`{3,}|~{3,})(.*)$', re.MULTILINE)
+_CODE_SPAN = re.compile(r'(`+)(?!`).*?(?<!`)\1(?!`)')
+_HEADING = re.compile(r'^[ ]{0,3}(#{1,6})[ \t]+(.*?)[ \t]*$')
+_ATTR_ID = re.compile(r'\{:?[^}]*#([\w-]+)[^}]*\}\s*$')
+_HTML_ID = re.compile(r'<[a-zA-Z][^>]*?\s(?:id|name)\s*=\s*["\']([^"\']+)["\']')
+_SCHEME = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+_INLINE_MARKUP = re.compile(r'!?\[([^\]]*)\]\([^)]*\)|<[^>]+>|[`*]|~~')
+_NON_WORD = re.compile(r'[^\w\s-]')
+_SEPARATORS = re.compile(r'[-\s]+')
+_CLOSING_HASHES = re.compile(r'[ \t]+#+$')
+
+
+def slugify(text: str) -> str:
+    """Heading text -> anchor id, as python-markdown's toc ``slugify``"""
+    value = _INLINE_MARKUP.sub(lambda m: m.group(1) or '', text)
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+    value = _NON_WORD.sub('', value).strip().lower()
+    return _SEPARATORS.sub('-', value)
+
+
+def _blank(segment: str) -> str:
+    return '\n'.join(' ' * len(line) for line in segment.split('\n'))
+
+
+def _blank_spans(segment: str) -> str:
+    if '`' not in segment:
+        return segment
+    return _CODE_SPAN.sub(lambda m: ' ' * len(m.group(0)), segment)
+
+
+def _mask_code(text: str) -> str:
+    """``text`` with fenced blocks and code spans blanked (offsets and newlines kept)"""
+    if '`' not in text and '~~~' not in text:
+        return text
+    parts = []
+    pos = 0
+    fence = None
+    for m in _FENCE.finditer(text):
+        marker = m.group(1)
+        if fence is None:
+            parts.append(_blank_spans(text[pos:m.start()]))
+            fence, pos = marker, m.start()
+        # A closing fence is bare: "```text" inside a block is content
+        elif marker[0] == fence[0] and len(marker) >= len(fence) and not m.group(2).strip():
+            parts.append(_blank(text[pos:m.end()]))
+            fence, pos = None, m.end()
+    tail = text[pos:]
+    parts.append(_blank_spans(tail) if fence is None else _blank(tail))
+    return ''.join(parts)
+
+
+def heading_anchors(text: str) -> Set[str]:
+    """Every anchor id a page defines (headings, ``{#id}``, HTML id/name)"""
+    anchors: Set[str] = set()
+    counts: Dict[str, int] = {}
+    masked = _mask_code(_strip_frontmatter(text))
+    for line in masked.split('\n'):
+        m = _HEADING.match(line)
+        if m:
+            title = _CLOSING_HASHES.sub('', m.group(2))
+            explicit = _ATTR_ID.search(title)
+            if explicit:
+                anchors.add(explicit.group(1))
+                continue
+            slug = slugify(title) or '_'
+            n = counts.get(slug, 0)
+            counts[slug] = n + 1
+            anchors.add(slug if n == 0 else f"{slug}_{n}")
+        if '<' in line:
+            anchors.update(_HTML_ID.findall(line))
+    return anchors
+
+
+def _strip_frontmatter(text: str) -> str:
+    """Blank a leading ``---`` block so its lines are not read as headings"""
+    if not text.startswith('---'):
+        return text
+    end = text.find('\n---', 3)
+    if end == -1:
+        return text
+    return '\n' * text.count('\n', 0, end + 4) + text[end + 4:]
+
+
+def iter_links(text: str) -> Iterable[Tuple[int, str]]:
+    """(offset, target) for every link outside code, in document order"""
+    if '](' not in text and ']:' not in text:
+        return
+    masked = _mask_code(text)
+    found = []
+    for m in _INLINE_LINK.finditer(masked):
+        found.append((m.start(2), m.group(2)))
+        inner = m.group(1)
+        if '](' in inner:
+            base = m.start(1)
+            found.extend((base + n.start(2), n.group(2)) for n in _INLINE_LINK.finditer(inner))
+    found.extend((m.start(1), m.group(1)) for m in _REF_DEF.finditer(masked))
+    found.sort()
+    for offset, target in found:
+        yield offset, target.strip('<>')
+
+
+@dataclass
+class BrokenLink:
+    """An internal link whose file or anchor does not exist"""
+    file: str                          # source, relative to the project root
+    line: int                          # 1-indexed
+    link: str                          # target exactly as written
+    reason: str                        # MISSING_FILE or MISSING_ANCHOR
+    suggestion: Optional[str] = None   # replacement target when unambiguous
+    ignored: Optional[str] = None      # .linkcheck-ignore category, if listed
+
+    def to_item(self) -> Dict[str, str]:
+        """DetectionResult item; ``old_link``/``new_link`` drive the auto-fix"""
+        item = {
+            'file': self.file,
+            'line': self.line,
+            'link': self.link,
+            'reason': self.reason,
+            'old_link': self.link,
+            'context': f"{self.reason}: {self.link}",
+        }
+        if self.suggestion:
+            item['new_link'] = self.suggestion
+        return item
+
+
+class LinkIndex:
+    """Existing paths under ``docs/`` and the anchors of each markdown page"""
+
+    def __init__(self, docs_dir: Path, reader: Callable[[Path], Optional[str]]):
+        self.docs_dir = docs_dir
+        self._reader = reader
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = set()
+        self.by_name: Dict[str, List[str]] = {}
+        self._anchors: Dict[str, Optional[Set[str]]] = {}
+
+        root = str(docs_dir)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            self.dirs.add(dirpath)
+            for name in filenames:
+                full = os.path.join(dirpath, name)
+                self.files.add(full)
+                self.by_name.setdefault(name, []).append(full)
+
+    def contains(self, path: str) -> bool:
+        return path.startswith(str(self.docs_dir) + os.sep) or path == str(self.docs_dir)
+
+    def anchors(self, path: str) -> Optional[Set[str]]:
+        """Anchor ids of the markdown page at absolute ``path`` (None if unreadable)"""
+        if path not in self._anchors:
+            text = self._reader(Path(path))
+            self._anchors[path] = heading_anchors(text) if text is not None else None
+        return self._anchors[path]
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding='utf-8')
+    except (UnicodeDecodeError, OSError):
+        return None
+
+
+class LinkChecker:
+    """Resolve internal links against a `LinkIndex` built once per checker"""
+
+    def __init__(self, project_root, reader: Callable[[Path], Optional[str]] = None,
+                 ignore_rules: Optional[IgnoreRules] = None):
+        """
+        Args:
+            project_root: Project root (``docs/`` and ``.linkcheck-ignore`` live here)
+            reader: Returns a file's text or None; lets a caller share an
+                already-loaded corpus (default: read from disk)
+            ignore_rules: Parsed ignore rules (default: ``.linkcheck-ignore``)
+        """
+        self.project_root = Path(os.path.abspath(project_root))
+        self.docs_dir = self.project_root / "docs"
+        self._reader = reader or _read
+        if ignore_rules is None:
+            ignore_rules = parse_linkcheck_ignore(str(self.project_root / ".linkcheck-ignore"))
+        self.ignore_rules = ignore_rules
+        self._index: Optional[LinkIndex] = None
+        self._exists: Dict[str, bool] = {}
+        self._outside_anchors: Dict[str, Optional[Set[str]]] = {}
+        # (source dir, or source for "#anchor" links; target) -> check_link result
+        self._verdicts: Dict[Tuple[str, str], Optional[Tuple[str, Optional[str]]]] = {}
+
+    @property
+    def index(self) -> LinkIndex:
+        if self._index is None:
+            self._index = LinkIndex(self.docs_dir, self._reader)
+        return self._index
+
+    # -- resolution ---------------------------------------------------------
+    def _is_file(self, path: str) -> bool:
+        if self.index.contains(path):
+            return path in self.index.files
+        if path not in self._exists:
+            self._exists[path] = os.path.isfile(path)
+        return self._exists[path]
+
+    def _is_dir(self, path: str) -> bool:
+        if self.index.contains(path):
+            return path in self.index.dirs
+        return os.path.isdir(path)
+
+    def _anchors_of(self, path: str) -> Optional[Set[str]]:
+        if self.index.contains(path):
+            return self.index.anchors(path)
+        if path not in self._outside_anchors:
+            text = self._reader(Path(path))
+            self._outside_anchors[path] = heading_anchors(text) if text is not None else None
+        return self._outside_anchors[path]
+
+    def _resolve(self, source: Path, target: str) -> str:
+        """Absolute, normalized path of a link target written in ``source``"""
+        if target.startswith('/'):
+            in_docs = self.index.contains(str(source))
+            base = self.docs_dir if in_docs else self.project_root
+            return os.path.normpath(os.path.join(str(base), target.lstrip('/')))
+        return os.path.normpath(os.path.join(str(source.parent), target))
+
+    def _suggest_file(self, source: Path, path: str, anchor: str) -> Optional[str]:
+        candidates = self.index.by_name.get(os.path.basename(path.rstrip(os.sep)), [])
+        if len(candidates) != 1:
+            return None
+        rel = os.path.relpath(candidates[0], str(source.parent)).replace(os.sep, '/')
+        return rel + (f"#{anchor}" if anchor else '')
+
+    @staticmethod
+    def _suggest_anchor(anchor: str, anchors: Set[str]) -> Optional[str]:
+        slug = slugify(anchor.replace('-', ' '))
+        if slug in anchors:
+            return slug
+        close = difflib.get_close_matches(anchor.lower(), anchors, n=2, cutoff=0.85)
+        return close[0] if len(close) == 1 else None
+
+    def check_link(self, source: Path, target: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Check one link written in ``source``.
+
+        Returns:
+            None when it resolves (or is external/templated), else
+            ``(reason, suggested replacement or None)``
+        """
+        src = str(source)
+        key = (src if target.startswith('#') else os.path.dirname(src), target)
+        if key not in self._verdicts:
+            self._verdicts[key] = self._check_link(source, target)
+        return self._verdicts[key]
+
+    def _check_link(self, source: Path, target: str) -> Optional[Tuple[str, Optional[str]]]:
+        if not target or _SCHEME.match(target) or ('{' in target and '}' in target):
+            return None
+        path_part, _, anchor = target.partition('#')
+        path_part = unquote(path_part.split('?', 1)[0])
+        if not path_part:
+            page = str(source)
+        else:
+            page = self._resolve(source, path_part)
+            if not self._is_file(page):
+                if self._is_dir(page) or (path_part.endswith('/') and self._is_file(page + '.md')):
+                    return None  # directory or site-style page URL
+                prefix = target[:len(target) - len(anchor) - 1] if anchor else target
+                suggestion = self._suggest_file(source, page, anchor)
+                return MISSING_FILE, (suggestion if suggestion != prefix else None)
+        if not anchor or not page.endswith('.md'):
+            return None
+        anchors = self._anchors_of(page)
+        if anchors is None or anchor in anchors:
+            return None
+        fixed = self._suggest_anchor(anchor, anchors)
+        return MISSING_ANCHOR, (f"{target[:len(target) - len(anchor)]}{fixed}" if fixed else None)
+
+    # -- documents ------------------------------------------------------------
+    def check_text(self, source, text: str, line_of: Callable[[int], int] = None,
+                   anchors: bool = True) -> List[BrokenLink]:
+        """
+        Every broken link in ``text`` (the content of ``source``).
+
+        Args:
+            source: Path of the document (links resolve relative to it)
+            text: Its content
+            line_of: Offset -> 1-based line (default: counts newlines)
+            anchors: Also check ``#anchor`` fragments
+        """
+        source = Path(os.path.abspath(source))
+        try:
+            rel = source.relative_to(self.project_root).as_posix()
+        except ValueError:
+            rel = str(source)
+        if line_of is None:
+            line_of = lambda offset: text.count('\n', 0, offset) + 1  # noqa: E731
+
+        broken = []
+        for offset, target in iter_links(text):
+            problem = self.check_link(source, target if anchors else target.partition('#')[0])
+            if problem is None:
+                continue
+            reason, suggestion = problem
+            ignored, category = self.ignore_rules.should_ignore(rel, target)
+            broken.append(BrokenLink(
+                file=rel,
+                line=line_of(offset),
+                link=target,
+                reason=reason,
+                suggestion=suggestion,
+                ignored=category if ignored else None,
+            ))
+        return broken
+
+    def check_file(self, path, anchors: bool = True) -> List[BrokenLink]:
+        """``check_text`` over a file read through the checker's reader"""
+        text = self._reader(Path(path))
+        return [] if text is None else self.check_text(path, text, anchors=anchors)
+
+    def check_docs(self, extra: Iterable[str] = ("README.md",)) -> List[BrokenLink]:
+        """Every docs page plus ``extra`` root files"""
+        paths = sorted(p for p in self.index.files if p.endswith('.md'))
+        paths += [str(self.project_root / name) for name in extra]
+        broken: List[BrokenLink] = []
+        for p in paths:
+            broken.extend(self.check_file(p))
+        return broken
+
+
+def main():
+    """CLI: python3 utils/link_checker.py [project_root]"""
+    import sys
+
+    checker = LinkChecker(sys.argv[1] if len(sys.argv) > 1 else ".")
+    broken = checker.check_docs()
+    critical = [b for b in broken if not b.ignored]
+    for b in broken:
+        tag = f"ignored: {b.ignored}" if b.ignored else b.reason
+        fix = f" -> {b.suggestion}" if b.suggestion else ""
+        print(f"{b.file}:{b.line}: {b.link} ({tag}){fix}")
+    print(f"\n{len(critical)} broken, {len(broken) - len(critical)} ignored")
+    return 1 if critical else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Search Index - Inverted index for hub command/skill lookup
+
+Built once per discovery-cache write (``commands/_discovery.py`` stores it in
+the compact ``commands/_search.json`` sidecar next to ``_cache.json``, read
+only when searching) and queried in memory:
+
+- name trie: full names and every ``:``-suffix (``code:lint`` and ``lint``),
+  walked for exact, prefix and typo-tolerant (edit distance) matches
+- tag map: tag -> document ids
+- token map: token -> {document id: TF-IDF weight} over name, category,
+  tags and description, plus a vocabulary trie for misspelled words
+- category map: command category -> command ids
+
+Documents are the cache's ``commands`` followed by its ``skills``; an id is a
+position in that concatenation, so the index never duplicates a record.
+Everything is plain dicts/lists so it round-trips through JSON unchanged.
+"""
+
+import math
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SEARCH_VERSION = 1
+
+# Trie terminal key; never a character of a command name or token
+END = "$"
+
+# Score tiers: a name hit always outranks a description-only hit
+EXACT_SCORE = 4.0
+PREFIX_SCORE = 2.0
+FUZZY_SCORE = 1.5
+TAG_SCORE = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how i in into is it of on or the this "
+    "to use with what when you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, stopwords dropped, trailing plural 's' stemmed"""
+    tokens = []
+    for tok in _TOKEN_RE.findall(text.lower()):
+        if len(tok) < 2 or tok in _STOPWORDS:
+            continue
+        if len(tok) > 3 and tok.endswith("s") and not tok.endswith("ss"):
+            tok = tok[:-1]
+        tokens.append(tok)
+    return tokens
+
+
+def _name_keys(name: str) -> List[str]:
+    """``a:b:c`` -> ``["a:b:c", "b:c", "c"]``"""
+    parts = name.lower().split(":")
+    return [":".join(parts[i:]) for i in range(len(parts))]
+
+
+def _trie_insert(trie: dict, key: str, doc_id: Optional[int] = None) -> None:
+    node = trie
+    for ch in key:
+        node = node.setdefault(ch, {})
+    if doc_id is None:
+        node[END] = []
+    else:
+        ids = node.setdefault(END, [])
+        if doc_id not in ids:
+            ids.append(doc_id)
+
+
+def _trie_find(trie: dict, key: str) -> Optional[dict]:
+    node = trie
+    for ch in key:
+        node = node.get(ch)
+        if node is None:
+            return None
+    return node
+
+
+def _trie_items(node: dict, prefix: str) -> Iterator[Tuple[str, list]]:
+    """Every (key, payload) at or below ``node``"""
+    stack = [(node, prefix)]
+    while stack:
+        node, key = stack.pop()
+        for ch, child in node.items():
+            if ch == END:
+                yield key, child
+            else:
+                stack.append((child, key + ch))
+
+
+def _trie_fuzzy(trie: dict, word: str, max_dist: int) -> Iterator[Tuple[str, int, list]]:
+    """
+    Keys within ``max_dist`` edits of ``word``.
+
+    Levenshtein rows are carried down the trie, only the diagonal band
+    ``|i - depth| <= max_dist`` is computed, and a branch is abandoned as soon
+    as every cell of its row exceeds the bound.
+    """
+    n = len(word)
+    over = max_dist + 1
+    stack = [(trie, "", list(range(n + 1)))]
+    while stack:
+        node, key, row = stack.pop()
+        if END in node and row[n] <= max_dist:
+            yield key, row[n], node[END]
+        depth = len(key) + 1
+        if depth > n + max_dist:
+            continue
+        lo = max(1, depth - max_dist)
+        hi = min(n, depth + max_dist)
+        for ch, child in node.items():
+            if ch == END:
+                continue
+            cur = [over] * (n + 1)
+            cur[0] = depth if depth <= max_dist else over
+            best = cur[0]
+            for i in range(lo, hi + 1):
+                cost = row[i - 1] + (word[i - 1] != ch)
+                if row[i] + 1 < cost:
+                    cost = row[i] + 1
+                if cur[i - 1] + 1 < cost:
+                    cost = cur[i - 1] + 1
+                if cost > over:
+                    cost = over
+                cur[i] = cost
+                if cost < best:
+                    best = cost
+            if best <= max_dist:
+                stack.append((child, key + ch, cur))
+
+
+def _trie_near(trie: dict, word: str, max_dist: int) -> Iterator[Tuple[str, int, list]]:
+    """
+    ``_trie_fuzzy`` anchored on the first character.
+
+    Typos rarely hit the first letter, and fixing it cuts the walk to one
+    top-level branch of the trie.
+    """
+    if not word or word[0] not in trie:
+        return iter(())
+    head = word[0]
+    return (
+        (head + key, dist, payload)
+        for key, dist, payload in _trie_fuzzy(trie[head], word[1:], max_dist)
+    )
+
+
+def _max_edits(word: str) -> int:
+    if len(word) <= 2:
+        return 0
+    return 1 if len(word) <= 7 else 2
+
+
+def build_search_index(commands: List[dict], skills: List[dict]) -> Dict[str, Any]:
+    """
+    Build the JSON-serializable index for ``commands + skills``.
+
+    Args:
+        commands: Command records (as stored in ``_cache.json``)
+        skills: Skill records
+
+    Returns:
+        Index dictionary (see module docstring)
+    """
+    docs = list(commands) + list(skills)
+    names: Dict[str, List[int]] = {}
+    name_trie: dict = {}
+    tags: Dict[str, List[int]] = {}
+    categories: Dict[str, List[int]] = {}
+    counts: List[Dict[str, int]] = []
+
+    for doc_id, doc in enumerate(docs):
+        name = str(doc.get("name", ""))
+        names.setdefault(name, []).append(doc_id)
+        for key in _name_keys(name):
+            _trie_insert(name_trie, key, doc_id)
+
+        # Flow-style `tags: [a, b]` reaches the flat parser as "[a" / "b]"
+        doc_tags = [str(t).strip("[]'\" ").lower() for t in doc.get("tags") or []]
+        doc_tags = [t for t in doc_tags if t]
+        for tag in doc_tags:
+            ids = tags.setdefault(tag, [])
+            if doc_id not in ids:
+                ids.append(doc_id)
+        if doc_id < len(commands):
+            categories.setdefault(doc.get("category", ""), []).append(doc_id)
+
+        # Name and tag tokens count double: they are what users type.
+        tf: Dict[str, int] = {}
+        weighted = tokenize(name.replace(":", " ")) * 2 + tokenize(" ".join(doc_tags)) * 2
+        weighted += tokenize(str(doc.get("category", "")))
+        weighted += tokenize(str(doc.get("description", "")))
+        for tok in weighted:
+            tf[tok] = tf.get(tok, 0) + 1
+        counts.append(tf)
+
+    df: Dict[str, int] = {}
+    for tf in counts:
+        for tok in tf:
+            df[tok] = df.get(tok, 0) + 1
+
+    n = len(docs)
+    tokens: Dict[str, Dict[str, float]] = {}
+    vocab_trie: dict = {}
+    for doc_id, tf in enumerate(counts):
+        vec = {
+            tok: (1.0 + math.log(c)) * (math.log((1 + n) / (1 + df[tok])) + 1.0)
+            for tok, c in tf.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vec.values())) or 1.0
+        for tok, w in vec.items():
+            tokens.setdefault(tok, {})[str(doc_id)] = round(w / norm, 4)
+    for tok in tokens:
+        _trie_insert(vocab_trie, tok)
+
+    return {
+        "version": SEARCH_VERSION,
+        "n_commands": len(commands),
+        "names": names,
+        "name_trie": name_trie,
+        "tags": tags,
+        "tokens": tokens,
+        "vocab_trie": vocab_trie,
+        "categories": categories,
+    }
+
+
+class SearchIndex:
+    """Query side of the index over the records it was built from"""
+
+    def __init__(self, index: Dict[str, Any], commands: List[dict], skills: List[dict]):
+        self.index = index
+        self.commands = commands
+        self.skills = skills
+        self.n_commands = index["n_commands"]
+
+    def doc(self, doc_id: int) -> dict:
+        if doc_id < self.n_commands:
+            return self.commands[doc_id]
+        return self.skills[doc_id - self.n_commands]
+
+    def kind(self, doc_id: int) -> str:
+        return "command" if doc_id < self.n_commands else "skill"
+
+    def command(self, name: str) -> Optional[dict]:
+        """
+        Command by full name, or by its last segment when that is unambiguous.
+
+        ``lint`` resolves to ``code:lint`` only if no other command ends in
+        ``:lint``; otherwise None (the caller should disambiguate).
+        """
+        for doc_id in self.index["names"].get(name, []):
+            if doc_id < self.n_commands:
+                return self.commands[doc_id]
+        if ":" in name:
+            return None
+        node = _trie_find(self.index["name_trie"], name.lower())
+        if node is None:
+            return None
+        matches = [
+            i for i in node.get(END, [])
+            if i < self.n_commands and self.commands[i]["name"].lower().endswith(":" + name.lower())
+        ]
+        return self.commands[matches[0]] if len(matches) == 1 else None
+
+    def category(self, category: str) -> List[dict]:
+        """Commands in ``category``, in cache order"""
+        return [self.commands[i] for i in self.index["categories"].get(category, [])]
+
+    def _name_scores(self, query: str, scores: Dict[int, float]) -> None:
+        trie = self.index["name_trie"]
+        key = query.replace(" ", "-")
+        node = _trie_find(trie, key)
+        if node is not None:
+            for doc_id in node.get(END, []):
+                scores[doc_id] = max(scores.get(doc_id, 0.0), EXACT_SCORE)
+            for full, ids in _trie_items(node, key):
+                bonus = PREFIX_SCORE + len(key) / len(full)
+                for doc_id in ids:
+                    if scores.get(doc_id, 0.0) < bonus:
+                        scores[doc_id] = bonus
+            return  # typo tolerance is only for queries that match no name
+        for full, dist, ids in _trie_near(trie, key, _max_edits(key)):
+            if dist == 0:
+                continue
+            fuzzy = FUZZY_SCORE - 0.5 * (dist - 1) - 0.25
+            for doc_id in ids:
+                if scores.get(doc_id, 0.0) < fuzzy:
+                    scores[doc_id] = fuzzy
+
+    def _text_scores(self, query: str, scores: Dict[int, float]) -> None:
+        tokens = self.index["tokens"]
+        tags = self.index["tags"]
+        vocab = self.index["vocab_trie"]
+        for word in set(tokenize(query)):
+            for doc_id in tags.get(word, []):
+                scores[doc_id] = scores.get(doc_id, 0.0) + TAG_SCORE
+            if word in tokens:
+                hits = [(word, 1.0)]
+            else:
+                # Misspelled word: nearest vocabulary tokens at reduced weight
+                hits = [
+                    (tok, 0.5 / dist)
+                    for tok, dist, _ in _trie_near(vocab, word, _max_edits(word))
+                ]
+            for tok, factor in hits:
+                for doc_id, weight in tokens[tok].items():
+                    doc_id = int(doc_id)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * factor
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        """
+        Ranked lookup over command and skill names, tags and descriptions.
+
+        Args:
+            query: Free text, a (partial or misspelled) name such as
+                ``lnt`` / ``code:lint`` / ``/craft:code:lint``, or both
+            limit: Maximum number of results
+
+        Returns:
+            Records (shallow copies) with added ``kind`` ("command"/"skill")
+            and ``score`` keys, best first
+        """
+        query = query.strip().lower()
+        if query.startswith("/craft:"):
+            query = query[len("/craft:"):]
+        if not query or limit <= 0:
+            return []
+
+        scores: Dict[int, float] = {}
+        self._name_scores(query, scores)
+        self._text_scores(query, scores)
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], item[0] >= self.n_commands, self.doc(item[0])["name"]),
+        )
+        return [
+            dict(self.doc(doc_id), kind=self.kind(doc_id), score=round(score, 4))
+            for doc_id, score in ranked[:limit]
+        ]